@@ -2,12 +2,14 @@ from __future__ import annotations
 from typing import *
 from logging import getLogger
 from typing import Literal
-import json
 import random
 import time
 import os
 import tempfile
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar, copy_context
 
 import tls_requests
 import curl_cffi
@@ -16,12 +18,112 @@ from . import types
 from .exceptions import *
 from .parser import *
 from .enums import *
-from .misc import PERSISTED_QUERIES
+from . import payloads
+from . import json_backend
+from .batch import Batch
+from .cache import BaseCache, CachedResponse
+from .ratelimit import RateLimiter
+from .challenge import ChallengePolicy, CircuitBreaker, is_cloudflare_challenge
+from .hooks import Hooks
+from .proxies import ProxyPool, normalize_proxy
+from .transport import Transport
+from .pagination import iter_items
+from .chat_index import ChatIndex
+from .repricing import Repricer, RepriceReport
+from .identity import IdentityMap
+from . import identity
+
+
+USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.5938.132 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_6) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0.5845.96 Safari/537.36",
+    "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1",
+    "Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.5993.90 Mobile Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edg/118.0.2088.62 Chrome/118.0.5993.90 Safari/537.36",
+    "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:119.0) Gecko/20100101 Firefox/119.0",
+    "Mozilla/5.0 (Linux; Android 13; SM-G998B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Mobile Safari/537.36 OPR/88.0.0.0",
+    "Opera/9.80 (Windows NT 6.3; U; en) Presto/2.12.388 Version/12.16"
+)
+""" Юзер-агенты браузеров, из которых выбирается случайный, если `user_agent` не задан. """
+
+DEFAULT_HEADERS = {
+    "accept": "*/*",
+    "accept-language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
+    "access-control-allow-headers": "sentry-trace, baggage",
+    "apollo-require-preflight": "true",
+    "apollographql-client-name": "web",
+    "content-type": "application/json",
+    "cookie": None,
+    "origin": "https://playerok.com",
+    "priority": "u=1, i",
+    "referer": "https://playerok.com/",
+    "sec-ch-ua": "\"Chromium\";v=\"142\", \"Google Chrome\";v=\"142\", \"Not_A Brand\";v=\"99\"",
+    "sec-ch-ua-arch": "\"x86\"",
+    "sec-ch-ua-bitness": "\"64\"",
+    "sec-ch-ua-full-version": "\"142.0.7444.162\"",
+    "sec-ch-ua-full-version-list": "\"Chromium\";v=\"142.0.7444.162\", \"Google Chrome\";v=\"142.0.7444.162\", \"Not_A Brand\";v=\"99.0.0.0\"",
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-model": "\"\"",
+    "sec-ch-ua-platform": "\"Windows\"",
+    "sec-ch-ua-platform-version": "\"19.0.0\"",
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+    "user-agent": None,
+    "x-gql-op": "viewer",
+    "x-timezone-offset": "-240"
+}
+""" Шаблон заголовков запросов (`cookie` и `user-agent` подставляются аккаунтом). """
+
+
+_current_account: ContextVar[Account | None] = ContextVar("playerokapi_current_account", default=None)
+
+_cert_lock = threading.Lock()
+_tmp_cert_path: str | None = None
 
 
 def get_account() -> Account | None:
-    if hasattr(Account, "instance"):
-        return getattr(Account, "instance")
+    """
+    Получает текущий аккаунт.\n
+    Это аккаунт, который последним отправлял запрос (или был создан) в текущем потоке/задаче -
+    именно им пользуются объекты, созданные парсером из его ответа.
+    Аккаунты из других потоков не подставляются: если в текущем контексте аккаунта нет, возвращается `None`
+    (потоки библиотеки получают копию контекста, из которого были запущены).\n
+    Раньше, если в контексте аккаунта не было, возвращался последний созданный аккаунт процесса - с несколькими
+    аккаунтами это был чужой аккаунт. Объекты из ответов теперь запоминают свой аккаунт при разборе
+    (см. `playerokapi.types.UserProfile`), а разобранные вне запроса аккаунта привязываются явно - `UserProfile.bind`.
+
+    :return: Объект аккаунта.
+    :rtype: `playerokapi.account.Account` or `None`
+    """
+    return _current_account.get()
+
+
+def _get_tmp_cert_path() -> str:
+    """ Копирует cacert.pem во временную папку один раз на процесс. """
+    global _tmp_cert_path
+    with _cert_lock:
+        if _tmp_cert_path is None:
+            path = os.path.join(tempfile.gettempdir(), "cacert.pem")
+            shutil.copyfile(os.path.join(os.path.dirname(__file__), "cacert.pem"), path)
+            _tmp_cert_path = path
+    return _tmp_cert_path
+
+
+class _Flight:
+    """ Запрос, который сейчас выполняется, и его результат для ожидающих потоков. """
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: requests.Response | None = None
+        self.exception: BaseException | None = None
+
+    def wait(self) -> requests.Response:
+        self.event.wait()
+        if self.exception is not None:
+            raise self.exception
+        return self.result
 
 
 class Account:
@@ -34,28 +136,74 @@ class Account:
     :param user_agent: Юзер-агент браузера.
     :type user_agent: `str`
 
-    :param proxy: IPV4 прокси в формате: `user:pass@ip:port` или `ip:port`, _опционально_.
-    :type proxy: `str` or `None`
+    :param proxy: IPV4 прокси в формате: `user:pass@ip:port` или `ip:port`, или список таких прокси (пул с автоматическим переключением), _опционально_.
+    :type proxy: `str` or `list[str]` or `playerokapi.proxies.ProxyPool` or `None`
 
     :param requests_timeout: Таймаут ожидания ответов на запросы.
     :type requests_timeout: `int`
 
-    :param request_max_retries: Максимальное количество повторных попыток отправки запроса, если была обнаружена CloudFlare защита.
+    :param request_max_retries: Максимальное количество повторных попыток отправки запроса, если была обнаружена CloudFlare защита
+        (используется, если не передана своя `challenge_policy` - тогда лимит берётся из её `max_attempts`).
     :type request_max_retries: `int`
+
+    :param persisted_mutations: Отправлять мутации как Automatic Persisted Queries (после первой отправки мутации - только sha256 хеш запроса вместо полного текста), _опционально_.
+    :type persisted_mutations: `bool`
+
+    :param cache: Кеш ответов на справочные запросы (`playerokapi.cache.MemoryCache` или `playerokapi.cache.DiskCache`), _опционально_.
+    :type cache: `playerokapi.cache.BaseCache` or `None`
+
+    :param single_flight: Объединять одинаковые одновременные GET запросы в один, _опционально_.
+    :type single_flight: `bool`
+
+    :param rate_limiter: Ограничитель частоты запросов (можно передать один объект нескольким аккаунтам), _опционально_.
+    :type rate_limiter: `playerokapi.ratelimit.RateLimiter` or `None`
+
+    :param challenge_policy: Политика реакции на проверку Cloudflare, _опционально_.
+    :type challenge_policy: `playerokapi.challenge.ChallengePolicy` or `None`
+
+    :param circuit_breaker: Circuit breaker проверок Cloudflare (можно передать один объект нескольким аккаунтам), _опционально_.
+    :type circuit_breaker: `playerokapi.challenge.CircuitBreaker` or `None`
+
+    :param hooks: Обработчики событий запросов (можно передать один объект нескольким аккаунтам), _опционально_.
+    :type hooks: `playerokapi.hooks.Hooks` or `None`
+
+    :param transport: Транспорт HTTP запросов (например, запись или воспроизведение трафика), _опционально_.
+    :type transport: `playerokapi.transport.Transport` or `None`
+
+    :param chat_index: Индекс чатов по никнеймам собеседников (например, `ChatIndex("chats.jsonl")`, чтобы он сохранялся между запусками), _опционально_.
+    :type chat_index: `playerokapi.chat_index.ChatIndex` or `None`
+
+    :param identity_map: Карта идентичности для объектов из ответов: `IdentityMap` - общая для всех ответов аккаунта,
+        `"response"` - новая на каждый ответ, `None` - не использовать, _опционально_.
+    :type identity_map: `playerokapi.identity.IdentityMap` or `str` or `None`
+
+    :param lazy_parsing: Разбирать вложенные объекты сообщений, сделок и чатов только при первом обращении
+        (см. `playerokapi.parser.lazy`), _опционально_.
+    :type lazy_parsing: `bool`
     """
 
-    def __new__(cls, *args, **kwargs) -> Account:
-        if not hasattr(cls, "instance"):
-            cls.instance = super(Account, cls).__new__(cls)
-        return getattr(cls, "instance")
+    __tls_requests: tls_requests.Client | None = None
+    __proxy_tls_requests: dict[str, tls_requests.Client] | None = None # {прокси: клиент} для загрузки файлов через прокси пула
+    __curl_session: curl_cffi.Session | None = None
 
     def __init__(
             self, 
             token: str, 
             user_agent: str = "", 
-            proxy: str = None, 
+            proxy: str | list[str] | ProxyPool | None = None, 
             requests_timeout: int = 15,
             request_max_retries: int = 5,
+            persisted_mutations: bool = False,
+            cache: BaseCache | None = None,
+            single_flight: bool = True,
+            rate_limiter: RateLimiter | None = None,
+            challenge_policy: ChallengePolicy | None = None,
+            circuit_breaker: CircuitBreaker | None = None,
+            hooks: Hooks | None = None,
+            transport: Transport | None = None,
+            chat_index: ChatIndex | None = None,
+            identity_map: IdentityMap | Literal["response"] | None = None,
+            lazy_parsing: bool = False,
             **kwargs
         ):
         self.token = token
@@ -66,10 +214,44 @@ class Account:
         """ Таймаут ожидания ответов на запросы. """
         self.proxy = proxy
         """ Прокси. """
-        self.__proxy_string = f"http://{self.proxy.replace('https://', '').replace('http://', '')}" if self.proxy else None
+        self.proxy_pool: ProxyPool | None = None
+        """ Пул прокси (если передан список прокси). """
+        if isinstance(proxy, ProxyPool):
+            self.proxy_pool = proxy
+        elif isinstance(proxy, (list, tuple)):
+            self.proxy_pool = ProxyPool(list(proxy))
+        self._proxy_string = self.proxy_pool.select().url if self.proxy_pool else (normalize_proxy(self.proxy) if self.proxy else None)
         """ Строка прокси. """
         self.request_max_retries = request_max_retries
         """ Максимальное количество повторных попыток отправки запроса. """
+        self.persisted_mutations = persisted_mutations
+        """ Отправлять ли мутации как Automatic Persisted Queries. """
+        self._known_query_hashes: set[str] = set()
+        """ Хеши мутаций, которые уже зарегистрированы на сервере этого аккаунта (`base_url`). """
+        self.cache = cache
+        """ Кеш ответов на справочные запросы. """
+        self.single_flight = single_flight
+        """ Объединять ли одинаковые одновременные GET запросы в один. """
+        self.rate_limiter = rate_limiter
+        """ Ограничитель частоты запросов. """
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(challenge_policy or ChallengePolicy(max_attempts=request_max_retries + 1))
+        """ Circuit breaker проверок Cloudflare. """
+        self.challenge_policy = challenge_policy or self.circuit_breaker.policy
+        """ Политика реакции на проверку Cloudflare. """
+        self.impersonate = self.challenge_policy.fingerprints[0]
+        """ Текущий отпечаток браузера curl сессии. """
+        self.hooks = hooks or Hooks()
+        """ Обработчики событий запросов (`on_request_start`, `on_response`, `on_retry`, `on_cloudflare`). """
+        self.transport = transport
+        """ Транспорт HTTP запросов (`None` - запросы уходят напрямую через HTTP клиенты). """
+        self.chat_index = chat_index if chat_index is not None else ChatIndex()
+        """ Индекс чатов по никнеймам собеседников. """
+        self.repricer = Repricer(self)
+        """ Массовое изменение цен предметов (см. `reprice_items`). """
+        self.identity_map = identity_map
+        """ Карта идентичности для объектов из ответов (`IdentityMap`, `"response"` или `None`). """
+        self.lazy_parsing: bool = lazy_parsing
+        """ Разбирать ли вложенные объекты сообщений, сделок и чатов только при первом обращении. """
 
         self.base_url = "https://playerok.com"
         """ Базовый URL для всех запросов. """
@@ -105,23 +287,229 @@ class Account:
         self.profile: AccountProfile | None = None
         """ Профиль аккаунта (не путать с профилем пользователя). \n\n_Заполняется при первом использовании get()_ """
 
-        self.__cert_path = os.path.join(os.path.dirname(__file__), "cacert.pem")
-        self.__tmp_cert_path = os.path.join(tempfile.gettempdir(), "cacert.pem")
-        shutil.copyfile(self.__cert_path, self.__tmp_cert_path)
+        self._refresh_headers()
+        self._tmp_cert_path = _get_tmp_cert_path()
+        self.__flights: dict[tuple, _Flight] = {}
+        self.__flights_lock = threading.Lock()
+        self.__clients_lock = threading.Lock()
 
         self._refresh_clients()
         self.__logger = getLogger("playerokapi")
+        self._make_current()
+
+    def _make_current(self):
+        _current_account.set(self)
+
+    def _use_parse_context(self):
+        # настройки ставятся в контекст потока/задачи, из которого потом будет разбираться ответ
+        # (всегда, чтобы в том же потоке не остались настройки другого аккаунта)
+        identity.set_current(IdentityMap(maxsize=None) if self.identity_map == "response" else self.identity_map)
+        set_lazy(self.lazy_parsing)
 
     def _refresh_clients(self):
-        self.__tls_requests = tls_requests.Client(
-            proxy=self.__proxy_string
-        )
-        self.__curl_session = curl_cffi.Session(
-            impersonate="chrome",
+        self._refresh_tls_client()
+        self._refresh_curl_session()
+
+    def _refresh_tls_client(self):
+        with self.__clients_lock:
+            old, self.__tls_requests = self.__tls_requests, tls_requests.Client(
+                proxy=self._proxy_string
+            )
+            old_proxy_clients, self.__proxy_tls_requests = self.__proxy_tls_requests or {}, {}
+        for client in ([old] if old is not None else []) + list(old_proxy_clients.values()):
+            self._retire(client.close)
+
+    def _tls_client(self, proxy: str | None) -> tls_requests.Client:
+        # у tls_requests прокси задаётся на клиента, поэтому для каждого прокси пула - свой клиент
+        # (общий клиент не пересоздаётся на каждый запрос - его могут использовать другие потоки)
+        if proxy is None or proxy == self._proxy_string:
+            return self.__tls_requests
+        client = self.__proxy_tls_requests.get(proxy)
+        if client is None:
+            with self.__clients_lock:
+                client = self.__proxy_tls_requests.get(proxy)
+                if client is None:
+                    client = self.__proxy_tls_requests[proxy] = tls_requests.Client(proxy=proxy)
+        return client
+
+    def _refresh_curl_session(self):
+        old, self.__curl_session = self.__curl_session, curl_cffi.Session(
+            impersonate=self.impersonate,
             timeout=10,
-            proxy=self.__proxy_string,
-            verify=self.__tmp_cert_path
+            proxy=self._proxy_string,
+            verify=self._tmp_cert_path
         )
+        if old is not None:
+            self._retire(old.close)
+
+    def _retire(self, close: Callable[[], Any]):
+        # замененный клиент может ещё обслуживать запросы других потоков,
+        # поэтому он закрывается не сразу, а когда они гарантированно завершились (через таймаут запроса)
+        timer = threading.Timer(self.requests_timeout, close)
+        timer.daemon = True
+        timer.start()
+
+    def close(self):
+        """
+        Закрывает HTTP-сессии аккаунта (замененные при проверках Cloudflare закрываются сами через таймаут запроса).
+        """
+        with self.__clients_lock:
+            clients = [self.__curl_session, self.__tls_requests, *(self.__proxy_tls_requests or {}).values()]
+            self.__proxy_tls_requests = {}
+        for client in clients:
+            client.close()
+
+    def _rotate_fingerprint(self):
+        fingerprints = self.challenge_policy.fingerprints
+        index = fingerprints.index(self.impersonate) if self.impersonate in fingerprints else -1
+        self.impersonate = fingerprints[(index + 1) % len(fingerprints)]
+        self._refresh_curl_session()
+
+    def _rotate_proxy(self) -> bool:
+        # прокси с проверкой уже в карантине пула, следующий запрос уйдёт через другой
+        return self.proxy_pool is not None and len(self.proxy_pool) > 1
+
+    def _escalate(self, step: str):
+        """ Реагирует на проверку Cloudflare согласно шагу политики. """
+        if step == "rotate_fingerprint":
+            self._rotate_fingerprint()
+        elif step == "rotate_proxy":
+            if not self._rotate_proxy():
+                self._refresh_clients()
+        elif step == "rebuild":
+            self._refresh_headers()
+            self._refresh_clients()
+
+    def _refresh_headers(self):
+        self.__headers = {
+            **DEFAULT_HEADERS,
+            "cookie": f"token={self.token}",
+            "user-agent": self.user_agent if self.user_agent else random.choice(USER_AGENTS)
+        }
+        self.__headers_source = (self.token, self.user_agent)
+        self.__filtered_headers: dict[tuple[str, ...], dict[str, str]] = {}
+
+    def _build_headers(self, headers: dict[str, str]) -> dict[str, str]:
+        # заголовки собираются один раз на аккаунт (и пересобираются, если сменился токен или юзер-агент),
+        # а результат фильтрации кешируется по набору ключей - возвращаемый словарь изменять нельзя
+        if self.__headers_source != (self.token, self.user_agent):
+            self._refresh_headers()
+        key = tuple(headers)
+        built = self.__filtered_headers.get(key)
+        if built is None:
+            built = {k: v for k, v in self.__headers.items() if k not in headers}
+            self.__filtered_headers[key] = built
+        return built
+
+    def _is_cloudflare_response(self, resp: requests.Response) -> bool:
+        return is_cloudflare_challenge(resp)
+
+    def _persisted_query_error(self, resp: requests.Response) -> str | None:
+        try:
+            errors = resp.json().get("errors") or []
+        except:
+            return None
+        for error in errors:
+            code = (error.get("extensions") or {}).get("code")
+            message = error.get("message")
+            if "PERSISTED_QUERY_NOT_FOUND" in (code, message) or message == "PersistedQueryNotFound":
+                return "PERSISTED_QUERY_NOT_FOUND"
+            if "PERSISTED_QUERY_NOT_SUPPORTED" in (code, message) or message == "PersistedQueryNotSupported":
+                return "PERSISTED_QUERY_NOT_SUPPORTED"
+
+    @property
+    def known_persisted_queries(self) -> set[str]:
+        """ Хеши мутаций, которые сервер уже знает. """
+        return set(self._known_query_hashes)
+
+    def _persisted_payload(self, method: str, payload: dict | list | None) -> tuple[dict | list | None, str | None]:
+        if not self.persisted_mutations or method != "post" or not isinstance(payload, dict):
+            return payload, None
+        # только хеш отправляется для уже зарегистрированных запросов, в первый раз - хеш вместе с текстом
+        persisted_payload, query_hash = payloads.persisted_mutation(payload)
+        if query_hash is not None and query_hash not in self._known_query_hashes:
+            persisted_payload, _ = payloads.persisted_mutation(payload, include_query=True)
+        return persisted_payload, query_hash
+
+    def _persisted_retry_payload(self, error: str | None, full_payload: dict, query_hash: str) -> dict | None:
+        if error == "PERSISTED_QUERY_NOT_SUPPORTED":
+            self.persisted_mutations = False
+            self._known_query_hashes.clear()
+            return full_payload
+        if error == "PERSISTED_QUERY_NOT_FOUND":
+            # сервер забыл запрос - регистрируем заново
+            self._known_query_hashes.discard(query_hash)
+            return payloads.persisted_mutation(full_payload, include_query=True)[0]
+        return None
+
+    def _remember_persisted_query(self, resp: requests.Response, query_hash: str):
+        if self.persisted_mutations and self._persisted_query_error(resp) is None:
+            self._known_query_hashes.add(query_hash)
+
+    def _cache_key(self, method: str, payload: dict | None) -> tuple[str, Any] | None:
+        if self.cache is None or method != "get" or not isinstance(payload, dict):
+            return None
+        operation_name = payload.get("operationName")
+        if not self.cache.is_cacheable(operation_name):
+            return None
+        return operation_name, payload.get("variables")
+
+    def _get_cached_response(self, method: str, url: str, payload: dict | None) -> CachedResponse | None:
+        key = self._cache_key(method, payload)
+        if key is None:
+            return None
+        content = self.cache.get(*key)
+        if content is None:
+            return None
+        return json_backend.bind_response(CachedResponse(url, content))
+
+    def _cache_response(self, method: str, payload: dict | None, resp: requests.Response):
+        key = self._cache_key(method, payload)
+        if key is None or resp.status_code != 200 or b'"errors"' in resp.content:
+            return
+        self.cache.set(*key, resp.content)
+
+    def _operation_name(self, payload: dict | list | None) -> str | None:
+        if isinstance(payload, list):
+            return "batch"
+        if not isinstance(payload, dict):
+            return None
+        operation_name = payload.get("operationName")
+        if operation_name is None and isinstance(payload.get("operations"), str):
+            try:
+                operation_name = json_backend.loads(payload["operations"]).get("operationName")
+            except ValueError:
+                pass
+        return operation_name
+
+    def _single_flight_key(self, method: str, url: str, payload: dict | None, files: dict | None) -> tuple | None:
+        if not self.single_flight or method != "get" or files or not isinstance(payload, dict):
+            return None
+        try:
+            return (method, url, tuple(sorted(payload.items())))
+        except TypeError:
+            return None
+
+    def _rewind_files(self, files: dict | None):
+        for file in (files or {}).values():
+            if hasattr(file, "seek"):
+                file.seek(0)
+
+    def _set_viewer_data(self, data: dict):
+        self.id = data.get("id")
+        self.username = data.get("username")
+        self.email = data.get("email")
+        self.role = data.get("role")
+        self.has_frozen_balance = data.get("hasFrozenBalance")
+        self.support_chat_id = data.get("supportChatId")
+        self.system_chat_id = data.get("systemChatId")
+        self.unread_chats_counter = data.get("unreadChatsCounter")
+        self.is_blocked = data.get("isBlocked")
+        self.is_blocked_for = data.get("isBlockedFor")
+        self.created_at = data.get("createdAt")
+        self.last_item_created_at = data.get("lastItemCreatedAt")
+        self.has_confirmed_phone_number = data.get("hasConfirmedPhoneNumber")
+        self.can_publish_items = data.get("canPublishItems")
 
     def request(self, method: Literal["get", "post"], url: str, headers: dict[str, str], 
                 payload: dict[str, str] | None = None, files: dict | None = None) -> requests.Response:
@@ -146,94 +534,141 @@ class Account:
         :return: Ответа запроса requests.
         :rtype: `requests.Response`
         """
-        agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.5938.132 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_6) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/116.0.5845.96 Safari/537.36",
-            "Mozilla/5.0 (iPhone; CPU iPhone OS 17_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.0 Mobile/15E148 Safari/604.1",
-            "Mozilla/5.0 (Linux; Android 14; Pixel 8) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.5993.90 Mobile Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Edg/118.0.2088.62 Chrome/118.0.5993.90 Safari/537.36",
-            "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:119.0) Gecko/20100101 Firefox/119.0",
-            "Mozilla/5.0 (Linux; Android 13; SM-G998B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/117.0.0.0 Mobile Safari/537.36 OPR/88.0.0.0",
-            "Opera/9.80 (Windows NT 6.3; U; en) Presto/2.12.388 Version/12.16"
-        ]
-        _headers = {
-            "accept": "*/*",
-            "accept-language": "ru-RU,ru;q=0.9,en-US;q=0.8,en;q=0.7",
-            "access-control-allow-headers": "sentry-trace, baggage",
-            "apollo-require-preflight": "true",
-            "apollographql-client-name": "web",
-            "content-type": "application/json",
-            "cookie": f"token={self.token}",
-            "origin": "https://playerok.com",
-            "priority": "u=1, i",
-            "referer": "https://playerok.com/",
-            "sec-ch-ua": "\"Chromium\";v=\"142\", \"Google Chrome\";v=\"142\", \"Not_A Brand\";v=\"99\"",
-            "sec-ch-ua-arch": "\"x86\"",
-            "sec-ch-ua-bitness": "\"64\"",
-            "sec-ch-ua-full-version": "\"142.0.7444.162\"",
-            "sec-ch-ua-full-version-list": "\"Chromium\";v=\"142.0.7444.162\", \"Google Chrome\";v=\"142.0.7444.162\", \"Not_A Brand\";v=\"99.0.0.0\"",
-            "sec-ch-ua-mobile": "?0",
-            "sec-ch-ua-model": "\"\"",
-            "sec-ch-ua-platform": "\"Windows\"",
-            "sec-ch-ua-platform-version": "\"19.0.0\"",
-            "sec-fetch-dest": "empty",
-            "sec-fetch-mode": "cors",
-            "sec-fetch-site": "same-origin",
-            "user-agent": self.user_agent if self.user_agent else random.choice(agents),
-            "x-gql-op": "viewer",
-            "x-timezone-offset": "-240"
-        }
-        headers = {k: v for k, v in _headers.items() if k not in headers.keys()}
-                
-        def make_req():
-            if method == "get":
-                r = self.__curl_session.get(
+        self._make_current()
+        self._use_parse_context()
+        key = self._single_flight_key(method, url, payload, files)
+        if key is None:
+            return self._request(method, url, headers, payload, files)
+
+        with self.__flights_lock:
+            flight = self.__flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self.__flights[key] = _Flight()
+        if not is_leader:
+            return flight.wait()
+        try:
+            flight.result = self._request(method, url, headers, payload, files)
+        except BaseException as e:
+            flight.exception = e
+            raise
+        finally:
+            with self.__flights_lock:
+                del self.__flights[key]
+            flight.event.set()
+        return flight.result
+
+    def _send_http(self, method: Literal["get", "post"], url: str, headers: dict[str, str],
+                   payload: dict | list | None, files: dict | None, proxy: str | None) -> requests.Response:
+        if method == "get":
+            r = self.__curl_session.get(
+                url=url, 
+                params=payload, 
+                headers=headers, 
+                timeout=self.requests_timeout,
+                proxy=proxy
+            )
+        elif method == "post":
+            if files:
+                r = self._tls_client(proxy).post(
                     url=url, 
-                    params=payload, 
+                    json=payload if not files else None, 
+                    data=payload if files else None, 
                     headers=headers, 
+                    files=files, 
                     timeout=self.requests_timeout
                 )
-            elif method == "post":
-                if files:
-                    r = self.__tls_requests.post(
-                        url=url, 
-                        json=payload if not files else None, 
-                        data=payload if files else None, 
-                        headers=headers, 
-                        files=files, 
-                        timeout=self.requests_timeout
-                    )
-                else:
-                    r = self.__curl_session.post(
-                        url=url, 
-                        json=payload,
-                        headers=headers, 
-                        timeout=self.requests_timeout
-                    )
+            else:
+                r = self.__curl_session.post(
+                    url=url, 
+                    data=json_backend.dumps_bytes(payload),
+                    headers=headers, 
+                    timeout=self.requests_timeout,
+                    proxy=proxy
+                )
+        return r
+
+    def _request(self, method: Literal["get", "post"], url: str, headers: dict[str, str],
+                 payload: dict[str, str] | None = None, files: dict | None = None) -> requests.Response:
+        cached = self._get_cached_response(method, url, payload)
+        if cached is not None:
+            return cached
+        headers = self._build_headers(headers)
+        hooks = self.hooks
+        operation_name = self._operation_name(payload)
+                
+        def make_req():
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(operation_name)
+            if hooks.has("on_request_start"):
+                hooks.emit("on_request_start", self, operation_name, method, url)
+            # при сетевой ошибке запрос уходит через следующий прокси пула
+            tried = set()
+            for failover in range(len(self.proxy_pool) if self.proxy_pool is not None else 1):
+                proxy = self.proxy_pool.select(exclude=tried) if self.proxy_pool is not None else None
+                proxy_url = proxy.url if proxy is not None else self._proxy_string
+                started_at = time.perf_counter()
+                try:
+                    if self.transport is None:
+                        r = self._send_http(method, url, headers, payload, files, proxy_url)
+                    else:
+                        r = self.transport.send(self, method, url, headers, payload, files, proxy_url)
+                except:
+                    if proxy is None:
+                        raise
+                    self.proxy_pool.record(proxy, time.perf_counter() - started_at)
+                    if failover == len(self.proxy_pool) - 1:
+                        raise
+                    tried.add(proxy.url)
+                    self._rewind_files(files)
+                    continue
+                break
+            elapsed = time.perf_counter() - started_at
+            json_backend.bind_response(r)
+            if proxy is not None:
+                self.proxy_pool.record(proxy, elapsed, r)
+            if hooks.has("on_response"):
+                hooks.emit("on_response", self, operation_name, r, elapsed)
             return r
 
-        cloudflare_signatures = [
-            "<title>Just a moment...</title>",
-            "window._cf_chl_opt",
-            "Enable JavaScript and cookies to continue",
-            "Checking your browser before accessing",
-            "cf-browser-verification",
-            "Cloudflare Ray ID"
-        ]
-        for attempt in range(30):
-            resp = make_req()
-            if not any(sig in resp.text for sig in cloudflare_signatures):
-                break
-            self._refresh_clients()
-            delay = min(120.0, 5.0 * (2 ** attempt)) 
-            self.__logger.error(f"Cloudflare Detected, пробую отправить запрос снова через {delay} секунд")
-            time.sleep(delay)
-        else:
+        def send():
+            breaker = self.circuit_breaker
+            for attempt in range(self.challenge_policy.max_attempts):
+                if attempt:
+                    hooks.emit("on_retry", self, operation_name, "cloudflare", attempt)
+                breaker.wait()
+                try:
+                    resp = make_req()
+                except:
+                    breaker.release()
+                    raise
+                if not self._is_cloudflare_response(resp):
+                    breaker.record_success()
+                    return resp
+                reaction = breaker.record_challenge()
+                hooks.emit("on_cloudflare", self, operation_name, reaction[0] if reaction else None)
+                if reaction is not None:
+                    step, delay = reaction
+                    self._escalate(step)
+                    self.__logger.error(f"Cloudflare Detected ({step}), пробую отправить запрос снова через {delay} секунд")
+                self._rewind_files(files)
             raise CloudflareDetectedException(resp)
+
+        full_payload = payload
+        payload, query_hash = self._persisted_payload(method, full_payload)
+        resp = send()
+        if query_hash is not None:
+            retry_payload = self._persisted_retry_payload(self._persisted_query_error(resp), full_payload, query_hash)
+            if retry_payload is not None:
+                payload = retry_payload
+                self._rewind_files(files)
+                hooks.emit("on_retry", self, operation_name, "persisted_query", 1)
+                resp = send()
+            self._remember_persisted_query(resp, query_hash)
         try:
             if "errors" in resp.json():
                 for attempt in range(3):
+                    hooks.emit("on_retry", self, operation_name, "server_error", attempt + 1)
                     resp = make_req()
                     exc = RequestError(resp)
                     if exc.error_code != 500:
@@ -247,8 +682,38 @@ class Account:
             pass
         if resp.status_code != 200:
            raise RequestFailedError(resp)
+        self._cache_response(method, payload, resp)
         return resp
     
+    def batch(self, max_size: int = 20) -> Batch:
+        """
+        Создаёт пакетный запрос: операции, добавленные внутри `with`,
+        отправляются одним HTTP запросом при выходе из блока.
+
+        :param max_size: Максимальное количество операций в одном HTTP запросе.
+        :type max_size: `int`
+
+        :return: Объект пакетного запроса.
+        :rtype: `playerokapi.batch.Batch`
+        """
+        return Batch(self, max_size)
+
+    def _fetch_many(self, fetch: Callable[[str], Any], ids: Iterable[str], max_workers: int) -> list[Any]:
+        ids = list(ids)
+        unique = list(dict.fromkeys(ids))
+        results: dict[str, Any] = {}
+        if unique:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique))),
+                                    thread_name_prefix="playerokapi-fetch") as executor:
+                # у каждой задачи своя копия контекста - с текущим аккаунтом и настройками парсера
+                futures = {id: executor.submit(copy_context().run, fetch, id) for id in unique}
+                for id, future in futures.items():
+                    try:
+                        results[id] = future.result()
+                    except Exception as e:
+                        results[id] = e
+        return [results[id] for id in ids]
+
     def get(self) -> Account:
         """
         Получает/обновляет данные об аккаунте.
@@ -257,39 +722,17 @@ class Account:
         :rtype: `playerokapi.account.Account`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "viewer",
-            "query": "query viewer {\n  viewer {\n    ...Viewer\n    __typename\n  }\n}\n\nfragment Viewer on User {\n  id\n  username\n  email\n  role\n  hasFrozenBalance\n  supportChatId\n  systemChatId\n  unreadChatsCounter\n  isBlocked\n  isBlockedFor\n  createdAt\n  lastItemCreatedAt\n  hasConfirmedPhoneNumber\n  canPublishItems\n  profile {\n    id\n    avatarURL\n    testimonialCounter\n    __typename\n  }\n  __typename\n}",
-            "query": "query viewer {\n  viewer {\n    ...Viewer\n    __typename\n  }\n}\n\nfragment Viewer on User {\n  id\n  username\n  email\n  role\n  hasFrozenBalance\n  supportChatId\n  systemChatId\n  unreadChatsCounter\n  isBlocked\n  isBlockedFor\n  createdAt\n  lastItemCreatedAt\n  hasConfirmedPhoneNumber\n  canPublishItems\n  profile {\n    id\n    avatarURL\n    testimonialCounter\n    __typename\n  }\n  __typename\n}",
-            "variables": {}
-        }
+        payload = payloads.viewer()
         r = self.request("post", f"{self.base_url}/graphql", headers, payload)
         rjson = r.json()
         data: dict = rjson["data"]["viewer"]
         if data is None:
             raise UnauthorizedError()
-        
-        self.id = data.get("id")
-        self.username = data.get("username")
-        self.email = data.get("email")
-        self.role = data.get("role")
-        self.has_frozen_balance = data.get("hasFrozenBalance")
-        self.support_chat_id = data.get("supportChatId")
-        self.system_chat_id = data.get("systemChatId")
-        self.unread_chats_counter = data.get("unreadChatsCounter")
-        self.is_blocked = data.get("isBlocked")
-        self.is_blocked_for = data.get("isBlockedFor")
-        self.created_at = data.get("createdAt")
-        self.last_item_created_at = data.get("lastItemCreatedAt")
-        self.has_confirmed_phone_number = data.get("hasConfirmedPhoneNumber")
-        self.can_publish_items = data.get("canPublishItems")
+
+        self._set_viewer_data(data)
         
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "user",
-            "variables": json.dumps({"username": self.username, "hasSupportAccess": False}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("user")}}, ensure_ascii=False)
-        }
+        payload = payloads.persisted_query("user", "user", {"username": self.username, "hasSupportAccess": False})
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         data: dict = r["data"]["user"]
         if data.get("__typename") == "User": self.profile = account_profile(data)
@@ -310,11 +753,7 @@ class Account:
         :rtype: `playerokapi.types.UserProfile`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "user",
-            "variables": json.dumps({"id": id, "username": username, "hasSupportAccess": False}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("user")}}, ensure_ascii=False)
-        }
+        payload = payloads.user(id, username)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         data: dict = r["data"]["user"]
         if data.get("__typename") == "UserFragment": profile = data
@@ -342,17 +781,44 @@ class Account:
         :return: Страница сделок.
         :rtype: `playerokapi.types.ItemDealList`
         """
-        str_statuses = [status.name for status in statuses] if statuses else None
-        str_direction = direction.name if direction else None
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "deals",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": {"userId": self.id, "direction": str_direction, "status": str_statuses}, "showForbiddenImage": True}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("deals")}}, ensure_ascii=False)
-        }
+        payload = payloads.deals(self.id, count, statuses, direction, after_cursor)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return item_deal_list(r["data"]["deals"])
 
+    def iter_deals(self, count: int = 24, statuses: list[ItemDealStatuses] | None = None, 
+                   direction: ItemDealDirections | None = None, after_cursor: str = None,
+                   lookahead: int = 1, stop: Callable[[types.ItemDeal], bool] | None = None,
+                   limit: int | None = None) -> Generator[types.ItemDeal, None, None]:
+        """
+        Перебирает все сделки аккаунта, подгружая следующую страницу, пока обрабатывается текущая.
+
+        :param count: Кол-во сделок, которые нужно получить (не более 24 за один запрос).
+        :type count: `int`
+
+        :param statuses: Статусы заявок, которые нужно получать, _опционально_.
+        :type statuses: `list[playerokapi.enums.ItemDealsStatuses]` or `None`
+
+        :param direction: Направление сделок, _опционально_.
+        :type direction: `playerokapi.enums.ItemDealsDirections` or `None`
+
+        :param after_cursor: Курсор, с которого будет идти парсинг (если нету - ищет с самого начала страницы), _опционально_.
+        :type after_cursor: `str`
+
+        :param lookahead: Сколько страниц подгружать заранее (0 - без фоновой подгрузки).
+        :type lookahead: `int`
+
+        :param stop: Условие остановки: перебор заканчивается на первом объекте, для которого оно истинно, например `lambda deal: deal.created_at < "2025-01-01"`, _опционально_.
+        :type stop: `callable` or `None`
+
+        :param limit: Максимальное количество сделок, _опционально_.
+        :type limit: `int` or `None`
+
+        :return: Генератор сделок.
+        :rtype: `Generator` of `playerokapi.types.ItemDeal`
+        """
+        return iter_items(lambda cursor: self.get_deals(count=count, statuses=statuses, direction=direction, after_cursor=cursor), "deals", after_cursor, lookahead, stop, limit)
+
     def get_deal(self, deal_id: str) -> types.ItemDeal:
         """
         Получает сделку.
@@ -364,14 +830,26 @@ class Account:
         :rtype: `playerokapi.types.ItemDeal`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "deal",
-            "variables": json.dumps({"id": deal_id, "hasSupportAccess": False, "showForbiddenImage": True}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("deal")}}, ensure_ascii=False)
-        }
+        payload = payloads.deal(deal_id)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return item_deal(r["data"]["deal"])
     
+    def get_deals_by_ids(self, deal_ids: Iterable[str], max_workers: int = 8) -> list[types.ItemDeal | Exception]:
+        """
+        Получает сделки по списку ID, отправляя запросы параллельно (не более `max_workers` одновременно).\n
+        Ошибка получения одного объекта не прерывает остальные - на его месте в результате будет исключение.
+
+        :param deal_ids: ID сделок.
+        :type deal_ids: `list[str]`
+
+        :param max_workers: Максимальное количество одновременных запросов.
+        :type max_workers: `int`
+
+        :return: Сделки в том же порядке, что и ID (или исключения для ID, которые не удалось получить).
+        :rtype: `list` of `playerokapi.types.ItemDeal` _or_ `Exception`
+        """
+        return self._fetch_many(self.get_deal, deal_ids, max_workers)
+
     def update_deal(self, deal_id: str, new_status: ItemDealStatuses) -> types.ItemDeal:
         """
         Обновляет статус сделки
@@ -387,17 +865,7 @@ class Account:
         :rtype: `playerokapi.types.ItemDeal`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "updateDeal",
-            "variables": {
-                "input": {
-                    "id": deal_id,
-                    "status": new_status.name
-                }
-            },
-            "query": "mutation updateDeal($input: UpdateItemDealInput!) {\n  updateDeal(input: $input) {\n    ...RegularItemDeal\n    __typename\n  }\n}\n\nfragment RegularItemDeal on ItemDeal {\n  id\n  status\n  direction\n  statusExpirationDate\n  statusDescription\n  obtaining\n  hasProblem\n  reportProblemEnabled\n  completedBy {\n    ...MinimalUserFragment\n    __typename\n  }\n  props {\n    ...ItemDealProps\n    __typename\n  }\n  prevStatus\n  completedAt\n  createdAt\n  logs {\n    ...ItemLog\n    __typename\n  }\n  transaction {\n    ...ItemDealTransaction\n    __typename\n  }\n  user {\n    ...UserEdgeNode\n    __typename\n  }\n  chat {\n    ...RegularChatId\n    __typename\n  }\n  item {\n    ...PartialDealItem\n    __typename\n  }\n  testimonial {\n    ...RegularItemDealTestimonial\n    __typename\n  }\n  obtainingFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  commentFromBuyer\n  __typename\n}\n\nfragment MinimalUserFragment on UserFragment {\n  id\n  username\n  role\n  __typename\n}\n\nfragment ItemDealProps on ItemDealProps {\n  autoConfirmPeriod\n  __typename\n}\n\nfragment ItemLog on ItemLog {\n  id\n  event\n  createdAt\n  user {\n    ...UserEdgeNode\n    __typename\n  }\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment ItemDealTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  value\n  createdAt\n  paymentMethodId\n  statusExpirationDate\n  __typename\n}\n\nfragment RegularChatId on Chat {\n  id\n  __typename\n}\n\nfragment PartialDealItem on Item {\n  ...PartialDealMyItem\n  ...PartialDealForeignItem\n  __typename\n}\n\nfragment PartialDealMyItem on MyItem {\n  id\n  slug\n  priority\n  status\n  name\n  price\n  priorityPrice\n  rawPrice\n  statusExpirationDate\n  sellerType\n  approvalDate\n  createdAt\n  priorityPosition\n  viewsCounter\n  feeMultiplier\n  comment\n  attachments {\n    ...RegularFile\n    __typename\n  }\n  user {\n    ...UserEdgeNode\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  category {\n    ...MinimalGameCategory\n    __typename\n  }\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...MinimalGameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment RegularFile on File {\n  id\n  url\n  filename\n  mime\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment MinimalGameCategory on GameCategory {\n  id\n  slug\n  name\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment MinimalGameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment PartialDealForeignItem on ForeignItem {\n  id\n  slug\n  priority\n  status\n  name\n  price\n  rawPrice\n  sellerType\n  approvalDate\n  priorityPosition\n  createdAt\n  viewsCounter\n  feeMultiplier\n  comment\n  attachments {\n    ...RegularFile\n    __typename\n  }\n  user {\n    ...UserEdgeNode\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  category {\n    ...MinimalGameCategory\n    __typename\n  }\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...MinimalGameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment RegularItemDealTestimonial on Testimonial {\n  id\n  status\n  text\n  rating\n  createdAt\n  updatedAt\n  creator {\n    ...RegularUserFragment\n    __typename\n  }\n  moderator {\n    ...RegularUserFragment\n    __typename\n  }\n  user {\n    ...RegularUserFragment\n    __typename\n  }\n  __typename\n}"
-        }
-
+        payload = payloads.update_deal(deal_id, new_status)
         r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
         return item_deal(r["data"]["updateDeal"])
 
@@ -419,14 +887,40 @@ class Account:
         :rtype: `playerokapi.types.GameList`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "games",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": {"type": type.name} if type else {}}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("games")}}, ensure_ascii=False)
-        }
+        payload = payloads.games(count, type, after_cursor)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return game_list(r["data"]["games"])
     
+    def iter_games(self, count: int = 24, type: GameTypes | None = None, 
+                   after_cursor: str = None,
+                   lookahead: int = 1, stop: Callable[[types.Game], bool] | None = None,
+                   limit: int | None = None) -> Generator[types.Game, None, None]:
+        """
+        Перебирает все игры или/и приложения, подгружая следующую страницу, пока обрабатывается текущая.
+
+        :param count: Кол-во игр, которые нужно получить (не более 24 за один запрос).
+        :type count: `int`
+
+        :param type: Тип игр, которые нужно получать. По умолчанию не указано, значит будут все сразу, _опционально_.
+        :type type: `playerokapi.enums.GameTypes` or `None`
+
+        :param after_cursor: Курсор, с которого будет идти парсинг (если нету - ищет с самого начала страницы), _опционально_.
+        :type after_cursor: `str`
+
+        :param lookahead: Сколько страниц подгружать заранее (0 - без фоновой подгрузки).
+        :type lookahead: `int`
+
+        :param stop: Условие остановки: перебор заканчивается на первом объекте, для которого оно истинно, _опционально_.
+        :type stop: `callable` or `None`
+
+        :param limit: Максимальное количество игр, _опционально_.
+        :type limit: `int` or `None`
+
+        :return: Генератор игр.
+        :rtype: `Generator` of `playerokapi.types.Game`
+        """
+        return iter_items(lambda cursor: self.get_games(count=count, type=type, after_cursor=cursor), "games", after_cursor, lookahead, stop, limit)
+
     def get_game(self, id: str | None = None, slug: str | None = None) -> types.Game:
         """
         Получает игру/приложение.\n
@@ -442,11 +936,7 @@ class Account:
         :rtype: `playerokapi.types.Game`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "GamePage",
-            "variables": json.dumps({"id": id, "slug": slug}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("game")}}, ensure_ascii=False)
-        }
+        payload = payloads.game(id, slug)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return game(r["data"]["game"])
 
@@ -469,11 +959,7 @@ class Account:
         :rtype: `playerokapi.types.GameCategory`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "GamePageCategory",
-            "variables": json.dumps({"id": id, "gameId": game_id, "slug": slug}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("game_category")}}, ensure_ascii=False)
-        }
+        payload = payloads.game_category(id, game_id, slug)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return game_category(r["data"]["gameCategory"])
     
@@ -498,11 +984,7 @@ class Account:
         :rtype: `playerokapi.types.GameCategoryAgreementList`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "gameCategoryAgreements",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": {"gameCategoryId": game_category_id, "userId": user_id if user_id else self.id}}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("game_category_agreements")}}, ensure_ascii=False)
-        }
+        payload = payloads.game_category_agreements(game_category_id, user_id if user_id else self.id, count, after_cursor)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return game_category_agreement_list(r["data"]["gameCategoryAgreements"])
     
@@ -524,11 +1006,7 @@ class Account:
         :rtype: `playerokapi.types.GameCategoryAgreementList`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "gameCategoryObtainingTypes",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": {"gameCategoryId": game_category_id}}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("game_category_obtaining_types")}}, ensure_ascii=False)
-        }
+        payload = payloads.game_category_obtaining_types(game_category_id, count, after_cursor)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return game_category_obtaining_type_list(r["data"]["gameCategoryObtainingTypes"])
     
@@ -556,11 +1034,7 @@ class Account:
         :rtype: `playerokapi.types.GameCategoryInstructionList`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "gameCategoryInstructions",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": {"gameCategoryId": game_category_id, "obtainingTypeId": obtaining_type_id, "type": type.name if type else None}}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("game_category_instructions")}}, ensure_ascii=False)
-        }
+        payload = payloads.game_category_instructions(game_category_id, obtaining_type_id, count, type, after_cursor)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return game_category_instruction_list(r["data"]["gameCategoryInstructions"])
 
@@ -588,11 +1062,7 @@ class Account:
         :rtype: `playerokapi.types.GameCategoryDataFieldList`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "gameCategoryDataFields",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": {"gameCategoryId": game_category_id, "obtainingTypeId": obtaining_type_id, "type": type.name if type else None}}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("game_category_data_fields")}}, ensure_ascii=False)
-        }
+        payload = payloads.game_category_data_fields(game_category_id, obtaining_type_id, count, type, after_cursor)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return game_category_data_field_list(r["data"]["gameCategoryDataFields"])
     
@@ -617,14 +1087,45 @@ class Account:
         :rtype: `playerokapi.types.ChatList`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "chats",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": {"userId": self.id, "type": type.name if type else None, "status": status.name if status else None}, "hasSupportAccess": False}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("chats")}}, ensure_ascii=False)
-        }
+        payload = payloads.chats(self.id, count, type, status, after_cursor)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return chat_list(r["data"]["chats"])
+        chats = chat_list(r["data"]["chats"])
+        self.chat_index.add_chats(chats.chats, self.id)
+        return chats
     
+    def iter_chats(self, count: int = 24, type: ChatTypes | None = None,
+                   status: ChatStatuses | None = None, after_cursor: str | None = None,
+                   lookahead: int = 1, stop: Callable[[types.Chat], bool] | None = None,
+                   limit: int | None = None) -> Generator[types.Chat, None, None]:
+        """
+        Перебирает все чаты аккаунта, подгружая следующую страницу, пока обрабатывается текущая.
+
+        :param count: Кол-во чатов, которые нужно получить (не более 24 за один запрос).
+        :type count: `int`
+
+        :param type: Тип чатов, которые нужно получать. По умолчанию не указано, значит будут все сразу, _опционально_.
+        :type type: `playerokapi.enums.ChatTypes` or `None`
+
+        :param status: Статус чатов, которые нужно получать. По умолчанию не указано, значит будут любые, _опционально_.
+        :type status: `playerokapi.enums.ChatStatuses` or `None`
+        
+        :param after_cursor: Курсор, с которого будет идти парсинг (если нету - ищет с самого начала страницы), _опционально_.
+        :type after_cursor: `str` or `None`
+
+        :param lookahead: Сколько страниц подгружать заранее (0 - без фоновой подгрузки).
+        :type lookahead: `int`
+
+        :param stop: Условие остановки: перебор заканчивается на первом объекте, для которого оно истинно, _опционально_.
+        :type stop: `callable` or `None`
+
+        :param limit: Максимальное количество чатов, _опционально_.
+        :type limit: `int` or `None`
+
+        :return: Генератор чатов.
+        :rtype: `Generator` of `playerokapi.types.Chat`
+        """
+        return iter_items(lambda cursor: self.get_chats(count=count, type=type, status=status, after_cursor=cursor), "chats", after_cursor, lookahead, stop, limit)
+
     def get_chat(self, chat_id: str) -> types.Chat:
         """
         Получает чат.
@@ -636,17 +1137,33 @@ class Account:
         :rtype: `playerokapi.types.Chat`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "chat",
-            "variables": json.dumps({"id": chat_id, "hasSupportAccess": False}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("chat")}}, ensure_ascii=False)
-        }
+        payload = payloads.chat(chat_id)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
-        return chat(r["data"]["chat"])
+        _chat = chat(r["data"]["chat"])
+        self.chat_index.add_chats([_chat], self.id)
+        return _chat
     
+    def get_chats_by_ids(self, chat_ids: Iterable[str], max_workers: int = 8) -> list[types.Chat | Exception]:
+        """
+        Получает чаты по списку ID, отправляя запросы параллельно (не более `max_workers` одновременно).\n
+        Ошибка получения одного объекта не прерывает остальные - на его месте в результате будет исключение.
+
+        :param chat_ids: ID чатов.
+        :type chat_ids: `list[str]`
+
+        :param max_workers: Максимальное количество одновременных запросов.
+        :type max_workers: `int`
+
+        :return: Чаты в том же порядке, что и ID (или исключения для ID, которые не удалось получить).
+        :rtype: `list` of `playerokapi.types.Chat` _or_ `Exception`
+        """
+        return self._fetch_many(self.get_chat, chat_ids, max_workers)
+
     def get_chat_by_username(self, username: str) -> types.Chat | None:
         """
-        Получает чат по никнейму собеседника.
+        Получает чат по никнейму собеседника.\n
+        Сначала ищет ID чата в `chat_index`, и только если его там нет - обходит страницы чатов
+        (до первого совпадения, попутно записывая в индекс всех встреченных собеседников).
 
         :param username: Никнейм собеседника.
         :type username: `str`
@@ -654,6 +1171,18 @@ class Account:
         :return: Объект чата.
         :rtype: `playerokapi.types.Chat` or `None`
         """
+        chat_id = self.chat_index.get(username)
+        if chat_id is not None:
+            try:
+                _chat = self.get_chat(chat_id)
+            except (RequestError, RequestFailedError, KeyError, TypeError) as e:
+                # чат удалён или недоступен - запись в индексе устарела
+                self.__logger.debug(f"Чат {chat_id} из индекса недоступен: {e}")
+                _chat = None
+            if _chat is not None and any(user for user in _chat.users if user.username.lower() == username.lower()):
+                return _chat
+            self.chat_index.remove(username)
+
         next_cursor = None
         while True:
             chats = self.get_chats(count=24, after_cursor=next_cursor)
@@ -682,14 +1211,40 @@ class Account:
         :rtype: `playerokapi.types.ChatMessageList`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "chatMessages",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": {"chatId": chat_id}, "hasSupportAccess": False, "showForbiddenImage": True}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("chat_messages")}}, ensure_ascii=False)
-        }
+        payload = payloads.chat_messages(chat_id, count, after_cursor)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return chat_message_list(r["data"]["chatMessages"])
 
+    def iter_chat_messages(self, chat_id: str, count: int = 24,
+                           after_cursor: str | None = None,
+                           lookahead: int = 1, stop: Callable[[types.ChatMessage], bool] | None = None,
+                           limit: int | None = None) -> Generator[types.ChatMessage, None, None]:
+        """
+        Перебирает сообщения чата (от новых к старым), подгружая следующую страницу, пока обрабатывается текущая.
+
+        :param chat_id: ID чата.
+        :type chat_id: `str`
+
+        :param count: Кол-во сообщений, которые нужно получить (не более 24 за один запрос).
+        :type count: `int`
+
+        :param after_cursor: Курсор, с которого будет идти парсинг (если нету - ищет с самого начала страницы), _опционально_.
+        :type after_cursor: `str` or `None`
+
+        :param lookahead: Сколько страниц подгружать заранее (0 - без фоновой подгрузки).
+        :type lookahead: `int`
+
+        :param stop: Условие остановки: перебор заканчивается на первом объекте, для которого оно истинно, например `lambda message: message.created_at < "2025-01-01"`, _опционально_.
+        :type stop: `callable` or `None`
+
+        :param limit: Максимальное количество сообщений, _опционально_.
+        :type limit: `int` or `None`
+
+        :return: Генератор сообщений.
+        :rtype: `Generator` of `playerokapi.types.ChatMessage`
+        """
+        return iter_items(lambda cursor: self.get_chat_messages(chat_id=chat_id, count=count, after_cursor=cursor), "messages", after_cursor, lookahead, stop, limit)
+
     def mark_chat_as_read(self, chat_id: str) -> types.Chat:
         """
         Помечает чат как прочитанный (все сообщения).
@@ -701,15 +1256,7 @@ class Account:
         :rtype: `playerokapi.types.Chat`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "markChatAsRead",
-            "query": "mutation markChatAsRead($input: MarkChatAsReadInput!) {\n	markChatAsRead(input: $input) {\n		...RegularChat\n		__typename\n	}\n}\n\nfragment RegularChat on Chat {\n	id\n	type\n	unreadMessagesCounter\n	bookmarked\n	isTextingAllowed\n	owner {\n		...ChatParticipant\n		__typename\n	}\n	agent {\n		...ChatParticipant\n		__typename\n	}\n	participants {\n		...ChatParticipant\n		__typename\n	}\n	deals {\n		...ChatActiveItemDeal\n		__typename\n	}\n	status\n	startedAt\n	finishedAt\n	__typename\n}\n\nfragment ChatParticipant on UserFragment {\n	...RegularUserFragment\n	__typename\n}\n\nfragment RegularUserFragment on UserFragment {\n	id\n	username\n	role\n	avatarURL\n	isOnline\n	isBlocked\n	rating\n	testimonialCounter\n	createdAt\n	supportChatId\n	systemChatId\n	__typename\n}\n\nfragment ChatActiveItemDeal on ItemDealProfile {\n	id\n	direction\n	status\n	hasProblem\n	testimonial {\n		id\n		rating\n		__typename\n	}\n	item {\n		...ChatDealItemEdgeNode\n		__typename\n	}\n	user {\n		...RegularUserFragment\n		__typename\n	}\n	__typename\n}\n\nfragment ChatDealItemEdgeNode on ItemProfile {\n	...ChatDealMyItemEdgeNode\n	...ChatDealForeignItemEdgeNode\n	__typename\n}\n\nfragment ChatDealMyItemEdgeNode on MyItemProfile {\n	id\n	slug\n	priority\n	status\n	name\n	price\n	rawPrice\n	statusExpirationDate\n	sellerType\n	attachment {\n		...PartialFile\n		__typename\n	}\n	user {\n		...UserItemEdgeNode\n		__typename\n	}\n	approvalDate\n	createdAt\n	priorityPosition\n	feeMultiplier\n	__typename\n}\n\nfragment PartialFile on File {\n	id\n	url\n	__typename\n}\n\nfragment UserItemEdgeNode on UserFragment {\n	...UserEdgeNode\n	__typename\n}\n\nfragment UserEdgeNode on UserFragment {\n	...RegularUserFragment\n	__typename\n}\n\nfragment ChatDealForeignItemEdgeNode on ForeignItemProfile {\n	id\n	slug\n	priority\n	status\n	name\n	price\n	rawPrice\n	sellerType\n	attachment {\n		...PartialFile\n		__typename\n	}\n	user {\n		...UserItemEdgeNode\n		__typename\n	}\n	approvalDate\n	priorityPosition\n	createdAt\n	feeMultiplier\n	__typename\n}",
-            "variables": {
-                "input": {
-                    "chatId": chat_id
-                }
-            }
-        }
+        payload = payloads.mark_chat_as_read(chat_id)
         r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
         return chat(r["data"]["markChatAsRead"])
     
@@ -737,24 +1284,7 @@ class Account:
         if mark_chat_as_read:
             self.mark_chat_as_read(chat_id=chat_id)
         headers = {"accept": "*/*"}
-        if photo_file_path: query = "mutation createChatMessage($input: CreateChatMessageInput!, $file: Upload, $showForbiddenImage: Boolean) {\n  createChatMessage(input: $input, file: $file) {\n    ...RegularChatMessage\n    __typename\n  }\n}\n\nfragment RegularChatMessage on ChatMessage {\n  id\n  text\n  createdAt\n  deletedAt\n  isRead\n  isSuspicious\n  isBulkMessaging\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  file {\n    ...PartialFile\n    __typename\n  }\n  user {\n    ...ChatMessageUserFields\n    __typename\n  }\n  deal {\n    ...ChatMessageItemDeal\n    __typename\n  }\n  item {\n    ...ItemEdgeNode\n    __typename\n  }\n  transaction {\n    ...RegularTransaction\n    __typename\n  }\n  moderator {\n    ...UserEdgeNode\n    __typename\n  }\n  eventByUser {\n    ...ChatMessageUserFields\n    __typename\n  }\n  eventToUser {\n    ...ChatMessageUserFields\n    __typename\n  }\n  isAutoResponse\n  event\n  buttons {\n    ...ChatMessageButton\n    __typename\n  }\n  images {\n    ...RegularFile\n    __typename\n  }\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment ChatMessageUserFields on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment ChatMessageItemDeal on ItemDeal {\n  id\n  direction\n  status\n  statusDescription\n  hasProblem\n  user {\n    ...ChatParticipant\n    __typename\n  }\n  testimonial {\n    ...ChatMessageDealTestimonial\n    __typename\n  }\n  item {\n    id\n    name\n    price\n    slug\n    rawPrice\n    sellerType\n    user {\n      ...ChatParticipant\n      __typename\n    }\n    category {\n      id\n      __typename\n    }\n    attachments(showForbiddenImage: $showForbiddenImage) {\n      ...PartialFile\n      __typename\n    }\n    isAttachmentsForbidden\n    comment\n    dataFields {\n      ...GameCategoryDataFieldWithValue\n      __typename\n    }\n    obtainingType {\n      ...GameCategoryObtainingType\n      __typename\n    }\n    __typename\n  }\n  obtainingFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  chat {\n    id\n    type\n    __typename\n  }\n  transaction {\n    id\n    statusExpirationDate\n    __typename\n  }\n  statusExpirationDate\n  commentFromBuyer\n  __typename\n}\n\nfragment ChatParticipant on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment ChatMessageDealTestimonial on Testimonial {\n  id\n  status\n  text\n  rating\n  createdAt\n  updatedAt\n  creator {\n    ...RegularUserFragment\n    __typename\n  }\n  moderator {\n    ...RegularUserFragment\n    __typename\n  }\n  user {\n    ...RegularUserFragment\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment ItemEdgeNode on ItemProfile {\n  ...MyItemEdgeNode\n  ...ForeignItemEdgeNode\n  __typename\n}\n\nfragment MyItemEdgeNode on MyItemProfile {\n  id\n  slug\n  priority\n  status\n  name\n  price\n  rawPrice\n  statusExpirationDate\n  sellerType\n  attachment(showForbiddenImage: $showForbiddenImage) {\n    ...PartialFile\n    __typename\n  }\n  isAttachmentsForbidden\n  user {\n    ...UserItemEdgeNode\n    __typename\n  }\n  approvalDate\n  createdAt\n  priorityPosition\n  viewsCounter\n  feeMultiplier\n  __typename\n}\n\nfragment UserItemEdgeNode on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment ForeignItemEdgeNode on ForeignItemProfile {\n  id\n  slug\n  priority\n  status\n  name\n  price\n  rawPrice\n  sellerType\n  attachment(showForbiddenImage: $showForbiddenImage) {\n    ...PartialFile\n    __typename\n  }\n  isAttachmentsForbidden\n  user {\n    ...UserItemEdgeNode\n    __typename\n  }\n  approvalDate\n  priorityPosition\n  createdAt\n  viewsCounter\n  feeMultiplier\n  __typename\n}\n\nfragment RegularTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  provider {\n    ...RegularTransactionProvider\n    __typename\n  }\n  user {\n    ...RegularUserFragment\n    __typename\n  }\n  creator {\n    ...RegularUserFragment\n    __typename\n  }\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  fee\n  createdAt\n  props {\n    ...RegularTransactionProps\n    __typename\n  }\n  verifiedAt\n  verifiedBy {\n    ...UserEdgeNode\n    __typename\n  }\n  completedBy {\n    ...UserEdgeNode\n    __typename\n  }\n  paymentMethodId\n  completedAt\n  isSuspicious\n  spbBankName\n  __typename\n}\n\nfragment RegularTransactionProvider on TransactionProvider {\n  id\n  name\n  fee\n  minFeeAmount\n  description\n  account {\n    ...RegularTransactionProviderAccount\n    __typename\n  }\n  props {\n    ...TransactionProviderPropsFragment\n    __typename\n  }\n  limits {\n    ...ProviderLimits\n    __typename\n  }\n  paymentMethods {\n    ...TransactionPaymentMethod\n    __typename\n  }\n  __typename\n}\n\nfragment RegularTransactionProviderAccount on TransactionProviderAccount {\n  id\n  value\n  userId\n  __typename\n}\n\nfragment TransactionProviderPropsFragment on TransactionProviderPropsFragment {\n  requiredUserData {\n    ...TransactionProviderRequiredUserData\n    __typename\n  }\n  tooltip\n  __typename\n}\n\nfragment TransactionProviderRequiredUserData on TransactionProviderRequiredUserData {\n  email\n  phoneNumber\n  eripAccountNumber\n  __typename\n}\n\nfragment ProviderLimits on ProviderLimits {\n  incoming {\n    ...ProviderLimitRange\n    __typename\n  }\n  outgoing {\n    ...ProviderLimitRange\n    __typename\n  }\n  __typename\n}\n\nfragment ProviderLimitRange on ProviderLimitRange {\n  min\n  max\n  __typename\n}\n\nfragment TransactionPaymentMethod on TransactionPaymentMethod {\n  id\n  name\n  fee\n  providerId\n  account {\n    ...RegularTransactionProviderAccount\n    __typename\n  }\n  props {\n    ...TransactionProviderPropsFragment\n    __typename\n  }\n  limits {\n    ...ProviderLimits\n    __typename\n  }\n  __typename\n}\n\nfragment RegularTransactionProps on TransactionPropsFragment {\n  creatorId\n  dealId\n  paidFromPendingIncome\n  paymentURL\n  successURL\n  fee\n  paymentAccount {\n    id\n    value\n    __typename\n  }\n  paymentGateway\n  alreadySpent\n  exchangeRate\n  amountAfterConversionRub\n  amountAfterConversionUsdt\n  userData {\n    account\n    email\n    ipAddress\n    phoneNumber\n    __typename\n  }\n  __typename\n}\n\nfragment ChatMessageButton on ChatMessageButton {\n  type\n  url\n  text\n  __typename\n}\n\nfragment RegularFile on File {\n  id\n  url\n  filename\n  mime\n  __typename\n}"
-        elif text: query = "mutation createChatMessage($input: CreateChatMessageInput!, $file: Upload) {\n  createChatMessage(input: $input, file: $file) {\n    ...RegularChatMessage\n    __typename\n  }\n}\n\nfragment RegularChatMessage on ChatMessage {\n  id\n  text\n  createdAt\n  deletedAt\n  isRead\n  isSuspicious\n  isBulkMessaging\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  file {\n    ...PartialFile\n    __typename\n  }\n  user {\n    ...ChatMessageUserFields\n    __typename\n  }\n  deal {\n    ...ChatMessageItemDeal\n    __typename\n  }\n  item {\n    ...ItemEdgeNode\n    __typename\n  }\n  transaction {\n    ...RegularTransaction\n    __typename\n  }\n  moderator {\n    ...UserEdgeNode\n    __typename\n  }\n  eventByUser {\n    ...ChatMessageUserFields\n    __typename\n  }\n  eventToUser {\n    ...ChatMessageUserFields\n    __typename\n  }\n  isAutoResponse\n  event\n  buttons {\n    ...ChatMessageButton\n    __typename\n  }\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment ChatMessageUserFields on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment ChatMessageItemDeal on ItemDeal {\n  id\n  direction\n  status\n  statusDescription\n  hasProblem\n  user {\n    ...ChatParticipant\n    __typename\n  }\n  testimonial {\n    ...ChatMessageDealTestimonial\n    __typename\n  }\n  item {\n    id\n    name\n    price\n    slug\n    rawPrice\n    sellerType\n    user {\n      ...ChatParticipant\n      __typename\n    }\n    category {\n      id\n      __typename\n    }\n    attachments {\n      ...PartialFile\n      __typename\n    }\n    comment\n    dataFields {\n      ...GameCategoryDataFieldWithValue\n      __typename\n    }\n    obtainingType {\n      ...GameCategoryObtainingType\n      __typename\n    }\n    __typename\n  }\n  obtainingFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  chat {\n    id\n    type\n    __typename\n  }\n  transaction {\n    id\n    statusExpirationDate\n    __typename\n  }\n  statusExpirationDate\n  commentFromBuyer\n  __typename\n}\n\nfragment ChatParticipant on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment ChatMessageDealTestimonial on Testimonial {\n  id\n  status\n  text\n  rating\n  createdAt\n  updatedAt\n  creator {\n    ...RegularUserFragment\n    __typename\n  }\n  moderator {\n    ...RegularUserFragment\n    __typename\n  }\n  user {\n    ...RegularUserFragment\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment ItemEdgeNode on ItemProfile {\n  ...MyItemEdgeNode\n  ...ForeignItemEdgeNode\n  __typename\n}\n\nfragment MyItemEdgeNode on MyItemProfile {\n  id\n  slug\n  priority\n  status\n  name\n  price\n  rawPrice\n  statusExpirationDate\n  sellerType\n  attachment {\n    ...PartialFile\n    __typename\n  }\n  user {\n    ...UserItemEdgeNode\n    __typename\n  }\n  approvalDate\n  createdAt\n  priorityPosition\n  viewsCounter\n  feeMultiplier\n  __typename\n}\n\nfragment UserItemEdgeNode on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment ForeignItemEdgeNode on ForeignItemProfile {\n  id\n  slug\n  priority\n  status\n  name\n  price\n  rawPrice\n  sellerType\n  attachment {\n    ...PartialFile\n    __typename\n  }\n  user {\n    ...UserItemEdgeNode\n    __typename\n  }\n  approvalDate\n  priorityPosition\n  createdAt\n  viewsCounter\n  feeMultiplier\n  __typename\n}\n\nfragment RegularTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  provider {\n    ...RegularTransactionProvider\n    __typename\n  }\n  user {\n    ...RegularUserFragment\n    __typename\n  }\n  creator {\n    ...RegularUserFragment\n    __typename\n  }\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  fee\n  createdAt\n  props {\n    ...RegularTransactionProps\n    __typename\n  }\n  verifiedAt\n  verifiedBy {\n    ...UserEdgeNode\n    __typename\n  }\n  completedBy {\n    ...UserEdgeNode\n    __typename\n  }\n  paymentMethodId\n  completedAt\n  isSuspicious\n  __typename\n}\n\nfragment RegularTransactionProvider on TransactionProvider {\n  id\n  name\n  fee\n  minFeeAmount\n  description\n  account {\n    ...RegularTransactionProviderAccount\n    __typename\n  }\n  props {\n    ...TransactionProviderPropsFragment\n    __typename\n  }\n  limits {\n    ...ProviderLimits\n    __typename\n  }\n  paymentMethods {\n    ...TransactionPaymentMethod\n    __typename\n  }\n  __typename\n}\n\nfragment RegularTransactionProviderAccount on TransactionProviderAccount {\n  id\n  value\n  userId\n  __typename\n}\n\nfragment TransactionProviderPropsFragment on TransactionProviderPropsFragment {\n  requiredUserData {\n    ...TransactionProviderRequiredUserData\n    __typename\n  }\n  tooltip\n  __typename\n}\n\nfragment TransactionProviderRequiredUserData on TransactionProviderRequiredUserData {\n  email\n  phoneNumber\n  __typename\n}\n\nfragment ProviderLimits on ProviderLimits {\n  incoming {\n    ...ProviderLimitRange\n    __typename\n  }\n  outgoing {\n    ...ProviderLimitRange\n    __typename\n  }\n  __typename\n}\n\nfragment ProviderLimitRange on ProviderLimitRange {\n  min\n  max\n  __typename\n}\n\nfragment TransactionPaymentMethod on TransactionPaymentMethod {\n  id\n  name\n  fee\n  providerId\n  account {\n    ...RegularTransactionProviderAccount\n    __typename\n  }\n  props {\n    ...TransactionProviderPropsFragment\n    __typename\n  }\n  limits {\n    ...ProviderLimits\n    __typename\n  }\n  __typename\n}\n\nfragment RegularTransactionProps on TransactionPropsFragment {\n  creatorId\n  dealId\n  paidFromPendingIncome\n  paymentURL\n  successURL\n  fee\n  paymentAccount {\n    id\n    value\n    __typename\n  }\n  paymentGateway\n  alreadySpent\n  exchangeRate\n  amountAfterConversionRub\n  amountAfterConversionUsdt\n  __typename\n}\n\nfragment ChatMessageButton on ChatMessageButton {\n  type\n  url\n  text\n  __typename\n}"
-        operations = {
-            "operationName": "createChatMessage",
-            "query": query,
-            "variables": {
-                "input": {
-                    "chatId": chat_id
-                }
-            }
-        }
-        if photo_file_path:
-            operations["variables"]["file"] = None
-        elif text:
-            operations["variables"]["input"]["text"] = text
-        files = {"1": open(photo_file_path, "rb")} if photo_file_path else None
-        map = {"1":["variables.file"]} if photo_file_path else None
-        payload = operations if photo_file_path is None else {"operations": json.dumps(operations), "map": json.dumps(map)}
+        payload, files = payloads.create_chat_message(chat_id, text, photo_file_path)
         r = self.request("post", f"{self.base_url}/graphql", headers, payload, files).json()
         return chat_message(r["data"]["createChatMessage"])
 
@@ -793,37 +1323,8 @@ class Account:
         :return: Объект созданного предмета.
         :rtype: `playerokapi.types.Item`
         """
-        payload_attributes = {option.field: option.value for option in options}
-        payload_data_fields = [{"fieldId": field.id, "value": field.value} for field in data_fields]
         headers = {"accept": "*/*"}
-        operations = {
-            "operationName": "createItem",
-            "query": "mutation createItem($input: CreateItemInput!, $attachments: [Upload!]!) {\n  createItem(input: $input, attachments: $attachments) {\n    ...RegularItem\n    __typename\n  }\n}\n\nfragment RegularItem on Item {\n  ...RegularMyItem\n  ...RegularForeignItem\n  __typename\n}\n\nfragment RegularMyItem on MyItem {\n  ...ItemFields\n  prevPrice\n  priority\n  sequence\n  priorityPrice\n  statusExpirationDate\n  comment\n  viewsCounter\n  statusDescription\n  editable\n  statusPayment {\n    ...StatusPaymentTransaction\n    __typename\n  }\n  moderator {\n    id\n    username\n    __typename\n  }\n  approvalDate\n  deletedAt\n  createdAt\n  updatedAt\n  mayBePublished\n  prevFeeMultiplier\n  sellerNotifiedAboutFeeChange\n  __typename\n}\n\nfragment ItemFields on Item {\n  id\n  slug\n  name\n  description\n  rawPrice\n  price\n  attributes\n  status\n  priorityPosition\n  sellerType\n  feeMultiplier\n  user {\n    ...ItemUser\n    __typename\n  }\n  buyer {\n    ...ItemUser\n    __typename\n  }\n  attachments {\n    ...PartialFile\n    __typename\n  }\n  category {\n    ...RegularGameCategory\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  comment\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...GameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment ItemUser on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment RegularGameCategory on GameCategory {\n  id\n  slug\n  name\n  categoryId\n  gameId\n  obtaining\n  options {\n    ...RegularGameCategoryOption\n    __typename\n  }\n  props {\n    ...GameCategoryProps\n    __typename\n  }\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  useCustomObtaining\n  autoConfirmPeriod\n  autoModerationMode\n  agreements {\n    ...RegularGameCategoryAgreement\n    __typename\n  }\n  feeMultiplier\n  __typename\n}\n\nfragment RegularGameCategoryOption on GameCategoryOption {\n  id\n  group\n  label\n  type\n  field\n  value\n  valueRangeLimit {\n    min\n    max\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryProps on GameCategoryPropsObjectType {\n  minTestimonials\n  minTestimonialsForSeller\n  __typename\n}\n\nfragment RegularGameCategoryAgreement on GameCategoryAgreement {\n  description\n  gameCategoryId\n  gameCategoryObtainingTypeId\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment StatusPaymentTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  props {\n    paymentURL\n    __typename\n  }\n  __typename\n}\n\nfragment RegularForeignItem on ForeignItem {\n  ...ItemFields\n  __typename\n}",
-            "variables": {
-                "input": {
-                    "gameCategoryId": game_category_id,
-                    "obtainingTypeId": obtaining_type_id,
-                    "name": name,
-                    "price": int(price),
-                    "description": description,
-                    "attributes": payload_attributes,
-                    "dataFields": payload_data_fields
-                },
-                "attachments": [None] * len(attachments)
-            }
-        }
-        map = {}
-        files = {}
-        i=0
-        for att in attachments:
-            i+=1
-            map[str(i)] = [f"variables.attachments.{i-1}"]
-            files[str(i)] = open(att, "rb")
-        payload = {
-            "operations": json.dumps(operations),
-            "map": json.dumps(map)
-        }
-
+        payload, files = payloads.create_item(game_category_id, obtaining_type_id, name, price, description, options, data_fields, attachments)
         r = self.request("post", f"{self.base_url}/graphql", headers, payload, files).json()
         return item(r["data"]["createItem"])
     
@@ -862,40 +1363,34 @@ class Account:
         :return: Объект обновлённого предмета.
         :rtype: `playerokapi.types.Item`
         """
-        payload_attributes = {option.field: option.value for option in options} if options is not None else None
-        payload_data_fields = [{"fieldId": field.id, "value": field.value} for field in data_fields] if data_fields is not None else None
         headers = {"accept": "*/*"}
-        operations = {
-            "operationName": "updateItem",
-            "query": "mutation updateItem($input: UpdateItemInput!, $addedAttachments: [Upload!]) {\n  updateItem(input: $input, addedAttachments: $addedAttachments) {\n    ...RegularItem\n    __typename\n  }\n}\n\nfragment RegularItem on Item {\n  ...RegularMyItem\n  ...RegularForeignItem\n  __typename\n}\n\nfragment RegularMyItem on MyItem {\n  ...ItemFields\n  prevPrice\n  priority\n  sequence\n  priorityPrice\n  statusExpirationDate\n  comment\n  viewsCounter\n  statusDescription\n  editable\n  statusPayment {\n    ...StatusPaymentTransaction\n    __typename\n  }\n  moderator {\n    id\n    username\n    __typename\n  }\n  approvalDate\n  deletedAt\n  createdAt\n  updatedAt\n  mayBePublished\n  prevFeeMultiplier\n  sellerNotifiedAboutFeeChange\n  __typename\n}\n\nfragment ItemFields on Item {\n  id\n  slug\n  name\n  description\n  rawPrice\n  price\n  attributes\n  status\n  priorityPosition\n  sellerType\n  feeMultiplier\n  user {\n    ...ItemUser\n    __typename\n  }\n  buyer {\n    ...ItemUser\n    __typename\n  }\n  attachments {\n    ...PartialFile\n    __typename\n  }\n  category {\n    ...RegularGameCategory\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  comment\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...GameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment ItemUser on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment RegularGameCategory on GameCategory {\n  id\n  slug\n  name\n  categoryId\n  gameId\n  obtaining\n  options {\n    ...RegularGameCategoryOption\n    __typename\n  }\n  props {\n    ...GameCategoryProps\n    __typename\n  }\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  useCustomObtaining\n  autoConfirmPeriod\n  autoModerationMode\n  agreements {\n    ...RegularGameCategoryAgreement\n    __typename\n  }\n  feeMultiplier\n  __typename\n}\n\nfragment RegularGameCategoryOption on GameCategoryOption {\n  id\n  group\n  label\n  type\n  field\n  value\n  valueRangeLimit {\n    min\n    max\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryProps on GameCategoryPropsObjectType {\n  minTestimonials\n  minTestimonialsForSeller\n  __typename\n}\n\nfragment RegularGameCategoryAgreement on GameCategoryAgreement {\n  description\n  gameCategoryId\n  gameCategoryObtainingTypeId\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment StatusPaymentTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  props {\n    paymentURL\n    __typename\n  }\n  __typename\n}\n\nfragment RegularForeignItem on ForeignItem {\n  ...ItemFields\n  __typename\n}",
-            "variables": {
-                "input": {
-                    "id": id
-                },
-                "addedAttachments": [None] * len(add_attachments) if add_attachments else None
-            }
-        }
-        if name: operations["variables"]["input"]["name"] = name
-        if price: operations["variables"]["input"]["price"] = int(price)
-        if description: operations["variables"]["input"]["description"] = description
-        if options: operations["variables"]["input"]["attributes"] = payload_attributes
-        if data_fields: operations["variables"]["input"]["dataFields"] = payload_data_fields
-        if remove_attachments: operations["variables"]["input"]["removedAttachments"] = remove_attachments
-
-        map = {}
-        files = {}
-        if add_attachments:
-            i=0
-            for att in add_attachments:
-                i+=1
-                map[str(i)] = [f"variables.addedAttachments.{i-1}"]
-                files[str(i)] = open(att, "rb")
-        payload = {
-            "operations": json.dumps(operations),
-            "map": json.dumps(map)
-        }
-        r = self.request("post", f"{self.base_url}/graphql", headers, payload if files else operations, files if files else None).json()
-        return item(r["data"]["updateItem"])
+        payload, files = payloads.update_item(id, name, price, description, options, data_fields, remove_attachments, add_attachments)
+        r = self.request("post", f"{self.base_url}/graphql", headers, payload, files).json()
+        _item = item(r["data"]["updateItem"])
+        if price and _item is not None:
+            self.repricer.set_price(_item.id, _item.price)
+        return _item
+
+    def reprice_items(self, prices: dict[str, int] | Iterable[tuple[str, int]], force: bool = False,
+                      max_workers: int | None = None) -> RepriceReport:
+        """
+        Массово изменяет цены предметов аккаунта.\n
+        Запросы отправляются параллельно и запрашивают в ответе только цену предмета,
+        а предметы, цена которых уже совпадает с известной (см. `repricer`), пропускаются.
+
+        :param prices: Новые цены: {ID предмета: цена} или пары (ID предмета, цена).
+        :type prices: `dict[str, int]` or `list[tuple[str, int]]`
+
+        :param force: Отправлять запросы даже для предметов, цена которых уже совпадает.
+        :type force: `bool`
+
+        :param max_workers: Максимальное количество одновременных запросов (по умолчанию - `repricer.max_workers`), _опционально_.
+        :type max_workers: `int` or `None`
+
+        :return: Отчёт с результатами по каждому предмету и скоростью изменения цен.
+        :rtype: `playerokapi.repricing.RepriceReport`
+        """
+        return self.repricer.reprice(prices, force, max_workers)
 
     def remove_item(self, id: str) -> bool:
         """
@@ -905,13 +1400,7 @@ class Account:
         :type id: `str`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "removeItem",
-            "query": "mutation removeItem($id: UUID!) {\n  removeItem(id: $id) {\n    ...RegularItem\n    __typename\n  }\n}\n\nfragment RegularItem on Item {\n  ...RegularMyItem\n  ...RegularForeignItem\n  __typename\n}\n\nfragment RegularMyItem on MyItem {\n  ...ItemFields\n  prevPrice\n  priority\n  sequence\n  priorityPrice\n  statusExpirationDate\n  comment\n  viewsCounter\n  statusDescription\n  editable\n  statusPayment {\n    ...StatusPaymentTransaction\n    __typename\n  }\n  moderator {\n    id\n    username\n    __typename\n  }\n  approvalDate\n  deletedAt\n  createdAt\n  updatedAt\n  mayBePublished\n  prevFeeMultiplier\n  sellerNotifiedAboutFeeChange\n  __typename\n}\n\nfragment ItemFields on Item {\n  id\n  slug\n  name\n  description\n  rawPrice\n  price\n  attributes\n  status\n  priorityPosition\n  sellerType\n  feeMultiplier\n  user {\n    ...ItemUser\n    __typename\n  }\n  buyer {\n    ...ItemUser\n    __typename\n  }\n  attachments {\n    ...PartialFile\n    __typename\n  }\n  category {\n    ...RegularGameCategory\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  comment\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...GameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment ItemUser on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment RegularGameCategory on GameCategory {\n  id\n  slug\n  name\n  categoryId\n  gameId\n  obtaining\n  options {\n    ...RegularGameCategoryOption\n    __typename\n  }\n  props {\n    ...GameCategoryProps\n    __typename\n  }\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  useCustomObtaining\n  autoConfirmPeriod\n  autoModerationMode\n  agreements {\n    ...RegularGameCategoryAgreement\n    __typename\n  }\n  feeMultiplier\n  __typename\n}\n\nfragment RegularGameCategoryOption on GameCategoryOption {\n  id\n  group\n  label\n  type\n  field\n  value\n  valueRangeLimit {\n    min\n    max\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryProps on GameCategoryPropsObjectType {\n  minTestimonials\n  minTestimonialsForSeller\n  __typename\n}\n\nfragment RegularGameCategoryAgreement on GameCategoryAgreement {\n  description\n  gameCategoryId\n  gameCategoryObtainingTypeId\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment StatusPaymentTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  props {\n    paymentURL\n    __typename\n  }\n  __typename\n}\n\nfragment RegularForeignItem on ForeignItem {\n  ...ItemFields\n  __typename\n}",
-            "variables": {
-                "id": id,
-            }
-        }
+        payload = payloads.remove_item(id)
         self.request("post", f"{self.base_url}/graphql", headers, payload)
         return True
     
@@ -933,17 +1422,7 @@ class Account:
         :rtype: `playerokapi.types.Item`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "publishItem",
-            "query": "mutation publishItem($input: PublishItemInput!) {\n  publishItem(input: $input) {\n    ...RegularItem\n    __typename\n  }\n}\n\nfragment RegularItem on Item {\n  ...RegularMyItem\n  ...RegularForeignItem\n  __typename\n}\n\nfragment RegularMyItem on MyItem {\n  ...ItemFields\n  prevPrice\n  priority\n  sequence\n  priorityPrice\n  statusExpirationDate\n  comment\n  viewsCounter\n  statusDescription\n  editable\n  statusPayment {\n    ...StatusPaymentTransaction\n    __typename\n  }\n  moderator {\n    id\n    username\n    __typename\n  }\n  approvalDate\n  deletedAt\n  createdAt\n  updatedAt\n  mayBePublished\n  prevFeeMultiplier\n  sellerNotifiedAboutFeeChange\n  __typename\n}\n\nfragment ItemFields on Item {\n  id\n  slug\n  name\n  description\n  rawPrice\n  price\n  attributes\n  status\n  priorityPosition\n  sellerType\n  feeMultiplier\n  user {\n    ...ItemUser\n    __typename\n  }\n  buyer {\n    ...ItemUser\n    __typename\n  }\n  attachments {\n    ...PartialFile\n    __typename\n  }\n  category {\n    ...RegularGameCategory\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  comment\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...GameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment ItemUser on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment RegularGameCategory on GameCategory {\n  id\n  slug\n  name\n  categoryId\n  gameId\n  obtaining\n  options {\n    ...RegularGameCategoryOption\n    __typename\n  }\n  props {\n    ...GameCategoryProps\n    __typename\n  }\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  useCustomObtaining\n  autoConfirmPeriod\n  autoModerationMode\n  agreements {\n    ...RegularGameCategoryAgreement\n    __typename\n  }\n  feeMultiplier\n  __typename\n}\n\nfragment RegularGameCategoryOption on GameCategoryOption {\n  id\n  group\n  label\n  type\n  field\n  value\n  valueRangeLimit {\n    min\n    max\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryProps on GameCategoryPropsObjectType {\n  minTestimonials\n  minTestimonialsForSeller\n  __typename\n}\n\nfragment RegularGameCategoryAgreement on GameCategoryAgreement {\n  description\n  gameCategoryId\n  gameCategoryObtainingTypeId\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment StatusPaymentTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  props {\n    paymentURL\n    __typename\n  }\n  __typename\n}\n\nfragment RegularForeignItem on ForeignItem {\n  ...ItemFields\n  __typename\n}",
-            "variables": {
-                "input": {
-                    "transactionProviderId": transaction_provider_id.name,
-                    "priorityStatuses": [priority_status_id],
-                    "itemId": item_id
-                }
-            }
-        }
+        payload = payloads.publish_item(item_id, priority_status_id, transaction_provider_id)
         r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
         return item(r["data"]["publishItem"])
 
@@ -972,15 +1451,47 @@ class Account:
         :rtype: `playerokapi.types.ItemProfileList`
         """
         headers = {"accept": "*/*"}
-        filter = {"gameId": game_id, "status": [status.name] if status else None} if not category_id else {"gameCategoryId": category_id, "status": [status.name] if status else None}
-        payload = {
-            "operationName": "items",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": filter}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("items")}}, ensure_ascii=False)
-        }
+        payload = payloads.items(game_id, category_id, count, status, after_cursor)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return item_profile_list(r["data"]["items"])
 
+    def iter_items(self, game_id: str | None = None, category_id: str | None = None, count: int = 24,
+                   status: ItemStatuses = ItemStatuses.APPROVED, after_cursor: str | None = None,
+                   lookahead: int = 1, stop: Callable[[types.ItemProfile], bool] | None = None,
+                   limit: int | None = None) -> Generator[types.ItemProfile, None, None]:
+        """
+        Перебирает предметы игры/приложения, подгружая следующую страницу, пока обрабатывается текущая.\n
+        Можно получить по любому из двух параметров: `game_id`, `category_id`.
+
+        :param game_id: ID игры/приложения, _опционально_.
+        :type game_id: `str` or `None`
+
+        :param category_id: ID категории игры/приложения, _опционально_.
+        :type category_id: `str` or `None`
+
+        :param count: Кол-во предеметов, которые нужно получить (не более 24 за один запрос).
+        :type count: `int`
+
+        :param status: Тип предметов, которые нужно получать: активные или проданные. По умолчанию активные.
+        :type status: `playerokapi.enums.ItemStatuses`
+
+        :param after_cursor: Курсор, с которого будет идти парсинг (если нету - ищет с самого начала страницы), _опционально_.
+        :type after_cursor: `str` or `None`
+
+        :param lookahead: Сколько страниц подгружать заранее (0 - без фоновой подгрузки).
+        :type lookahead: `int`
+
+        :param stop: Условие остановки: перебор заканчивается на первом объекте, для которого оно истинно, _опционально_.
+        :type stop: `callable` or `None`
+
+        :param limit: Максимальное количество предметов, _опционально_.
+        :type limit: `int` or `None`
+
+        :return: Генератор предметов.
+        :rtype: `Generator` of `playerokapi.types.ItemProfile`
+        """
+        return iter_items(lambda cursor: self.get_items(game_id=game_id, category_id=category_id, count=count, status=status, after_cursor=cursor), "items", after_cursor, lookahead, stop, limit)
+
     def get_item(self, id: str | None = None, slug: str | None = None) -> types.MyItem | types.Item | types.ItemProfile:
         """
         Получает предмет (товар).\n
@@ -996,11 +1507,7 @@ class Account:
         :rtype: `playerokapi.types.MyItem` or `playerokapi.types.Item` or `playerokapi.types.ItemProfile`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "item",
-            "variables": json.dumps({"id": id, "slug": slug, "hasSupportAccess": False, "showForbiddenImage": True}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("item")}}, ensure_ascii=False)
-        }
+        payload = payloads.item(id, slug)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         data: dict = r["data"]["item"]
         if data["__typename"] == "MyItem": _item = my_item(data)
@@ -1009,6 +1516,22 @@ class Account:
         else: _item = None
         return _item
 
+    def get_items_by_ids(self, item_ids: Iterable[str], max_workers: int = 8) -> list[types.MyItem | types.Item | types.ItemProfile | Exception]:
+        """
+        Получает предметы по списку ID, отправляя запросы параллельно (не более `max_workers` одновременно).\n
+        Ошибка получения одного объекта не прерывает остальные - на его месте в результате будет исключение.
+
+        :param item_ids: ID предметов.
+        :type item_ids: `list[str]`
+
+        :param max_workers: Максимальное количество одновременных запросов.
+        :type max_workers: `int`
+
+        :return: Предметы в том же порядке, что и ID (или исключения для ID, которые не удалось получить).
+        :rtype: `list` of `playerokapi.types.MyItem` _or_ `playerokapi.types.Item` _or_ `playerokapi.types.ItemProfile` _or_ `Exception`
+        """
+        return self._fetch_many(lambda id: self.get_item(id), item_ids, max_workers)
+
     def get_item_priority_statuses(self, item_id: str, item_price: str) -> list[types.ItemPriorityStatus]:
         """
         Получает статусы приоритетов для предмета.
@@ -1023,11 +1546,7 @@ class Account:
         :rtype: `list[playerokapi.types.ItemPriorityStatus]`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "itemPriorityStatuses",
-            "variables": json.dumps({"itemId": item_id, "price": int(item_price)}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("item_priority_statuses")}}, ensure_ascii=False)
-        }
+        payload = payloads.item_priority_statuses(item_id, item_price)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return [item_priority_status(status) for status in r["data"]["itemPriorityStatuses"]]
 
@@ -1052,20 +1571,7 @@ class Account:
         :rtype: `playerokapi.types.Item`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "increaseItemPriorityStatus",
-            "query": "mutation increaseItemPriorityStatus($input: PublishItemInput!) {\n  increaseItemPriorityStatus(input: $input) {\n    ...RegularItem\n    __typename\n  }\n}\n\nfragment RegularItem on Item {\n  ...RegularMyItem\n  ...RegularForeignItem\n  __typename\n}\n\nfragment RegularMyItem on MyItem {\n  ...ItemFields\n  prevPrice\n  priority\n  sequence\n  priorityPrice\n  statusExpirationDate\n  comment\n  viewsCounter\n  statusDescription\n  editable\n  statusPayment {\n    ...StatusPaymentTransaction\n    __typename\n  }\n  moderator {\n    id\n    username\n    __typename\n  }\n  approvalDate\n  deletedAt\n  createdAt\n  updatedAt\n  mayBePublished\n  prevFeeMultiplier\n  sellerNotifiedAboutFeeChange\n  __typename\n}\n\nfragment ItemFields on Item {\n  id\n  slug\n  name\n  description\n  rawPrice\n  price\n  attributes\n  status\n  priorityPosition\n  sellerType\n  feeMultiplier\n  user {\n    ...ItemUser\n    __typename\n  }\n  buyer {\n    ...ItemUser\n    __typename\n  }\n  attachments {\n    ...PartialFile\n    __typename\n  }\n  category {\n    ...RegularGameCategory\n    __typename\n  }\n  game {\n    ...RegularGameProfile\n    __typename\n  }\n  comment\n  dataFields {\n    ...GameCategoryDataFieldWithValue\n    __typename\n  }\n  obtainingType {\n    ...GameCategoryObtainingType\n    __typename\n  }\n  __typename\n}\n\nfragment ItemUser on UserFragment {\n  ...UserEdgeNode\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment PartialFile on File {\n  id\n  url\n  __typename\n}\n\nfragment RegularGameCategory on GameCategory {\n  id\n  slug\n  name\n  categoryId\n  gameId\n  obtaining\n  options {\n    ...RegularGameCategoryOption\n    __typename\n  }\n  props {\n    ...GameCategoryProps\n    __typename\n  }\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  useCustomObtaining\n  autoConfirmPeriod\n  autoModerationMode\n  agreements {\n    ...RegularGameCategoryAgreement\n    __typename\n  }\n  feeMultiplier\n  __typename\n}\n\nfragment RegularGameCategoryOption on GameCategoryOption {\n  id\n  group\n  label\n  type\n  field\n  value\n  valueRangeLimit {\n    min\n    max\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryProps on GameCategoryPropsObjectType {\n  minTestimonials\n  minTestimonialsForSeller\n  __typename\n}\n\nfragment RegularGameCategoryAgreement on GameCategoryAgreement {\n  description\n  gameCategoryId\n  gameCategoryObtainingTypeId\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment RegularGameProfile on GameProfile {\n  id\n  name\n  type\n  slug\n  logo {\n    ...PartialFile\n    __typename\n  }\n  __typename\n}\n\nfragment GameCategoryDataFieldWithValue on GameCategoryDataFieldWithValue {\n  id\n  label\n  type\n  inputType\n  copyable\n  hidden\n  required\n  value\n  __typename\n}\n\nfragment GameCategoryObtainingType on GameCategoryObtainingType {\n  id\n  name\n  description\n  gameCategoryId\n  noCommentFromBuyer\n  instructionForBuyer\n  instructionForSeller\n  sequence\n  feeMultiplier\n  agreements {\n    ...MinimalGameCategoryAgreement\n    __typename\n  }\n  props {\n    minTestimonialsForSeller\n    __typename\n  }\n  __typename\n}\n\nfragment MinimalGameCategoryAgreement on GameCategoryAgreement {\n  description\n  iconType\n  id\n  sequence\n  __typename\n}\n\nfragment StatusPaymentTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  props {\n    paymentURL\n    __typename\n  }\n  __typename\n}\n\nfragment RegularForeignItem on ForeignItem {\n  ...ItemFields\n  __typename\n}",
-            "variables": {
-                "input": {
-                    "itemId": item_id,
-                    "priorityStatuses": [priority_status_id],
-                    "transactionProviderData": {
-                        "paymentMethodId": payment_method_id.name if payment_method_id else None
-                    },
-                    "transactionProviderId": transaction_provider_id.name
-                }
-            }
-        }
+        payload = payloads.increase_item_priority_status(item_id, priority_status_id, payment_method_id, transaction_provider_id)
         r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
         return item(r["data"]["increaseItemPriorityStatus"])
 
@@ -1080,11 +1586,7 @@ class Account:
         :rtype: `list` of `playerokapi.types.TransactionProvider`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "transactionProviders",
-            "variables": json.dumps({"filter": {"direction": direction.name if direction else None}}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("transaction_providers")}}, ensure_ascii=False)
-        }
+        payload = payloads.transaction_providers(direction)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return [transaction_provider(provider) for provider in r["data"]["transactionProviders"]]
 
@@ -1119,22 +1621,53 @@ class Account:
         :rtype: `playerokapi.types.TransactionList`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "transactions",
-            "variables": {"pagination": {"first": count, "after": after_cursor}, "filter": {"userId": self.id}, "hasSupportAccess": False},
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("transactions")}}, ensure_ascii=False)
-        }
-        if operation: payload["variables"]["filter"]["operation"] = [operation.name]
-        if min_value or max_value:
-            payload["variables"]["filter"]["value"] = {}
-            if min_value: payload["variables"]["filter"]["value"]["min"] = str(min_value)
-            if max_value: payload["variables"]["filter"]["value"]["max"] = str(max_value)
-        if provider_id: payload["variables"]["filter"]["providerId"] = [provider_id.name]
-        if status: payload["variables"]["filter"]["status"] = [status.name]
-        payload["variables"] = json.dumps(payload["variables"], ensure_ascii=False),
+        payload = payloads.transactions(self.id, count, operation, min_value, max_value, provider_id, status, after_cursor)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return transaction_list(r["data"]["transactions"])
     
+    def iter_transactions(self, count: int = 24, operation: TransactionOperations | None = None, min_value: int | None = None,
+                          max_value: int | None = None, provider_id: TransactionProviderIds | None = None, status: TransactionStatuses | None = None,
+                          after_cursor: str | None = None,
+                          lookahead: int = 1, stop: Callable[[types.Transaction], bool] | None = None,
+                          limit: int | None = None) -> Generator[types.Transaction, None, None]:
+        """
+        Перебирает все транзакции аккаунта, подгружая следующую страницу, пока обрабатывается текущая.
+
+        :param count: Кол-во транзакциий которые нужно получить (не более 24 за один запрос).
+        :type count: `int`
+
+        :param operation: Операция транзакции, _опционально_.
+        :type operation: `playerokapi.enums.TransactionOperations` or `None`
+
+        :param min_value: Минимальная сумма транзакции, _опционально_.
+        :type min_value: `int` or `None`
+
+        :param max_value: Максимальная сумма транзакции, _опционально_.
+        :type max_value: `int` or `None`
+
+        :param provider_id: ID провайдера транзакции, _опционально_.
+        :type provider_id: `playerokapi.enums.TransactionProviderIds` or `None`
+
+        :param status: Статус транзакции, _опционально_.
+        :type status: `playerokapi.enums.TransactionStatuses` or `None`
+
+        :param after_cursor: Курсор, с которого будет идти парсинг (если нету - ищет с самого начала страницы), _опционально_.
+        :type after_cursor: `str` or `None`
+
+        :param lookahead: Сколько страниц подгружать заранее (0 - без фоновой подгрузки).
+        :type lookahead: `int`
+
+        :param stop: Условие остановки: перебор заканчивается на первом объекте, для которого оно истинно, _опционально_.
+        :type stop: `callable` or `None`
+
+        :param limit: Максимальное количество транзакций, _опционально_.
+        :type limit: `int` or `None`
+
+        :return: Генератор транзакций.
+        :rtype: `Generator` of `playerokapi.types.Transaction`
+        """
+        return iter_items(lambda cursor: self.get_transactions(count=count, operation=operation, min_value=min_value, max_value=max_value, provider_id=provider_id, status=status, after_cursor=cursor), "transactions", after_cursor, lookahead, stop, limit)
+
     def get_sbp_bank_members(self) -> list[SBPBankMember]:
         """
         Получает всех членов банка СБП.
@@ -1143,11 +1676,7 @@ class Account:
         :rtype: `list` of `playerokapi.types.SBPBankMember`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "SbpBankMembers",
-            "variables": json.dumps({}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("sbp_bank_members")}}, ensure_ascii=False)
-        }
+        payload = payloads.sbp_bank_members()
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return [sbp_bank_member(member) for member in r["data"]["sbpBankMembers"]]
     
@@ -1169,14 +1698,40 @@ class Account:
         :rtype: `playerokapi.types.UserBankCardList`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "verifiedCards",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "sort": {"direction": direction.name}, "field": "createdAt"}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get("verified_cards")}}, ensure_ascii=False)
-        }
+        payload = payloads.verified_cards(count, after_cursor, direction)
         r = self.request("get", f"{self.base_url}/graphql", headers, payload).json()
         return user_bank_card_list(r["data"]["verifiedCards"])
     
+    def iter_verified_cards(self, count: int = 24, after_cursor: str | None = None,
+                            direction: SortDirections = SortDirections.ASC,
+                            lookahead: int = 1, stop: Callable[[types.UserBankCard], bool] | None = None,
+                            limit: int | None = None) -> Generator[types.UserBankCard, None, None]:
+        """
+        Перебирает верифицированные карты аккаунта, подгружая следующую страницу, пока обрабатывается текущая.
+
+        :param count: Кол-во банковских карт, которые нужно получить (не более 24 за один запрос).
+        :type count: `int`
+
+        :param after_cursor: Курсор, с которого будет идти парсинг (если нету - ищет с самого начала страницы), _опционально_.
+        :type after_cursor: `str` or `None`
+
+        :param direction: Тип сортировки банковских карт.
+        :type direction: `playerokapi.enums.SortDirections`
+
+        :param lookahead: Сколько страниц подгружать заранее (0 - без фоновой подгрузки).
+        :type lookahead: `int`
+
+        :param stop: Условие остановки: перебор заканчивается на первом объекте, для которого оно истинно, _опционально_.
+        :type stop: `callable` or `None`
+
+        :param limit: Максимальное количество банковских карт, _опционально_.
+        :type limit: `int` or `None`
+
+        :return: Генератор банковских карт.
+        :rtype: `Generator` of `playerokapi.types.UserBankCard`
+        """
+        return iter_items(lambda cursor: self.get_verified_cards(count=count, after_cursor=cursor, direction=direction), "bank_cards", after_cursor, lookahead, stop, limit)
+
     def delete_card(self, card_id: str) -> bool:
         """
         Удаляет карту из сохранённых в аккаунте.
@@ -1188,15 +1743,7 @@ class Account:
         :rtype: `bool`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "deleteCard",
-            "query": "mutation deleteCard($input: DeleteCardInput!) {\n  deleteCard(input: $input)\n}",
-            "variables": {
-                "input": {
-                    "cardId": card_id
-                }
-            }
-        }
+        payload = payloads.delete_card(card_id)
         r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
         return r["data"]["deleteCard"]
     
@@ -1225,21 +1772,7 @@ class Account:
         :rtype: `playerokapi.types.Transaction`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "requestWithdrawal",
-            "query": "mutation requestWithdrawal($input: CreateWithdrawalTransactionInput!) {\n  requestWithdrawal(input: $input) {\n    ...RegularTransaction\n    __typename\n  }\n}\n\nfragment RegularTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  provider {\n    ...RegularTransactionProvider\n    __typename\n  }\n  user {\n    ...RegularUserFragment\n    __typename\n  }\n  creator {\n    ...RegularUserFragment\n    __typename\n  }\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  fee\n  createdAt\n  props {\n    ...RegularTransactionProps\n    __typename\n  }\n  verifiedAt\n  verifiedBy {\n    ...UserEdgeNode\n    __typename\n  }\n  completedBy {\n    ...UserEdgeNode\n    __typename\n  }\n  paymentMethodId\n  completedAt\n  isSuspicious\n  spbBankName\n  __typename\n}\n\nfragment RegularTransactionProvider on TransactionProvider {\n  id\n  name\n  fee\n  minFeeAmount\n  description\n  account {\n    ...RegularTransactionProviderAccount\n    __typename\n  }\n  props {\n    ...TransactionProviderPropsFragment\n    __typename\n  }\n  limits {\n    ...ProviderLimits\n    __typename\n  }\n  paymentMethods {\n    ...TransactionPaymentMethod\n    __typename\n  }\n  __typename\n}\n\nfragment RegularTransactionProviderAccount on TransactionProviderAccount {\n  id\n  value\n  userId\n  providerId\n  paymentMethodId\n  __typename\n}\n\nfragment TransactionProviderPropsFragment on TransactionProviderPropsFragment {\n  requiredUserData {\n    ...TransactionProviderRequiredUserData\n    __typename\n  }\n  tooltip\n  __typename\n}\n\nfragment TransactionProviderRequiredUserData on TransactionProviderRequiredUserData {\n  email\n  phoneNumber\n  eripAccountNumber\n  __typename\n}\n\nfragment ProviderLimits on ProviderLimits {\n  incoming {\n    ...ProviderLimitRange\n    __typename\n  }\n  outgoing {\n    ...ProviderLimitRange\n    __typename\n  }\n  __typename\n}\n\nfragment ProviderLimitRange on ProviderLimitRange {\n  min\n  max\n  __typename\n}\n\nfragment TransactionPaymentMethod on TransactionPaymentMethod {\n  id\n  name\n  fee\n  providerId\n  account {\n    ...RegularTransactionProviderAccount\n    __typename\n  }\n  props {\n    ...TransactionProviderPropsFragment\n    __typename\n  }\n  limits {\n    ...ProviderLimits\n    __typename\n  }\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment RegularTransactionProps on TransactionPropsFragment {\n  creatorId\n  dealId\n  paidFromPendingIncome\n  paymentURL\n  successURL\n  fee\n  paymentAccount {\n    id\n    value\n    __typename\n  }\n  paymentGateway\n  alreadySpent\n  exchangeRate\n  amountAfterConversionRub\n  amountAfterConversionUsdt\n  userData {\n    account\n    email\n    ipAddress\n    phoneNumber\n    __typename\n  }\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}",
-            "variables": {
-                "input": {
-                    "provider": provider.name,
-                    "account": account,
-                    "value": value,
-                    "providerData": {
-                        "paymentMethodId": payment_method_id.name if payment_method_id else None,
-                        "sbpBankMemberId": sbp_bank_member_id if sbp_bank_member_id else None
-                    }
-                }
-            }
-        }
+        payload = payloads.request_withdrawal(provider, account, value, payment_method_id, sbp_bank_member_id)
         r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
         return transaction(r["data"]["requestWithdrawal"])
     
@@ -1254,12 +1787,6 @@ class Account:
         :rtype: `playerokapi.types.Transaction`
         """
         headers = {"accept": "*/*"}
-        payload = {
-            "operationName": "removeTransaction",
-            "query": "mutation removeTransaction($id: UUID!) {\n  removeTransaction(id: $id) {\n    ...RegularTransaction\n    __typename\n  }\n}\n\nfragment RegularTransaction on Transaction {\n  id\n  operation\n  direction\n  providerId\n  provider {\n    ...RegularTransactionProvider\n    __typename\n  }\n  user {\n    ...RegularUserFragment\n    __typename\n  }\n  creator {\n    ...RegularUserFragment\n    __typename\n  }\n  status\n  statusDescription\n  statusExpirationDate\n  value\n  fee\n  createdAt\n  props {\n    ...RegularTransactionProps\n    __typename\n  }\n  verifiedAt\n  verifiedBy {\n    ...UserEdgeNode\n    __typename\n  }\n  completedBy {\n    ...UserEdgeNode\n    __typename\n  }\n  paymentMethodId\n  completedAt\n  isSuspicious\n  spbBankName\n  __typename\n}\n\nfragment RegularTransactionProvider on TransactionProvider {\n  id\n  name\n  fee\n  minFeeAmount\n  description\n  account {\n    ...RegularTransactionProviderAccount\n    __typename\n  }\n  props {\n    ...TransactionProviderPropsFragment\n    __typename\n  }\n  limits {\n    ...ProviderLimits\n    __typename\n  }\n  paymentMethods {\n    ...TransactionPaymentMethod\n    __typename\n  }\n  __typename\n}\n\nfragment RegularTransactionProviderAccount on TransactionProviderAccount {\n  id\n  value\n  userId\n  providerId\n  paymentMethodId\n  __typename\n}\n\nfragment TransactionProviderPropsFragment on TransactionProviderPropsFragment {\n  requiredUserData {\n    ...TransactionProviderRequiredUserData\n    __typename\n  }\n  tooltip\n  __typename\n}\n\nfragment TransactionProviderRequiredUserData on TransactionProviderRequiredUserData {\n  email\n  phoneNumber\n  eripAccountNumber\n  __typename\n}\n\nfragment ProviderLimits on ProviderLimits {\n  incoming {\n    ...ProviderLimitRange\n    __typename\n  }\n  outgoing {\n    ...ProviderLimitRange\n    __typename\n  }\n  __typename\n}\n\nfragment ProviderLimitRange on ProviderLimitRange {\n  min\n  max\n  __typename\n}\n\nfragment TransactionPaymentMethod on TransactionPaymentMethod {\n  id\n  name\n  fee\n  providerId\n  account {\n    ...RegularTransactionProviderAccount\n    __typename\n  }\n  props {\n    ...TransactionProviderPropsFragment\n    __typename\n  }\n  limits {\n    ...ProviderLimits\n    __typename\n  }\n  __typename\n}\n\nfragment RegularUserFragment on UserFragment {\n  id\n  username\n  role\n  avatarURL\n  isOnline\n  isBlocked\n  rating\n  testimonialCounter\n  createdAt\n  supportChatId\n  systemChatId\n  __typename\n}\n\nfragment RegularTransactionProps on TransactionPropsFragment {\n  creatorId\n  dealId\n  paidFromPendingIncome\n  paymentURL\n  successURL\n  fee\n  paymentAccount {\n    id\n    value\n    __typename\n  }\n  paymentGateway\n  alreadySpent\n  exchangeRate\n  amountAfterConversionRub\n  amountAfterConversionUsdt\n  userData {\n    account\n    email\n    ipAddress\n    phoneNumber\n    __typename\n  }\n  __typename\n}\n\nfragment UserEdgeNode on UserFragment {\n  ...RegularUserFragment\n  __typename\n}",
-            "variables": {
-                "id": transaction_id
-            }
-        }
+        payload = payloads.remove_transaction(transaction_id)
         r = self.request("post", f"{self.base_url}/graphql", headers, payload).json()
         return transaction(r["data"]["removeTransaction"])
\ No newline at end of file
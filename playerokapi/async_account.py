@@ -0,0 +1,662 @@
+from __future__ import annotations
+from typing import *
+from logging import getLogger
+from typing import Literal
+import asyncio
+import time
+
+import tls_requests
+from curl_cffi import AsyncSession
+
+from . import types
+from . import payloads
+from . import json_backend
+from .account import Account
+from .batch import AsyncBatch
+from .pagination import aiter_items
+from .repricing import AsyncRepricer, RepriceReport
+from .exceptions import *
+from .parser import *
+from .enums import *
+
+
+class _FlightAbandoned(Exception):
+    """ Ведущий запрос single-flight был отменён, не получив ответа. """
+
+
+class AsyncAccount(Account):
+    """
+    Асинхронный клиент Playerok аккаунта на `asyncio`.\n
+    Повторяет все методы `playerokapi.account.Account`, но каждый из них - корутина,
+    поэтому один event loop может держать в полёте сразу много запросов.
+    Payload'ы собираются теми же функциями из `playerokapi.payloads`,
+    а ответы разбираются тем же модулем `playerokapi.parser`.
+
+    Параметры такие же, как у `playerokapi.account.Account`.
+    """
+
+    __tls_requests: tls_requests.AsyncClient | None = None
+    __proxy_tls_requests: dict[str, tls_requests.AsyncClient] | None = None # {прокси: клиент} для загрузки файлов через прокси пула
+    __curl_session: AsyncSession | None = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.__logger = getLogger("playerokapi")
+        self.__flights: dict[tuple, asyncio.Future] = {}
+        self.__retired: list[Callable[[], Awaitable[Any]]] = [] # закрытия замененных, но ещё не закрытых сессий
+        self.__retire_tasks: set[asyncio.Task] = set()
+        self.repricer = AsyncRepricer(self)
+        """ Массовое изменение цен предметов (см. `reprice_items`). """
+
+    def _refresh_tls_client(self):
+        old, self.__tls_requests = self.__tls_requests, tls_requests.AsyncClient(
+            proxy=self._proxy_string
+        )
+        old_proxy_clients, self.__proxy_tls_requests = self.__proxy_tls_requests or {}, {}
+        for client in ([old] if old is not None else []) + list(old_proxy_clients.values()):
+            self._retire(client.aclose)
+
+    def _tls_client(self, proxy: str | None) -> tls_requests.AsyncClient:
+        if proxy is None or proxy == self._proxy_string:
+            return self.__tls_requests
+        client = self.__proxy_tls_requests.get(proxy)
+        if client is None:
+            client = self.__proxy_tls_requests[proxy] = tls_requests.AsyncClient(proxy=proxy)
+        return client
+
+    def _refresh_curl_session(self):
+        old, self.__curl_session = self.__curl_session, AsyncSession(
+            impersonate=self.impersonate,
+            timeout=10,
+            proxy=self._proxy_string,
+            verify=self._tmp_cert_path
+        )
+        if old is not None:
+            self._retire(old.close)
+
+    def _retire(self, close: Callable[[], Awaitable[Any]]):
+        # замененный клиент может ещё обслуживать запросы других задач, поэтому он закрывается
+        # через таймаут запроса (или раньше - в `close`)
+        self.__retired.append(close)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return # без event loop'а клиент закроется в `close`
+        task = loop.create_task(self._close_retired(close, self.requests_timeout))
+        self.__retire_tasks.add(task)
+        task.add_done_callback(self.__retire_tasks.discard)
+
+    async def _close_retired(self, close: Callable[[], Awaitable[Any]], delay: float = 0):
+        if delay:
+            await asyncio.sleep(delay)
+        if close not in self.__retired:
+            return
+        self.__retired.remove(close)
+        try:
+            await close()
+        except Exception as e:
+            self.__logger.debug(f"Ошибка при закрытии старой HTTP-сессии: {e}")
+
+    async def close(self):
+        """
+        Закрывает HTTP-сессии аккаунта (в том числе замененные, которые ещё не закрыты).
+        """
+        for task in list(self.__retire_tasks):
+            task.cancel()
+        for close in list(self.__retired):
+            await self._close_retired(close)
+        proxy_clients, self.__proxy_tls_requests = self.__proxy_tls_requests, {}
+        await self.__curl_session.close()
+        await self.__tls_requests.aclose()
+        for client in proxy_clients.values():
+            await client.aclose()
+
+    async def __aenter__(self) -> AsyncAccount:
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def request(self, method: Literal["get", "post"], url: str, headers: dict[str, str],
+                      payload: dict[str, str] | None = None, files: dict | None = None) -> requests.Response:
+        """
+        Асинхронно отправляет запрос на сервер playerok.com.\n
+        Параметры и поведение такие же, как у `playerokapi.account.Account.request`.
+
+        :return: Ответа запроса.
+        :rtype: `curl_cffi.requests.Response`
+        """
+        self._make_current()
+        self._use_parse_context()
+        key = self._single_flight_key(method, url, payload, files)
+        if key is None:
+            return await self._request(method, url, headers, payload, files)
+
+        while (flight := self.__flights.get(key)) is not None:
+            try:
+                return await asyncio.shield(flight)
+            except _FlightAbandoned:
+                continue # ведущий запрос отменён - один из ожидающих отправит его заново
+        flight = self.__flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            resp = await self._request(method, url, headers, payload, files)
+        except BaseException as e:
+            if not flight.done():
+                # отмена касается только отменённой задачи, а не всех, кто ждёт тот же ответ
+                flight.set_exception(_FlightAbandoned() if isinstance(e, asyncio.CancelledError) else e)
+                flight.exception() # ошибка передаётся ожидающим, а не в лог loop'а
+            raise
+        else:
+            flight.set_result(resp)
+        finally:
+            del self.__flights[key]
+        return resp
+
+    async def _send_http(self, method: Literal["get", "post"], url: str, headers: dict[str, str],
+                         payload: dict | list | None, files: dict | None, proxy: str | None) -> requests.Response:
+        if method == "get":
+            r = await self.__curl_session.get(
+                url=url,
+                params=payload,
+                headers=headers,
+                timeout=self.requests_timeout,
+                proxy=proxy
+            )
+        elif method == "post":
+            if files:
+                r = await self._tls_client(proxy).post(
+                    url=url,
+                    data=payload,
+                    headers=headers,
+                    files=files,
+                    timeout=self.requests_timeout
+                )
+            else:
+                r = await self.__curl_session.post(
+                    url=url,
+                    data=json_backend.dumps_bytes(payload),
+                    headers=headers,
+                    timeout=self.requests_timeout,
+                    proxy=proxy
+                )
+        return r
+
+    async def _request(self, method: Literal["get", "post"], url: str, headers: dict[str, str],
+                       payload: dict[str, str] | None = None, files: dict | None = None) -> requests.Response:
+        cached = self._get_cached_response(method, url, payload)
+        if cached is not None:
+            return cached
+        headers = self._build_headers(headers)
+        hooks = self.hooks
+        operation_name = self._operation_name(payload)
+
+        async def make_req():
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(operation_name)
+            if hooks.has("on_request_start"):
+                hooks.emit("on_request_start", self, operation_name, method, url)
+            # при сетевой ошибке запрос уходит через следующий прокси пула
+            tried = set()
+            for failover in range(len(self.proxy_pool) if self.proxy_pool is not None else 1):
+                proxy = self.proxy_pool.select(exclude=tried) if self.proxy_pool is not None else None
+                proxy_url = proxy.url if proxy is not None else self._proxy_string
+                started_at = time.perf_counter()
+                try:
+                    if self.transport is None:
+                        r = await self._send_http(method, url, headers, payload, files, proxy_url)
+                    else:
+                        r = await self.transport.send_async(self, method, url, headers, payload, files, proxy_url)
+                except:
+                    if proxy is None:
+                        raise
+                    self.proxy_pool.record(proxy, time.perf_counter() - started_at)
+                    if failover == len(self.proxy_pool) - 1:
+                        raise
+                    tried.add(proxy.url)
+                    self._rewind_files(files)
+                    continue
+                break
+            elapsed = time.perf_counter() - started_at
+            json_backend.bind_response(r)
+            if proxy is not None:
+                self.proxy_pool.record(proxy, elapsed, r)
+            if hooks.has("on_response"):
+                hooks.emit("on_response", self, operation_name, r, elapsed)
+            return r
+
+        async def send():
+            breaker = self.circuit_breaker
+            for attempt in range(self.challenge_policy.max_attempts):
+                if attempt:
+                    hooks.emit("on_retry", self, operation_name, "cloudflare", attempt)
+                await breaker.wait_async()
+                try:
+                    resp = await make_req()
+                except BaseException:
+                    breaker.release()
+                    raise
+                if not self._is_cloudflare_response(resp):
+                    breaker.record_success()
+                    return resp
+                reaction = breaker.record_challenge()
+                hooks.emit("on_cloudflare", self, operation_name, reaction[0] if reaction else None)
+                if reaction is not None:
+                    step, delay = reaction
+                    self._escalate(step)
+                    self.__logger.error(f"Cloudflare Detected ({step}), пробую отправить запрос снова через {delay} секунд")
+                self._rewind_files(files)
+            raise CloudflareDetectedException(resp)
+
+        full_payload = payload
+        payload, query_hash = self._persisted_payload(method, full_payload)
+        resp = await send()
+        if query_hash is not None:
+            retry_payload = self._persisted_retry_payload(self._persisted_query_error(resp), full_payload, query_hash)
+            if retry_payload is not None:
+                payload = retry_payload
+                self._rewind_files(files)
+                hooks.emit("on_retry", self, operation_name, "persisted_query", 1)
+                resp = await send()
+            self._remember_persisted_query(resp, query_hash)
+        try:
+            if "errors" in resp.json():
+                for attempt in range(3):
+                    hooks.emit("on_retry", self, operation_name, "server_error", attempt + 1)
+                    resp = await make_req()
+                    exc = RequestError(resp)
+                    if exc.error_code != 500:
+                        break
+                    delay = min(120.0, 2 ** attempt)
+                    self.__logger.error(f"500 Error Code, пробую отправить запрос снова через {delay} секунд")
+                    await asyncio.sleep(delay)
+                else:
+                    raise exc
+        except:
+            pass
+        if resp.status_code != 200:
+            raise RequestFailedError(resp)
+        self._cache_response(method, payload, resp)
+        return resp
+
+    def batch(self, max_size: int = 20) -> AsyncBatch:
+        """ Асинхронная версия `Account.batch`, используется через `async with`. """
+        return AsyncBatch(self, max_size)
+
+    async def _fetch_many(self, fetch: Callable[[str], Awaitable[Any]], ids: Iterable[str], max_workers: int) -> list[Any]:
+        ids = list(ids)
+        unique = list(dict.fromkeys(ids))
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def fetch_one(id: str):
+            async with semaphore:
+                try:
+                    return await fetch(id)
+                except Exception as e:
+                    return e
+
+        results = dict(zip(unique, await asyncio.gather(*(fetch_one(id) for id in unique))))
+        return [results[id] for id in ids]
+
+    async def get(self) -> AsyncAccount:
+        """ Асинхронная версия `Account.get`. """
+        headers = {"accept": "*/*"}
+        r = (await self.request("post", f"{self.base_url}/graphql", headers, payloads.viewer())).json()
+        data: dict = r["data"]["viewer"]
+        if data is None:
+            raise UnauthorizedError()
+
+        self._set_viewer_data(data)
+
+        payload = payloads.persisted_query("user", "user", {"username": self.username, "hasSupportAccess": False})
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        data: dict = r["data"]["user"]
+        if data.get("__typename") == "User": self.profile = account_profile(data)
+        return self
+
+    async def get_user(self, id: str | None = None, username: str | None = None) -> types.UserProfile:
+        """ Асинхронная версия `Account.get_user`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.user(id, username)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        data: dict = r["data"]["user"]
+        if data.get("__typename") == "UserFragment": profile = data
+        elif data.get("__typename") == "User": profile = data.get("profile")
+        else: profile = None
+        return user_profile(profile)
+
+    async def get_deals(self, count: int = 24, statuses: list[ItemDealStatuses] | None = None,
+                        direction: ItemDealDirections | None = None, after_cursor: str = None) -> types.ItemDealList:
+        """ Асинхронная версия `Account.get_deals`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.deals(self.id, count, statuses, direction, after_cursor)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return item_deal_list(r["data"]["deals"])
+
+    def iter_deals(self, count: int = 24, statuses: list[ItemDealStatuses] | None = None, 
+                   direction: ItemDealDirections | None = None, after_cursor: str = None,
+                   lookahead: int = 1, stop: Callable[[types.ItemDeal], bool] | None = None,
+                   limit: int | None = None) -> AsyncGenerator[types.ItemDeal, None]:
+        """ Асинхронная версия `Account.iter_deals`, используется через `async for`. """
+        return aiter_items(lambda cursor: self.get_deals(count=count, statuses=statuses, direction=direction, after_cursor=cursor), "deals", after_cursor, lookahead, stop, limit)
+
+    async def get_deal(self, deal_id: str) -> types.ItemDeal:
+        """ Асинхронная версия `Account.get_deal`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.deal(deal_id)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return item_deal(r["data"]["deal"])
+
+    async def get_deals_by_ids(self, deal_ids: Iterable[str], max_workers: int = 8) -> list[types.ItemDeal | Exception]:
+        """ Асинхронная версия `Account.get_deals_by_ids`. """
+        return await self._fetch_many(self.get_deal, deal_ids, max_workers)
+
+    async def update_deal(self, deal_id: str, new_status: ItemDealStatuses) -> types.ItemDeal:
+        """ Асинхронная версия `Account.update_deal`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.update_deal(deal_id, new_status)
+        r = (await self.request("post", f"{self.base_url}/graphql", headers, payload)).json()
+        return item_deal(r["data"]["updateDeal"])
+
+    async def get_games(self, count: int = 24, type: GameTypes | None = None,
+                        after_cursor: str = None) -> types.GameList:
+        """ Асинхронная версия `Account.get_games`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.games(count, type, after_cursor)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return game_list(r["data"]["games"])
+
+    def iter_games(self, count: int = 24, type: GameTypes | None = None, 
+                   after_cursor: str = None,
+                   lookahead: int = 1, stop: Callable[[types.Game], bool] | None = None,
+                   limit: int | None = None) -> AsyncGenerator[types.Game, None]:
+        """ Асинхронная версия `Account.iter_games`, используется через `async for`. """
+        return aiter_items(lambda cursor: self.get_games(count=count, type=type, after_cursor=cursor), "games", after_cursor, lookahead, stop, limit)
+
+    async def get_game(self, id: str | None = None, slug: str | None = None) -> types.Game:
+        """ Асинхронная версия `Account.get_game`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.game(id, slug)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return game(r["data"]["game"])
+
+    async def get_game_category(self, id: str | None = None, game_id: str | None = None,
+                                slug: str | None = None) -> types.GameCategory:
+        """ Асинхронная версия `Account.get_game_category`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.game_category(id, game_id, slug)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return game_category(r["data"]["gameCategory"])
+
+    async def get_game_category_agreements(self, game_category_id: str, user_id: str | None = None,
+                                           count: int = 24, after_cursor: str | None = None) -> types.GameCategoryAgreementList:
+        """ Асинхронная версия `Account.get_game_category_agreements`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.game_category_agreements(game_category_id, user_id if user_id else self.id, count, after_cursor)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return game_category_agreement_list(r["data"]["gameCategoryAgreements"])
+
+    async def get_game_category_obtaining_types(self, game_category_id: str, count: int = 24,
+                                                after_cursor: str | None = None) -> types.GameCategoryObtainingTypeList:
+        """ Асинхронная версия `Account.get_game_category_obtaining_types`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.game_category_obtaining_types(game_category_id, count, after_cursor)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return game_category_obtaining_type_list(r["data"]["gameCategoryObtainingTypes"])
+
+    async def get_game_category_instructions(self, game_category_id: str, obtaining_type_id: str, count: int = 24,
+                                             type: GameCategoryInstructionTypes | None = None, after_cursor: str | None = None) -> types.GameCategoryInstructionList:
+        """ Асинхронная версия `Account.get_game_category_instructions`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.game_category_instructions(game_category_id, obtaining_type_id, count, type, after_cursor)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return game_category_instruction_list(r["data"]["gameCategoryInstructions"])
+
+    async def get_game_category_data_fields(self, game_category_id: str, obtaining_type_id: str, count: int = 24,
+                                            type: GameCategoryDataFieldTypes | None = None, after_cursor: str | None = None) -> types.GameCategoryDataFieldList:
+        """ Асинхронная версия `Account.get_game_category_data_fields`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.game_category_data_fields(game_category_id, obtaining_type_id, count, type, after_cursor)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return game_category_data_field_list(r["data"]["gameCategoryDataFields"])
+
+    async def get_chats(self, count: int = 24, type: ChatTypes | None = None,
+                        status: ChatStatuses | None = None, after_cursor: str | None = None) -> types.ChatList:
+        """ Асинхронная версия `Account.get_chats`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.chats(self.id, count, type, status, after_cursor)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        chats = chat_list(r["data"]["chats"])
+        self.chat_index.add_chats(chats.chats, self.id)
+        return chats
+
+    def iter_chats(self, count: int = 24, type: ChatTypes | None = None,
+                   status: ChatStatuses | None = None, after_cursor: str | None = None,
+                   lookahead: int = 1, stop: Callable[[types.Chat], bool] | None = None,
+                   limit: int | None = None) -> AsyncGenerator[types.Chat, None]:
+        """ Асинхронная версия `Account.iter_chats`, используется через `async for`. """
+        return aiter_items(lambda cursor: self.get_chats(count=count, type=type, status=status, after_cursor=cursor), "chats", after_cursor, lookahead, stop, limit)
+
+    async def get_chat(self, chat_id: str) -> types.Chat:
+        """ Асинхронная версия `Account.get_chat`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.chat(chat_id)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        _chat = chat(r["data"]["chat"])
+        self.chat_index.add_chats([_chat], self.id)
+        return _chat
+
+    async def get_chats_by_ids(self, chat_ids: Iterable[str], max_workers: int = 8) -> list[types.Chat | Exception]:
+        """ Асинхронная версия `Account.get_chats_by_ids`. """
+        return await self._fetch_many(self.get_chat, chat_ids, max_workers)
+
+    async def get_chat_by_username(self, username: str) -> types.Chat | None:
+        """ Асинхронная версия `Account.get_chat_by_username`. """
+        chat_id = self.chat_index.get(username)
+        if chat_id is not None:
+            try:
+                _chat = await self.get_chat(chat_id)
+            except (RequestError, RequestFailedError, KeyError, TypeError) as e:
+                # чат удалён или недоступен - запись в индексе устарела
+                self.__logger.debug(f"Чат {chat_id} из индекса недоступен: {e}")
+                _chat = None
+            if _chat is not None and any(user for user in _chat.users if user.username.lower() == username.lower()):
+                return _chat
+            self.chat_index.remove(username)
+
+        next_cursor = None
+        while True:
+            chats = await self.get_chats(count=24, after_cursor=next_cursor)
+            for chat in chats.chats:
+                if any(user for user in chat.users if user.username.lower() == username.lower()):
+                    return chat
+            if not chats.page_info.has_next_page:
+                break
+            next_cursor = chats.page_info.end_cursor
+
+    async def get_chat_messages(self, chat_id: str, count: int = 24,
+                                after_cursor: str | None = None) -> types.ChatMessageList:
+        """ Асинхронная версия `Account.get_chat_messages`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.chat_messages(chat_id, count, after_cursor)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return chat_message_list(r["data"]["chatMessages"])
+
+    def iter_chat_messages(self, chat_id: str, count: int = 24,
+                           after_cursor: str | None = None,
+                           lookahead: int = 1, stop: Callable[[types.ChatMessage], bool] | None = None,
+                           limit: int | None = None) -> AsyncGenerator[types.ChatMessage, None]:
+        """ Асинхронная версия `Account.iter_chat_messages`, используется через `async for`. """
+        return aiter_items(lambda cursor: self.get_chat_messages(chat_id=chat_id, count=count, after_cursor=cursor), "messages", after_cursor, lookahead, stop, limit)
+
+    async def mark_chat_as_read(self, chat_id: str) -> types.Chat:
+        """ Асинхронная версия `Account.mark_chat_as_read`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.mark_chat_as_read(chat_id)
+        r = (await self.request("post", f"{self.base_url}/graphql", headers, payload)).json()
+        return chat(r["data"]["markChatAsRead"])
+
+    async def send_message(self, chat_id: str, text: str | None = None,
+                           photo_file_path: str | None = None, mark_chat_as_read: bool = False) -> types.ChatMessage:
+        """ Асинхронная версия `Account.send_message`. """
+        if mark_chat_as_read:
+            await self.mark_chat_as_read(chat_id=chat_id)
+        headers = {"accept": "*/*"}
+        payload, files = payloads.create_chat_message(chat_id, text, photo_file_path)
+        r = (await self.request("post", f"{self.base_url}/graphql", headers, payload, files)).json()
+        return chat_message(r["data"]["createChatMessage"])
+
+    async def create_item(self, game_category_id: str, obtaining_type_id: str, name: str, price: int,
+                          description: str, options: list[GameCategoryOption], data_fields: list[GameCategoryDataField],
+                          attachments: list[str]) -> types.Item:
+        """ Асинхронная версия `Account.create_item`. """
+        headers = {"accept": "*/*"}
+        payload, files = payloads.create_item(game_category_id, obtaining_type_id, name, price, description, options, data_fields, attachments)
+        r = (await self.request("post", f"{self.base_url}/graphql", headers, payload, files)).json()
+        return item(r["data"]["createItem"])
+
+    async def update_item(self, id: str, name: str | None = None, price: int | None = None, description: str | None = None,
+                          options: list[GameCategoryOption] | None = None, data_fields: list[GameCategoryDataField] | None = None,
+                          remove_attachments: list[str] | None = None, add_attachments: list[str] | None = None) -> types.Item:
+        """ Асинхронная версия `Account.update_item`. """
+        headers = {"accept": "*/*"}
+        payload, files = payloads.update_item(id, name, price, description, options, data_fields, remove_attachments, add_attachments)
+        r = (await self.request("post", f"{self.base_url}/graphql", headers, payload, files)).json()
+        _item = item(r["data"]["updateItem"])
+        if price and _item is not None:
+            self.repricer.set_price(_item.id, _item.price)
+        return _item
+
+    async def reprice_items(self, prices: dict[str, int] | Iterable[tuple[str, int]], force: bool = False,
+                            max_workers: int | None = None) -> RepriceReport:
+        """ Асинхронная версия `Account.reprice_items`. """
+        return await self.repricer.reprice(prices, force, max_workers)
+
+    async def remove_item(self, id: str) -> bool:
+        """ Асинхронная версия `Account.remove_item`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.remove_item(id)
+        await self.request("post", f"{self.base_url}/graphql", headers, payload)
+        return True
+
+    async def publish_item(self, item_id: str, priority_status_id: str,
+                           transaction_provider_id: TransactionProviderIds = TransactionProviderIds.LOCAL) -> types.Item:
+        """ Асинхронная версия `Account.publish_item`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.publish_item(item_id, priority_status_id, transaction_provider_id)
+        r = (await self.request("post", f"{self.base_url}/graphql", headers, payload)).json()
+        return item(r["data"]["publishItem"])
+
+    async def get_items(self, game_id: str | None = None, category_id: str | None = None, count: int = 24,
+                        status: ItemStatuses = ItemStatuses.APPROVED, after_cursor: str | None = None) -> types.ItemProfileList:
+        """ Асинхронная версия `Account.get_items`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.items(game_id, category_id, count, status, after_cursor)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return item_profile_list(r["data"]["items"])
+
+    def iter_items(self, game_id: str | None = None, category_id: str | None = None, count: int = 24,
+                   status: ItemStatuses = ItemStatuses.APPROVED, after_cursor: str | None = None,
+                   lookahead: int = 1, stop: Callable[[types.ItemProfile], bool] | None = None,
+                   limit: int | None = None) -> AsyncGenerator[types.ItemProfile, None]:
+        """ Асинхронная версия `Account.iter_items`, используется через `async for`. """
+        return aiter_items(lambda cursor: self.get_items(game_id=game_id, category_id=category_id, count=count, status=status, after_cursor=cursor), "items", after_cursor, lookahead, stop, limit)
+
+    async def get_item(self, id: str | None = None, slug: str | None = None) -> types.MyItem | types.Item | types.ItemProfile:
+        """ Асинхронная версия `Account.get_item`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.item(id, slug)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        data: dict = r["data"]["item"]
+        if data["__typename"] == "MyItem": _item = my_item(data)
+        elif data["__typename"] == "ItemProfile": _item = item_profile(data)
+        elif data["__typename"] in ["Item", "ForeignItem"]: _item = item(data)
+        else: _item = None
+        return _item
+
+    async def get_items_by_ids(self, item_ids: Iterable[str], max_workers: int = 8) -> list[types.MyItem | types.Item | types.ItemProfile | Exception]:
+        """ Асинхронная версия `Account.get_items_by_ids`. """
+        return await self._fetch_many(lambda id: self.get_item(id), item_ids, max_workers)
+
+    async def get_item_priority_statuses(self, item_id: str, item_price: str) -> list[types.ItemPriorityStatus]:
+        """ Асинхронная версия `Account.get_item_priority_statuses`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.item_priority_statuses(item_id, item_price)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return [item_priority_status(status) for status in r["data"]["itemPriorityStatuses"]]
+
+    async def increase_item_priority_status(self, item_id: str, priority_status_id: str, payment_method_id: TransactionPaymentMethodIds | None = None,
+                                            transaction_provider_id: TransactionProviderIds = TransactionProviderIds.LOCAL) -> types.Item:
+        """ Асинхронная версия `Account.increase_item_priority_status`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.increase_item_priority_status(item_id, priority_status_id, payment_method_id, transaction_provider_id)
+        r = (await self.request("post", f"{self.base_url}/graphql", headers, payload)).json()
+        return item(r["data"]["increaseItemPriorityStatus"])
+
+    async def get_transaction_providers(self, direction: TransactionProviderDirections = TransactionProviderDirections.IN) -> list[types.TransactionProvider]:
+        """ Асинхронная версия `Account.get_transaction_providers`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.transaction_providers(direction)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return [transaction_provider(provider) for provider in r["data"]["transactionProviders"]]
+
+    async def get_transactions(self, count: int = 24, operation: TransactionOperations | None = None, min_value: int | None = None,
+                               max_value: int | None = None, provider_id: TransactionProviderIds | None = None, status: TransactionStatuses | None = None,
+                               after_cursor: str | None = None) -> types.TransactionList:
+        """ Асинхронная версия `Account.get_transactions`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.transactions(self.id, count, operation, min_value, max_value, provider_id, status, after_cursor)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return transaction_list(r["data"]["transactions"])
+
+    def iter_transactions(self, count: int = 24, operation: TransactionOperations | None = None, min_value: int | None = None,
+                          max_value: int | None = None, provider_id: TransactionProviderIds | None = None, status: TransactionStatuses | None = None,
+                          after_cursor: str | None = None,
+                          lookahead: int = 1, stop: Callable[[types.Transaction], bool] | None = None,
+                          limit: int | None = None) -> AsyncGenerator[types.Transaction, None]:
+        """ Асинхронная версия `Account.iter_transactions`, используется через `async for`. """
+        return aiter_items(lambda cursor: self.get_transactions(count=count, operation=operation, min_value=min_value, max_value=max_value, provider_id=provider_id, status=status, after_cursor=cursor), "transactions", after_cursor, lookahead, stop, limit)
+
+    async def get_sbp_bank_members(self) -> list[types.SBPBankMember]:
+        """ Асинхронная версия `Account.get_sbp_bank_members`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.sbp_bank_members()
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return [sbp_bank_member(member) for member in r["data"]["sbpBankMembers"]]
+
+    async def get_verified_cards(self, count: int = 24, after_cursor: str | None = None,
+                                 direction: SortDirections = SortDirections.ASC) -> types.UserBankCardList:
+        """ Асинхронная версия `Account.get_verified_cards`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.verified_cards(count, after_cursor, direction)
+        r = (await self.request("get", f"{self.base_url}/graphql", headers, payload)).json()
+        return user_bank_card_list(r["data"]["verifiedCards"])
+
+    def iter_verified_cards(self, count: int = 24, after_cursor: str | None = None,
+                            direction: SortDirections = SortDirections.ASC,
+                            lookahead: int = 1, stop: Callable[[types.UserBankCard], bool] | None = None,
+                            limit: int | None = None) -> AsyncGenerator[types.UserBankCard, None]:
+        """ Асинхронная версия `Account.iter_verified_cards`, используется через `async for`. """
+        return aiter_items(lambda cursor: self.get_verified_cards(count=count, after_cursor=cursor, direction=direction), "bank_cards", after_cursor, lookahead, stop, limit)
+
+    async def delete_card(self, card_id: str) -> bool:
+        """ Асинхронная версия `Account.delete_card`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.delete_card(card_id)
+        r = (await self.request("post", f"{self.base_url}/graphql", headers, payload)).json()
+        return r["data"]["deleteCard"]
+
+    async def request_withdrawal(self, provider: TransactionProviderIds, account: str, value: int,
+                                 payment_method_id: TransactionPaymentMethodIds | None = None,
+                                 sbp_bank_member_id: str | None = None) -> types.Transaction:
+        """ Асинхронная версия `Account.request_withdrawal`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.request_withdrawal(provider, account, value, payment_method_id, sbp_bank_member_id)
+        r = (await self.request("post", f"{self.base_url}/graphql", headers, payload)).json()
+        return transaction(r["data"]["requestWithdrawal"])
+
+    async def remove_transaction(self, transaction_id: str) -> types.Transaction:
+        """ Асинхронная версия `Account.remove_transaction`. """
+        headers = {"accept": "*/*"}
+        payload = payloads.remove_transaction(transaction_id)
+        r = (await self.request("post", f"{self.base_url}/graphql", headers, payload)).json()
+        return transaction(r["data"]["removeTransaction"])
@@ -0,0 +1,234 @@
+from __future__ import annotations
+from typing import *
+from concurrent.futures import Future
+
+from . import types
+from . import payloads
+from . import json_backend
+from .exceptions import *
+from .parser import *
+from .enums import *
+
+if TYPE_CHECKING:
+    from .account import Account
+
+
+class Batch:
+    """
+    Пакетный GraphQL запрос: собирает несколько операций
+    и отправляет их одним POST запросом с массивом операций.\n
+    Каждый метод сразу возвращает `concurrent.futures.Future`,
+    результат которого появляется после отправки пакета (при выходе из `with`).
+
+    Пример:
+        with account.batch() as b:
+            deal = b.get_deal(deal_id)
+            chat = b.get_chat(chat_id)
+        print(deal.result().status, chat.result().id)
+
+    :param account: Объект аккаунта.
+    :type account: `playerokapi.account.Account`
+
+    :param max_size: Максимальное количество операций в одном HTTP запросе (большие пакеты делятся на части).
+    :type max_size: `int`
+    """
+
+    def __init__(self, account: Account, max_size: int = 20):
+        self.account: Account = account
+        """ Объект аккаунта. """
+        self.max_size: int = max_size
+        """ Максимальное количество операций в одном HTTP запросе. """
+
+        self._operations: list[tuple[dict, Callable[[dict], Any], Future]] = [] # [(operation, parse, future)]
+
+    def __enter__(self) -> Batch:
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.cancel()
+            return
+        self.execute()
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def add(self, payload: dict, parse: Callable[[dict], Any]) -> Future:
+        """
+        Добавляет операцию в пакет.
+
+        :param payload: Payload операции (из `playerokapi.payloads`).
+        :type payload: `dict`
+
+        :param parse: Функция, которая получает `data` ответа операции и возвращает результат.
+        :type parse: `callable`
+
+        :return: Future с результатом операции.
+        :rtype: `concurrent.futures.Future`
+        """
+        operation = {k: json_backend.loads(v) if k in ("variables", "extensions") and isinstance(v, str) else v
+                     for k, v in payload.items()}
+        future = Future()
+        self._operations.append((operation, parse, future))
+        return future
+
+    def cancel(self):
+        """
+        Отменяет все неотправленные операции пакета.
+        """
+        for _, _, future in self._operations:
+            future.cancel()
+        self._operations = []
+
+    def _chunks(self) -> list[list[tuple[dict, Callable[[dict], Any], Future]]]:
+        operations, self._operations = self._operations, []
+        return [operations[i:i + self.max_size] for i in range(0, len(operations), self.max_size)]
+
+    def _resolve(self, chunk: list[tuple[dict, Callable[[dict], Any], Future]], results: Any):
+        if not isinstance(results, list) or len(results) != len(chunk):
+            # сервер без поддержки пакетов отвечает одним объектом (обычно `{"errors": [...]}`)
+            errors = results.get("errors") if isinstance(results, dict) else None
+            error = errors[0] if errors and isinstance(errors[0], dict) else {
+                "message": f"Ожидался массив из {len(chunk)} ответов, получено: {type(results).__name__}"
+            }
+            self._fail(chunk, BatchOperationError("batch", error))
+            return
+        for (operation, parse, future), result in zip(chunk, results):
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                errors = result.get("errors")
+                if errors and not result.get("data"):
+                    raise BatchOperationError(operation.get("operationName"), errors[0])
+                future.set_result(parse(result.get("data") or {}))
+            except Exception as e:
+                future.set_exception(e)
+
+    def _fail(self, chunk: list[tuple[dict, Callable[[dict], Any], Future]], exc: Exception):
+        for _, _, future in chunk:
+            if future.done():
+                continue
+            if future.running() or future.set_running_or_notify_cancel():
+                future.set_exception(exc)
+
+    def execute(self) -> list[Future]:
+        """
+        Отправляет все накопленные операции.\n
+        Ошибка одной операции попадает только в её Future и не прерывает остальные.
+
+        :return: Future всех отправленных операций.
+        :rtype: `list[concurrent.futures.Future]`
+        """
+        futures = [future for _, _, future in self._operations]
+        headers = {"accept": "*/*"}
+        for chunk in self._chunks():
+            try:
+                r = self.account.request("post", f"{self.account.base_url}/graphql", headers, [op for op, _, _ in chunk])
+                self._resolve(chunk, r.json())
+            except Exception as e:
+                self._fail(chunk, e)
+            # ни одна Future пакета не должна остаться без результата
+            self._fail(chunk, BatchOperationError("batch", {"message": "Операция осталась без ответа"}))
+        return futures
+
+    def get_user(self, id: str | None = None, username: str | None = None) -> Future[types.UserProfile]:
+        """ Пакетная версия `Account.get_user`. """
+        def parse(data: dict):
+            data = data["user"]
+            if data.get("__typename") == "UserFragment": profile = data
+            elif data.get("__typename") == "User": profile = data.get("profile")
+            else: profile = None
+            return user_profile(profile)
+        return self.add(payloads.user(id, username), parse)
+
+    def get_deals(self, count: int = 24, statuses: list[ItemDealStatuses] | None = None,
+                  direction: ItemDealDirections | None = None, after_cursor: str = None) -> Future[types.ItemDealList]:
+        """ Пакетная версия `Account.get_deals`. """
+        return self.add(payloads.deals(self.account.id, count, statuses, direction, after_cursor), lambda data: item_deal_list(data["deals"]))
+
+    def get_deal(self, deal_id: str) -> Future[types.ItemDeal]:
+        """ Пакетная версия `Account.get_deal`. """
+        return self.add(payloads.deal(deal_id), lambda data: item_deal(data["deal"]))
+
+    def update_deal(self, deal_id: str, new_status: ItemDealStatuses) -> Future[types.ItemDeal]:
+        """ Пакетная версия `Account.update_deal`. """
+        return self.add(payloads.update_deal(deal_id, new_status), lambda data: item_deal(data["updateDeal"]))
+
+    def get_game(self, id: str | None = None, slug: str | None = None) -> Future[types.Game]:
+        """ Пакетная версия `Account.get_game`. """
+        return self.add(payloads.game(id, slug), lambda data: game(data["game"]))
+
+    def get_game_category(self, id: str | None = None, game_id: str | None = None,
+                          slug: str | None = None) -> Future[types.GameCategory]:
+        """ Пакетная версия `Account.get_game_category`. """
+        return self.add(payloads.game_category(id, game_id, slug), lambda data: game_category(data["gameCategory"]))
+
+    def get_chats(self, count: int = 24, type: ChatTypes | None = None,
+                  status: ChatStatuses | None = None, after_cursor: str | None = None) -> Future[types.ChatList]:
+        """ Пакетная версия `Account.get_chats`. """
+        def parse(data: dict):
+            chats = chat_list(data["chats"])
+            self.account.chat_index.add_chats(chats.chats, self.account.id)
+            return chats
+        return self.add(payloads.chats(self.account.id, count, type, status, after_cursor), parse)
+
+    def get_chat(self, chat_id: str) -> Future[types.Chat]:
+        """ Пакетная версия `Account.get_chat`. """
+        def parse(data: dict):
+            _chat = chat(data["chat"])
+            self.account.chat_index.add_chats([_chat], self.account.id)
+            return _chat
+        return self.add(payloads.chat(chat_id), parse)
+
+    def get_chat_messages(self, chat_id: str, count: int = 24,
+                          after_cursor: str | None = None) -> Future[types.ChatMessageList]:
+        """ Пакетная версия `Account.get_chat_messages`. """
+        return self.add(payloads.chat_messages(chat_id, count, after_cursor), lambda data: chat_message_list(data["chatMessages"]))
+
+    def mark_chat_as_read(self, chat_id: str) -> Future[types.Chat]:
+        """ Пакетная версия `Account.mark_chat_as_read`. """
+        return self.add(payloads.mark_chat_as_read(chat_id), lambda data: chat(data["markChatAsRead"]))
+
+    def get_item(self, id: str | None = None, slug: str | None = None) -> Future[types.MyItem | types.Item | types.ItemProfile]:
+        """ Пакетная версия `Account.get_item`. """
+        def parse(data: dict):
+            data = data["item"]
+            if data["__typename"] == "MyItem": return my_item(data)
+            elif data["__typename"] == "ItemProfile": return item_profile(data)
+            elif data["__typename"] in ["Item", "ForeignItem"]: return item(data)
+        return self.add(payloads.item(id, slug), parse)
+
+    def get_items(self, game_id: str | None = None, category_id: str | None = None, count: int = 24,
+                  status: ItemStatuses = ItemStatuses.APPROVED, after_cursor: str | None = None) -> Future[types.ItemProfileList]:
+        """ Пакетная версия `Account.get_items`. """
+        return self.add(payloads.items(game_id, category_id, count, status, after_cursor), lambda data: item_profile_list(data["items"]))
+
+
+class AsyncBatch(Batch):
+    """
+    Пакетный GraphQL запрос для `playerokapi.async_account.AsyncAccount`.\n
+    Используется через `async with account.batch() as b:`.
+    """
+
+    async def __aenter__(self) -> AsyncBatch:
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.cancel()
+            return
+        await self.execute()
+
+    async def execute(self) -> list[Future]:
+        """ Асинхронная версия `Batch.execute`. """
+        futures = [future for _, _, future in self._operations]
+        headers = {"accept": "*/*"}
+        for chunk in self._chunks():
+            try:
+                r = await self.account.request("post", f"{self.account.base_url}/graphql", headers, [op for op, _, _ in chunk])
+                self._resolve(chunk, r.json())
+            except Exception as e:
+                self._fail(chunk, e)
+            # ни одна Future пакета не должна остаться без результата
+            self._fail(chunk, BatchOperationError("batch", {"message": "Операция осталась без ответа"}))
+        return futures
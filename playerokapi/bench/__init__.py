@@ -0,0 +1,5 @@
+"""
+Бенчмарки playerokapi: накладные расходы клиента (без сети), скорость парсера, память моделей
+и end-to-end прогон `Account` и `EventListener` против локального сервера-заглушки.\n
+Запуск: `python -m playerokapi.bench [overhead] [parsing] [memory] [e2e]`.
+"""
@@ -0,0 +1,33 @@
+import argparse
+
+from . import overhead, e2e, memory, parsing, json_backends
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m playerokapi.bench", description="Бенчмарки playerokapi")
+    parser.add_argument("suites", nargs="*", metavar="{overhead,parsing,memory,json,e2e}",
+                        help="какие бенчмарки запустить (по умолчанию - все)")
+    parser.add_argument("--objects", type=int, default=1000, help="количество объектов на странице в бенчмарках парсера и JSON (в бенчмарке памяти - в 10 раз больше)")
+    parser.add_argument("--chats", type=int, default=2000, help="количество чатов на сервере-заглушке")
+    parser.add_argument("--messages", type=int, default=30, help="количество сообщений в каждом чате")
+    parser.add_argument("--latency", type=float, default=0.0, help="задержка ответов сервера-заглушки (в секундах)")
+    args = parser.parse_args()
+    suites = args.suites or ["overhead", "parsing", "memory", "json", "e2e"]
+    for suite in suites:
+        if suite not in ("overhead", "parsing", "memory", "json", "e2e"):
+            parser.error(f"неизвестный бенчмарк: {suite}")
+
+    if "overhead" in suites:
+        overhead.main()
+    if "parsing" in suites:
+        parsing.main(args.objects)
+    if "memory" in suites:
+        memory.main(args.objects * 10)
+    if "json" in suites:
+        json_backends.main(args.objects)
+    if "e2e" in suites:
+        e2e.main(args.chats, args.messages, args.latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+from __future__ import annotations
+from typing import *
+from concurrent.futures import ThreadPoolExecutor
+import statistics
+import threading
+import time
+import tracemalloc
+
+from .. import payloads
+from ..account import Account
+from ..listener.listener import EventListener
+from ..listener.events import NewMessageEvent
+from ..parser import chat_list, chat_message_list, item_deal, item_deal_list, item_profile_list
+from .server import FakePlayerokServer
+
+
+def make_account(server: FakePlayerokServer, **kwargs) -> Account:
+    """
+    Создаёт аккаунт, который ходит в локальный сервер-заглушку.
+    """
+    account = Account(token="bench", **kwargs)
+    account.base_url = server.url
+    return account.get()
+
+
+def _raw(account: Account, payload: dict) -> dict:
+    return account.request("get", f"{account.base_url}/graphql", {"accept": "*/*"}, payload).json()["data"]
+
+
+def bench_requests(account: Account, server: FakePlayerokServer, number: int = 300, threads: int = 8) -> dict[str, float]:
+    """
+    Измеряет пропускную способность клиента: запросов в секунду последовательно и из нескольких потоков.
+
+    :return: Словарь с ключами `sequential_rps`, `concurrent_rps`.
+    :rtype: `dict[str, float]`
+    """
+    chat_ids = list(server.chats)
+    started_at = time.perf_counter()
+    for i in range(number):
+        account.get_chat(chat_ids[i % len(chat_ids)])
+    sequential = number / (time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(threads) as executor:
+        list(executor.map(lambda i: account.get_deal(f"deal-{i % len(chat_ids):05d}"), range(number)))
+    concurrent = number / (time.perf_counter() - started_at)
+    return {"sequential_rps": sequential, "concurrent_rps": concurrent}
+
+
+def bench_parse(account: Account, server: FakePlayerokServer, repeat: int = 20) -> dict[str, float]:
+    """
+    Измеряет время разбора ответов в объекты (в микросекундах на объект).
+
+    :return: Словарь {тип объекта: мкс на объект}.
+    :rtype: `dict[str, float]`
+    """
+    chat_id = next(iter(server.chats))
+    samples = {
+        "Chat": (chat_list, _raw(account, payloads.chats(account.id, 24))["chats"]),
+        "ChatMessage": (chat_message_list, _raw(account, payloads.chat_messages(chat_id, 24))["chatMessages"]),
+        "ItemDeal (list)": (item_deal_list, _raw(account, payloads.deals(account.id, 24))["deals"]),
+        "ItemProfile": (item_profile_list, _raw(account, payloads.items(count=24))["items"]),
+    }
+    results = {}
+    for name, (parse, data) in samples.items():
+        count = len(data["edges"]) or 1
+        started_at = time.perf_counter()
+        for _ in range(repeat):
+            parse(data)
+        results[name] = (time.perf_counter() - started_at) / (repeat * count) * 1e6
+    deal_data = _raw(account, payloads.deal(next(iter(server.deals))))["deal"]
+    started_at = time.perf_counter()
+    for _ in range(repeat * 24):
+        item_deal(deal_data)
+    results["ItemDeal"] = (time.perf_counter() - started_at) / (repeat * 24) * 1e6
+    return results
+
+
+def bench_memory(account: Account, server: FakePlayerokServer, messages: int = 10000) -> dict[str, float]:
+    """
+    Измеряет память, которую занимают разобранные сообщения.
+
+    :return: Словарь с ключами `messages`, `bytes_total`, `bytes_per_message`, `mb_per_10k`.
+    :rtype: `dict[str, float]`
+    """
+    pages = []
+    collected = 0
+    for chat_id in server.chats:
+        if collected >= messages:
+            break
+        page = _raw(account, payloads.chat_messages(chat_id, 100))["chatMessages"]
+        pages.append(page)
+        collected += len(page["edges"])
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        parsed = [chat_message_list(page) for page in pages]
+        total = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    count = sum(len(page.messages) for page in parsed)
+    return {
+        "messages": count,
+        "bytes_total": total,
+        "bytes_per_message": total / count if count else 0.0,
+        "mb_per_10k": total / count * 10000 / 1024 / 1024 if count else 0.0
+    }
+
+
+def bench_listener(account: Account, server: FakePlayerokServer, events: int = 30,
+                   requests_delay: float = 0.05, interval: float = 0.1) -> dict[str, float]:
+    """
+    Измеряет задержку событий `EventListener`: от появления сообщения на сервере до получения события.
+
+    :return: Словарь с ключами `events`, `p50_ms`, `p95_ms`, `max_ms`.
+    :rtype: `dict[str, float]`
+    """
+    listener = EventListener(account)
+    sent_at: dict[str, float] = {}
+    latencies: list[float] = []
+    done = threading.Event()
+    ready = threading.Event()
+
+    def consume():
+        for event in listener.listen(requests_delay=requests_delay, get_new_review_events=False):
+            ready.set()
+            if isinstance(event, NewMessageEvent) and event.message.id in sent_at:
+                latencies.append(time.perf_counter() - sent_at.pop(event.message.id))
+                if len(latencies) >= events:
+                    done.set()
+            if done.is_set():
+                return
+
+    threading.Thread(target=consume, daemon=True).start()
+    ready.wait(10)
+    for _ in range(events):
+        message = server.add_message()
+        sent_at[message["id"]] = time.perf_counter()
+        time.sleep(interval)
+    done.wait(10)
+    done.set()
+    if not latencies:
+        return {"events": 0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    latencies.sort()
+    return {
+        "events": len(latencies),
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+        "max_ms": latencies[-1] * 1000
+    }
+
+
+def run(chats: int = 2000, messages_per_chat: int = 30, latency: float = 0.0) -> dict[str, dict[str, float]]:
+    """
+    Запускает сервер-заглушку и гоняет против него все end-to-end бенчмарки.
+
+    :return: Результаты по бенчмаркам.
+    :rtype: `dict[str, dict[str, float]]`
+    """
+    with FakePlayerokServer(chats=chats, items=chats, messages_per_chat=messages_per_chat, latency=latency) as server:
+        account = make_account(server)
+        return {
+            "requests": bench_requests(account, server),
+            "parse_us_per_object": bench_parse(account, server),
+            "memory": bench_memory(account, server),
+            "listener": bench_listener(account, server)
+        }
+
+
+def main(chats: int = 2000, messages_per_chat: int = 30, latency: float = 0.0):
+    for section, values in run(chats, messages_per_chat, latency).items():
+        print(section)
+        for name, value in values.items():
+            print(f"  {name:<20}{value:>14.2f}")
@@ -0,0 +1,71 @@
+from __future__ import annotations
+from typing import *
+import json
+import timeit
+
+from .. import json_backend
+from .. import payloads
+from .server import FakePlayerokServer
+
+
+def _measure(func: Callable[[], Any], number: int) -> float:
+    """ Время одного вызова в секундах (лучшее из 5 повторов). """
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def run(objects: int = 1000, number: int = 5) -> list[tuple[str, str, float, float]]:
+    """
+    Измеряет скорость JSON на больших страницах `items` и `deals`: как было раньше
+    (`json.loads` из `text` дважды на ответ - проверка ошибок и метод аккаунта, `json.dumps` для payload)
+    против каждой установленной библиотеки из `playerokapi.json_backend` (один разбор прямо из `bytes`).
+
+    :param objects: Количество объектов на странице.
+    :type objects: `int`
+
+    :param number: Количество операций в одном повторе.
+    :type number: `int`
+
+    :return: Список (библиотека, операция, до, после), время одной операции в миллисекундах.
+    :rtype: `list[tuple[str, str, float, float]]`
+    """
+    server = FakePlayerokServer(chats=objects, items=objects, messages_per_chat=1)
+    variables = {"pagination": {"first": objects}}
+    bodies = {
+        "items": json.dumps(server.resolve("items", "items", variables), ensure_ascii=False).encode("utf-8"),
+        "deals": json.dumps(server.resolve("deals", "deals", variables), ensure_ascii=False).encode("utf-8"),
+    }
+    filters = {"userId": "user-1", "status": ["PAID", "SENT"], "direction": "IN"}
+
+    def legacy_payload():
+        return {"operationName": "deals",
+                "variables": json.dumps({"pagination": {"first": 24, "after": None}, "filter": filters}, ensure_ascii=False),
+                "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": "0" * 64}}, ensure_ascii=False)}
+
+    def new_payload():
+        return payloads.persisted_query("deals", "deals", {"pagination": {"first": 24, "after": None}, "filter": filters})
+
+    previous = json_backend.get_backend()
+    results = []
+    try:
+        for name in json_backend.available():
+            backend = json_backend.use(name)
+            for page, body in bodies.items():
+                before = _measure(lambda: [json.loads(body.decode("utf-8")) for _ in range(2)], number)
+                after = _measure(lambda: backend.loads(body), number)
+                results.append((name, f"разбор {page} ({len(body) // 1024} КБ)", before * 1000, after * 1000))
+                data = backend.loads(body)
+                before = _measure(lambda: json.dumps(data).encode("utf-8"), number)
+                after = _measure(lambda: json_backend.dumps_bytes(data), number)
+                results.append((name, f"сериализация {page}", before * 1000, after * 1000))
+            before = _measure(lambda: json.dumps(legacy_payload()).encode("utf-8"), number * 1000)
+            after = _measure(lambda: json_backend.dumps_bytes(new_payload()), number * 1000)
+            results.append((name, "payload запроса", before * 1000, after * 1000))
+    finally:
+        json_backend.use(previous.name)
+    return results
+
+
+def main(objects: int = 1000):
+    print(f"{'json':<10}{'операция':<30}{'до, мс':>10}{'после, мс':>12}{'ускорение':>12}")
+    for name, operation, before, after in run(objects):
+        print(f"{name:<10}{operation:<30}{before:>10.3f}{after:>12.3f}{before / after:>11.2f}x")
@@ -0,0 +1,77 @@
+from __future__ import annotations
+from typing import *
+from contextlib import contextmanager
+import gc
+import tracemalloc
+
+from .. import parser
+from .server import FakePlayerokServer
+
+
+def _unslotted(cls: type) -> type:
+    """ Копия класса без `__slots__` - так модели выглядели раньше (атрибуты в `__dict__`). """
+    namespace = {k: v for k, v in cls.__dict__.items()
+                 if k not in ("__slots__", "__dict__", "__weakref__") and k not in cls.__slots__
+                 and not k.startswith(f"_{cls.__name__}__")}
+    return type(cls.__name__, cls.__bases__, namespace)
+
+
+@contextmanager
+def _dict_models():
+    """ Временно подменяет классы, которые создаёт парсер, на версии без `__slots__`. """
+    namespace = vars(parser)
+    original = {name: value for name, value in namespace.items()
+                if name.startswith("_") and isinstance(value, type) and "__slots__" in value.__dict__}
+    namespace.update({name: _unslotted(cls) for name, cls in original.items()})
+    try:
+        yield
+    finally:
+        namespace.update(original)
+
+
+def _traced(parse: Callable[[dict], Any], pages: list[dict]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        parsed = [parse(page) for page in pages]
+        total = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del parsed
+    return total
+
+
+def run(objects: int = 10000) -> list[tuple[str, int, float, float]]:
+    """
+    Измеряет память, которую занимают разобранные объекты (вместе с вложенными):
+    модели с `__dict__` (как раньше) против моделей с `__slots__`.
+
+    :param objects: Количество объектов каждого типа.
+    :type objects: `int`
+
+    :return: Список (название, количество объектов, до, после), байт на объект.
+    :rtype: `list[tuple[str, int, float, float]]`
+    """
+    chats = max(1, objects // 100)
+    server = FakePlayerokServer(chats=chats, items=objects, messages_per_chat=100)
+    message_pages = [server.resolve("chatMessages", "chat_messages",
+                                    {"pagination": {"first": 100}, "filter": {"chatId": chat_id}})["data"]["chatMessages"]
+                     for chat_id in server.chats]
+    item_pages = [server.resolve("items", "items", {"pagination": {"first": 100, "after": str(i)}})["data"]["items"]
+                  for i in range(0, objects, 100)]
+    results = []
+    for name, parse, pages in (("ChatMessage", parser.chat_message_list, message_pages),
+                               ("ItemProfile", parser.item_profile_list, item_pages)):
+        count = sum(len(page["edges"]) for page in pages)
+        with _dict_models():
+            before = _traced(parse, pages)
+        after = _traced(parse, pages)
+        results.append((name, count, before / count, after / count))
+    return results
+
+
+def main(objects: int = 10000):
+    print(f"{'memory':<20}{'объектов':>10}{'до, байт':>12}{'после, байт':>14}{'экономия':>11}")
+    for name, count, before, after in run(objects):
+        print(f"{name:<20}{count:>10}{before:>12.0f}{after:>14.0f}{1 - after / before:>10.0%}")
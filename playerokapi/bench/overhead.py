@@ -0,0 +1,61 @@
+from __future__ import annotations
+from typing import *
+import json
+import random
+import timeit
+
+from .. import payloads
+from ..account import Account, USER_AGENTS, DEFAULT_HEADERS
+from ..misc import PERSISTED_QUERIES
+
+
+def _legacy_build_headers(token: str, user_agent: str, headers: dict[str, str]) -> dict[str, str]:
+    # так заголовки собирались на каждый запрос раньше
+    agents = list(USER_AGENTS)
+    _headers = {**DEFAULT_HEADERS, "cookie": f"token={token}", "user-agent": user_agent if user_agent else random.choice(agents)}
+    return {k: v for k, v in _headers.items() if k not in headers.keys()}
+
+
+def _legacy_persisted_query(operation_name: str, query_name: str, variables: dict) -> dict:
+    return {
+        "operationName": operation_name,
+        "variables": json.dumps(variables, ensure_ascii=False),
+        "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get(query_name)}}, ensure_ascii=False)
+    }
+
+
+def _measure(func: Callable[[], Any], number: int) -> float:
+    """ Время одного вызова в микросекундах (лучшее из 5 повторов). """
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def run(number: int = 20000) -> list[tuple[str, float, float]]:
+    """
+    Измеряет накладные расходы клиента на один запрос: сборку заголовков и payload'а.
+
+    :param number: Количество вызовов в одном повторе.
+    :type number: `int`
+
+    :return: Список (название, до, после), время в микросекундах на вызов.
+    :rtype: `list[tuple[str, float, float]]`
+    """
+    account = Account(token="bench")
+    caller_headers = {"accept": "*/*"}
+    variables = {"id": "00000000-0000-0000-0000-000000000000", "hasSupportAccess": False, "showForbiddenImage": True}
+    results = [
+        ("headers",
+         _measure(lambda: _legacy_build_headers(account.token, account.user_agent, caller_headers), number),
+         _measure(lambda: account._build_headers(caller_headers), number)),
+        ("persisted_query",
+         _measure(lambda: _legacy_persisted_query("deal", "deal", variables), number),
+         _measure(lambda: payloads.persisted_query("deal", "deal", variables), number))
+    ]
+    before, after = sum(r[1] for r in results), sum(r[2] for r in results)
+    results.append(("total", before, after))
+    return results
+
+
+def main():
+    print(f"{'overhead':<20}{'до, мкс':>12}{'после, мкс':>14}{'ускорение':>12}")
+    for name, before, after in run():
+        print(f"{name:<20}{before:>12.2f}{after:>14.2f}{before / after:>11.1f}x")
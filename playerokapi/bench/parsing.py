@@ -0,0 +1,79 @@
+from __future__ import annotations
+from typing import *
+from pathlib import Path
+from types import ModuleType
+import importlib.util
+import timeit
+
+from .. import parser
+from .server import FakePlayerokServer
+
+
+LEGACY_PARSER_PATH: Path = Path(__file__).resolve().parents[2] / "bench" / "legacy_parser.py"
+""" Путь к старому парсеру (`bench/legacy_parser.py` в корне репозитория, в пакет не входит). """
+
+
+def load_legacy_parser(path: Path = LEGACY_PARSER_PATH) -> ModuleType:
+    """
+    Загружает старый парсер для сравнения.
+
+    :param path: Путь к файлу старого парсера, _опционально_.
+    :type path: `pathlib.Path`
+
+    :return: Модуль старого парсера.
+    :rtype: `types.ModuleType`
+    """
+    if not path.is_file():
+        raise FileNotFoundError(f"Старый парсер не найден: {path} (бенчмарк парсера запускается из репозитория)")
+    spec = importlib.util.spec_from_file_location("playerokapi_legacy_parser", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _measure(func: Callable[[], Any], number: int) -> float:
+    """ Время одного вызова в секундах (лучшее из 5 повторов). """
+    return min(timeit.repeat(func, number=number, repeat=5)) / number
+
+
+def run(objects: int = 1000, number: int = 5) -> list[tuple[str, float, float]]:
+    """
+    Измеряет скорость разбора больших страниц ответа: старый парсер (импорт классов
+    внутри каждой функции) против табличного `playerokapi.parser`.
+
+    :param objects: Количество объектов на странице.
+    :type objects: `int`
+
+    :param number: Количество разборов страницы в одном повторе.
+    :type number: `int`
+
+    :return: Список (название, до, после), скорость в объектах в секунду.
+    :rtype: `list[tuple[str, float, float]]`
+    """
+    legacy_parser = load_legacy_parser()
+    server = FakePlayerokServer(chats=objects, items=objects, messages_per_chat=max(1, objects // 100))
+    variables = {"pagination": {"first": objects}}
+    chat_id = next(iter(server.chats))
+    pages = [
+        ("item_deal_list", server.resolve("deals", "deals", variables)["data"]["deals"]),
+        ("chat_list", server.resolve("chats", "chats", variables)["data"]["chats"]),
+        ("chat_message_list", server.resolve("chatMessages", "chat_messages",
+                                             {**variables, "filter": {"chatId": chat_id}})["data"]["chatMessages"]),
+        ("item_profile_list", server.resolve("items", "items", variables)["data"]["items"])
+    ]
+    results = []
+    for name, data in pages:
+        count = len(data["edges"])
+        before = _measure(lambda: getattr(legacy_parser, name)(data), number)
+        after = _measure(lambda: getattr(parser, name)(data), number)
+        results.append((name, count / before, count / after))
+    return results
+
+
+def main(objects: int = 1000):
+    if not LEGACY_PARSER_PATH.is_file():
+        print(f"Бенчмарк парсера пропущен: нет {LEGACY_PARSER_PATH}")
+        return
+    print(f"{'parser':<20}{'до, объект/с':>16}{'после, объект/с':>18}{'ускорение':>12}")
+    for name, before, after in run(objects):
+        print(f"{name:<20}{before:>16.0f}{after:>18.0f}{after / before:>11.2f}x")
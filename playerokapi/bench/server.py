@@ -0,0 +1,420 @@
+from __future__ import annotations
+from typing import *
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from datetime import datetime, timedelta, timezone
+from email.parser import BytesParser
+import json
+import random
+import threading
+import time
+import urllib.parse
+
+from ..misc import PERSISTED_QUERIES
+
+
+_QUERY_NAMES = {hash: query_name for query_name, hash in PERSISTED_QUERIES.items()}
+
+_WORDS = ("привет", "здравствуйте", "аккаунт", "спасибо", "когда", "отправите", "данные", "проверил",
+          "всё", "работает", "оплатил", "подскажите", "пожалуйста", "ок", "жду", "логин", "пароль")
+
+_BASE_TIME = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _isodate(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:%S.") + f"{dt.microsecond // 1000:03d}Z"
+
+
+def _page(nodes: list[dict], variables: dict) -> dict:
+    pagination = variables.get("pagination") or {}
+    first = pagination.get("first") or 24
+    start = int(pagination.get("after") or 0)
+    page = nodes[start:start + first]
+    end = start + len(page)
+    return {
+        "edges": [{"cursor": str(start + i + 1), "node": node} for i, node in enumerate(page)],
+        "pageInfo": {
+            "startCursor": str(start) if page else None,
+            "endCursor": str(end) if page else None,
+            "hasPreviousPage": start > 0,
+            "hasNextPage": end < len(nodes)
+        },
+        "totalCount": len(nodes)
+    }
+
+
+class FakePlayerokServer:
+    """
+    Локальный сервер-заглушка Playerok GraphQL API для бенчмарков.\n
+    Отвечает на persisted queries из `misc.PERSISTED_QUERIES` (по хешу), inline мутации,
+    пакетные запросы и Automatic Persisted Queries синтетическими, но правдоподобными данными:
+    тысячи чатов, сделок, предметов и сообщений.
+
+    Пример:
+        with FakePlayerokServer(chats=5000) as server:
+            account = Account(token="bench")
+            account.base_url = server.url
+            account.get()
+
+    :param chats: Количество чатов (и сделок - по одной на чат).
+    :type chats: `int`
+
+    :param items: Количество предметов.
+    :type items: `int`
+
+    :param messages_per_chat: Количество сообщений в каждом чате.
+    :type messages_per_chat: `int`
+
+    :param latency: Искусственная задержка каждого ответа (в секундах).
+    :type latency: `float`
+
+    :param seed: Зерно генератора данных.
+    :type seed: `int`
+
+    :param host: Адрес.
+    :type host: `str`
+
+    :param port: Порт (0 - любой свободный).
+    :type port: `int`
+    """
+
+    def __init__(self, chats: int = 2000, items: int = 2000, messages_per_chat: int = 30,
+                 latency: float = 0.0, seed: int = 0, host: str = "127.0.0.1", port: int = 0):
+        self.latency: float = latency
+        """ Искусственная задержка каждого ответа (в секундах). """
+        self.requests: int = 0
+        """ Количество обработанных HTTP запросов. """
+
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__registered_queries: set[str] = set()
+        self.__message_counter = 0
+        self.__host, self.__port = host, port
+        self.__server: ThreadingHTTPServer | None = None
+
+        self.seller: dict = self.__user("seller-00000", "BenchSeller")
+        """ Пользователь аккаунта, на котором "авторизован" сервер. """
+        self.items: list[dict] = [self.__item(i) for i in range(items)]
+        """ Предметы. """
+        self.deals: dict[str, dict] = {}
+        """ Сделки по ID. """
+        self.chats: dict[str, dict] = {}
+        """ Чаты по ID. """
+        self.messages: dict[str, list[dict]] = {}
+        """ Сообщения чатов (новые первыми) по ID чата. """
+        self.__chat_order: list[str] = []
+        for i in range(chats):
+            self.__create_chat(i, messages_per_chat)
+        self.__chat_order.sort(key=lambda chat_id: self.chats[chat_id]["lastMessage"]["createdAt"], reverse=True)
+
+    # --- данные ---
+
+    def __user(self, id: str, username: str) -> dict:
+        return {
+            "__typename": "UserFragment",
+            "id": id,
+            "username": username,
+            "role": "USER",
+            "avatarURL": f"https://i.playerok.com/avatars/{id}.webp",
+            "isOnline": self.__random.random() < 0.3,
+            "isBlocked": False,
+            "rating": round(self.__random.uniform(4.0, 5.0), 1),
+            "testimonialCounter": self.__random.randint(0, 500),
+            "createdAt": _isodate(_BASE_TIME - timedelta(days=self.__random.randint(1, 900))),
+            "supportChatId": None,
+            "systemChatId": None
+        }
+
+    def __item(self, i: int) -> dict:
+        price = self.__random.randint(50, 20000)
+        return {
+            "__typename": "MyItem",
+            "id": f"item-{i:05d}",
+            "slug": f"item-{i:05d}",
+            "name": f"Аккаунт #{i} с редкими скинами",
+            "description": "Полный доступ, смена почты, гарантия. " * 3,
+            "price": price,
+            "rawPrice": price,
+            "priorityPosition": i,
+            "status": "APPROVED",
+            "priority": "DEFAULT",
+            "sellerType": "USER",
+            "viewsCounter": self.__random.randint(0, 10000),
+            "feeMultiplier": 0.1,
+            "attachment": {"id": f"file-{i:05d}", "url": f"https://i.playerok.com/items/{i}.webp", "filename": f"{i}.webp", "mime": "image/webp"},
+            "attachments": [{"id": f"file-{i:05d}", "url": f"https://i.playerok.com/items/{i}.webp", "filename": f"{i}.webp", "mime": "image/webp"}],
+            "game": {"id": "game-00001", "slug": "bench-game", "name": "Bench Game", "type": "GAME", "logo": None},
+            "category": {"id": "category-00001", "slug": "accounts", "name": "Аккаунты", "gameId": "game-00001"},
+            "user": self.seller,
+            "approvalDate": _isodate(_BASE_TIME - timedelta(days=i % 30)),
+            "createdAt": _isodate(_BASE_TIME - timedelta(days=i % 60)),
+            "updatedAt": _isodate(_BASE_TIME)
+        }
+
+    def __create_chat(self, i: int, messages_count: int):
+        buyer = self.__user(f"user-{i:05d}", f"buyer{i:05d}")
+        chat_id = f"chat-{i:05d}"
+        item = self.items[i % len(self.items)] if self.items else None
+        started_at = _BASE_TIME - timedelta(minutes=self.__random.randint(messages_count + 1, 60 * 24 * 90))
+        deal = {
+            "__typename": "ItemDeal",
+            "id": f"deal-{i:05d}",
+            "status": self.__random.choice(("PAID", "SENT", "CONFIRMED", "CONFIRMED", "CONFIRMED")),
+            "direction": "IN",
+            "obtaining": None,
+            "hasProblem": False,
+            "reportProblemEnabled": True,
+            "props": None,
+            "prevStatus": None,
+            "completedAt": None,
+            "createdAt": _isodate(started_at),
+            "logs": [{"id": f"log-{i:05d}", "event": "PAID", "createdAt": _isodate(started_at), "user": buyer}],
+            "transaction": None,
+            "user": buyer,
+            "chat": {"__typename": "Chat", "id": chat_id},
+            "item": item,
+            "testimonial": None,
+            "obtainingFields": [],
+            "commentFromBuyer": None
+        }
+        self.deals[deal["id"]] = deal
+        messages = []
+        for j in range(messages_count):
+            created_at = started_at + timedelta(minutes=j)
+            if j == 0:
+                messages.append(self.__message(chat_id, "{{ITEM_PAID}}", buyer, created_at, deal))
+            else:
+                author = buyer if j % 2 else self.seller
+                text = " ".join(self.__random.choice(_WORDS) for _ in range(self.__random.randint(2, 12)))
+                messages.append(self.__message(chat_id, text, author, created_at))
+        messages.reverse()
+        self.messages[chat_id] = messages
+        self.chats[chat_id] = {
+            "__typename": "Chat",
+            "id": chat_id,
+            "type": "PM",
+            "status": "NEW",
+            "unreadMessagesCounter": self.__random.randint(0, 3),
+            "bookmarked": False,
+            "isTextingAllowed": True,
+            "owner": None,
+            "deals": [{"__typename": "ItemDeal", "id": deal["id"], "status": deal["status"], "direction": "IN"}],
+            "startedAt": _isodate(started_at),
+            "finishedAt": None,
+            "lastMessage": messages[0] if messages else None,
+            "participants": [self.seller, buyer]
+        }
+        self.__chat_order.append(chat_id)
+
+    def __message(self, chat_id: str, text: str, user: dict, created_at: datetime, deal: dict | None = None) -> dict:
+        self.__message_counter += 1
+        return {
+            "__typename": "ChatMessage",
+            "id": f"message-{self.__message_counter:08d}",
+            "text": text,
+            "createdAt": _isodate(created_at),
+            "deletedAt": None,
+            "isRead": True,
+            "isSuspicious": False,
+            "isBulkMessaging": False,
+            "isAutoResponse": False,
+            "file": None,
+            "game": None,
+            "user": user,
+            "deal": deal,
+            "item": None,
+            "transaction": None,
+            "moderator": None,
+            "event": None,
+            "eventByUser": None,
+            "eventToUser": None,
+            "buttons": [],
+            "chatId": chat_id
+        }
+
+    def add_message(self, chat_id: str | None = None, text: str | None = None, from_buyer: bool = True) -> dict:
+        """
+        Добавляет новое сообщение в чат (имитация активности покупателя).\n
+        Чат поднимается наверх списка чатов, как на настоящем сайте.
+
+        :param chat_id: ID чата, по умолчанию - случайный, _опционально_.
+        :type chat_id: `str` or `None`
+
+        :param text: Текст сообщения, _опционально_.
+        :type text: `str` or `None`
+
+        :param from_buyer: От покупателя ли сообщение (иначе - от продавца).
+        :type from_buyer: `bool`
+
+        :return: Узел нового сообщения.
+        :rtype: `dict`
+        """
+        with self.__lock:
+            chat_id = chat_id or self.__random.choice(self.__chat_order)
+            chat = self.chats[chat_id]
+            author = chat["participants"][1] if from_buyer else self.seller
+            text = text or " ".join(self.__random.choice(_WORDS) for _ in range(5))
+            message = self.__message(chat_id, text, author, datetime.now(timezone.utc))
+            self.messages[chat_id].insert(0, message)
+            chat["lastMessage"] = message
+            self.__chat_order.remove(chat_id)
+            self.__chat_order.insert(0, chat_id)
+            return message
+
+    def forget_persisted_queries(self):
+        """
+        Забывает зарегистрированные Automatic Persisted Queries (имитация перезапуска сервера).
+        """
+        with self.__lock:
+            self.__registered_queries.clear()
+
+    # --- GraphQL ---
+
+    def resolve(self, operation_name: str | None, query_name: str | None, variables: dict) -> dict:
+        """
+        Выполняет одну GraphQL операцию.
+
+        :return: Ответ операции (`{"data": ...}` или `{"errors": [...]}`).
+        :rtype: `dict`
+        """
+        name = query_name or operation_name
+        with self.__lock:
+            if name == "viewer":
+                return {"data": {"viewer": {**self.seller, "__typename": "User", "email": "seller@bench.local",
+                                            "hasFrozenBalance": False, "unreadChatsCounter": 0,
+                                            "hasConfirmedPhoneNumber": True, "canPublishItems": True}}}
+            if name == "user":
+                return {"data": {"user": {"__typename": "User", "id": self.seller["id"], "email": "seller@bench.local",
+                                          "role": "USER", "isBlocked": False, "profile": self.seller,
+                                          "balance": {"id": "balance", "value": 1000, "frozen": 0, "available": 1000,
+                                                      "withdrawable": 1000, "pendingIncome": 0}}}}
+            if name == "chats":
+                return {"data": {"chats": _page([self.chats[chat_id] for chat_id in self.__chat_order], variables)}}
+            if name == "chat":
+                return {"data": {"chat": self.chats.get(variables.get("id"))}}
+            if name in ("chat_messages", "chatMessages"):
+                chat_id = (variables.get("filter") or {}).get("chatId")
+                return {"data": {"chatMessages": _page(self.messages.get(chat_id, []), variables)}}
+            if name == "deals":
+                return {"data": {"deals": _page(list(self.deals.values()), variables)}}
+            if name == "deal":
+                return {"data": {"deal": self.deals.get(variables.get("id"))}}
+            if name == "items":
+                return {"data": {"items": _page(self.items, variables)}}
+            if name == "item":
+                item_id = variables.get("id") or variables.get("slug")
+                return {"data": {"item": next((item for item in self.items if item["id"] == item_id), None)}}
+            if name == "games":
+                return {"data": {"games": _page([self.items[0]["game"]] if self.items else [], variables)}}
+            if name in ("game", "GamePage"):
+                return {"data": {"game": self.items[0]["game"] if self.items else None}}
+            if name == "markChatAsRead":
+                chat = self.chats.get(variables["input"]["chatId"])
+                if chat is not None:
+                    chat["unreadMessagesCounter"] = 0
+                return {"data": {"markChatAsRead": chat}}
+            if name == "updateDeal":
+                deal = self.deals.get(variables["input"]["id"])
+                if deal is not None:
+                    deal["prevStatus"], deal["status"] = deal["status"], variables["input"].get("status")
+                return {"data": {"updateDeal": deal}}
+            if name == "updateItem":
+                item = next((item for item in self.items if item["id"] == variables["input"]["id"]), None)
+                if item is not None and variables["input"].get("price"):
+                    item["price"] = item["rawPrice"] = variables["input"]["price"]
+                return {"data": {"updateItem": item}}
+        if name == "createChatMessage":
+            chat_id = variables["input"]["chatId"]
+            message = self.add_message(chat_id, variables["input"].get("text"), from_buyer=False)
+            return {"data": {"createChatMessage": message}}
+        return {"data": {operation_name: None}}
+
+    def _handle(self, operation: dict) -> dict:
+        extensions = operation.get("extensions") or {}
+        if isinstance(extensions, str):
+            extensions = json.loads(extensions)
+        variables = operation.get("variables") or {}
+        if isinstance(variables, str):
+            variables = json.loads(variables)
+        hash = (extensions.get("persistedQuery") or {}).get("sha256Hash")
+        query_name = _QUERY_NAMES.get(hash)
+        if hash is not None and query_name is None:
+            # Automatic Persisted Query мутации
+            if operation.get("query"):
+                self.__registered_queries.add(hash)
+            elif hash not in self.__registered_queries:
+                return {"errors": [{"message": "PersistedQueryNotFound", "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"}}]}
+        return self.resolve(operation.get("operationName"), query_name, variables)
+
+    # --- HTTP ---
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _answer(self, obj: Any):
+                raw = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+                if server.latency:
+                    time.sleep(server.latency)
+                server.requests += 1
+                self.send_response(200)
+                self.send_header("content-type", "application/json; charset=utf-8")
+                self.send_header("content-length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def do_GET(self):
+                query = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+                operation = {k: v[0] for k, v in query.items()}
+                self._answer(server._handle(operation))
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("content-length") or 0))
+                content_type = self.headers.get("content-type") or ""
+                if content_type.startswith("multipart/form-data"):
+                    message = BytesParser().parsebytes(f"Content-Type: {content_type}\r\n\r\n".encode() + body)
+                    parts = {part.get_param("name", header="content-disposition"): part for part in message.get_payload()}
+                    operation = json.loads(parts["operations"].get_payload(decode=True))
+                else:
+                    operation = json.loads(body)
+                if isinstance(operation, list):
+                    self._answer([server._handle(op) for op in operation])
+                else:
+                    self._answer(server._handle(operation))
+
+        return Handler
+
+    @property
+    def url(self) -> str:
+        """ Базовый URL сервера (для `Account.base_url`). """
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> FakePlayerokServer:
+        """
+        Запускает сервер в фоновом потоке.
+        """
+        self.__server = ThreadingHTTPServer((self.__host, self.__port), self._make_handler())
+        self.__server.daemon_threads = True
+        threading.Thread(target=self.__server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        """
+        Останавливает сервер.
+        """
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
+
+    def __enter__(self) -> FakePlayerokServer:
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,280 @@
+from __future__ import annotations
+from typing import *
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import threading
+import time
+
+from . import json_backend
+
+
+DEFAULT_TTLS: dict[str, float] = {
+    "games": 3600,
+    "GamePage": 3600,
+    "GamePageCategory": 3600,
+    "gameCategoryObtainingTypes": 3600,
+    "gameCategoryDataFields": 3600,
+    "gameCategoryInstructions": 3600,
+    "transactionProviders": 3600,
+    "SbpBankMembers": 3600
+}
+""" TTL (в секундах) по умолчанию для справочных запросов, ключ - operationName. """
+
+
+class CachedResponse:
+    """
+    Ответ, полученный из кеша вместо сети.\n
+    Повторяет нужную библиотеке часть интерфейса ответа `curl_cffi`/`requests`.
+
+    :param url: URL запроса.
+    :type url: `str`
+
+    :param content: Тело ответа.
+    :type content: `bytes`
+
+    :param status_code: Код ответа.
+    :type status_code: `int`
+    """
+
+    def __init__(self, url: str, content: bytes, status_code: int = 200):
+        self.url: str = url
+        """ URL запроса. """
+        self.content: bytes = content
+        """ Тело ответа. """
+        self.status_code: int = status_code
+        """ Код ответа. """
+        self.headers: dict[str, str] = {"content-type": "application/json"}
+        """ Заголовки ответа. """
+        self.from_cache: bool = True
+        """ Получен ли ответ из кеша. """
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        return json_backend.loads(self.content)
+
+
+class BaseCache:
+    """
+    Базовый класс кеша ответов на GraphQL запросы.\n
+    Ключ кеша - пара (operationName, variables), у каждой операции свой TTL,
+    при переполнении вытесняются давно не использованные записи (LRU).
+
+    :param ttls: TTL (в секундах) по операциям, по умолчанию `DEFAULT_TTLS`, _опционально_.
+    :type ttls: `dict[str, float]` or `None`
+
+    :param max_size: Максимальное количество записей в кеше.
+    :type max_size: `int`
+    """
+
+    def __init__(self, ttls: dict[str, float] | None = None, max_size: int = 1024):
+        self.ttls: dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        """ TTL (в секундах) по операциям. Операции, которых здесь нет, не кешируются. """
+        self.max_size: int = max_size
+        """ Максимальное количество записей в кеше. """
+        self.hits: int = 0
+        """ Количество попаданий в кеш. """
+        self.misses: int = 0
+        """ Количество промахов кеша. """
+
+        self._lock = threading.RLock()
+
+    def make_key(self, operation_name: str, variables: Any) -> str:
+        if isinstance(variables, str):
+            # строка от разных библиотек JSON может отличаться (экранирование не-ASCII, порядок ключей),
+            # поэтому ключ строится по разобранным переменным, как и ключ кассеты
+            try:
+                variables = json.loads(variables)
+            except ValueError:
+                return f"{operation_name}:{variables}"
+        return f"{operation_name}:{json.dumps(variables, ensure_ascii=False, sort_keys=True)}"
+
+    def is_cacheable(self, operation_name: str | None) -> bool:
+        return operation_name in self.ttls
+
+    def get(self, operation_name: str, variables: Any) -> bytes | None:
+        """
+        Получает тело ответа из кеша.
+
+        :return: Тело ответа или `None`, если записи нет или она устарела.
+        :rtype: `bytes` or `None`
+        """
+        key = self.make_key(operation_name, variables)
+        with self._lock:
+            value = self._get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def set(self, operation_name: str, variables: Any, content: bytes):
+        """
+        Сохраняет тело ответа в кеш на TTL операции.
+        """
+        ttl = self.ttls.get(operation_name)
+        if not ttl:
+            return
+        key = self.make_key(operation_name, variables)
+        with self._lock:
+            self._set(key, content, time.time() + ttl)
+
+    def stats(self) -> dict[str, int]:
+        """
+        Получает статистику кеша.
+
+        :return: Словарь с ключами `hits`, `misses`, `size`.
+        :rtype: `dict[str, int]`
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self)}
+
+    def _get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    def _set(self, key: str, content: bytes, expires_at: float):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class MemoryCache(BaseCache):
+    """
+    Кеш ответов в памяти процесса.
+
+    :param ttls: TTL (в секундах) по операциям, по умолчанию `DEFAULT_TTLS`, _опционально_.
+    :type ttls: `dict[str, float]` or `None`
+
+    :param max_size: Максимальное количество записей в кеше.
+    :type max_size: `int`
+    """
+
+    def __init__(self, ttls: dict[str, float] | None = None, max_size: int = 1024):
+        super().__init__(ttls, max_size)
+        self.__entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict() # {key: (expires_at, content)}
+
+    def _get(self, key: str) -> bytes | None:
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        expires_at, content = entry
+        if expires_at <= time.time():
+            del self.__entries[key]
+            return None
+        self.__entries.move_to_end(key)
+        return content
+
+    def _set(self, key: str, content: bytes, expires_at: float):
+        self.__entries[key] = (expires_at, content)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self.__entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+
+class DiskCache(BaseCache):
+    """
+    Кеш ответов на диске: записи переживают перезапуск процесса.\n
+    Каждая запись хранится отдельным файлом в папке `path`.
+
+    :param path: Путь к папке кеша.
+    :type path: `str`
+
+    :param ttls: TTL (в секундах) по операциям, по умолчанию `DEFAULT_TTLS`, _опционально_.
+    :type ttls: `dict[str, float]` or `None`
+
+    :param max_size: Максимальное количество записей в кеше.
+    :type max_size: `int`
+    """
+
+    def __init__(self, path: str, ttls: dict[str, float] | None = None, max_size: int = 4096):
+        super().__init__(ttls, max_size)
+        self.path: str = path
+        """ Путь к папке кеша. """
+        os.makedirs(self.path, exist_ok=True)
+        self.__index: OrderedDict[str, float] = OrderedDict() # {filename: expires_at}
+        self.__load_index()
+
+    def __load_index(self):
+        now = time.time()
+        entries = []
+        for filename in os.listdir(self.path):
+            if not filename.endswith(".json"):
+                continue
+            file_path = os.path.join(self.path, filename)
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    expires_at = json.load(f)["expires_at"]
+            except (OSError, ValueError, KeyError):
+                continue
+            if expires_at <= now:
+                self.__remove_file(filename)
+                continue
+            entries.append((os.path.getmtime(file_path), filename, expires_at))
+        for _, filename, expires_at in sorted(entries):
+            self.__index[filename] = expires_at
+
+    def __filename(self, key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+
+    def __remove_file(self, filename: str):
+        try:
+            os.remove(os.path.join(self.path, filename))
+        except OSError:
+            pass
+
+    def _get(self, key: str) -> bytes | None:
+        filename = self.__filename(key)
+        expires_at = self.__index.get(filename)
+        if expires_at is None:
+            return None
+        if expires_at <= time.time():
+            del self.__index[filename]
+            self.__remove_file(filename)
+            return None
+        try:
+            with open(os.path.join(self.path, filename), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            del self.__index[filename]
+            return None
+        if entry.get("key") != key:
+            return None
+        self.__index.move_to_end(filename)
+        return entry["content"].encode("utf-8")
+
+    def _set(self, key: str, content: bytes, expires_at: float):
+        filename = self.__filename(key)
+        file_path = os.path.join(self.path, filename)
+        tmp_path = f"{file_path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": key, "expires_at": expires_at, "content": content.decode("utf-8")}, f, ensure_ascii=False)
+        os.replace(tmp_path, file_path)
+        self.__index[filename] = expires_at
+        self.__index.move_to_end(filename)
+        while len(self.__index) > self.max_size:
+            old_filename, _ = self.__index.popitem(last=False)
+            self.__remove_file(old_filename)
+
+    def clear(self):
+        with self._lock:
+            for filename in list(self.__index):
+                self.__remove_file(filename)
+            self.__index.clear()
+
+    def __len__(self) -> int:
+        return len(self.__index)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+from typing import *
+import asyncio
+import threading
+import time
+
+
+CLOUDFLARE_SIGNATURES = (
+    "<title>Just a moment...</title>",
+    "window._cf_chl_opt",
+    "Enable JavaScript and cookies to continue",
+    "Checking your browser before accessing",
+    "cf-browser-verification",
+    "Cloudflare Ray ID"
+)
+""" Строки, по которым в HTML странице узнаётся проверка Cloudflare. """
+
+CLOUDFLARE_STATUS_CODES = (403, 503)
+""" Коды ответа, с которыми Cloudflare отдаёт страницу проверки. """
+
+
+def is_cloudflare_challenge(resp) -> bool:
+    """
+    Проверяет, является ли ответ страницей проверки Cloudflare.\n
+    Сначала смотрит на дешёвые признаки (заголовок `cf-mitigated`, код ответа, тип содержимого),
+    и только для не-JSON ответов с кодом 403/503 ищет сигнатуры в тексте - обычный ответ,
+    в тексте которого встречается "Cloudflare", проверкой не считается.
+
+    :param resp: Объект ответа.
+
+    :return: True, если это проверка Cloudflare.
+    :rtype: `bool`
+    """
+    headers = resp.headers
+    if headers.get("cf-mitigated") == "challenge":
+        return True
+    if resp.status_code not in CLOUDFLARE_STATUS_CODES:
+        return False
+    content_type = headers.get("content-type") or ""
+    if "json" in content_type:
+        return False
+    text = resp.text
+    return any(sig in text for sig in CLOUDFLARE_SIGNATURES)
+
+
+class ChallengePolicy:
+    """
+    Политика реакции на проверку Cloudflare.\n
+    С каждой следующей подряд проверкой реакция усиливается по шагам `steps`
+    (последний шаг повторяется), а задержка растёт экспоненциально.
+
+    Доступные шаги:
+    - `retry` - просто повторить запрос после задержки;
+    - `rotate_fingerprint` - пересоздать curl сессию с другим TLS отпечатком браузера;
+    - `rotate_proxy` - переключиться на другой прокси (если есть из чего выбирать, иначе - `rebuild`);
+    - `rebuild` - пересоздать оба HTTP клиента.
+
+    :param steps: Шаги эскалации по порядку.
+    :type steps: `tuple[str]`
+
+    :param base_delay: Начальная задержка (в секундах).
+    :type base_delay: `float`
+
+    :param max_delay: Максимальная задержка (в секундах).
+    :type max_delay: `float`
+
+    :param max_attempts: Максимальное количество попыток одного запроса.
+    :type max_attempts: `int`
+
+    :param fingerprints: Отпечатки браузеров `curl_cffi` для шага `rotate_fingerprint`.
+    :type fingerprints: `tuple[str]`
+    """
+
+    def __init__(self, steps: tuple[str, ...] = ("retry", "rotate_fingerprint", "rotate_proxy", "rebuild"),
+                 base_delay: float = 5.0, max_delay: float = 120.0, max_attempts: int = 30,
+                 fingerprints: tuple[str, ...] = ("chrome", "chrome131", "chrome124", "edge101", "safari17_0")):
+        self.steps: tuple[str, ...] = tuple(steps)
+        """ Шаги эскалации по порядку. """
+        self.base_delay: float = base_delay
+        """ Начальная задержка (в секундах). """
+        self.max_delay: float = max_delay
+        """ Максимальная задержка (в секундах). """
+        self.max_attempts: int = max_attempts
+        """ Максимальное количество попыток одного запроса. """
+        self.fingerprints: tuple[str, ...] = tuple(fingerprints)
+        """ Отпечатки браузеров для шага `rotate_fingerprint`. """
+
+    def step(self, level: int) -> str:
+        return self.steps[min(level, len(self.steps) - 1)]
+
+    def delay(self, level: int) -> float:
+        return min(self.max_delay, self.base_delay * (2 ** level))
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker для проверок Cloudflare, общий для всех потоков (и задач) аккаунта.\n
+    После проверки он "размыкается" на время задержки, и все запросы ждут,
+    вместо того чтобы каждый в своём цикле повторять попытки. Затем один запрос
+    уходит пробным: если он прошёл - цепь замыкается, если нет - задержка растёт.
+
+    Один объект можно передать нескольким аккаунтам (например, с общим прокси).
+
+    :param policy: Политика реакции на проверку, _опционально_.
+    :type policy: `playerokapi.challenge.ChallengePolicy` or `None`
+    """
+
+    def __init__(self, policy: ChallengePolicy | None = None):
+        self.policy: ChallengePolicy = policy or ChallengePolicy()
+        """ Политика реакции на проверку. """
+        self.failures: int = 0
+        """ Количество проверок подряд. """
+        self.challenges: int = 0
+        """ Сколько всего было проверок. """
+
+        self.__open_until: float = 0.0
+        self.__probing: bool = False
+        self.__cond = threading.Condition()
+
+    @property
+    def is_open(self) -> bool:
+        """ Разомкнута ли сейчас цепь (запросы ждут). """
+        return time.monotonic() < self.__open_until
+
+    def __try_enter(self) -> float:
+        # 0 - можно отправлять запрос, иначе - сколько подождать
+        now = time.monotonic()
+        if now < self.__open_until:
+            return self.__open_until - now
+        if self.failures:
+            if self.__probing:
+                return 0.1
+            self.__probing = True
+        return 0.0
+
+    def wait(self):
+        """
+        Блокирует поток, пока цепь разомкнута.
+        """
+        with self.__cond:
+            while True:
+                delay = self.__try_enter()
+                if delay <= 0:
+                    return
+                self.__cond.wait(delay)
+
+    async def wait_async(self):
+        """
+        Асинхронная версия `wait`.
+        """
+        while True:
+            with self.__cond:
+                delay = self.__try_enter()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def record_success(self):
+        """
+        Отмечает успешный ответ - цепь замыкается.
+        """
+        with self.__cond:
+            if self.failures or self.__probing:
+                self.failures = 0
+                self.__probing = False
+                self.__cond.notify_all()
+
+    def release(self):
+        """
+        Отмечает, что запрос завершился без ответа (например, сетевая ошибка).
+        """
+        with self.__cond:
+            if self.__probing:
+                self.__probing = False
+                self.__cond.notify_all()
+
+    def record_challenge(self) -> tuple[str, float] | None:
+        """
+        Отмечает проверку Cloudflare и размыкает цепь.
+
+        :return: Шаг эскалации и задержка, если реагировать должен вызывающий,
+            или `None`, если цепь уже разомкнута другим запросом.
+        :rtype: `tuple[str, float]` or `None`
+        """
+        with self.__cond:
+            self.challenges += 1
+            now = time.monotonic()
+            if now < self.__open_until:
+                return None
+            level = self.failures
+            self.failures += 1
+            self.__probing = False
+            delay = self.policy.delay(level)
+            self.__open_until = now + delay
+            self.__cond.notify_all()
+            return self.policy.step(level), delay
@@ -0,0 +1,152 @@
+from __future__ import annotations
+from typing import *
+import json
+import os
+import threading
+
+if TYPE_CHECKING:
+    from .types import Chat
+
+
+COMPACT_MIN_SUPERSEDED = 100
+""" Сколько устаревших записей должно накопиться в файле индекса (и не меньше, чем актуальных), чтобы при загрузке он был переписан. """
+
+
+class ChatIndex:
+    """
+    Индекс чатов по никнеймам собеседников: {никнейм: ID чата}.\n
+    Заполняется автоматически при получении чатов (`Account.get_chats`, `Account.get_chat`),
+    поэтому `Account.get_chat_by_username` находит уже известные чаты без обхода всех страниц.\n
+    Никнеймы сравниваются без учёта регистра.
+
+    :param path: Путь к файлу, в котором индекс хранится между запусками (JSON записи построчно), _опционально_.
+    :type path: `str` or `None`
+    """
+
+    def __init__(self, path: str | None = None):
+        self.path: str | None = path
+        """ Путь к файлу индекса. """
+
+        self.__lock = threading.Lock()
+        self.__chat_ids: dict[str, str] = {} # {username.lower(): chat_id}
+        self.load()
+
+    def load(self):
+        """
+        Загружает индекс из файла (если он есть).
+        """
+        with self.__lock:
+            self.__chat_ids.clear()
+            if self.path is None or not os.path.exists(self.path):
+                return
+            lines = 0
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    lines += 1
+                    entry = json.loads(line)
+                    if entry["chat_id"] is None:
+                        self.__chat_ids.pop(entry["username"], None)
+                    else:
+                        self.__chat_ids[entry["username"]] = entry["chat_id"]
+            # файл только дописывается, поэтому со временем в нём копятся устаревшие записи
+            if lines - len(self.__chat_ids) >= max(len(self.__chat_ids), COMPACT_MIN_SUPERSEDED):
+                self._compact()
+
+    def _compact(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for username, chat_id in self.__chat_ids.items():
+                f.write(json.dumps({"username": username, "chat_id": chat_id}, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def _write(self, entries: list[tuple[str, str | None]]):
+        if self.path is None or not entries:
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for username, chat_id in entries:
+                f.write(json.dumps({"username": username, "chat_id": chat_id}, ensure_ascii=False) + "\n")
+
+    def __len__(self) -> int:
+        return len(self.__chat_ids)
+
+    def __contains__(self, username: str) -> bool:
+        return username.lower() in self.__chat_ids
+
+    def get(self, username: str) -> str | None:
+        """
+        Получает ID чата с пользователем.
+
+        :param username: Никнейм собеседника.
+        :type username: `str`
+
+        :return: ID чата или `None`, если чат ещё не встречался.
+        :rtype: `str` or `None`
+        """
+        return self.__chat_ids.get(username.lower())
+
+    def set(self, username: str, chat_id: str):
+        """
+        Записывает ID чата с пользователем.
+
+        :param username: Никнейм собеседника.
+        :type username: `str`
+
+        :param chat_id: ID чата.
+        :type chat_id: `str`
+        """
+        key = username.lower()
+        with self.__lock:
+            if self.__chat_ids.get(key) == chat_id:
+                return
+            self.__chat_ids[key] = chat_id
+            self._write([(key, chat_id)])
+
+    def remove(self, username: str):
+        """
+        Удаляет пользователя из индекса (например, если чат с ним больше не существует).
+
+        :param username: Никнейм собеседника.
+        :type username: `str`
+        """
+        key = username.lower()
+        with self.__lock:
+            if self.__chat_ids.pop(key, None) is not None:
+                self._write([(key, None)])
+
+    def add_chats(self, chats: Iterable[Chat | None], exclude_user_id: str | None = None):
+        """
+        Записывает в индекс собеседников из чатов.
+
+        :param chats: Чаты.
+        :type chats: `list[playerokapi.types.Chat]`
+
+        :param exclude_user_id: ID пользователя, которого не нужно записывать (сам аккаунт), _опционально_.
+        :type exclude_user_id: `str` or `None`
+        """
+        entries = []
+        with self.__lock:
+            for chat in chats:
+                if chat is None or not chat.users:
+                    continue
+                for user in chat.users:
+                    if user is None or not user.username or (exclude_user_id is not None and user.id == exclude_user_id):
+                        continue
+                    key = user.username.lower()
+                    if self.__chat_ids.get(key) != chat.id:
+                        self.__chat_ids[key] = chat.id
+                        entries.append((key, chat.id))
+            self._write(entries)
+
+    def clear(self):
+        """
+        Очищает индекс (вместе с файлом).
+        """
+        with self.__lock:
+            self.__chat_ids.clear()
+            if self.path is not None and os.path.exists(self.path):
+                os.remove(self.path)
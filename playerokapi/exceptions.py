@@ -75,3 +75,52 @@ class UnauthorizedError(Exception):
 
     def __str__(self):
         return "Не удалось подключиться к аккаунту Playerok. Может вы указали неверный token?"
+
+
+class BatchOperationError(Exception):
+    """
+    Ошибка, которая возбуждается, если одна из операций пакетного запроса завершилась с ошибкой.
+
+    :param operation_name: Название GraphQL операции.
+    :type operation_name: `str`
+
+    :param error: Объект ошибки из ответа сервера.
+    :type error: `dict`
+    """
+
+    def __init__(self, operation_name: str, error: dict):
+        self.operation_name = operation_name
+        self.error = error
+        self.error_code = (error.get("extensions") or {}).get("code")
+        self.error_message = error.get("message")
+
+    def __str__(self):
+        msg = (
+            f"Ошибка операции {self.operation_name} в пакетном запросе"
+            f"\nКод ошибки: {self.error_code}"
+            f"\nСообщение: {self.error_message}"
+        )
+        return msg
+
+
+class CassetteMissError(Exception):
+    """
+    Ошибка, которая возбуждается, если в кассете нет записанного ответа на запрос.
+
+    :param operation_name: Название GraphQL операции.
+    :type operation_name: `str`
+
+    :param variables: Переменные запроса (JSON строка).
+    :type variables: `str`
+    """
+
+    def __init__(self, operation_name: str | None, variables: str):
+        self.operation_name = operation_name
+        self.variables = variables
+
+    def __str__(self):
+        msg = (
+            f"В кассете нет ответа на запрос {self.operation_name}"
+            f"\nПеременные: {self.variables}"
+        )
+        return msg
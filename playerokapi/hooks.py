@@ -0,0 +1,77 @@
+from __future__ import annotations
+from typing import *
+from logging import getLogger
+
+
+HOOK_EVENTS = ("on_request_start", "on_response", "on_retry", "on_cloudflare")
+"""
+События запросов, на которые можно подписаться:
+- `on_request_start(account, operation_name, method, url)` - перед отправкой HTTP запроса;
+- `on_response(account, operation_name, response, elapsed)` - после получения ответа (`elapsed` - в секундах);
+- `on_retry(account, operation_name, reason, attempt)` - перед повторной отправкой (`reason`: `cloudflare`, `persisted_query`, `server_error`);
+- `on_cloudflare(account, operation_name, step)` - при проверке Cloudflare (`step` - шаг эскалации или `None`, если реагирует другой запрос).
+"""
+
+
+class Hooks:
+    """
+    Набор обработчиков событий запросов аккаунта.\n
+    Исключения обработчиков логируются и не прерывают запрос.
+    Один объект можно передать нескольким аккаунтам.
+
+    Пример:
+        account.hooks.add("on_response", lambda account, op, resp, elapsed: print(op, elapsed))
+    """
+
+    def __init__(self):
+        self.__handlers: dict[str, list[Callable]] = {event: [] for event in HOOK_EVENTS}
+        self.__logger = getLogger("playerokapi.hooks")
+
+    def __check_event(self, event: str):
+        if event not in self.__handlers:
+            raise ValueError(f"Неизвестное событие {event}, доступные: {', '.join(HOOK_EVENTS)}")
+
+    def add(self, event: str, handler: Callable) -> Callable:
+        """
+        Добавляет обработчик события.
+
+        :param event: Название события (из `HOOK_EVENTS`).
+        :type event: `str`
+
+        :param handler: Функция-обработчик.
+        :type handler: `callable`
+
+        :return: Тот же обработчик.
+        :rtype: `callable`
+        """
+        self.__check_event(event)
+        self.__handlers[event].append(handler)
+        return handler
+
+    def remove(self, event: str, handler: Callable):
+        """
+        Удаляет обработчик события.
+
+        :param event: Название события (из `HOOK_EVENTS`).
+        :type event: `str`
+
+        :param handler: Функция-обработчик.
+        :type handler: `callable`
+        """
+        self.__check_event(event)
+        if handler in self.__handlers[event]:
+            self.__handlers[event].remove(handler)
+
+    def has(self, event: str) -> bool:
+        """ Есть ли обработчики у события. """
+        return bool(self.__handlers.get(event))
+
+    def emit(self, event: str, *args):
+        """
+        Вызывает все обработчики события.
+        """
+        for handler in self.__handlers[event]:
+            try:
+                handler(*args)
+            except Exception:
+                self.__logger.exception(f"Ошибка в обработчике {event}")
@@ -0,0 +1,156 @@
+from __future__ import annotations
+from typing import *
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+import threading
+
+
+class IdentityMap:
+    """
+    Карта идентичности: один объект на каждую пару (тип, ID).\n
+    Пока карта используется парсером (см. `use` и параметр `identity_map` аккаунта),
+    повторяющиеся в ответах пользователи, игры и чаты (`UserProfile`, `Game`, `Chat`)
+    не создаются заново, а берутся из карты и обновляются полями, пришедшими в новом ответе.
+    Поля, которых в ответе нет, сохраняют известные значения.\n
+    Поэтому один и тот же пользователь - это один и тот же объект (`a is b`),
+    даже если он встретился в разных ответах.
+
+    :param maxsize: Максимальное количество объектов (самые давно использованные вытесняются), `None` - без ограничения.
+    :type maxsize: `int` or `None`
+    """
+
+    def __init__(self, maxsize: int | None = 10000):
+        self.maxsize: int | None = maxsize
+        """ Максимальное количество объектов. """
+        self.hits: int = 0
+        """ Сколько раз объект был найден в карте. """
+        self.misses: int = 0
+        """ Сколько раз объекта не было в карте. """
+
+        self.__lock = threading.Lock()
+        self.__objects: OrderedDict[tuple[str, str], Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__objects)
+
+    def __contains__(self, key: tuple[str, str]) -> bool:
+        return key in self.__objects
+
+    def get(self, key: tuple[str, str]) -> Any | None:
+        """
+        Получает объект из карты.
+
+        :param key: Ключ: (название класса, ID).
+        :type key: `tuple[str, str]`
+
+        :return: Объект или `None`, если его нет.
+        """
+        with self.__lock:
+            obj = self.__objects.get(key)
+            if obj is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.__objects.move_to_end(key)
+            return obj
+
+    def put(self, key: tuple[str, str], obj: Any):
+        """
+        Записывает объект в карту.
+
+        :param key: Ключ: (название класса, ID).
+        :type key: `tuple[str, str]`
+
+        :param obj: Объект.
+        """
+        with self.__lock:
+            self.__objects[key] = obj
+            self.__objects.move_to_end(key)
+            if self.maxsize is not None and len(self.__objects) > self.maxsize:
+                self.__objects.popitem(last=False)
+
+    def setdefault(self, key: tuple[str, str], obj: Any) -> Any:
+        """
+        Записывает объект в карту, если по этому ключу ещё ничего нет.
+
+        :param key: Ключ: (название класса, ID).
+        :type key: `tuple[str, str]`
+
+        :param obj: Объект.
+
+        :return: Объект из карты (уже существовавший или только что записанный).
+        """
+        with self.__lock:
+            existing = self.__objects.get(key)
+            if existing is not None:
+                self.__objects.move_to_end(key)
+                return existing
+            self.__objects[key] = obj
+            if self.maxsize is not None and len(self.__objects) > self.maxsize:
+                self.__objects.popitem(last=False)
+            return obj
+
+    def remove(self, key: tuple[str, str]):
+        """
+        Удаляет объект из карты.
+
+        :param key: Ключ: (название класса, ID).
+        :type key: `tuple[str, str]`
+        """
+        with self.__lock:
+            self.__objects.pop(key, None)
+
+    def clear(self):
+        """
+        Очищает карту.
+        """
+        with self.__lock:
+            self.__objects.clear()
+            self.hits = self.misses = 0
+
+
+_current_map: ContextVar[IdentityMap | None] = ContextVar("playerokapi_identity_map", default=None)
+
+
+def current() -> IdentityMap | None:
+    """
+    Получает карту идентичности, которой сейчас пользуется парсер.
+
+    :return: Карта идентичности или `None`.
+    :rtype: `playerokapi.identity.IdentityMap` or `None`
+    """
+    return _current_map.get()
+
+
+def set_current(identity_map: IdentityMap | None):
+    """
+    Устанавливает карту идентичности для парсера в текущем потоке/задаче.
+
+    :param identity_map: Карта идентичности (`None` - не использовать).
+    :type identity_map: `playerokapi.identity.IdentityMap` or `None`
+    """
+    _current_map.set(identity_map)
+
+
+@contextmanager
+def use(identity_map: IdentityMap | None = None) -> Generator[IdentityMap, None, None]:
+    """
+    Использует карту идентичности для всего, что разбирается внутри `with`.
+
+    Пример:
+        with identity.use() as m:
+            messages = parser.chat_message_list(data)  # один UserProfile на каждого автора
+
+    :param identity_map: Карта идентичности (по умолчанию - новая без ограничения размера), _опционально_.
+    :type identity_map: `playerokapi.identity.IdentityMap` or `None`
+
+    :return: Используемая карта идентичности.
+    :rtype: `playerokapi.identity.IdentityMap`
+    """
+    identity_map = identity_map if identity_map is not None else IdentityMap(maxsize=None)
+    token = _current_map.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _current_map.reset(token)
@@ -0,0 +1,187 @@
+from __future__ import annotations
+from typing import *
+import json
+
+
+class JSONBackend:
+    """
+    Библиотека для сериализации JSON (тела запросов, переменные GraphQL, ответы).
+
+    :param name: Название библиотеки (`orjson`, `msgspec` или `json`).
+    :type name: `str`
+
+    :param dumps: Функция сериализации в `bytes`.
+    :type dumps: `Callable[[Any], bytes]`
+
+    :param loads: Функция разбора из `bytes` или `str`.
+    :type loads: `Callable[[bytes | str], Any]`
+    """
+
+    def __init__(self, name: str, dumps: Callable[[Any], bytes], loads: Callable[[bytes | str], Any]):
+        self.name: str = name
+        """ Название библиотеки. """
+        self.dumps: Callable[[Any], bytes] = dumps
+        """ Функция сериализации в `bytes`. """
+        self.loads: Callable[[bytes | str], Any] = loads
+        """ Функция разбора из `bytes` или `str`. """
+
+    def __repr__(self) -> str:
+        return f"JSONBackend({self.name!r})"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # с экранированием не-ASCII символов стандартный кодировщик заметно быстрее, а JSON тот же
+    return json.dumps(obj, separators=(",", ":")).encode("ascii")
+
+
+def _make_backend(name: str) -> JSONBackend:
+    if name == "orjson":
+        import orjson
+        options = orjson.OPT_NON_STR_KEYS
+        return JSONBackend("orjson", lambda obj: orjson.dumps(obj, option=options), orjson.loads)
+    if name == "msgspec":
+        import msgspec
+        encoder, decoder = msgspec.json.Encoder(), msgspec.json.Decoder()
+        return JSONBackend("msgspec", encoder.encode, decoder.decode)
+    if name == "json":
+        return JSONBackend("json", _stdlib_dumps, json.loads)
+    raise ValueError(f"Неизвестная библиотека JSON: {name}")
+
+
+BACKENDS: tuple[str, ...] = ("orjson", "msgspec", "json")
+""" Поддерживаемые библиотеки JSON в порядке предпочтения. """
+
+STDLIB: JSONBackend = _make_backend("json")
+""" Стандартный модуль `json` (используется, если другие библиотеки не установлены или не справились с объектом). """
+
+
+def available() -> list[str]:
+    """
+    Получает установленные библиотеки JSON.
+
+    :return: Названия библиотек в порядке предпочтения.
+    :rtype: `list[str]`
+    """
+    names = []
+    for name in BACKENDS:
+        try:
+            _make_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+_backend: JSONBackend = STDLIB
+
+
+def use(name: str | None = None) -> JSONBackend:
+    """
+    Выбирает библиотеку JSON для всей библиотеки.\n
+    По умолчанию (при импорте) выбирается самая быстрая из установленных: `orjson`, затем `msgspec`, затем `json`.
+
+    :param name: Название библиотеки (`orjson`, `msgspec` или `json`), `None` - самая быстрая из установленных, _опционально_.
+    :type name: `str` or `None`
+
+    :return: Выбранная библиотека.
+    :rtype: `playerokapi.json_backend.JSONBackend`
+    """
+    global _backend
+    _backend = _make_backend(name) if name is not None else _make_backend(available()[0])
+    return _backend
+
+
+def get_backend() -> JSONBackend:
+    """
+    Получает используемую библиотеку JSON.
+
+    :return: Используемая библиотека.
+    :rtype: `playerokapi.json_backend.JSONBackend`
+    """
+    return _backend
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Сериализует объект в JSON (компактно).
+
+    :param obj: Объект.
+    :type obj: `Any`
+
+    :return: JSON в кодировке UTF-8.
+    :rtype: `bytes`
+    """
+    try:
+        return _backend.dumps(obj)
+    except TypeError:
+        # например, целые числа больше 64 бит или неподдерживаемые типы
+        return STDLIB.dumps(obj)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Сериализует объект в JSON строку (компактно).
+
+    :param obj: Объект.
+    :type obj: `Any`
+
+    :return: JSON строка.
+    :rtype: `str`
+    """
+    return dumps_bytes(obj).decode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Разбирает JSON.
+
+    :param data: JSON в `bytes` или `str`.
+    :type data: `bytes` or `str`
+
+    :return: Разобранный объект.
+    :rtype: `Any`
+    """
+    return _backend.loads(data)
+
+
+class _ResponseJSON:
+    """ Замена метода `json()` ответа: разбирает тело один раз и возвращает тот же объект при повторных вызовах. """
+
+    __slots__ = ("content", "value")
+
+    def __init__(self, content: bytes):
+        self.content = content # само тело, а не ответ - без цикла ответ -> метод -> ответ
+        self.value = _missing
+
+    def __call__(self, **kwargs) -> Any:
+        if kwargs:
+            return json.loads(self.content, **kwargs)
+        if self.value is _missing:
+            self.value = _backend.loads(self.content)
+        return self.value
+
+
+_missing = object()
+
+
+def bind_response(response: Any) -> Any:
+    """
+    Подменяет `response.json()` так, чтобы тело ответа разбиралось выбранной библиотекой
+    прямо из `content` (без сборки `text`) и только один раз за время жизни ответа.\n
+    Повторные вызовы возвращают один и тот же объект - изменять его нельзя.
+
+    :param response: Ответ `curl_cffi`/`tls_requests` или `playerokapi.cache.CachedResponse`.
+    :type response: `curl_cffi.requests.Response`
+
+    :return: Тот же ответ.
+    :rtype: `curl_cffi.requests.Response`
+    """
+    if not isinstance(getattr(response, "json", None), _ResponseJSON):
+        try:
+            response.json = _ResponseJSON(response.content)
+        except (AttributeError, TypeError):
+            pass
+    return response
+
+
+use()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+from typing import *
+import time
+
+
+class BoundedSet:
+    """
+    Множество ID для отсева повторов с ограниченным размером.\n
+    Элементы хранятся в порядке последнего обращения: при переполнении (`maxsize`)
+    и по истечении `ttl` вытесняются самые старые, поэтому память не растёт,
+    сколько бы ни работал слушатель. Проверка, добавление и вытеснение - O(1).\n
+    Не потокобезопасно (рассчитано на один слушатель).
+
+    :param maxsize: Максимальное количество элементов.
+    :type maxsize: `int`
+
+    :param ttl: Сколько секунд хранить элемент после последнего обращения, `None` - без ограничения, _опционально_.
+    :type ttl: `float` or `None`
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float | None = None):
+        self.maxsize: int = maxsize
+        """ Максимальное количество элементов. """
+        self.ttl: float | None = ttl
+        """ Сколько секунд хранить элемент после последнего обращения. """
+        self.hits: int = 0
+        """ Сколько раз элемент уже был в множестве (отсеянные повторы). """
+        self.misses: int = 0
+        """ Сколько раз элемента не было в множестве (новые элементы). """
+        self.evictions: int = 0
+        """ Сколько элементов вытеснено (по размеру или по времени). """
+
+        self.__items: dict[Hashable, float] = {} # {элемент: время последнего обращения}, в порядке обращения
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        added_at = self.__items.get(item)
+        return added_at is not None and (self.ttl is None or time.monotonic() - added_at <= self.ttl)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self.__items))
+
+    def _evict(self, now: float):
+        items = self.__items
+        while len(items) > self.maxsize:
+            del items[next(iter(items))]
+            self.evictions += 1
+        if self.ttl is not None:
+            deadline = now - self.ttl
+            while items:
+                oldest = next(iter(items))
+                if items[oldest] >= deadline:
+                    break
+                del items[oldest]
+                self.evictions += 1
+
+    def add(self, item: Hashable) -> bool:
+        """
+        Добавляет элемент (если он уже есть - обновляет время обращения к нему).
+
+        :param item: Элемент (например, ID сообщения).
+        :type item: `Hashable`
+
+        :return: `True`, если элемента ещё не было (или он устарел), иначе `False`.
+        :rtype: `bool`
+        """
+        now = time.monotonic()
+        items = self.__items
+        added_at = items.pop(item, None)
+        items[item] = now
+        is_new = added_at is None or (self.ttl is not None and now - added_at > self.ttl)
+        if is_new:
+            self.misses += 1
+        else:
+            self.hits += 1
+        self._evict(now)
+        return is_new
+
+    def discard(self, item: Hashable):
+        """
+        Удаляет элемент, если он есть.
+
+        :param item: Элемент.
+        :type item: `Hashable`
+        """
+        self.__items.pop(item, None)
+
+    def clear(self):
+        """
+        Очищает множество и счётчики.
+        """
+        self.__items.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int | float | None]:
+        """
+        Получает метрики множества.
+
+        :return: Размер, ограничения и счётчики: `size`, `maxsize`, `ttl`, `hits`, `misses`, `evictions`.
+        :rtype: `dict[str, int | float | None]`
+        """
+        return {
+            "size": len(self.__items),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
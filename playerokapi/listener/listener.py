@@ -1,10 +1,11 @@
 from typing import Generator
 from logging import getLogger
-from datetime import datetime
 
 from ..account import Account
 from ..types import ChatList, ChatMessage, Chat
 from .events import *
+from .dedup import BoundedSet
+from .scheduler import ReviewCheckScheduler
 
 
 class EventListener:
@@ -13,18 +14,43 @@ class EventListener:
 
     :param account: Объект аккаунта.
     :type account: `playerokapi.account.Account`
+
+    :param dedup_maxsize: Сколько последних ID сообщений и сделок помнить для отсева повторов.
+        Должно быть больше, чем сообщений в одном опросе (24 чата по 24 сообщения), _опционально_.
+    :type dedup_maxsize: `int`
+
+    :param dedup_ttl: Сколько секунд помнить ID после того, как он последний раз встретился, `None` - без ограничения, _опционально_.
+    :type dedup_ttl: `float` or `None`
+
+    :param review_scheduler: Очередь проверок сделок на новые отзывы (интервалы, рост интервала, окно отзыва), _опционально_.
+    :type review_scheduler: `playerokapi.listener.scheduler.ReviewCheckScheduler` or `None`
     """
 
-    def __init__(self, account: Account):
+    def __init__(self, account: Account, dedup_maxsize: int = 10000, dedup_ttl: float | None = None,
+                 review_scheduler: ReviewCheckScheduler | None = None):
         self.account: Account = account
         """ Объект аккаунта. """
 
         self.__logger = getLogger("playerokapi.listener")
-        self.__review_check_deals: list[str] = [] # [deal_id]
-        self.__last_check_time: dict[str, datetime] = {} # {deal_id: last_check_time}
-        
-        self.__listened_messages: list[str] = [] # [mess_id]
-        self.__saved_deals: list[str] = [] # [deal_id]
+        self.review_scheduler: ReviewCheckScheduler = review_scheduler if review_scheduler is not None else ReviewCheckScheduler()
+        """ Очередь проверок сделок на новые отзывы. """
+
+        self.__listened_messages = BoundedSet(dedup_maxsize, dedup_ttl) # {mess_id}
+        self.__saved_deals = BoundedSet(dedup_maxsize, dedup_ttl) # {deal_id}
+
+    def stats(self) -> dict[str, dict[str, int | float | None]]:
+        """
+        Получает метрики состояния слушателя: размеры множеств для отсева повторов.
+
+        :return: Метрики множеств `listened_messages` и `saved_deals` (см. `playerokapi.listener.dedup.BoundedSet.stats`)
+            и очереди проверок отзывов `review_checks` (см. `playerokapi.listener.scheduler.ReviewCheckScheduler.stats`).
+        :rtype: `dict[str, dict[str, int | float | None]]`
+        """
+        return {
+            "listened_messages": self.__listened_messages.stats(),
+            "saved_deals": self.__saved_deals.stats(),
+            "review_checks": self.review_scheduler.stats()
+        }
 
     def parse_chat_event(
         self, chat: Chat
@@ -102,8 +128,7 @@ class EventListener:
             return []
         
         if message.text == "{{ITEM_PAID}}" and message.deal is not None:
-            if message.deal.id not in self.__saved_deals:
-                self.__saved_deals.append(message.deal.id)
+            if self.__saved_deals.add(message.deal.id):
                 return [
                     NewDealEvent(message.deal, chat), 
                     ItemPaidEvent(message.deal, chat)
@@ -133,23 +158,27 @@ class EventListener:
 
         return [NewMessageEvent(message, chat)]
 
-    def _should_check_deal(
-        self, deal_id: int, delay: int = 30
-    ) -> bool:
-        now = time.time()
-        last_time = self.__last_check_time.get(deal_id, 0)
-        if now - last_time > delay:
-            self.__last_check_time[deal_id] = now
-            return True
-        return False
-    
-    def _correct_isodate(
-        self, iso_date: str
-    ) -> datetime:
-        return datetime.fromisoformat(iso_date.replace("Z", "+00:00"))
+    @staticmethod
+    def snapshot_chats(chats: ChatList | None) -> list[tuple[str, str | None, int | None]]:
+        """
+        Запоминает состояние страницы чатов: для каждого чата - ID и дату последнего сообщения.\n
+        С картой идентичности (`Account(identity_map=...)`) объекты чатов общие для всех ответов
+        и обновляются на месте, поэтому сравнивать новые чаты нужно со снимком, а не со старым `ChatList`.
+
+        :param chats: Страница чатов.
+        :type chats: `playerokapi.types.ChatList` or `None`
+
+        :return: Список (ID чата, ID последнего сообщения, дата последнего сообщения в миллисекундах).
+        :rtype: `list[tuple[str, str | None, int | None]]`
+        """
+        if not chats:
+            return []
+        return [(chat.id, chat.last_message.id, chat.last_message.created_at_ts) if chat.last_message else (chat.id, None, None)
+                for chat in chats.chats]
 
     def get_message_events(
-        self, old_chats: ChatList, new_chats: ChatList, get_new_review_events: bool
+        self, old_chats: ChatList | list[tuple[str, str | None, int | None]],
+        new_chats: ChatList, get_new_review_events: bool
     ) -> list[
         NewMessageEvent
         | NewDealEvent
@@ -165,8 +194,8 @@ class EventListener:
         """
         Получает новые ивенты сообщений, сравнивая старые чаты с новыми полученными.
         
-        :param old_chats: Старые чаты.
-        :type old_chats: `playerokapi.types.ChatList`
+        :param old_chats: Старые чаты или их снимок (см. `snapshot_chats`).
+        :type old_chats: `playerokapi.types.ChatList` or `list[tuple[str, str | None, int | None]]`
         
         :param new_chats: Новые чаты.
         :type new_chats: `playerokapi.types.ChatList`
@@ -186,42 +215,65 @@ class EventListener:
         _or_ `playerokapi.listener.events.DealStatusChangedEvent(message.deal)`
         """
         
+        old_snapshot = old_chats if isinstance(old_chats, list) else self.snapshot_chats(old_chats)
+        new_snapshot = self.snapshot_chats(new_chats)
         events = []
         if get_new_review_events:
-            for deal_id in self.__review_check_deals:
-                if not self._should_check_deal(deal_id):
-                    continue
-                deal = self.account.get_deal(deal_id)
-                if deal.review is not None:
-                    del self.__review_check_deals[self.__review_check_deals.index(deal_id)]
-                    try: deal.chat = self.account.get_chat(deal.chat.id)
-                    except: pass
-                    events.append(NewReviewEvent(deal, deal.chat))
+            scheduler = self.review_scheduler
+            check_deal_ids = scheduler.pop_due()
+            unchecked_deal_ids = set(check_deal_ids)
+            reviewed_deals = []
+            try:
+                for deal_id, deal in zip(check_deal_ids, self.account.get_deals_by_ids(check_deal_ids)):
+                    if deal is None or isinstance(deal, Exception):
+                        self.__logger.error(f"Ошибка при проверке отзыва в сделке {deal_id}: {deal if deal is not None else 'сделка не найдена'}")
+                        scheduler.reschedule(deal_id)
+                    elif deal.review is not None:
+                        scheduler.remove(deal_id)
+                        reviewed_deals.append(deal)
+                    else:
+                        scheduler.reschedule(deal_id)
+                    unchecked_deal_ids.discard(deal_id)
+            finally:
+                # выданные, но не проверенные сделки возвращаются в очередь, иначе они из неё уже не выйдут
+                for deal_id in unchecked_deal_ids:
+                    scheduler.reschedule(deal_id)
+            chat_ids = [deal.chat.id for deal in reviewed_deals if deal.chat]
+            try:
+                new_deal_chats = dict(zip(chat_ids, self.account.get_chats_by_ids(chat_ids)))
+            except Exception as e:
+                self.__logger.error(f"Ошибка при получении чатов сделок с новыми отзывами: {e}")
+                new_deal_chats = {}
+            for deal in reviewed_deals:
+                deal_chat = new_deal_chats.get(deal.chat.id) if deal.chat else None
+                if deal_chat is not None and not isinstance(deal_chat, Exception):
+                    deal.chat = deal_chat
+                events.append(NewReviewEvent(deal, deal.chat))
         
-        old_chats_last_mess_ids = [chat.last_message.id for chat in old_chats.chats if chat.last_message] if old_chats else []
-        new_chats_last_mess_ids = [chat.last_message.id for chat in new_chats.chats if chat.last_message] if new_chats else []
+        old_chats_last_mess_ids = [last_message_id for _, last_message_id, _ in old_snapshot if last_message_id]
+        new_chats_last_mess_ids = [last_message_id for _, last_message_id, _ in new_snapshot if last_message_id]
         if old_chats_last_mess_ids != new_chats_last_mess_ids:
-            old_chat_map = {chat.id: chat for chat in old_chats.chats}
-            for new_chat in new_chats.chats:
+            old_chat_map = {chat_id: (last_message_id, last_message_ts) for chat_id, last_message_id, last_message_ts in old_snapshot}
+            for new_chat, (_, new_last_message_id, _) in zip(new_chats.chats, new_snapshot):
                 old_chat = old_chat_map.get(new_chat.id)
 
                 if not old_chat:
                     msg_list = self.account.get_chat_messages(new_chat.id, 24)
                     new_msgs = [msg for msg in msg_list.messages]
                 elif old_chat:
-                    if not new_chat.last_message or not old_chat.last_message:
+                    old_last_message_id, last_message_ts = old_chat
+                    if not new_last_message_id or not old_last_message_id:
                         continue
-                    if new_chat.last_message.id == old_chat.last_message.id:
+                    if new_last_message_id == old_last_message_id:
                         continue
                     msg_list = self.account.get_chat_messages(new_chat.id, 24)
-                    new_msgs = [msg for msg in msg_list.messages if self._correct_isodate(msg.created_at) > self._correct_isodate(old_chat.last_message.created_at)]
+                    new_msgs = [msg for msg in msg_list.messages if msg.created_at_ts > last_message_ts]
 
-                for msg in sorted(new_msgs, key=lambda m: m.created_at):
-                    if msg.id in self.__listened_messages:
+                for msg in sorted(new_msgs, key=lambda m: m.created_at_ts):
+                    if not self.__listened_messages.add(msg.id):
                         continue
-                    if get_new_review_events and msg.deal and msg.deal.id not in self.__review_check_deals:
-                        self.__review_check_deals.append(msg.deal.id)
-                    self.__listened_messages.append(msg.id)
+                    if get_new_review_events and msg.deal:
+                        self.review_scheduler.add(msg.deal.id)
                     events.extend(self.parse_message_event(msg, new_chat))
         return events
 
@@ -267,11 +319,12 @@ class EventListener:
         _or_ `playerokapi.listener.events.DealStatusChangedEvent(message.deal)`
         """
 
-        chats: ChatList = None
+        chats: list[tuple[str, str | None, int | None]] | None = None # снимок, а не ChatList - см. `snapshot_chats`
         while True:
             try:
                 next_chats = self.account.get_chats(24)
-                if not chats:
+                next_snapshot = self.snapshot_chats(next_chats)
+                if chats is None:
                     events = self.get_chat_events(next_chats)
                     for event in events:
                         yield event
@@ -279,7 +332,7 @@ class EventListener:
                     events = self.get_message_events(chats, next_chats, get_new_review_events)
                     for event in events:
                         yield event
-                chats = next_chats
+                chats = next_snapshot
             except Exception as e:
                 self.__logger.error(f"Ошибка при получении ивентов: {e}")
             time.sleep(requests_delay)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+from typing import *
+import heapq
+import time
+
+
+class ReviewCheckScheduler:
+    """
+    Очередь проверок сделок на новые отзывы, упорядоченная по времени следующей проверки (куча).\n
+    Между проверками сделки ничего не стоят: на каждом опросе смотрится только вершина кучи.
+    Если отзыва нет, интервал до следующей проверки растёт (`interval * backoff ** n`, но не больше `max_interval`),
+    а через `expire_after` секунд после добавления сделка перестаёт проверяться - окно для отзыва закрыто.\n
+    Не потокобезопасно (рассчитано на один слушатель).
+
+    Пример:
+        scheduler.add(deal_id)
+        for deal_id in scheduler.pop_due():
+            ...  # получить сделку
+            scheduler.remove(deal_id) if deal.review else scheduler.reschedule(deal_id)
+
+    :param interval: Через сколько секунд после добавления проверять сделку первый раз.
+    :type interval: `float`
+
+    :param backoff: Во сколько раз увеличивается интервал после каждой проверки без отзыва.
+    :type backoff: `float`
+
+    :param max_interval: Максимальный интервал между проверками (в секундах).
+    :type max_interval: `float`
+
+    :param expire_after: Через сколько секунд после добавления сделка перестаёт проверяться, `None` - никогда, _опционально_.
+    :type expire_after: `float` or `None`
+
+    :param batch_size: Сколько сделок проверять за один опрос (остальные останутся в очереди до следующего), _опционально_.
+    :type batch_size: `int` or `None`
+    """
+
+    def __init__(self, interval: float = 30, backoff: float = 2.0, max_interval: float = 3600,
+                 expire_after: float | None = 7 * 24 * 3600, batch_size: int | None = 50):
+        self.interval: float = interval
+        """ Через сколько секунд после добавления проверять сделку первый раз. """
+        self.backoff: float = backoff
+        """ Во сколько раз увеличивается интервал после каждой проверки без отзыва. """
+        self.max_interval: float = max_interval
+        """ Максимальный интервал между проверками (в секундах). """
+        self.expire_after: float | None = expire_after
+        """ Через сколько секунд после добавления сделка перестаёт проверяться. """
+        self.batch_size: int | None = batch_size
+        """ Сколько сделок проверять за один опрос. """
+        self.checks: int = 0
+        """ Сколько проверок выдано. """
+        self.expired: int = 0
+        """ Сколько сделок перестали проверяться, так и не получив отзыв. """
+
+        self.__heap: list[tuple[float, int, str]] = [] # [(время проверки, порядковый номер, deal_id)]
+        self.__deals: dict[str, list] = {} # {deal_id: [время добавления, количество проверок, время проверки или None]}
+        self.__counter = 0
+
+    def __len__(self) -> int:
+        return len(self.__deals)
+
+    def __contains__(self, deal_id: str) -> bool:
+        return deal_id in self.__deals
+
+    def _push(self, deal_id: str, due: float):
+        self.__deals[deal_id][2] = due
+        self.__counter += 1
+        heapq.heappush(self.__heap, (due, self.__counter, deal_id))
+
+    def add(self, deal_id: str, now: float | None = None) -> bool:
+        """
+        Добавляет сделку в очередь (если её там ещё нет).
+
+        :param deal_id: ID сделки.
+        :type deal_id: `str`
+
+        :param now: Текущее время (`time.monotonic()`), _опционально_.
+        :type now: `float` or `None`
+
+        :return: `True`, если сделка добавлена, `False` - если она уже в очереди.
+        :rtype: `bool`
+        """
+        if deal_id in self.__deals:
+            return False
+        now = time.monotonic() if now is None else now
+        self.__deals[deal_id] = [now, 0, None]
+        self._push(deal_id, now + self.interval)
+        return True
+
+    def next_due(self) -> float | None:
+        """
+        Получает время ближайшей проверки.
+
+        :return: Время (`time.monotonic()`) или `None`, если очередь пуста.
+        :rtype: `float` or `None`
+        """
+        heap = self.__heap
+        while heap:
+            due, _, deal_id = heap[0]
+            state = self.__deals.get(deal_id)
+            if state is not None and state[2] == due:
+                return due
+            heapq.heappop(heap) # сделка уже удалена или перенесена
+        return None
+
+    def pop_due(self, now: float | None = None, limit: int | None = None) -> list[str]:
+        """
+        Получает сделки, которые пора проверить (не больше `limit`, по умолчанию - `batch_size`).\n
+        После проверки каждую из них нужно либо удалить (`remove`), либо перенести (`reschedule`).
+        Сделки, окно отзыва которых закрылось, удаляются из очереди без проверки.
+
+        :param now: Текущее время (`time.monotonic()`), _опционально_.
+        :type now: `float` or `None`
+
+        :param limit: Максимальное количество сделок, _опционально_.
+        :type limit: `int` or `None`
+
+        :return: ID сделок в порядке времени проверки.
+        :rtype: `list[str]`
+        """
+        now = time.monotonic() if now is None else now
+        limit = self.batch_size if limit is None else limit
+        heap, deals = self.__heap, self.__deals
+        due_deals = []
+        while heap and heap[0][0] <= now and (limit is None or len(due_deals) < limit):
+            due, _, deal_id = heapq.heappop(heap)
+            state = deals.get(deal_id)
+            if state is None or state[2] != due:
+                continue # сделка уже удалена или перенесена
+            if self.expire_after is not None and now - state[0] > self.expire_after:
+                del deals[deal_id]
+                self.expired += 1
+                continue
+            state[2] = None
+            due_deals.append(deal_id)
+        self.checks += len(due_deals)
+        return due_deals
+
+    def reschedule(self, deal_id: str, now: float | None = None):
+        """
+        Переносит проверку сделки, в которой отзыва пока нет (интервал увеличивается в `backoff` раз).
+        Если следующая проверка была бы уже после закрытия окна отзыва, сделка удаляется из очереди.
+
+        :param deal_id: ID сделки.
+        :type deal_id: `str`
+
+        :param now: Текущее время (`time.monotonic()`), _опционально_.
+        :type now: `float` or `None`
+        """
+        state = self.__deals.get(deal_id)
+        if state is None:
+            return
+        now = time.monotonic() if now is None else now
+        state[1] += 1
+        due = now + min(self.max_interval, self.interval * self.backoff ** state[1])
+        if self.expire_after is not None and due - state[0] > self.expire_after:
+            del self.__deals[deal_id]
+            self.expired += 1
+            return
+        self._push(deal_id, due)
+
+    def remove(self, deal_id: str):
+        """
+        Удаляет сделку из очереди (например, когда отзыв получен).
+
+        :param deal_id: ID сделки.
+        :type deal_id: `str`
+        """
+        self.__deals.pop(deal_id, None) # запись в куче станет устаревшей и будет пропущена
+
+    def clear(self):
+        """
+        Очищает очередь и счётчики.
+        """
+        self.__heap.clear()
+        self.__deals.clear()
+        self.checks = self.expired = 0
+
+    def stats(self) -> dict[str, int | float | None]:
+        """
+        Получает метрики очереди.
+
+        :return: `size` - сделок в очереди, `heap` - записей в куче (вместе с устаревшими),
+            `checks` - выдано проверок, `expired` - истекло без отзыва, `next_due_in` - секунд до ближайшей проверки.
+        :rtype: `dict[str, int | float | None]`
+        """
+        next_due = self.next_due()
+        return {
+            "size": len(self.__deals),
+            "heap": len(self.__heap),
+            "checks": self.checks,
+            "expired": self.expired,
+            "next_due_in": max(0.0, next_due - time.monotonic()) if next_due is not None else None
+        }
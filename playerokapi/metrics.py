@@ -0,0 +1,268 @@
+from __future__ import annotations
+from typing import *
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import bisect
+import json
+import threading
+
+from .hooks import Hooks
+
+if TYPE_CHECKING:
+    from .account import Account
+
+
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+""" Границы корзин гистограммы задержек (в секундах). """
+
+
+class OperationMetrics:
+    """
+    Метрики одной GraphQL операции.
+
+    :param buckets: Границы корзин гистограммы задержек.
+    :type buckets: `tuple[float]`
+    """
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.requests: int = 0
+        """ Количество отправленных HTTP запросов. """
+        self.responses: int = 0
+        """ Количество полученных ответов. """
+        self.latency_buckets: list[int] = [0] * (len(buckets) + 1)
+        """ Количество ответов в каждой корзине (последняя - `+Inf`). """
+        self.latency_sum: float = 0.0
+        """ Суммарная задержка (в секундах). """
+        self.response_bytes: int = 0
+        """ Суммарный размер ответов (в байтах). """
+        self.retries: dict[str, int] = {}
+        """ Повторы по причинам. """
+        self.errors: dict[str, int] = {}
+        """ Ошибки по кодам. """
+        self.cloudflare: int = 0
+        """ Количество проверок Cloudflare. """
+
+
+class MetricsCollector:
+    """
+    Сборщик метрик запросов в памяти процесса.\n
+    Считает по каждой GraphQL операции (`operationName`) гистограмму задержек,
+    размер ответов, повторы, коды ошибок и проверки Cloudflare.
+    Экспортирует их в текстовом формате Prometheus или в JSON.
+
+    Пример:
+        metrics = MetricsCollector()
+        metrics.attach(account)
+        ...
+        print(metrics.to_prometheus())
+
+    :param buckets: Границы корзин гистограммы задержек (в секундах), _опционально_.
+    :type buckets: `tuple[float]`
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets: tuple[float, ...] = tuple(sorted(buckets))
+        """ Границы корзин гистограммы задержек. """
+        self.operations: dict[str, OperationMetrics] = {}
+        """ Метрики по операциям. """
+
+        self.__lock = threading.Lock()
+
+    def attach(self, target: Account | Hooks) -> MetricsCollector:
+        """
+        Подписывает сборщик на события аккаунта (или набора обработчиков).
+
+        :param target: Аккаунт или `playerokapi.hooks.Hooks`.
+        :type target: `playerokapi.account.Account` or `playerokapi.hooks.Hooks`
+
+        :return: Этот же сборщик.
+        :rtype: `playerokapi.metrics.MetricsCollector`
+        """
+        hooks = target if isinstance(target, Hooks) else target.hooks
+        hooks.add("on_request_start", self.on_request_start)
+        hooks.add("on_response", self.on_response)
+        hooks.add("on_retry", self.on_retry)
+        hooks.add("on_cloudflare", self.on_cloudflare)
+        return self
+
+    def detach(self, target: Account | Hooks):
+        """
+        Отписывает сборщик от событий аккаунта (или набора обработчиков).
+        """
+        hooks = target if isinstance(target, Hooks) else target.hooks
+        hooks.remove("on_request_start", self.on_request_start)
+        hooks.remove("on_response", self.on_response)
+        hooks.remove("on_retry", self.on_retry)
+        hooks.remove("on_cloudflare", self.on_cloudflare)
+
+    def __operation(self, operation_name: str | None) -> OperationMetrics:
+        operation_name = operation_name or "unknown"
+        metrics = self.operations.get(operation_name)
+        if metrics is None:
+            metrics = self.operations[operation_name] = OperationMetrics(self.buckets)
+        return metrics
+
+    def on_request_start(self, account: Account, operation_name: str | None, method: str, url: str):
+        with self.__lock:
+            self.__operation(operation_name).requests += 1
+
+    def on_response(self, account: Account, operation_name: str | None, response, elapsed: float):
+        error = self.__error_code(response)
+        content = response.content or b""
+        with self.__lock:
+            metrics = self.__operation(operation_name)
+            metrics.responses += 1
+            metrics.latency_sum += elapsed
+            metrics.latency_buckets[bisect.bisect_left(self.buckets, elapsed)] += 1
+            metrics.response_bytes += len(content)
+            if error is not None:
+                metrics.errors[error] = metrics.errors.get(error, 0) + 1
+
+    def on_retry(self, account: Account, operation_name: str | None, reason: str, attempt: int):
+        with self.__lock:
+            retries = self.__operation(operation_name).retries
+            retries[reason] = retries.get(reason, 0) + 1
+
+    def on_cloudflare(self, account: Account, operation_name: str | None, step: str | None):
+        with self.__lock:
+            self.__operation(operation_name).cloudflare += 1
+
+    def __error_code(self, response) -> str | None:
+        if response.status_code != 200:
+            return f"HTTP_{response.status_code}"
+        if b'"errors"' not in (response.content or b""):
+            return None
+        try:
+            errors = response.json()
+            errors = errors.get("errors") if isinstance(errors, dict) else [e for r in errors for e in (r.get("errors") or [])]
+        except Exception:
+            return None
+        if not errors:
+            return None
+        extensions = errors[0].get("extensions") or {}
+        return str(extensions.get("code") or extensions.get("statusCode") or "GRAPHQL_ERROR")
+
+    def reset(self):
+        """
+        Сбрасывает все метрики.
+        """
+        with self.__lock:
+            self.operations = {}
+
+    def snapshot(self) -> dict[str, dict]:
+        """
+        Получает снимок метрик.
+
+        :return: Словарь {operationName: метрики}.
+        :rtype: `dict[str, dict]`
+        """
+        with self.__lock:
+            snapshot = {}
+            for operation_name, metrics in sorted(self.operations.items()):
+                cumulative, buckets = 0, {}
+                for bound, count in zip([*map(str, self.buckets), "+Inf"], metrics.latency_buckets):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                snapshot[operation_name] = {
+                    "requests": metrics.requests,
+                    "responses": metrics.responses,
+                    "latency": {
+                        "sum": metrics.latency_sum,
+                        "avg": metrics.latency_sum / metrics.responses if metrics.responses else 0.0,
+                        "buckets": buckets
+                    },
+                    "response_bytes": metrics.response_bytes,
+                    "retries": dict(metrics.retries),
+                    "errors": dict(metrics.errors),
+                    "cloudflare": metrics.cloudflare
+                }
+            return snapshot
+
+    def to_json(self) -> str:
+        """
+        Экспортирует метрики в JSON.
+
+        :return: JSON строка снимка метрик.
+        :rtype: `str`
+        """
+        return json.dumps(self.snapshot(), ensure_ascii=False)
+
+    def to_prometheus(self, prefix: str = "playerokapi") -> str:
+        """
+        Экспортирует метрики в текстовом формате Prometheus.
+
+        :param prefix: Префикс названий метрик.
+        :type prefix: `str`
+
+        :return: Текст метрик.
+        :rtype: `str`
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        def metric(name: str, type: str, help: str, samples: list[tuple[str, dict[str, str], float]]):
+            lines.append(f"# HELP {prefix}_{name} {help}")
+            lines.append(f"# TYPE {prefix}_{name} {type}")
+            for suffix, labels, value in samples:
+                labels = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+                lines.append(f"{prefix}_{name}{suffix}{{{labels}}} {value}")
+
+        metric("requests_total", "counter", "HTTP requests sent",
+               [("", {"operation": op}, m["requests"]) for op, m in snapshot.items()])
+        duration = []
+        for op, m in snapshot.items():
+            duration += [("_bucket", {"operation": op, "le": le}, count) for le, count in m["latency"]["buckets"].items()]
+            duration.append(("_sum", {"operation": op}, m["latency"]["sum"]))
+            duration.append(("_count", {"operation": op}, m["responses"]))
+        metric("request_duration_seconds", "histogram", "HTTP request latency", duration)
+        metric("response_bytes_total", "counter", "Response body size",
+               [("", {"operation": op}, m["response_bytes"]) for op, m in snapshot.items()])
+        metric("retries_total", "counter", "Request retries",
+               [("", {"operation": op, "reason": reason}, count) for op, m in snapshot.items() for reason, count in m["retries"].items()])
+        metric("errors_total", "counter", "Error responses",
+               [("", {"operation": op, "code": code}, count) for op, m in snapshot.items() for code, count in m["errors"].items()])
+        metric("cloudflare_challenges_total", "counter", "Cloudflare challenges",
+               [("", {"operation": op}, m["cloudflare"]) for op, m in snapshot.items()])
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9100, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """
+        Запускает HTTP сервер метрик в фоновом потоке:
+        `/metrics` - формат Prometheus, `/metrics.json` - JSON.
+
+        :param port: Порт.
+        :type port: `int`
+
+        :param host: Адрес.
+        :type host: `str`
+
+        :return: Запущенный сервер (остановить - `server.shutdown()`).
+        :rtype: `http.server.ThreadingHTTPServer`
+        """
+        collector = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, content_type = collector.to_prometheus(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, content_type = collector.to_json(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                raw = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("content-type", content_type)
+                self.send_header("content-length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
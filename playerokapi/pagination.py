@@ -0,0 +1,205 @@
+from __future__ import annotations
+from typing import *
+import asyncio
+import queue
+import threading
+from contextvars import copy_context
+
+
+T = TypeVar("T")
+
+
+_DONE = object()
+
+
+def _next_cursor(page) -> str | None:
+    page_info = page.page_info if page is not None else None
+    if page_info is None or not page_info.has_next_page:
+        return None
+    return page_info.end_cursor
+
+
+def iter_pages(fetch: Callable[[str | None], Any], after_cursor: str | None = None,
+               lookahead: int = 1) -> Generator[Any, None, None]:
+    """
+    Перебирает страницы, подгружая следующие в фоновом потоке,
+    пока вызывающий обрабатывает текущую.
+
+    :param fetch: Функция, которая получает курсор и возвращает страницу (`*List` объект).
+    :type fetch: `callable`
+
+    :param after_cursor: Курсор, с которого начинать, _опционально_.
+    :type after_cursor: `str` or `None`
+
+    :param lookahead: Сколько страниц подгружать заранее (0 - без фоновой подгрузки).
+    :type lookahead: `int`
+
+    :return: Генератор страниц.
+    :rtype: `Generator`
+    """
+    if lookahead <= 0:
+        cursor = after_cursor
+        while True:
+            page = fetch(cursor)
+            if page is None:
+                return
+            yield page
+            cursor = _next_cursor(page)
+            if cursor is None:
+                return
+
+    pages: queue.Queue = queue.Queue(maxsize=lookahead)
+    stopped = threading.Event()
+
+    def put(value) -> bool:
+        while not stopped.is_set():
+            try:
+                pages.put(value, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        cursor = after_cursor
+        try:
+            while not stopped.is_set():
+                page = fetch(cursor)
+                if page is None or not put(page):
+                    break
+                cursor = _next_cursor(page)
+                if cursor is None:
+                    break
+        except BaseException as e:
+            put(e)
+            return
+        put(_DONE)
+
+    # поток получает копию контекста: текущий аккаунт и настройки парсера те же, что у вызывающего
+    threading.Thread(target=copy_context().run, args=(produce,), daemon=True).start()
+    try:
+        while True:
+            page = pages.get()
+            if page is _DONE:
+                return
+            if isinstance(page, BaseException):
+                raise page
+            yield page
+    finally:
+        stopped.set()
+
+
+def iter_items(fetch: Callable[[str | None], Any], attr: str, after_cursor: str | None = None, lookahead: int = 1,
+               stop: Callable[[T], bool] | None = None, limit: int | None = None) -> Generator[T, None, None]:
+    """
+    Перебирает объекты всех страниц по очереди (см. `iter_pages`).
+
+    :param fetch: Функция, которая получает курсор и возвращает страницу (`*List` объект).
+    :type fetch: `callable`
+
+    :param attr: Атрибут страницы со списком объектов (например, `deals`).
+    :type attr: `str`
+
+    :param after_cursor: Курсор, с которого начинать, _опционально_.
+    :type after_cursor: `str` or `None`
+
+    :param lookahead: Сколько страниц подгружать заранее (0 - без фоновой подгрузки).
+    :type lookahead: `int`
+
+    :param stop: Условие остановки: перебор заканчивается на первом объекте, для которого оно истинно
+        (сам объект не возвращается), например `lambda deal: deal.created_at < "2025-01-01"`, _опционально_.
+    :type stop: `callable` or `None`
+
+    :param limit: Максимальное количество объектов, _опционально_.
+    :type limit: `int` or `None`
+
+    :return: Генератор объектов.
+    :rtype: `Generator`
+    """
+    if limit is not None and limit <= 0:
+        return
+    count = 0
+    pages = iter_pages(fetch, after_cursor, lookahead)
+    try:
+        for page in pages:
+            for obj in getattr(page, attr) or []:
+                if stop is not None and stop(obj):
+                    return
+                yield obj
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+    finally:
+        pages.close()
+
+
+async def aiter_pages(fetch: Callable[[str | None], Awaitable[Any]], after_cursor: str | None = None,
+                      lookahead: int = 1) -> AsyncGenerator[Any, None]:
+    """
+    Асинхронная версия `iter_pages`: следующие страницы подгружаются фоновой задачей.
+    """
+    if lookahead <= 0:
+        cursor = after_cursor
+        while True:
+            page = await fetch(cursor)
+            if page is None:
+                return
+            yield page
+            cursor = _next_cursor(page)
+            if cursor is None:
+                return
+
+    pages: asyncio.Queue = asyncio.Queue(maxsize=lookahead)
+
+    async def produce():
+        cursor = after_cursor
+        try:
+            while True:
+                page = await fetch(cursor)
+                if page is None:
+                    break
+                await pages.put(page)
+                cursor = _next_cursor(page)
+                if cursor is None:
+                    break
+        except asyncio.CancelledError:
+            raise
+        except BaseException as e:
+            await pages.put(e)
+            return
+        await pages.put(_DONE)
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page = await pages.get()
+            if page is _DONE:
+                return
+            if isinstance(page, BaseException):
+                raise page
+            yield page
+    finally:
+        task.cancel()
+
+
+async def aiter_items(fetch: Callable[[str | None], Awaitable[Any]], attr: str, after_cursor: str | None = None,
+                      lookahead: int = 1, stop: Callable[[T], bool] | None = None,
+                      limit: int | None = None) -> AsyncGenerator[T, None]:
+    """
+    Асинхронная версия `iter_items`.
+    """
+    if limit is not None and limit <= 0:
+        return
+    count = 0
+    pages = aiter_pages(fetch, after_cursor, lookahead)
+    try:
+        async for page in pages:
+            for obj in getattr(page, attr) or []:
+                if stop is not None and stop(obj):
+                    return
+                yield obj
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+    finally:
+        await pages.aclose()
@@ -1,821 +1,524 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
 
 from .enums import *
+from .identity import _current_map
 
 if TYPE_CHECKING:
     from .types import *
 
 
-def file(data: dict) -> "FileObject":
-    from .types import FileObject
+class Value:
+    """
+    Поле, значение которого берётся из ответа как есть.
 
-    if not data:
-        return None
-    return FileObject(
-        id=data.get("id"),
-        url=data.get("url"),
-        filename=data.get("filename"),
-        mime=data.get("mime"),
-    )
+    :param key: Ключ в ответе GraphQL (через точку - ключ вложенного словаря, например `profile.username`).
+    :type key: `str`
 
-
-def sbp_bank_member(data: dict) -> "SBPBankMember":
-    from .types import SBPBankMember
-
-    if not data:
-        return None
-    return SBPBankMember(
-        id=data.get("id"),
-        name=data.get("name"),
-        icon=data.get("icon")
-    )
-
-
-def transaction_payment_method(data: dict) -> "TransactionPaymentMethod":
-    from .types import TransactionPaymentMethod
-    from .parser import transaction_provider_props, transaction_provider_limits
-
-    if not data:
-        return None
-    return TransactionPaymentMethod(
-        id=TransactionPaymentMethodIds.__members__.get(data.get("id")),
-        name=data.get("name"),
-        fee=data.get("fee"),
-        provider_id=TransactionProviderIds.__members__.get(data.get("provider_id")),
-        account=account_profile(data.get("account")),
-        props=transaction_provider_props(data.get("props")),
-        limits=transaction_provider_limits(data.get("limits"))
-    )
-
-
-def transaction_provider_limit_range(data: dict) -> "TransactionProviderLimitRange":
-    from .types import TransactionProviderLimitRange
-
-    if not data:
-        return None
-    return TransactionProviderLimitRange(
-        min=data.get("min"),
-        max=data.get("max")
-    )
-
-
-def transaction_provider_limits(data: dict) -> "TransactionProviderLimits":
-    from .types import TransactionProviderLimits
-
-    if not data:
-        return None
-    return TransactionProviderLimits(
-        incoming=transaction_provider_limit_range(data.get("incoming")),
-        outgoing=transaction_provider_limit_range(data.get("outgoing"))
-    )
-
-
-def transaction_provider_required_user_data(data: dict) -> "TransactionProviderRequiredUserData":
-    from .types import TransactionProviderRequiredUserData
-
-    if not data:
-        return None
-    return TransactionProviderRequiredUserData(
-        email=data.get("email"),
-        phone_number=data.get("phoneNumber"),
-        erip_account_number=data.get("eripAccountNumber")
-    )
-
-
-def transaction_provider_props(data: dict) -> "TransactionProviderProps":
-    from .types import TransactionProviderProps
-
-    if not data:
-        return None
-    return TransactionProviderProps(
-        required_user_data=transaction_provider_required_user_data(data.get("requiredUserData")),
-        tooltip=data.get("tooltip")
-    )
-
-
-def transaction_provider(data: dict) -> "TransactionProvider":
-    from .types import TransactionProvider
-    from .parser import account_profile
-
-    if not data:
-        return None
-    return TransactionProvider(
-        id=TransactionProviderIds.__members__.get(data.get("id")),
-        name=data.get("name"),
-        fee=data.get("fee"),
-        min_fee_amount=data.get("minFeeAmount"),
-        description=data.get("description"),
-        account=account_profile(data.get("account")),
-        props=transaction_provider_props(data.get("props")),
-        limits=transaction_provider_limits(data.get("limits")),
-        payment_methods=[transaction_payment_method(method) for method in data.get("paymentMethods")]
-    )
-
-
-def transaction(data: dict) -> "Transaction":
-    from .types import Transaction
-
-    if not data:
-        return None
-    return Transaction(
-        id=data.get("id"),
-        operation=TransactionOperations.__members__.get(data.get("operation")),
-        direction=TransactionDirections.__members__.get(data.get("direction")),
-        provider_id=TransactionProviderIds.__members__.get(data.get("providerId")),
-        provider=transaction_provider(data.get("provider")),
-        user=user_profile(data.get("user")),
-        creator=user_profile(data.get("creator")),
-        status=TransactionStatuses.__members__.get(data.get("status")),
-        status_description=data.get("statusDescription"),
-        status_expiration_date=data.get("statusExpirationDate"),
-        value=data.get("value"),
-        fee=data.get("fee"),
-        created_at=data.get("createdAt"),
-        verified_at=data.get("verified_at"),
-        verified_by=data.get("verified_by"),
-        completed_at=data.get("completed_at"),
-        completed_by=data.get("completed_by"),
-        payment_method_id=data.get("paymentMethodId"), 
-        is_suspicious=data.get("is_suspicious"), 
-        sbp_bank_name=data.get("spb_bank_name")
-    )
-
-
-def transaction_page_info(data: dict) -> "TransactionPageInfo":
-    from .types import TransactionPageInfo
-
-    if not data:
-        return None
-    return TransactionPageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage")
-    )
-
-
-def transaction_list(data: dict) -> "TransactionList":
-    from .types import TransactionList
-
-    if not data:
-        return None
-    return TransactionList(
-        transactions=[transaction(edge.get("node")) for edge in data.get("edges")],
-        page_info=transaction_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount")
-    )
-
-
-def user_bank_card(data: dict) -> "UserBankCard":
-    from .types import UserBankCard
-
-    if not data:
-        return None
-    return UserBankCard(
-        id=data.get("id"),
-        card_first_six=data.get("cardFirstSix"),
-        card_last_four=data.get("cardLastFour"),
-        card_type=BankCardTypes.__members__.get(data.get("cardType")),
-        is_chosen=data.get("isChosen")
-    )
-
-
-def user_bank_card_page_info(data: dict) -> "UserBankCardPageInfo":
-    from .types import UserBankCardPageInfo
-
-    if not data:
-        return None
-    return UserBankCardPageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage")
-    )
-
-
-def user_bank_card_list(data: dict) -> "UserBankCardList":
-    from .types import UserBankCardList
-
-    if not data:
-        return None
-    return UserBankCardList(
-        bank_cards=[user_bank_card(edge.get("node")) for edge in data.get("edges")],
-        page_info=user_bank_card_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount")
-    )
-
-
-def game_category_data_field(data: dict) -> "GameCategoryDataField":
-    from .types import GameCategoryDataField
-
-    if not data:
-        return None
-    return GameCategoryDataField(
-        id=data.get("id"),
-        label=data.get("label"),
-        type=GameCategoryDataFieldTypes.__members__.get(data.get("type")),
-        input_type=GameCategoryDataFieldInputTypes.__members__.get(
-            data.get("inputType")
-        ),
-        copyable=data.get("copyable"),
-        hidden=data.get("hidden"),
-        required=data.get("required"),
-        value=data.get("value"),
-    )
-
-
-def game_category_data_field_page_info(data: dict) -> "GameCategoryDataFieldPageInfo":
-    from .types import GameCategoryDataFieldPageInfo
-
-    if not data:
-        return None
-    return GameCategoryDataFieldPageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage"),
-    )
-
-
-def game_category_data_field_list(data: dict) -> "GameCategoryDataFieldList":
-    from .types import GameCategoryDataFieldList
-
-    if not data:
-        return None
-    data_fields = []
-    edges: dict[dict] = data.get("edges")
-    if edges:
-        for edge in edges:
-            data_fields.append(game_category_data_field(edge.get("node")))
-    return GameCategoryDataFieldList(
-        data_fields=data_fields,
-        page_info=game_category_data_field_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount"),
-    )
-
-
-def game_category_props(data: dict) -> "GameCategoryProps":
-    from .types import GameCategoryProps
-
-    if not data:
-        return None
-    return GameCategoryProps(
-        min_reviews=data.get("minTestimonials"),
-        min_reviews_for_seller=data.get("minTestimonialsForSeller"),
-    )
-
-
-def game_category_option(data: dict) -> "GameCategoryOption":
-    from .types import GameCategoryOption
-
-    if not data:
-        return None
-    return GameCategoryOption(
-        id=data.get("id"),
-        group=data.get("group"),
-        label=data.get("label"),
-        type=GameCategoryOptionTypes.__members__.get(data.get("type")),
-        field=data.get("field"),
-        value=data.get("value"),
-        value_range_limit=data.get("valueRangeLimit"),
-    )
-
-
-def game_category_agreement(data: dict) -> "GameCategoryAgreement":
-    from .types import GameCategoryAgreement
-
-    if not data:
-        return None
-    return GameCategoryAgreement(
-        id=data.get("id"),
-        description=data.get("description"),
-        icontype=GameCategoryAgreementIconTypes.__members__.get(data.get("iconType")),
-        sequence=data.get("sequence"),
-    )
-
-
-def game_category_agreement_page_info(data: dict) -> "GameCategoryAgreementPageInfo":
-    from .types import GameCategoryAgreementPageInfo
-
-    if not data:
-        return None
-    return GameCategoryAgreementPageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage"),
-    )
-
-
-def game_category_agreement_list(data: dict) -> "GameCategoryAgreementList":
-    from .types import GameCategoryAgreementList
-
-    if not data:
-        return None
-    agreements = []
-    edges: dict[dict] = data.get("edges")
-    if edges:
-        for edge in edges:
-            agreements.append(game_category_agreement(edge.get("node")))
-    return GameCategoryAgreementList(
-        agreements=agreements,
-        page_info=game_category_agreement_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount"),
-    )
-
-
-def game_category_obtaining_type(data: dict) -> "GameCategoryObtainingType":
-    from .types import GameCategoryObtainingType
-
-    if not data:
-        return None
-    agrs = []
-    data_agrs = data.get("agreements")
-    if data_agrs:
-        for agr in data_agrs:
-            agrs.append(game_category_agreement(agr))
-    return GameCategoryObtainingType(
-        id=data.get("id"),
-        name=data.get("name"),
-        description=data.get("description"),
-        game_category_id=data.get("gameCategoryId"),
-        no_comment_from_buyer=data.get("noCommentFromBuyer"),
-        instruction_for_buyer=data.get("instructionForBuyer"),
-        instruction_for_seller=data.get("instructionForSeller"),
-        sequence=data.get("sequence"),
-        fee_multiplier=data.get("feeMultiplier"),
-        agreements=agrs,
-        props=game_category_props(data.get("props")),
-    )
-
-
-def game_category_obtaining_type_page_info(
-    data: dict,
-) -> "GameCategoryObtainingTypePageInfo":
-    from .types import GameCategoryObtainingTypePageInfo
-
-    if not data:
-        return None
-    return GameCategoryObtainingTypePageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage"),
-    )
-
-
-def game_category_obtaining_type_list(data: dict) -> "GameCategoryObtainingTypeList":
-    from .types import GameCategoryObtainingTypeList
-
-    if not data:
-        return None
-    types = []
-    edges: dict[dict] = data.get("edges")
-    if edges:
-        for edge in edges:
-            types.append(game_category_obtaining_type(edge.get("node")))
-    return GameCategoryObtainingTypeList(
-        obtaining_types=types,
-        page_info=game_category_obtaining_type_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount"),
-    )
-
-
-def game_category_instruction(data: dict) -> "GameCategoryInstruction":
-    from .types import GameCategoryInstruction
-
-    if not data:
-        return None
-    return GameCategoryInstruction(id=data.get("id"), text=data.get("text"))
-
-
-def game_category_instruction_page_info(
-    data: dict,
-) -> "GameCategoryInstructionPageInfo":
-    from .types import GameCategoryInstructionPageInfo
-
-    if not data:
-        return None
-    return GameCategoryInstructionPageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage"),
-    )
-
-
-def game_category_instruction_list(data: dict) -> "GameCategoryInstructionList":
-    from .types import GameCategoryInstructionList
-
-    if not data:
-        return None
-    instructions = []
-    edges: dict[dict] = data.get("edges")
-    if edges:
-        for edge in edges:
-            instructions.append(game_category_instruction(edge.get("node")))
-    return GameCategoryInstructionList(
-        instructions=instructions,
-        page_info=game_category_instruction_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount"),
-    )
-
-
-def game_category(data: dict) -> "GameCategory":
-    from .types import GameCategory
-
-    if not data:
-        return None
-    options = []
-    data_options = data.get("options")
-    if data_options:
-        for option in data_options:
-            options.append(game_category_option(option))
-    agrs = []
-    data_agrs = data.get("agreements")
-    if data_agrs:
-        for agr in data_agrs:
-            agrs.append(game_category_agreement(agr))
-    return GameCategory(
-        id=data.get("id"),
-        slug=data.get("slug"),
-        name=data.get("name"),
-        category_id=data.get("categoryId"),
-        game_id=data.get("gameId"),
-        obtaining=data.get("obtaining"),
-        options=options,
-        props=game_category_props(data.get("props")),
-        no_comment_from_buyer=data.get("noCommentFromBuyer"),
-        instruction_for_buyer=data.get("instructionForBuyer"),
-        instruction_for_seller=data.get("instructionForSeller"),
-        use_custom_obtaining=data.get("useCustomObtaining"),
-        auto_confirm_period=GameCategoryAutoConfirmPeriods.__members__.get(
-            data.get("autoConfirmPeriod")
-        ),
-        auto_moderation_mode=data.get("autoModerationMode"),
-        agreements=agrs,
-        fee_multiplier=data.get("feeMultiplier"),
-    )
-
-
-def game(data: dict) -> "Game":
-    from .types import Game
-
-    if not data:
-        return None
-    cats = []
-    data_cats = data.get("categories")
-    if data_cats:
-        for cat in data_cats:
-            cats.append(game_category(cat))
-    return Game(
-        id=data.get("id"),
-        slug=data.get("slug"),
-        name=data.get("name"),
-        type=GameTypes.__members__.get(data.get("type")),
-        logo=file(data.get("logo")),
-        banner=file(data.get("banner")),
-        categories=cats,
-        created_at=data.get("createdAt"),
-    )
-
-
-def game_profile(data: dict) -> "GameProfile":
-    from .types import GameProfile
-
-    if not data:
-        return None
-    return GameProfile(
-        id=data.get("id"),
-        slug=data.get("slug"),
-        name=data.get("name"),
-        type=GameTypes.__members__.get(data.get("type")),
-        logo=file(data.get("logo")),
-    )
-
-
-def game_page_info(data: dict) -> "GamePageInfo":
-    from .types import GamePageInfo
-
-    if not data:
-        return None
-    return GamePageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage"),
-    )
-
-
-def game_list(data: dict) -> "GameList":
-    from .types import GameList
-
-    if not data:
-        return None
-    games = []
-    edges: dict[dict] = data.get("edges")
-    if edges:
-        for edge in edges:
-            games.append(game(edge.get("node")))
-    return GameList(
-        games=games,
-        page_info=game_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount"),
-    )
-
-
-def user_profile(data: dict) -> "UserProfile":
-    from .types import UserProfile
-
-    if not data:
-        return None
-    u = UserProfile(
-        id=data.get("id"),
-        username=data.get("username", "Поддержка"),
-        role=UserTypes.__members__.get(data.get("role")),
-        avatar_url=data.get("avatarURL"),
-        is_online=data.get("isOnline"),
-        is_blocked=data.get("isBlocked"),
-        rating=data.get("rating"),
-        reviews_count=data.get("testimonialCounter"),
-        created_at=data.get("createdAt"),
-        support_chat_id=data.get("supportChatId"),
-        system_chat_id=data.get("systemChatId"),
-    )
-    return u
-
-
-def account_items_stats(data: dict) -> "AccountItemsStats":
-    from .types import AccountItemsStats
-
-    if not data:
-        return None
-    return AccountItemsStats(total=data.get("total"), finished=data.get("finished"))
-
-
-def account_incoming_deals_stats(data: dict) -> "AccountIncomingDealsStats":
-    from .types import AccountIncomingDealsStats
-
-    if not data:
-        return None
-    return AccountIncomingDealsStats(
-        total=data.get("total"), finished=data.get("finished")
-    )
-
-
-def account_outgoing_deals_stats(data: dict) -> "AccountOutgoingDealsStats":
-    from .types import AccountOutgoingDealsStats
-
-    if not data:
-        return None
-    return AccountOutgoingDealsStats(
-        total=data.get("total"), finished=data.get("finished")
-    )
-
-
-def account_deals_stats(data: dict) -> "AccountDealsStats":
-    from .types import AccountDealsStats
-
-    if not data:
-        return None
-    return AccountDealsStats(
-        incoming=account_incoming_deals_stats(data.get("incoming")),
-        outgoing=account_outgoing_deals_stats(data.get("outgoing")),
-    )
-
-
-def account_stats(data: dict) -> "AccountStats":
-    from .types import AccountStats
-
-    if not data:
-        return None
-    items = account_items_stats(data.get("items"))
-    deals = account_deals_stats(data.get("deals"))
-    return AccountStats(items=items, deals=deals)
-
-
-def account_balance(data: dict) -> "AccountBalance":
-    from .types import AccountBalance
-
-    if not data:
-        return None
-    return AccountBalance(
-        id=data.get("id"),
-        value=data.get("value"),
-        frozen=data.get("frozen"),
-        available=data.get("available"),
-        withdrawable=data.get("withdrawable"),
-        pending_income=data.get("pendingIncome"),
-    )
-
-
-def account_profile(data: dict) -> "AccountProfile":
-    from .types import AccountProfile
-
-    if not data:
-        return None
-    profile: dict = data.get("profile", {})
-    return AccountProfile(
-        id=data.get("id"),
-        username=profile.get("username"),
-        email=data.get("email"),
-        balance=account_balance(data.get("balance")),
-        stats=account_stats(data.get("stats")),
-        role=UserTypes.__members__.get(data.get("role")),
-        avatar_url=profile.get("avatarURL"),
-        is_online=profile.get("isOnline"),
-        is_blocked=data.get("isBlocked"),
-        is_blocked_for=data.get("isBlockedFor"),
-        is_verified=data.get("isVerified"),
-        rating=profile.get("rating"),
-        reviews_count=profile.get("testimonialCounter"),
-        created_at=profile.get("createdAt"),
-        support_chat_id=profile.get("supportChatId"),
-        system_chat_id=profile.get("systemChatId"),
-        has_frozen_balance=data.get("hasFrozenBalance"),
-        has_enabled_notifications=data.get("hasEnabledNotifications"),
-    )
-
-
-def item_priority_status_price_range(data: dict) -> "ItemPriorityStatusPriceRange":
-    from .types import ItemPriorityStatusPriceRange
-
-    if not data:
-        return None
-    return ItemPriorityStatusPriceRange(min=data.get("min"), max=data.get("max"))
-
-
-def item_priority_status(data: dict) -> "ItemPriorityStatus":
-    from .types import ItemPriorityStatus
-
-    if not data:
-        return None
-    return ItemPriorityStatus(
-        id=data.get("id"),
-        price=data.get("price"),
-        name=data.get("name"),
-        type=PriorityTypes.__members__.get(data.get("type")),
-        period=data.get("period"),
-        price_range=item_priority_status_price_range(data.get("priceRange")),
-    )
-
-
-def item_log(data: dict) -> "ItemLog":
-    from .types import ItemLog
-
-    if not data:
-        return None
-    return ItemLog(
-        id=data.get("id"),
-        event=ItemLogEvents.__members__.get(data.get("event")),
-        created_at=data.get("createdAt"),
-        user=user_profile(data.get("user")),
-    )
-
-
-def item(data: dict) -> "Item":
-    from .types import Item
-
-    if not data:
-        return None
-    attachments = []
-    data_attachments = data.get("attachments")
-    if data_attachments:
-        for att in data_attachments:
-            attachments.append(file(att))
-    data_fields = []
-    data_data_fields = data.get("dataFields")
-    if data_data_fields:
-        for field in data_data_fields:
-            data_fields.append(game_category_data_field(field))
-    return Item(
-        id=data.get("id"),
-        slug=data.get("slug"),
-        name=data.get("name"),
-        description=data.get("description"),
-        obtaining_type=game_category_obtaining_type(data.get("obtainingType")),
-        price=data.get("price"),
-        raw_price=data.get("rawPrice"),
-        priority_position=data.get("priorityPosition"),
-        attachments=attachments,
-        attributes=data.get("attributes"),
-        category=game_category(data.get("category")),
-        comment=data.get("comment"),
-        data_fields=data_fields,
-        fee_multiplier=data.get("feeMultiplier"),
-        game=game_profile(data.get("game")),
-        seller_type=data.get("sellerType"),
-        status=ItemStatuses.__members__.get(data.get("status")),
-        user=user_profile(data.get("user")),
-    )
-
-
-def my_item(data: dict) -> "MyItem":
-    from .types import MyItem
-
-    if not data:
-        return None
-    attachments = []
-    data_attachments = data.get("attachments")
-    if data_attachments:
-        for att in data_attachments:
-            attachments.append(file(att))
-    data_fields = []
-    data_data_fields = data.get("dataFields")
-    if data_data_fields:
-        for field in data_data_fields:
-            data_fields.append(game_category_data_field(field))
-
-    return MyItem(
-        id=data.get("id"),
-        slug=data.get("slug"),
-        name=data.get("name"),
-        description=data.get("description"),
-        obtaining_type=game_category_obtaining_type(data.get("obtainingType")),
-        price=data.get("price"),
-        prev_price=data.get("prevPrice"),
-        raw_price=data.get("rawPrice"),
-        priority_position=data.get("priorityPosition"),
-        attachments=attachments,
-        attributes=data.get("attributes"),
-        buyer=user_profile(data.get("buyer")),
-        category=game_category(data.get("category")),
-        comment=data.get("comment"),
-        data_fields=data_fields,
-        fee_multiplier=data.get("feeMultiplier"),
-        prev_fee_multiplier=data.get("prevFeeMultiplier"),
-        seller_notified_about_fee_change=data.get("sellerNotifiedAboutFeeChange"),
-        game=game_profile(data.get("game")),
-        seller_type=data.get("sellerType"),
-        status=ItemStatuses.__members__.get(data.get("status")),
-        user=user_profile(data.get("user")),
-        priority=PriorityTypes.__members__.get(data.get("priority")),
-        priority_price=data.get("priorityPrice"),
-        sequence=data.get("sequence"),
-        status_expiration_date=data.get("statusExpirationDate"),
-        status_description=data.get("statusDescription"),
-        status_payment=transaction(data.get("statusPayment")),
-        views_counter=data.get("viewsCounter"),
-        is_editable=data.get("isEditable"),
-        approval_date=data.get("approvalDate"),
-        deleted_at=data.get("deletedAt"),
-        updated_at=data.get("updatedAt"),
-        created_at=data.get("createdAt"),
-    )
-
-
-def item_profile(data: dict) -> "ItemProfile":
-    from .types import ItemProfile
-
-    if not data:
-        return None
-    return ItemProfile(
-        id=data.get("id"),
-        slug=data.get("slug"),
-        priority=PriorityTypes.__members__.get(data.get("priority")),
-        status=ItemStatuses.__members__.get(data.get("status")),
-        name=data.get("name"),
-        price=data.get("price"),
-        raw_price=data.get("rawPrice"),
-        seller_type=UserTypes.__members__.get(data.get("sellerType")),
-        attachment=file(data.get("attachment")),
-        user=user_profile(data.get("user")),
-        approval_date=data.get("approvalDate"),
-        priority_position=data.get("priorityPosition"),
-        views_counter=data.get("viewsCounter"),
-        fee_multiplier=data.get("feeMultiplier"),
-        created_at=data.get("createdAt"),
-    )
-
-
-def item_profile_page_info(data: dict) -> "ItemProfilePageInfo":
-    from .types import ItemProfilePageInfo
-
-    if not data:
-        return None
-    return ItemProfilePageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage"),
-    )
-
-
-def item_profile_list(data: dict) -> "ItemProfileList":
-    from .types import ItemProfileList
-
-    if not data:
-        return None
-    items = []
-    edges: dict[dict] = data.get("edges")
-    if edges:
-        for edge in edges:
-            items.append(item_profile(edge.get("node")))
-    return ItemProfileList(
-        items=items,
-        page_info=item_profile_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount"),
-    )
+    :param default: Значение по умолчанию, если ключа нет в ответе.
+    :type default: `Any`
+    """
+
+    def __init__(self, key: str, default: Any = None):
+        self.key: str = key
+        """ Ключ в ответе GraphQL. """
+        self.default: Any = default
+        """ Значение по умолчанию. """
+
+
+class EnumValue(Value):
+    """
+    Поле-перечисление: значение из ответа превращается в член `enum` по имени.
+
+    :param key: Ключ в ответе GraphQL.
+    :type key: `str`
+
+    :param enum: Класс перечисления.
+    :type enum: `type[enum.Enum]`
+    """
+
+    def __init__(self, key: str, enum: type[Enum]):
+        super().__init__(key)
+        self.enum: type[Enum] = enum
+        """ Класс перечисления. """
+
+
+class Nested(Value):
+    """
+    Вложенный объект, который разбирается другой функцией парсера.
+
+    :param key: Ключ в ответе GraphQL.
+    :type key: `str`
+
+    :param parser: Название функции парсера (например, `user_profile`).
+    :type parser: `str`
+    """
+
+    def __init__(self, key: str, parser: str):
+        super().__init__(key)
+        self.parser: str = parser
+        """ Название функции парсера. """
+
+
+class NestedList(Nested):
+    """
+    Список вложенных объектов (если в ответе его нет - пустой список).
+
+    :param key: Ключ в ответе GraphQL.
+    :type key: `str`
+
+    :param parser: Название функции парсера элементов.
+    :type parser: `str`
+
+    :param node: Ключ объекта внутри элемента (`node` для `edges` страниц), _опционально_.
+    :type node: `str` or `None`
+    """
+
+    def __init__(self, key: str, parser: str, node: str | None = None):
+        super().__init__(key, parser)
+        self.node: str | None = node
+        """ Ключ объекта внутри элемента. """
+
+
+def _page_info(cls: str) -> tuple[str, dict]:
+    return cls, {
+        "start_cursor": "startCursor",
+        "end_cursor": "endCursor",
+        "has_previous_page": "hasPreviousPage",
+        "has_next_page": "hasNextPage",
+    }
+
+
+def _page(cls: str, attr: str, parser: str, page_info: str) -> tuple[str, dict]:
+    return cls, {
+        attr: NestedList("edges", parser, "node"),
+        "page_info": Nested("pageInfo", page_info),
+        "total_count": "totalCount",
+    }
+
+
+PARSERS: dict[str, tuple[str, dict[str, str | Value]]] = {
+    "file": ("FileObject", {
+        "id": "id",
+        "url": "url",
+        "filename": "filename",
+        "mime": "mime",
+    }),
+    "sbp_bank_member": ("SBPBankMember", {
+        "id": "id",
+        "name": "name",
+        "icon": "icon",
+    }),
+    "transaction_payment_method": ("TransactionPaymentMethod", {
+        "id": EnumValue("id", TransactionPaymentMethodIds),
+        "name": "name",
+        "fee": "fee",
+        "provider_id": EnumValue("provider_id", TransactionProviderIds),
+        "account": Nested("account", "account_profile"),
+        "props": Nested("props", "transaction_provider_props"),
+        "limits": Nested("limits", "transaction_provider_limits"),
+    }),
+    "transaction_provider_limit_range": ("TransactionProviderLimitRange", {
+        "min": "min",
+        "max": "max",
+    }),
+    "transaction_provider_limits": ("TransactionProviderLimits", {
+        "incoming": Nested("incoming", "transaction_provider_limit_range"),
+        "outgoing": Nested("outgoing", "transaction_provider_limit_range"),
+    }),
+    "transaction_provider_required_user_data": ("TransactionProviderRequiredUserData", {
+        "email": "email",
+        "phone_number": "phoneNumber",
+        "erip_account_number": "eripAccountNumber",
+    }),
+    "transaction_provider_props": ("TransactionProviderProps", {
+        "required_user_data": Nested("requiredUserData", "transaction_provider_required_user_data"),
+        "tooltip": "tooltip",
+    }),
+    "transaction_provider": ("TransactionProvider", {
+        "id": EnumValue("id", TransactionProviderIds),
+        "name": "name",
+        "fee": "fee",
+        "min_fee_amount": "minFeeAmount",
+        "description": "description",
+        "account": Nested("account", "account_profile"),
+        "props": Nested("props", "transaction_provider_props"),
+        "limits": Nested("limits", "transaction_provider_limits"),
+        "payment_methods": NestedList("paymentMethods", "transaction_payment_method"),
+    }),
+    "transaction": ("Transaction", {
+        "id": "id",
+        "operation": EnumValue("operation", TransactionOperations),
+        "direction": EnumValue("direction", TransactionDirections),
+        "provider_id": EnumValue("providerId", TransactionProviderIds),
+        "provider": Nested("provider", "transaction_provider"),
+        "user": Nested("user", "user_profile"),
+        "creator": Nested("creator", "user_profile"),
+        "status": EnumValue("status", TransactionStatuses),
+        "status_description": "statusDescription",
+        "status_expiration_date": "statusExpirationDate",
+        "value": "value",
+        "fee": "fee",
+        "created_at": "createdAt",
+        "verified_at": "verified_at",
+        "verified_by": "verified_by",
+        "completed_at": "completed_at",
+        "completed_by": "completed_by",
+        "payment_method_id": "paymentMethodId",
+        "is_suspicious": "is_suspicious",
+        "sbp_bank_name": "spb_bank_name",
+    }),
+    "transaction_page_info": _page_info("TransactionPageInfo"),
+    "transaction_list": _page("TransactionList", "transactions", "transaction", "transaction_page_info"),
+    "user_bank_card": ("UserBankCard", {
+        "id": "id",
+        "card_first_six": "cardFirstSix",
+        "card_last_four": "cardLastFour",
+        "card_type": EnumValue("cardType", BankCardTypes),
+        "is_chosen": "isChosen",
+    }),
+    "user_bank_card_page_info": _page_info("UserBankCardPageInfo"),
+    "user_bank_card_list": _page("UserBankCardList", "bank_cards", "user_bank_card", "user_bank_card_page_info"),
+    "game_category_data_field": ("GameCategoryDataField", {
+        "id": "id",
+        "label": "label",
+        "type": EnumValue("type", GameCategoryDataFieldTypes),
+        "input_type": EnumValue("inputType", GameCategoryDataFieldInputTypes),
+        "copyable": "copyable",
+        "hidden": "hidden",
+        "required": "required",
+        "value": "value",
+    }),
+    "game_category_data_field_page_info": _page_info("GameCategoryDataFieldPageInfo"),
+    "game_category_data_field_list": _page("GameCategoryDataFieldList", "data_fields", "game_category_data_field",
+                                           "game_category_data_field_page_info"),
+    "game_category_props": ("GameCategoryProps", {
+        "min_reviews": "minTestimonials",
+        "min_reviews_for_seller": "minTestimonialsForSeller",
+    }),
+    "game_category_option": ("GameCategoryOption", {
+        "id": "id",
+        "group": "group",
+        "label": "label",
+        "type": EnumValue("type", GameCategoryOptionTypes),
+        "field": "field",
+        "value": "value",
+        "value_range_limit": "valueRangeLimit",
+    }),
+    "game_category_agreement": ("GameCategoryAgreement", {
+        "id": "id",
+        "description": "description",
+        "icontype": EnumValue("iconType", GameCategoryAgreementIconTypes),
+        "sequence": "sequence",
+    }),
+    "game_category_agreement_page_info": _page_info("GameCategoryAgreementPageInfo"),
+    "game_category_agreement_list": _page("GameCategoryAgreementList", "agreements", "game_category_agreement",
+                                          "game_category_agreement_page_info"),
+    "game_category_obtaining_type": ("GameCategoryObtainingType", {
+        "id": "id",
+        "name": "name",
+        "description": "description",
+        "game_category_id": "gameCategoryId",
+        "no_comment_from_buyer": "noCommentFromBuyer",
+        "instruction_for_buyer": "instructionForBuyer",
+        "instruction_for_seller": "instructionForSeller",
+        "sequence": "sequence",
+        "fee_multiplier": "feeMultiplier",
+        "agreements": NestedList("agreements", "game_category_agreement"),
+        "props": Nested("props", "game_category_props"),
+    }),
+    "game_category_obtaining_type_page_info": _page_info("GameCategoryObtainingTypePageInfo"),
+    "game_category_obtaining_type_list": _page("GameCategoryObtainingTypeList", "obtaining_types", "game_category_obtaining_type",
+                                               "game_category_obtaining_type_page_info"),
+    "game_category_instruction": ("GameCategoryInstruction", {
+        "id": "id",
+        "text": "text",
+    }),
+    "game_category_instruction_page_info": _page_info("GameCategoryInstructionPageInfo"),
+    "game_category_instruction_list": _page("GameCategoryInstructionList", "instructions", "game_category_instruction",
+                                            "game_category_instruction_page_info"),
+    "game_category": ("GameCategory", {
+        "id": "id",
+        "slug": "slug",
+        "name": "name",
+        "category_id": "categoryId",
+        "game_id": "gameId",
+        "obtaining": "obtaining",
+        "options": NestedList("options", "game_category_option"),
+        "props": Nested("props", "game_category_props"),
+        "no_comment_from_buyer": "noCommentFromBuyer",
+        "instruction_for_buyer": "instructionForBuyer",
+        "instruction_for_seller": "instructionForSeller",
+        "use_custom_obtaining": "useCustomObtaining",
+        "auto_confirm_period": EnumValue("autoConfirmPeriod", GameCategoryAutoConfirmPeriods),
+        "auto_moderation_mode": "autoModerationMode",
+        "agreements": NestedList("agreements", "game_category_agreement"),
+        "fee_multiplier": "feeMultiplier",
+    }),
+    "game": ("Game", {
+        "id": "id",
+        "slug": "slug",
+        "name": "name",
+        "type": EnumValue("type", GameTypes),
+        "logo": Nested("logo", "file"),
+        "banner": Nested("banner", "file"),
+        "categories": NestedList("categories", "game_category"),
+        "created_at": "createdAt",
+    }),
+    "game_profile": ("GameProfile", {
+        "id": "id",
+        "slug": "slug",
+        "name": "name",
+        "type": EnumValue("type", GameTypes),
+        "logo": Nested("logo", "file"),
+    }),
+    "game_page_info": _page_info("GamePageInfo"),
+    "game_list": _page("GameList", "games", "game", "game_page_info"),
+    "user_profile": ("UserProfile", {
+        "id": "id",
+        "username": Value("username", "Поддержка"),
+        "role": EnumValue("role", UserTypes),
+        "avatar_url": "avatarURL",
+        "is_online": "isOnline",
+        "is_blocked": "isBlocked",
+        "rating": "rating",
+        "reviews_count": "testimonialCounter",
+        "created_at": "createdAt",
+        "support_chat_id": "supportChatId",
+        "system_chat_id": "systemChatId",
+    }),
+    "account_items_stats": ("AccountItemsStats", {
+        "total": "total",
+        "finished": "finished",
+    }),
+    "account_incoming_deals_stats": ("AccountIncomingDealsStats", {
+        "total": "total",
+        "finished": "finished",
+    }),
+    "account_outgoing_deals_stats": ("AccountOutgoingDealsStats", {
+        "total": "total",
+        "finished": "finished",
+    }),
+    "account_deals_stats": ("AccountDealsStats", {
+        "incoming": Nested("incoming", "account_incoming_deals_stats"),
+        "outgoing": Nested("outgoing", "account_outgoing_deals_stats"),
+    }),
+    "account_stats": ("AccountStats", {
+        "items": Nested("items", "account_items_stats"),
+        "deals": Nested("deals", "account_deals_stats"),
+    }),
+    "account_balance": ("AccountBalance", {
+        "id": "id",
+        "value": "value",
+        "frozen": "frozen",
+        "available": "available",
+        "withdrawable": "withdrawable",
+        "pending_income": "pendingIncome",
+    }),
+    "account_profile": ("AccountProfile", {
+        "id": "id",
+        "username": "profile.username",
+        "email": "email",
+        "balance": Nested("balance", "account_balance"),
+        "stats": Nested("stats", "account_stats"),
+        "role": EnumValue("role", UserTypes),
+        "avatar_url": "profile.avatarURL",
+        "is_online": "profile.isOnline",
+        "is_blocked": "isBlocked",
+        "is_blocked_for": "isBlockedFor",
+        "is_verified": "isVerified",
+        "rating": "profile.rating",
+        "reviews_count": "profile.testimonialCounter",
+        "created_at": "profile.createdAt",
+        "support_chat_id": "profile.supportChatId",
+        "system_chat_id": "profile.systemChatId",
+        "has_frozen_balance": "hasFrozenBalance",
+        "has_enabled_notifications": "hasEnabledNotifications",
+    }),
+    "item_priority_status_price_range": ("ItemPriorityStatusPriceRange", {
+        "min": "min",
+        "max": "max",
+    }),
+    "item_priority_status": ("ItemPriorityStatus", {
+        "id": "id",
+        "price": "price",
+        "name": "name",
+        "type": EnumValue("type", PriorityTypes),
+        "period": "period",
+        "price_range": Nested("priceRange", "item_priority_status_price_range"),
+    }),
+    "item_log": ("ItemLog", {
+        "id": "id",
+        "event": EnumValue("event", ItemLogEvents),
+        "created_at": "createdAt",
+        "user": Nested("user", "user_profile"),
+    }),
+    "item": ("Item", {
+        "id": "id",
+        "slug": "slug",
+        "name": "name",
+        "description": "description",
+        "obtaining_type": Nested("obtainingType", "game_category_obtaining_type"),
+        "price": "price",
+        "raw_price": "rawPrice",
+        "priority_position": "priorityPosition",
+        "attachments": NestedList("attachments", "file"),
+        "attributes": "attributes",
+        "category": Nested("category", "game_category"),
+        "comment": "comment",
+        "data_fields": NestedList("dataFields", "game_category_data_field"),
+        "fee_multiplier": "feeMultiplier",
+        "game": Nested("game", "game_profile"),
+        "seller_type": "sellerType",
+        "status": EnumValue("status", ItemStatuses),
+        "user": Nested("user", "user_profile"),
+    }),
+    "my_item": ("MyItem", {
+        "id": "id",
+        "slug": "slug",
+        "name": "name",
+        "description": "description",
+        "obtaining_type": Nested("obtainingType", "game_category_obtaining_type"),
+        "price": "price",
+        "prev_price": "prevPrice",
+        "raw_price": "rawPrice",
+        "priority_position": "priorityPosition",
+        "attachments": NestedList("attachments", "file"),
+        "attributes": "attributes",
+        "buyer": Nested("buyer", "user_profile"),
+        "category": Nested("category", "game_category"),
+        "comment": "comment",
+        "data_fields": NestedList("dataFields", "game_category_data_field"),
+        "fee_multiplier": "feeMultiplier",
+        "prev_fee_multiplier": "prevFeeMultiplier",
+        "seller_notified_about_fee_change": "sellerNotifiedAboutFeeChange",
+        "game": Nested("game", "game_profile"),
+        "seller_type": "sellerType",
+        "status": EnumValue("status", ItemStatuses),
+        "user": Nested("user", "user_profile"),
+        "priority": EnumValue("priority", PriorityTypes),
+        "priority_price": "priorityPrice",
+        "sequence": "sequence",
+        "status_expiration_date": "statusExpirationDate",
+        "status_description": "statusDescription",
+        "status_payment": Nested("statusPayment", "transaction"),
+        "views_counter": "viewsCounter",
+        "is_editable": "isEditable",
+        "approval_date": "approvalDate",
+        "deleted_at": "deletedAt",
+        "updated_at": "updatedAt",
+        "created_at": "createdAt",
+    }),
+    "item_profile": ("ItemProfile", {
+        "id": "id",
+        "slug": "slug",
+        "priority": EnumValue("priority", PriorityTypes),
+        "status": EnumValue("status", ItemStatuses),
+        "name": "name",
+        "price": "price",
+        "raw_price": "rawPrice",
+        "seller_type": EnumValue("sellerType", UserTypes),
+        "attachment": Nested("attachment", "file"),
+        "user": Nested("user", "user_profile"),
+        "approval_date": "approvalDate",
+        "priority_position": "priorityPosition",
+        "views_counter": "viewsCounter",
+        "fee_multiplier": "feeMultiplier",
+        "created_at": "createdAt",
+    }),
+    "item_profile_page_info": _page_info("ItemProfilePageInfo"),
+    "item_profile_list": _page("ItemProfileList", "items", "item_profile", "item_profile_page_info"),
+    "chat": ("Chat", {
+        "id": "id",
+        "type": EnumValue("type", ChatTypes),
+        "status": EnumValue("status", ChatStatuses),
+        "unread_messages_counter": "unreadMessagesCounter",
+        "bookmarked": "bookmarked",
+        "is_texting_allowed": "isTextingAllowed",
+        "owner": Nested("owner", "user_profile"),
+        "deals": NestedList("deals", "item_deal"),
+        "started_at": "startedAt",
+        "finished_at": "finishedAt",
+        "last_message": Nested("lastMessage", "chat_message"),
+        "users": NestedList("participants", "user_profile"),
+    }),
+    "chat_page_info": _page_info("ChatPageInfo"),
+    "chat_list": _page("ChatList", "chats", "chat", "chat_page_info"),
+    "review": ("Review", {
+        "id": "id",
+        "status": EnumValue("status", ReviewStatuses),
+        "text": "text",
+        "rating": "rating",
+        "created_at": "createdAt",
+        "updated_at": "updatedAt",
+        "deal": Nested("deal", "item_deal"),
+        "creator": Nested("creator", "user_profile"),
+        "moderator": Nested("moderator", "moderator"),
+        "user": Nested("user", "user_profile"),
+    }),
+    "review_page_info": _page_info("ReviewPageInfo"),
+    "review_list": _page("ReviewList", "reviews", "review", "review_page_info"),
+    "item_deal": ("ItemDeal", {
+        "id": "id",
+        "status": EnumValue("status", ItemDealStatuses),
+        "status_expiration_date": "statusExpirationDate",
+        "status_description": "statusDescription",
+        "direction": EnumValue("direction", ItemDealDirections),
+        "obtaining": "obtaining",
+        "has_problem": "hasProblem",
+        "report_problem_enabled": "reportProblemEnabled",
+        "completed_user": Nested("completedBy", "user_profile"),
+        "props": "props",
+        "previous_status": "prevStatus",
+        "completed_at": "completedAt",
+        "created_at": "createdAt",
+        "logs": NestedList("logs", "item_log"),
+        "transaction": Nested("transaction", "transaction"),
+        "user": Nested("user", "user_profile"),
+        "chat": Nested("chat", "chat"),
+        "item": Nested("item", "item"),
+        "review": Nested("testimonial", "review"),
+        "obtaining_fields": NestedList("obtainingFields", "game_category_data_field"),
+        "comment_from_buyer": "commentFromBuyer",
+    }),
+    "item_deal_page_info": _page_info("ItemDealPageInfo"),
+    "item_deal_list": _page("ItemDealList", "deals", "item_deal", "item_deal_page_info"),
+    "chat_message_button": ("ChatMessageButton", {
+        "type": EnumValue("type", ChatMessageButtonTypes),
+        "url": "url",
+        "text": "text",
+    }),
+    "chat_message": ("ChatMessage", {
+        "id": "id",
+        "text": "text",
+        "created_at": "createdAt",
+        "deleted_at": "deletedAt",
+        "is_read": "isRead",
+        "is_suspicious": "isSuspicious",
+        "is_bulk_messaging": "isBulkMessaging",
+        "file": Nested("file", "file"),
+        "game": Nested("game", "game"),
+        "user": Nested("user", "user_profile"),
+        "deal": Nested("deal", "item_deal"),
+        "item": Nested("item", "item"),
+        "transaction": Nested("transaction", "transaction"),
+        "moderator": Nested("moderator", "moderator"),
+        "event": Nested("event", "event"),
+        "event_by_user": Nested("eventByUser", "user_profile"),
+        "event_to_user": Nested("eventToUser", "user_profile"),
+        "is_auto_response": "isAutoResponse",
+        "buttons": NestedList("buttons", "chat_message_button"),
+    }),
+    "chat_message_page_info": _page_info("ChatMessagePageInfo"),
+    "chat_message_list": _page("ChatMessageList", "messages", "chat_message", "chat_message_page_info"),
+}
+"""
+Описание всех объектов ответа: {функция парсера: (класс из `playerokapi.types`, {атрибут: поле ответа})}.\n
+Поле - ключ ответа (строка) или `Value`/`EnumValue`/`Nested`/`NestedList`.
+По этой таблице при импорте модуля генерируются функции парсера (`file`, `chat`, `item_deal` и т.д.).
+"""
 
 
 def moderator(data: dict) -> "Moderator": ...  # TODO: Сделать парсинг класса Moderator
@@ -824,256 +527,188 @@ def moderator(data: dict) -> "Moderator": ...  # TODO: Сделать парси
 def event(data: dict): ...  # TODO: Сделать парсинг класса Event
 
 
-def chat(data: dict) -> "Chat":
-    from .types import Chat
-
-    if not data:
-        return None
-    users = []
-    data_users = data.get("participants")
-    if data_users:
-        for user in data_users:
-            users.append(user_profile(user))
-    deals = []
-    data_deals = data.get("deals")
-    if data_deals:
-        for deal in data_deals:
-            deals.append(item_deal(deal))
-    return Chat(
-        id=data.get("id"),
-        type=ChatTypes.__members__.get(data.get("type")),
-        status=ChatStatuses.__members__.get(data.get("status")),
-        unread_messages_counter=data.get("unreadMessagesCounter"),
-        bookmarked=data.get("bookmarked"),
-        is_texting_allowed=data.get("isTextingAllowed"),
-        owner=user_profile(data.get("owner")),
-        deals=deals,
-        started_at=data.get("startedAt"),
-        finished_at=data.get("finishedAt"),
-        last_message=chat_message(data.get("lastMessage")),
-        users=users,
-    )
-
-
-def chat_page_info(data: dict) -> "ChatPageInfo":
-    from .types import ChatPageInfo
-
-    if not data:
-        return None
-    return ChatPageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage"),
-    )
-
-
-def chat_list(data: dict) -> "ChatList":
-    from .types import ChatList
-
-    if not data:
-        return None
-    chats = []
-    edges: dict[dict] = data.get("edges")
-    if edges:
-        for edge in edges:
-            chats.append(chat(edge.get("node")))
-    return ChatList(
-        chats=chats,
-        page_info=chat_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount"),
-    )
-
-
-def review(data: dict) -> "Review":
-    from .types import Review
-
-    if not data:
-        return None
-    return Review(
-        id=data.get("id"),
-        status=ReviewStatuses.__members__.get(data.get("status")),
-        text=data.get("text"),
-        rating=data.get("rating"),
-        created_at=data.get("createdAt"),
-        updated_at=data.get("updatedAt"),
-        deal=item_deal(data.get("deal")),
-        creator=user_profile(data.get("creator")),
-        moderator=moderator(data.get("moderator")),
-        user=user_profile(data.get("user")),
-    )
-
-
-def review_page_info(data: dict) -> "ReviewPageInfo":
-    from .types import ReviewPageInfo
-
-    if not data:
-        return None
-    return ReviewPageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage"),
-    )
-
-
-def review_list(data: dict) -> "ReviewList":
-    from .types import ReviewList
-
-    if not data:
-        return None
-    reviews = []
-    edges: dict[dict] = data.get("edges")
-    if edges:
-        for edge in edges:
-            reviews.append(review(edge.get("node")))
-    return ReviewList(
-        reviews=reviews,
-        page_info=review_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount"),
-    )
-
-
-def item_deal(data: dict) -> "ItemDeal":
-    from .types import ItemDeal
-
-    if not data:
-        return None
-    logs = []
-    data_logs: dict[dict] = data.get("logs")
-    if data_logs:
-        for log in data_logs:
-            logs.append(item_log(log))
-    obtaining_fields = []
-    data_obtaining_fields = data.get("obtainingFields")
-    if data_obtaining_fields:
-        for field in data_obtaining_fields:
-            obtaining_fields.append(game_category_data_field(field))
-    return ItemDeal(
-        id=data.get("id"),
-        status=ItemDealStatuses.__members__.get(data.get("status")),
-        status_expiration_date=data.get("statusExpirationDate"),
-        status_description=data.get("statusDescription"),
-        direction=ItemDealDirections.__members__.get(data.get("direction")),
-        obtaining=data.get("obtaining"),
-        has_problem=data.get("hasProblem"),
-        report_problem_enabled=data.get("reportProblemEnabled"),
-        completed_user=user_profile(data.get("completedBy")),
-        props=data.get("props"),
-        previous_status=data.get("prevStatus"),
-        completed_at=data.get("completedAt"),
-        created_at=data.get("createdAt"),
-        logs=logs,
-        transaction=transaction(data.get("transaction")),
-        user=user_profile(data.get("user")),
-        chat=chat(data.get("chat")),
-        item=item(data.get("item")),
-        review=review(data.get("testimonial")),
-        obtaining_fields=obtaining_fields,
-        comment_from_buyer=data.get("commentFromBuyer"),
-    )
-
-
-def item_deal_page_info(data: dict) -> "ItemDealPageInfo":
-    from .types import ItemDealPageInfo
-
-    if not data:
-        return None
-    return ItemDealPageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage"),
-    )
-
-
-def item_deal_list(data: dict) -> "ItemDealList":
-    from .types import ItemDealList
-
-    if not data:
-        return None
-    deals = []
-    edges: dict[dict] = data.get("edges")
-    if edges:
-        for edge in edges:
-            deals.append(item_deal(edge.get("node")))
-    return ItemDealList(
-        deals=deals,
-        page_info=item_deal_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount"),
-    )
-
-
-def chat_message_button(data: dict) -> "ChatMessageButton":
-    from .types import ChatMessageButton
-
-    if not data:
-        return None
-    return ChatMessageButton(
-        type=ChatMessageButtonTypes.__members__.get(data.get("type")),
-        url=data.get("url"),
-        text=data.get("text"),
-    )
-
-
-def chat_message(data: dict) -> "ChatMessage":
-    from .types import ChatMessage
-
-    if not data:
-        return None
-    btns = []
-    data_btns = data.get("buttons")
-    if data_btns:
-        for btn in data_btns:
-            btns.append(chat_message_button(btn))
-    return ChatMessage(
-        id=data.get("id"),
-        text=data.get("text"),
-        created_at=data.get("createdAt"),
-        deleted_at=data.get("deletedAt"),
-        is_read=data.get("isRead"),
-        is_suspicious=data.get("isSuspicious"),
-        is_bulk_messaging=data.get("isBulkMessaging"),
-        file=file(data.get("file")),
-        game=game(data.get("game")),
-        user=user_profile(data.get("user")),
-        deal=item_deal(data.get("deal")),
-        item=item(data.get("item")),
-        transaction=transaction(data.get("transaction")),
-        moderator=moderator(data.get("moderator")),
-        event=event(data.get("event")),
-        event_by_user=user_profile(data.get("eventByUser")),
-        event_to_user=user_profile(data.get("eventToUser")),
-        is_auto_response=data.get("isAutoResponse"),
-        buttons=btns,
-    )
-
-
-def chat_message_page_info(data: dict) -> "ChatMessagePageInfo":
-    from .types import ChatMessagePageInfo
-
-    if not data:
-        return None
-    return ChatMessagePageInfo(
-        start_cursor=data.get("startCursor"),
-        end_cursor=data.get("endCursor"),
-        has_previous_page=data.get("hasPreviousPage"),
-        has_next_page=data.get("hasNextPage"),
-    )
-
-
-def chat_message_list(data: dict) -> "ChatMessageList":
-    from .types import ChatMessageList
-
-    if not data:
-        return None
-    messages = []
-    edges: dict[dict] = data.get("edges")
-    if edges:
-        for edge in edges:
-            messages.append(chat_message(edge.get("node")))
-    return ChatMessageList(
-        messages=messages,
-        page_info=chat_message_page_info(data.get("pageInfo")),
-        total_count=data.get("totalCount"),
-    )
+IDENTITY_MAPPED: set[str] = {"user_profile", "game", "chat"}
+""" Функции парсера, объекты которых берутся из карты идентичности (см. `playerokapi.identity`), если она используется. """
+
+
+LAZY_PARSED: set[str] = {"chat_message", "item_deal", "chat"}
+""" Функции парсера, вложенные объекты которых в ленивом режиме (см. `lazy`) разбираются только при первом обращении. """
+
+_lazy_parsing: ContextVar[bool] = ContextVar("playerokapi_lazy_parsing", default=False)
+
+
+def set_lazy(enabled: bool):
+    """
+    Включает/выключает ленивый разбор вложенных объектов в текущем потоке/задаче.
+
+    :param enabled: Включить ли ленивый разбор.
+    :type enabled: `bool`
+    """
+    _lazy_parsing.set(enabled)
+
+
+@contextmanager
+def lazy(enabled: bool = True):
+    """
+    Ленивый разбор вложенных объектов для всего, что разбирается внутри `with`.\n
+    Сообщения, сделки и чаты (`LAZY_PARSED`) создаются только с простыми полями, а вложенные
+    объекты (`user`, `deal`, `item`, `transaction`, `deals`, `last_message` и т.д.) разбираются
+    из сохранённого ответа при первом обращении к атрибуту. Снаружи объекты ничем не отличаются
+    от обычных (`isinstance(message, ChatMessage)` верно).
+
+    Пример:
+        with parser.lazy():
+            messages = parser.chat_message_list(data)  # user/deal/item пока не разобраны
+        messages.messages[0].deal.id  # сделка разбирается здесь
+
+    :param enabled: Включить ли ленивый разбор.
+    :type enabled: `bool`
+    """
+    token = _lazy_parsing.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy_parsing.reset(token)
+
+
+class _LazyField:
+    """
+    Атрибут ленивого объекта: при первом чтении разбирает вложенный объект из `_raw` и записывает его в слот.\n
+    Разбор идёт в контексте, сохранённом при создании объекта (`_context`: аккаунт и карта идентичности,
+    ленивый режим), а не в контексте того, кто обратился к атрибуту.
+    """
+
+    __slots__ = ("slot", "parse")
+
+    def __init__(self, slot: Any, parse: Callable[[dict], Any]):
+        self.slot = slot
+        self.parse = parse
+
+    def __get__(self, obj: Any, owner: type | None = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            return self.slot.__get__(obj, owner)
+        except AttributeError:
+            account, identity_map = obj._context
+            account_token = _current_account.set(account)
+            map_token = _current_map.set(identity_map)
+            lazy_token = _lazy_parsing.set(True)
+            try:
+                value = self.parse(obj._raw)
+            finally:
+                _lazy_parsing.reset(lazy_token)
+                _current_map.reset(map_token)
+                _current_account.reset(account_token)
+            self.slot.__set__(obj, value)
+            return value
+
+    def __set__(self, obj: Any, value: Any):
+        self.slot.__set__(obj, value)
+
+    def __delete__(self, obj: Any):
+        self.slot.__delete__(obj)
+
+
+_lazy_fields: dict[str, dict[str, Callable[[dict], Any]]] = {} # {класс: {атрибут: функция разбора}}
+
+
+def _compile(name: str, cls: str, fields: dict[str, str | Value]):
+    namespace = globals()
+    lines = [f"def {name}(data: dict) -> {cls!r}:",
+             "    if not data:",
+             "        return None",
+             "    get = data.get"]
+    values = [] # [(атрибут, выражение, ключ ответа, вложенный ли)]
+    sources = {} # {ключ вложенного словаря: локальная переменная}
+    for attr, field in fields.items():
+        if isinstance(field, str):
+            field = Value(field)
+        getter, key, present = "get", field.key, field.key
+        if "." in key:
+            present, key = key.split(".", 1)
+            getter = sources.get(present)
+            if getter is None:
+                getter = sources[present] = f"_{present}"
+                lines.append(f"    {getter} = get({present!r}, {{}}).get")
+        value = f"{getter}({key!r}, {field.default!r})" if field.default is not None else f"{getter}({key!r})"
+        if isinstance(field, NestedList):
+            item = f"x.get({field.node!r})" if field.node else "x"
+            value = f"[{field.parser}({item}) for x in _{attr}] if (_{attr} := {value}) else []"
+        elif isinstance(field, Nested):
+            value = f"{field.parser}({value})"
+        elif isinstance(field, EnumValue):
+            members = f"_{field.enum.__name__}_members"
+            namespace.setdefault(members, dict(field.enum.__members__))
+            value = f"{members}.get({value})"
+        values.append((attr, value, present, isinstance(field, Nested)))
+
+    create = ["    _obj = " + "\n    ".join([f"_{cls}("] + [f"    {attr}={value}," for attr, value, *_ in values] + [")"])]
+    if name in LAZY_PARSED:
+        # в ленивом режиме вложенные поля остаются пустыми слотами, их заполняет `_LazyField`
+        create = ["    if _lazy():",
+                  f"        _obj = _new(_Lazy{cls})",
+                  *[f"        _obj.{attr} = {value}" for attr, value, _, nested in values if not nested],
+                  "        _obj._raw = data",
+                  "        _obj._context = (_account(), _identity_map())",
+                  "    else:",
+                  *["    " + line for line in create]]
+        _lazy_fields[cls] = {}
+        for attr, value, _, nested in values:
+            if nested:
+                exec(f"def _parse(data):\n    get = data.get\n    return {value}", namespace)
+                _lazy_fields[cls][attr] = namespace.pop("_parse")
+    if name not in IDENTITY_MAPPED:
+        lines += create + ["    return _obj"]
+    else:
+        # известный объект обновляется только полями, которые есть в ответе
+        def update(obj: str, source: Callable[[str, str], str], indent: str) -> list[str]:
+            return [f"{indent}if {present!r} in data: {obj}.{attr} = {source(attr, value)}"
+                    for attr, value, present, _ in values if attr != "id"]
+        lines += ["    _map = _identity_map()",
+                  f"    _key = ({cls!r}, _id) if _map is not None and (_id := get('id')) is not None else None",
+                  "    if _key is not None:",
+                  "        _obj = _map.get(_key)",
+                  "        if _obj is not None:",
+                  *update("_obj", lambda attr, value: value, "            "),
+                  "            return _obj",
+                  *create,
+                  "    if _key is not None:",
+                  "        _prev = _map.setdefault(_key, _obj)",
+                  "        if _prev is not _obj:",
+                  *update("_prev", lambda attr, value: f"_obj.{attr}", "            "),
+                  "            _obj = _prev",
+                  "    return _obj"]
+    exec("\n".join(lines), namespace)
+
+
+_identity_map = _current_map.get
+_lazy = _lazy_parsing.get
+_new = object.__new__
+
+for _name, (_cls, _fields) in PARSERS.items():
+    _compile(_name, _cls, _fields)
+
+
+def _bind_types():
+    """
+    Подставляет классы из `playerokapi.types` в функции парсера.\n
+    Вызывается один раз в конце `playerokapi.types` (парсер нельзя
+    импортировать оттуда раньше - модули ссылаются друг на друга).
+    """
+    from . import types
+    from .account import _current_account
+    namespace = globals()
+    namespace["_current_account"] = _current_account
+    namespace["_account"] = _current_account.get
+    for cls, _ in PARSERS.values():
+        namespace[f"_{cls}"] = getattr(types, cls)
+    for cls, fields in _lazy_fields.items():
+        base = getattr(types, cls)
+        attrs = {attr: _LazyField(base.__dict__[attr], parse) for attr, parse in fields.items()}
+        namespace[f"_Lazy{cls}"] = type(f"Lazy{cls}", (base,), {
+            "__slots__": ("_raw", "_context"),
+            "__module__": base.__module__,
+            "__doc__": f"`{cls}`, вложенные объекты которого разбираются при первом обращении (см. `playerokapi.parser.lazy`).",
+            **attrs
+        })
@@ -0,0 +1,378 @@
+import hashlib
+
+from . import json_backend
+
+from .enums import *
+from .misc import PERSISTED_QUERIES, QUERIES
+
+
+_query_hashes: dict[str, str] = {}
+
+
+def query_hash(query: str) -> str:
+    hash = _query_hashes.get(query)
+    if hash is None:
+        hash = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        _query_hashes[query] = hash
+    return hash
+
+
+def persisted_mutation(payload: dict, include_query: bool = False) -> tuple[dict, str | None]:
+    """
+    Превращает payload мутации в Automatic Persisted Query:
+    вместо полного текста запроса отправляется только его sha256 хеш
+    (с `include_query=True` - хеш вместе с текстом, чтобы зарегистрировать запрос на сервере).\n
+    Поддерживает и обычный JSON payload, и multipart (`operations` + `map`).
+
+    :return: Новый payload и хеш запроса (`None`, если в payload нет текста запроса).
+    :rtype: `tuple[dict, str | None]`
+    """
+    multipart_payload = "operations" in payload
+    operations = json_backend.loads(payload["operations"]) if multipart_payload else payload
+    query = operations.get("query")
+    if not query:
+        return payload, None
+    hash = query_hash(query)
+    operations = {k: v for k, v in operations.items() if k != "query" or include_query}
+    operations["extensions"] = {"persistedQuery": {"version": 1, "sha256Hash": hash}}
+    if multipart_payload:
+        return {**payload, "operations": json_backend.dumps(operations)}, hash
+    return operations, hash
+
+
+PERSISTED_EXTENSIONS: dict[str, str] = {
+    query_name: json_backend.dumps({"persistedQuery": {"version": 1, "sha256Hash": hash}})
+    for query_name, hash in PERSISTED_QUERIES.items()
+}
+""" Заранее сериализованные `extensions` для каждого запроса из `PERSISTED_QUERIES`. """
+
+
+def persisted_query(operation_name: str, query_name: str, variables: dict) -> dict:
+    extensions = PERSISTED_EXTENSIONS.get(query_name)
+    if extensions is None:
+        extensions = json_backend.dumps({"persistedQuery": {"version": 1, "sha256Hash": PERSISTED_QUERIES.get(query_name)}})
+    return {
+        "operationName": operation_name,
+        "variables": json_backend.dumps(variables),
+        "extensions": extensions
+    }
+
+
+def multipart(operations: dict, map: dict) -> dict:
+    return {
+        "operations": json_backend.dumps(operations),
+        "map": json_backend.dumps(map)
+    }
+
+
+def viewer() -> dict:
+    return {
+        "operationName": "viewer",
+        "query": QUERIES["viewer"],
+        "variables": {}
+    }
+
+
+def user(id: str | None = None, username: str | None = None) -> dict:
+    return persisted_query("user", "user", {"id": id, "username": username, "hasSupportAccess": False})
+
+
+def deals(user_id: str, count: int = 24, statuses: list[ItemDealStatuses] | None = None,
+          direction: ItemDealDirections | None = None, after_cursor: str | None = None) -> dict:
+    str_statuses = [status.name for status in statuses] if statuses else None
+    str_direction = direction.name if direction else None
+    return persisted_query("deals", "deals", {"pagination": {"first": count, "after": after_cursor}, "filter": {"userId": user_id, "direction": str_direction, "status": str_statuses}, "showForbiddenImage": True})
+
+
+def deal(deal_id: str) -> dict:
+    return persisted_query("deal", "deal", {"id": deal_id, "hasSupportAccess": False, "showForbiddenImage": True})
+
+
+def update_deal(deal_id: str, new_status: ItemDealStatuses) -> dict:
+    return {
+        "operationName": "updateDeal",
+        "variables": {
+            "input": {
+                "id": deal_id,
+                "status": new_status.name
+            }
+        },
+        "query": QUERIES["update_deal"]
+    }
+
+
+def games(count: int = 24, type: GameTypes | None = None, after_cursor: str | None = None) -> dict:
+    return persisted_query("games", "games", {"pagination": {"first": count, "after": after_cursor}, "filter": {"type": type.name} if type else {}})
+
+
+def game(id: str | None = None, slug: str | None = None) -> dict:
+    return persisted_query("GamePage", "game", {"id": id, "slug": slug})
+
+
+def game_category(id: str | None = None, game_id: str | None = None, slug: str | None = None) -> dict:
+    return persisted_query("GamePageCategory", "game_category", {"id": id, "gameId": game_id, "slug": slug})
+
+
+def game_category_agreements(game_category_id: str, user_id: str | None, count: int = 24,
+                             after_cursor: str | None = None) -> dict:
+    return persisted_query("gameCategoryAgreements", "game_category_agreements", {"pagination": {"first": count, "after": after_cursor}, "filter": {"gameCategoryId": game_category_id, "userId": user_id}})
+
+
+def game_category_obtaining_types(game_category_id: str, count: int = 24, after_cursor: str | None = None) -> dict:
+    return persisted_query("gameCategoryObtainingTypes", "game_category_obtaining_types", {"pagination": {"first": count, "after": after_cursor}, "filter": {"gameCategoryId": game_category_id}})
+
+
+def game_category_instructions(game_category_id: str, obtaining_type_id: str, count: int = 24,
+                               type: GameCategoryInstructionTypes | None = None, after_cursor: str | None = None) -> dict:
+    return persisted_query("gameCategoryInstructions", "game_category_instructions", {"pagination": {"first": count, "after": after_cursor}, "filter": {"gameCategoryId": game_category_id, "obtainingTypeId": obtaining_type_id, "type": type.name if type else None}})
+
+
+def game_category_data_fields(game_category_id: str, obtaining_type_id: str, count: int = 24,
+                              type: GameCategoryDataFieldTypes | None = None, after_cursor: str | None = None) -> dict:
+    return persisted_query("gameCategoryDataFields", "game_category_data_fields", {"pagination": {"first": count, "after": after_cursor}, "filter": {"gameCategoryId": game_category_id, "obtainingTypeId": obtaining_type_id, "type": type.name if type else None}})
+
+
+def chats(user_id: str, count: int = 24, type: ChatTypes | None = None,
+          status: ChatStatuses | None = None, after_cursor: str | None = None) -> dict:
+    return persisted_query("chats", "chats", {"pagination": {"first": count, "after": after_cursor}, "filter": {"userId": user_id, "type": type.name if type else None, "status": status.name if status else None}, "hasSupportAccess": False})
+
+
+def chat(chat_id: str) -> dict:
+    return persisted_query("chat", "chat", {"id": chat_id, "hasSupportAccess": False})
+
+
+def chat_messages(chat_id: str, count: int = 24, after_cursor: str | None = None) -> dict:
+    return persisted_query("chatMessages", "chat_messages", {"pagination": {"first": count, "after": after_cursor}, "filter": {"chatId": chat_id}, "hasSupportAccess": False, "showForbiddenImage": True})
+
+
+def mark_chat_as_read(chat_id: str) -> dict:
+    return {
+        "operationName": "markChatAsRead",
+        "query": QUERIES["mark_chat_as_read"],
+        "variables": {
+            "input": {
+                "chatId": chat_id
+            }
+        }
+    }
+
+
+def create_chat_message(chat_id: str, text: str | None = None,
+                        photo_file_path: str | None = None) -> tuple[dict, dict | None]:
+    if photo_file_path: query = QUERIES["create_chat_message_with_file"]
+    elif text: query = QUERIES["create_chat_message"]
+    operations = {
+        "operationName": "createChatMessage",
+        "query": query,
+        "variables": {
+            "input": {
+                "chatId": chat_id
+            }
+        }
+    }
+    if photo_file_path:
+        operations["variables"]["file"] = None
+    elif text:
+        operations["variables"]["input"]["text"] = text
+    if photo_file_path is None:
+        return operations, None
+    files = {"1": open(photo_file_path, "rb")}
+    return multipart(operations, {"1": ["variables.file"]}), files
+
+
+def create_item(game_category_id: str, obtaining_type_id: str, name: str, price: int,
+                description: str, options: list, data_fields: list,
+                attachments: list[str]) -> tuple[dict, dict]:
+    payload_attributes = {option.field: option.value for option in options}
+    payload_data_fields = [{"fieldId": field.id, "value": field.value} for field in data_fields]
+    operations = {
+        "operationName": "createItem",
+        "query": QUERIES["create_item"],
+        "variables": {
+            "input": {
+                "gameCategoryId": game_category_id,
+                "obtainingTypeId": obtaining_type_id,
+                "name": name,
+                "price": int(price),
+                "description": description,
+                "attributes": payload_attributes,
+                "dataFields": payload_data_fields
+            },
+            "attachments": [None] * len(attachments)
+        }
+    }
+    map = {}
+    files = {}
+    for i, att in enumerate(attachments, start=1):
+        map[str(i)] = [f"variables.attachments.{i-1}"]
+        files[str(i)] = open(att, "rb")
+    return multipart(operations, map), files
+
+
+def update_item(id: str, name: str | None = None, price: int | None = None, description: str | None = None,
+                options: list | None = None, data_fields: list | None = None,
+                remove_attachments: list[str] | None = None, add_attachments: list[str] | None = None) -> tuple[dict, dict | None]:
+    operations = {
+        "operationName": "updateItem",
+        "query": QUERIES["update_item"],
+        "variables": {
+            "input": {
+                "id": id
+            },
+            "addedAttachments": [None] * len(add_attachments) if add_attachments else None
+        }
+    }
+    if name: operations["variables"]["input"]["name"] = name
+    if price: operations["variables"]["input"]["price"] = int(price)
+    if description: operations["variables"]["input"]["description"] = description
+    if options: operations["variables"]["input"]["attributes"] = {option.field: option.value for option in options}
+    if data_fields: operations["variables"]["input"]["dataFields"] = [{"fieldId": field.id, "value": field.value} for field in data_fields]
+    if remove_attachments: operations["variables"]["input"]["removedAttachments"] = remove_attachments
+
+    if not add_attachments:
+        return operations, None
+    map = {}
+    files = {}
+    for i, att in enumerate(add_attachments, start=1):
+        map[str(i)] = [f"variables.addedAttachments.{i-1}"]
+        files[str(i)] = open(att, "rb")
+    return multipart(operations, map), files
+
+
+
+def update_item_price(id: str, price: int, minimal: bool = True) -> dict:
+    return {
+        "operationName": "updateItem",
+        "query": QUERIES["update_item_price"] if minimal else QUERIES["update_item"],
+        "variables": {
+            "input": {
+                "id": id,
+                "price": int(price)
+            }
+        }
+    }
+
+def remove_item(id: str) -> dict:
+    return {
+        "operationName": "removeItem",
+        "query": QUERIES["remove_item"],
+        "variables": {
+            "id": id,
+        }
+    }
+
+
+def publish_item(item_id: str, priority_status_id: str,
+                 transaction_provider_id: TransactionProviderIds = TransactionProviderIds.LOCAL) -> dict:
+    return {
+        "operationName": "publishItem",
+        "query": QUERIES["publish_item"],
+        "variables": {
+            "input": {
+                "transactionProviderId": transaction_provider_id.name,
+                "priorityStatuses": [priority_status_id],
+                "itemId": item_id
+            }
+        }
+    }
+
+
+def items(game_id: str | None = None, category_id: str | None = None, count: int = 24,
+          status: ItemStatuses = ItemStatuses.APPROVED, after_cursor: str | None = None) -> dict:
+    filter = {"gameId": game_id, "status": [status.name] if status else None} if not category_id else {"gameCategoryId": category_id, "status": [status.name] if status else None}
+    return persisted_query("items", "items", {"pagination": {"first": count, "after": after_cursor}, "filter": filter})
+
+
+def item(id: str | None = None, slug: str | None = None) -> dict:
+    return persisted_query("item", "item", {"id": id, "slug": slug, "hasSupportAccess": False, "showForbiddenImage": True})
+
+
+def item_priority_statuses(item_id: str, item_price: str) -> dict:
+    return persisted_query("itemPriorityStatuses", "item_priority_statuses", {"itemId": item_id, "price": int(item_price)})
+
+
+def increase_item_priority_status(item_id: str, priority_status_id: str, payment_method_id: TransactionPaymentMethodIds | None = None,
+                                  transaction_provider_id: TransactionProviderIds = TransactionProviderIds.LOCAL) -> dict:
+    return {
+        "operationName": "increaseItemPriorityStatus",
+        "query": QUERIES["increase_item_priority_status"],
+        "variables": {
+            "input": {
+                "itemId": item_id,
+                "priorityStatuses": [priority_status_id],
+                "transactionProviderData": {
+                    "paymentMethodId": payment_method_id.name if payment_method_id else None
+                },
+                "transactionProviderId": transaction_provider_id.name
+            }
+        }
+    }
+
+
+def transaction_providers(direction: TransactionProviderDirections = TransactionProviderDirections.IN) -> dict:
+    return persisted_query("transactionProviders", "transaction_providers", {"filter": {"direction": direction.name if direction else None}})
+
+
+def transactions(user_id: str, count: int = 24, operation: TransactionOperations | None = None, min_value: int | None = None,
+                 max_value: int | None = None, provider_id: TransactionProviderIds | None = None, status: TransactionStatuses | None = None,
+                 after_cursor: str | None = None) -> dict:
+    variables = {"pagination": {"first": count, "after": after_cursor}, "filter": {"userId": user_id}, "hasSupportAccess": False}
+    if operation: variables["filter"]["operation"] = [operation.name]
+    if min_value or max_value:
+        variables["filter"]["value"] = {}
+        if min_value: variables["filter"]["value"]["min"] = str(min_value)
+        if max_value: variables["filter"]["value"]["max"] = str(max_value)
+    if provider_id: variables["filter"]["providerId"] = [provider_id.name]
+    if status: variables["filter"]["status"] = [status.name]
+    return persisted_query("transactions", "transactions", variables)
+
+
+def sbp_bank_members() -> dict:
+    return persisted_query("SbpBankMembers", "sbp_bank_members", {})
+
+
+def verified_cards(count: int = 24, after_cursor: str | None = None,
+                   direction: SortDirections = SortDirections.ASC) -> dict:
+    return persisted_query("verifiedCards", "verified_cards", {"pagination": {"first": count, "after": after_cursor}, "sort": {"direction": direction.name}, "field": "createdAt"})
+
+
+def delete_card(card_id: str) -> dict:
+    return {
+        "operationName": "deleteCard",
+        "query": QUERIES["delete_card"],
+        "variables": {
+            "input": {
+                "cardId": card_id
+            }
+        }
+    }
+
+
+def request_withdrawal(provider: TransactionProviderIds, account: str, value: int,
+                       payment_method_id: TransactionPaymentMethodIds | None = None,
+                       sbp_bank_member_id: str | None = None) -> dict:
+    return {
+        "operationName": "requestWithdrawal",
+        "query": QUERIES["request_withdrawal"],
+        "variables": {
+            "input": {
+                "provider": provider.name,
+                "account": account,
+                "value": value,
+                "providerData": {
+                    "paymentMethodId": payment_method_id.name if payment_method_id else None,
+                    "sbpBankMemberId": sbp_bank_member_id if sbp_bank_member_id else None
+                }
+            }
+        }
+    }
+
+
+def remove_transaction(transaction_id: str) -> dict:
+    return {
+        "operationName": "removeTransaction",
+        "query": QUERIES["remove_transaction"],
+        "variables": {
+            "id": transaction_id
+        }
+    }
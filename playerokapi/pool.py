@@ -0,0 +1,161 @@
+from __future__ import annotations
+from typing import *
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+from .account import Account
+
+
+class AccountPool:
+    """
+    Пул из нескольких Playerok аккаунтов в одном процессе.\n
+    У каждого аккаунта свои HTTP-сессии, а пул хранит их по токену
+    и позволяет выполнять задачи сразу по всем аккаунтам на общем пуле потоков.
+
+    :param max_workers: Максимальное количество потоков для `map`, _опционально_.
+    :type max_workers: `int` or `None`
+
+    :param account_cls: Класс создаваемых аккаунтов.
+    :type account_cls: `type`
+    """
+
+    def __init__(self, max_workers: int | None = None, account_cls: type[Account] = Account):
+        self.max_workers = max_workers
+        """ Максимальное количество потоков для `map`. """
+        self.account_cls = account_cls
+        """ Класс создаваемых аккаунтов. """
+
+        self.__accounts: dict[str, Account] = {} # {token: account}
+        self.__lock = threading.Lock()
+        self.__executor: ThreadPoolExecutor | None = None
+
+    def add(self, token: str, **kwargs) -> Account:
+        """
+        Добавляет аккаунт в пул (если аккаунт с таким токеном уже есть - возвращает его).
+
+        :param token: Токен аккаунта.
+        :type token: `str`
+
+        :param kwargs: Остальные параметры `playerokapi.account.Account`.
+
+        :return: Объект аккаунта.
+        :rtype: `playerokapi.account.Account`
+        """
+        with self.__lock:
+            account = self.__accounts.get(token)
+            if account is None:
+                account = self.account_cls(token=token, **kwargs)
+                self.__accounts[token] = account
+            return account
+
+    def add_account(self, account: Account) -> Account:
+        """
+        Добавляет в пул уже созданный аккаунт.
+
+        :param account: Объект аккаунта.
+        :type account: `playerokapi.account.Account`
+
+        :return: Объект аккаунта.
+        :rtype: `playerokapi.account.Account`
+        """
+        with self.__lock:
+            self.__accounts[account.token] = account
+        return account
+
+    def get(self, key: str) -> Account | None:
+        """
+        Получает аккаунт из пула по токену или ID.
+
+        :param key: Токен или ID аккаунта.
+        :type key: `str`
+
+        :return: Объект аккаунта.
+        :rtype: `playerokapi.account.Account` or `None`
+        """
+        with self.__lock:
+            account = self.__accounts.get(key)
+            if account is not None:
+                return account
+            for account in self.__accounts.values():
+                if account.id is not None and account.id == key:
+                    return account
+
+    def remove(self, key: str) -> Account | None:
+        """
+        Удаляет аккаунт из пула по токену или ID.
+
+        :param key: Токен или ID аккаунта.
+        :type key: `str`
+
+        :return: Удалённый аккаунт.
+        :rtype: `playerokapi.account.Account` or `None`
+        """
+        account = self.get(key)
+        if account is not None:
+            with self.__lock:
+                self.__accounts.pop(account.token, None)
+        return account
+
+    @property
+    def accounts(self) -> list[Account]:
+        """ Список аккаунтов пула. """
+        with self.__lock:
+            return list(self.__accounts.values())
+
+    def __len__(self) -> int:
+        return len(self.__accounts)
+
+    def __iter__(self) -> Iterator[Account]:
+        return iter(self.accounts)
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self.__lock:
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="playerokapi-pool")
+            return self.__executor
+
+    def map(self, func: Callable[[Account], Any], accounts: Iterable[Account] | None = None) -> dict[str, Any]:
+        """
+        Параллельно выполняет функцию для каждого аккаунта пула.\n
+        Ошибка одного аккаунта не прерывает остальные - вместо результата возвращается исключение.
+
+        :param func: Функция, принимающая объект аккаунта.
+        :type func: `callable`
+
+        :param accounts: Аккаунты, для которых нужно выполнить функцию (по умолчанию - все), _опционально_.
+        :type accounts: `list[playerokapi.account.Account]` or `None`
+
+        :return: Словарь результатов по токенам аккаунтов: {token: результат или исключение}.
+        :rtype: `dict[str, Any]`
+        """
+        accounts = list(accounts) if accounts is not None else self.accounts
+        executor = self._get_executor()
+        futures = {account.token: executor.submit(func, account) for account in accounts}
+        results = {}
+        for token, future in futures.items():
+            try:
+                results[token] = future.result()
+            except Exception as e:
+                results[token] = e
+        return results
+
+    def get_all(self) -> dict[str, Account | Exception]:
+        """
+        Получает/обновляет данные всех аккаунтов пула (вызывает `get()` у каждого).
+
+        :return: Словарь результатов по токенам аккаунтов.
+        :rtype: `dict[str, playerokapi.account.Account | Exception]`
+        """
+        return self.map(lambda account: account.get())
+
+    def close(self):
+        """
+        Останавливает пул потоков.
+        """
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+from typing import *
+import math
+import threading
+import time
+
+from .challenge import is_cloudflare_challenge
+
+
+def normalize_proxy(proxy: str) -> str:
+    """
+    Приводит строку прокси к виду `http://[user:password@]host:port`.
+
+    :param proxy: Прокси в формате `[http(s)://][user:password@]host:port`.
+    :type proxy: `str`
+
+    :return: Строка прокси.
+    :rtype: `str`
+    """
+    return f"http://{proxy.replace('https://', '').replace('http://', '')}"
+
+
+class Proxy:
+    """
+    Прокси из пула и его оценка здоровья.\n
+    Задержка, доля ошибок и доля проверок Cloudflare считаются скользящими
+    средними. Доли ошибок и проверок со временем затухают,
+    поэтому прокси после карантина постепенно возвращается в работу.
+
+    :param url: Строка прокси.
+    :type url: `str`
+    """
+
+    def __init__(self, url: str):
+        self.url: str = url
+        """ Строка прокси. """
+        self.latency: float | None = None
+        """ Скользящая средняя задержка ответа (в секундах). """
+        self.requests: int = 0
+        """ Количество запросов через прокси. """
+        self.errors: int = 0
+        """ Количество ошибок через прокси. """
+        self.challenges: int = 0
+        """ Количество проверок Cloudflare через прокси. """
+        self.strikes: int = 0
+        """ Сколько раз подряд прокси попадал в карантин. """
+        self.quarantined_until: float = 0.0
+        """ До какого момента (`time.monotonic()`) прокси в карантине. """
+
+        self._error_rate: float = 0.0
+        self._challenge_rate: float = 0.0
+        self._updated_at: float = time.monotonic()
+
+    @property
+    def is_quarantined(self) -> bool:
+        """ В карантине ли сейчас прокси. """
+        return time.monotonic() < self.quarantined_until
+
+    def __repr__(self) -> str:
+        return f"Proxy({self.url!r}, latency={self.latency}, errors={self.errors}, challenges={self.challenges})"
+
+
+class ProxyPool:
+    """
+    Пул прокси с оценкой здоровья и автоматическим переключением.\n
+    Каждый запрос уходит через самый "здоровый" прокси: с наименьшей задержкой
+    с поправкой на долю ошибок и проверок Cloudflare. Прокси с проверкой
+    Cloudflare или слишком частыми ошибками отправляется в карантин,
+    и каждый следующий карантин подряд длится вдвое дольше.
+
+    Пример:
+        account = Account(token, proxy=["1.1.1.1:8000", "user:pass@2.2.2.2:8000"])
+        print(account.proxy_pool.stats())
+
+    :param proxies: Список прокси в формате `[http(s)://][user:password@]host:port`.
+    :type proxies: `list[str]`
+
+    :param alpha: Вес нового значения в скользящих средних.
+    :type alpha: `float`
+
+    :param decay_half_life: Период полураспада долей ошибок и проверок (в секундах).
+    :type decay_half_life: `float`
+
+    :param error_threshold: Доля ошибок, при которой прокси уходит в карантин.
+    :type error_threshold: `float`
+
+    :param quarantine_time: Длительность первого карантина (в секундах).
+    :type quarantine_time: `float`
+
+    :param max_quarantine_time: Максимальная длительность карантина (в секундах).
+    :type max_quarantine_time: `float`
+    """
+
+    def __init__(self, proxies: list[str], alpha: float = 0.2, decay_half_life: float = 300.0,
+                 error_threshold: float = 0.5, quarantine_time: float = 30.0, max_quarantine_time: float = 900.0):
+        if not proxies:
+            raise ValueError("Список прокси пуст")
+        self.proxies: list[Proxy] = [Proxy(normalize_proxy(proxy)) for proxy in proxies]
+        """ Прокси пула. """
+        self.alpha: float = alpha
+        """ Вес нового значения в скользящих средних. """
+        self.decay_half_life: float = decay_half_life
+        """ Период полураспада долей ошибок и проверок (в секундах). """
+        self.error_threshold: float = error_threshold
+        """ Доля ошибок, при которой прокси уходит в карантин. """
+        self.quarantine_time: float = quarantine_time
+        """ Длительность первого карантина (в секундах). """
+        self.max_quarantine_time: float = max_quarantine_time
+        """ Максимальная длительность карантина (в секундах). """
+
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def __decay(self, proxy: Proxy, now: float):
+        factor = math.pow(0.5, (now - proxy._updated_at) / self.decay_half_life)
+        proxy._error_rate *= factor
+        proxy._challenge_rate *= factor
+        proxy._updated_at = now
+
+    def __score(self, proxy: Proxy) -> float:
+        # неизвестную задержку считаем нулевой, чтобы новый прокси попробовали
+        latency = proxy.latency or 0.0
+        return (latency + 0.05) * (1 + 4 * proxy._error_rate + 8 * proxy._challenge_rate)
+
+    def __quarantine(self, proxy: Proxy, now: float):
+        duration = min(self.max_quarantine_time, self.quarantine_time * (2 ** proxy.strikes))
+        proxy.quarantined_until = now + duration
+        proxy.strikes += 1
+
+    def select(self, exclude: Container[str] = ()) -> Proxy:
+        """
+        Выбирает прокси для запроса.\n
+        Если все прокси в карантине - тот, чей карантин закончится раньше.
+
+        :param exclude: Строки прокси, которые не нужно выбирать (если есть другие), _опционально_.
+        :type exclude: `set[str]`
+
+        :return: Прокси.
+        :rtype: `playerokapi.proxies.Proxy`
+        """
+        now = time.monotonic()
+        with self.__lock:
+            candidates = [proxy for proxy in self.proxies if proxy.url not in exclude] or self.proxies
+            healthy = [proxy for proxy in candidates if proxy.quarantined_until <= now]
+            if not healthy:
+                return min(candidates, key=lambda proxy: proxy.quarantined_until)
+            for proxy in healthy:
+                self.__decay(proxy, now)
+            return min(healthy, key=self.__score)
+
+    def record(self, proxy: Proxy, elapsed: float, response=None):
+        """
+        Учитывает результат запроса через прокси.
+
+        :param proxy: Прокси, через который ушёл запрос.
+        :type proxy: `playerokapi.proxies.Proxy`
+
+        :param elapsed: Время запроса (в секундах).
+        :type elapsed: `float`
+
+        :param response: Ответ или `None`, если запрос завершился сетевой ошибкой.
+        """
+        challenge = response is not None and is_cloudflare_challenge(response)
+        error = response is None or (not challenge and (response.status_code >= 500 or response.status_code in (407, 429)))
+        now = time.monotonic()
+        with self.__lock:
+            self.__decay(proxy, now)
+            proxy.requests += 1
+            if response is not None:
+                proxy.latency = elapsed if proxy.latency is None else (1 - self.alpha) * proxy.latency + self.alpha * elapsed
+            proxy._error_rate = (1 - self.alpha) * proxy._error_rate + self.alpha * error
+            proxy._challenge_rate = (1 - self.alpha) * proxy._challenge_rate + self.alpha * challenge
+            if challenge:
+                proxy.challenges += 1
+                self.__quarantine(proxy, now)
+            elif error:
+                proxy.errors += 1
+                if response is None or proxy._error_rate >= self.error_threshold:
+                    self.__quarantine(proxy, now)
+            elif proxy.strikes and proxy.quarantined_until <= now:
+                proxy.strikes -= 1
+
+    def stats(self) -> list[dict[str, Any]]:
+        """
+        Получает статистику прокси пула.
+
+        :return: Список словарей с ключами `url`, `latency`, `error_rate`, `challenge_rate`,
+            `requests`, `errors`, `challenges`, `quarantined`.
+        :rtype: `list[dict[str, Any]]`
+        """
+        now = time.monotonic()
+        with self.__lock:
+            for proxy in self.proxies:
+                self.__decay(proxy, now)
+            return [{
+                "url": proxy.url,
+                "latency": proxy.latency,
+                "error_rate": proxy._error_rate,
+                "challenge_rate": proxy._challenge_rate,
+                "requests": proxy.requests,
+                "errors": proxy.errors,
+                "challenges": proxy.challenges,
+                "quarantined": proxy.quarantined_until > now
+            } for proxy in self.proxies]
@@ -0,0 +1,202 @@
+from __future__ import annotations
+from typing import *
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Потокобезопасный token bucket.\n
+    Каждый запрос резервирует один токен. Если токенов нет, запрос получает
+    время ожидания, и вызывающие встают в очередь равномерно, без всплесков.
+
+    :param rate: Скорость пополнения (токенов/запросов в секунду).
+    :type rate: `float`
+
+    :param capacity: Ёмкость (максимальный всплеск), по умолчанию равна `rate`, но не меньше 1, _опционально_.
+    :type capacity: `float` or `None`
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate должен быть больше 0")
+        self.rate: float = rate
+        """ Скорость пополнения (токенов в секунду). """
+        self.capacity: float = capacity if capacity is not None else max(1.0, rate)
+        """ Ёмкость (максимальный всплеск). """
+
+        self.__tokens: float = self.capacity
+        self.__updated_at: float = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __refill(self, now: float):
+        self.__tokens = min(self.capacity, self.__tokens + (now - self.__updated_at) * self.rate)
+        self.__updated_at = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Резервирует токены.
+
+        :return: Сколько секунд нужно подождать, прежде чем отправлять запрос.
+        :rtype: `float`
+        """
+        with self.__lock:
+            self.__refill(time.monotonic())
+            self.__tokens -= tokens
+            return max(0.0, -self.__tokens / self.rate)
+
+    @property
+    def wait_time(self) -> float:
+        """ Сколько секунд сейчас ждал бы новый запрос. """
+        with self.__lock:
+            self.__refill(time.monotonic())
+            return max(0.0, (1 - self.__tokens) / self.rate)
+
+
+class RateLimiter:
+    """
+    Клиентский ограничитель частоты запросов.\n
+    Объединяет общий лимит, лимиты по отдельным GraphQL операциям (`operationName`)
+    и, опционально, родительский ограничитель. Один объект можно передать
+    нескольким аккаунтам - тогда лимит будет общим для них.
+
+    Пример:
+        shared = RateLimiter(rate=10)  # не больше 10 запросов/сек на весь процесс
+        account = Account(token, rate_limiter=RateLimiter(rate=3, operations={"chats": 0.5}, parent=shared))
+
+    :param rate: Общий лимит запросов в секунду, _опционально_.
+    :type rate: `float` or `None`
+
+    :param capacity: Ёмкость общего лимита (максимальный всплеск), _опционально_.
+    :type capacity: `float` or `None`
+
+    :param operations: Лимиты по операциям: {operationName: rate} или {operationName: (rate, capacity)}, _опционально_.
+    :type operations: `dict[str, float | tuple[float, float]]` or `None`
+
+    :param parent: Родительский ограничитель (например, общий для всех аккаунтов), _опционально_.
+    :type parent: `playerokapi.ratelimit.RateLimiter` or `None`
+    """
+
+    def __init__(self, rate: float | None = None, capacity: float | None = None,
+                 operations: dict[str, float | tuple[float, float]] | None = None,
+                 parent: RateLimiter | None = None):
+        self.bucket: TokenBucket | None = TokenBucket(rate, capacity) if rate else None
+        """ Общий token bucket. """
+        self.operations: dict[str, TokenBucket] = {}
+        """ Token bucket'ы по операциям. """
+        self.parent: RateLimiter | None = parent
+        """ Родительский ограничитель. """
+        for operation_name, limit in (operations or {}).items():
+            self.set_operation_limit(operation_name, *(limit if isinstance(limit, tuple) else (limit,)))
+
+        self.acquired: int = 0
+        """ Сколько запросов прошло через ограничитель. """
+        self.total_wait_time: float = 0.0
+        """ Суммарное время ожидания (в секундах). """
+        self.__queue_depth: int = 0
+        self.__lock = threading.Lock()
+
+    def set_operation_limit(self, operation_name: str, rate: float, capacity: float | None = None):
+        """
+        Устанавливает лимит для GraphQL операции.
+
+        :param operation_name: Название операции (`operationName`).
+        :type operation_name: `str`
+
+        :param rate: Лимит запросов в секунду.
+        :type rate: `float`
+
+        :param capacity: Ёмкость (максимальный всплеск), _опционально_.
+        :type capacity: `float` or `None`
+        """
+        self.operations[operation_name] = TokenBucket(rate, capacity)
+
+    def reserve(self, operation_name: str | None = None) -> float:
+        """
+        Резервирует место для запроса во всех подходящих лимитах.
+
+        :return: Сколько секунд нужно подождать перед отправкой.
+        :rtype: `float`
+        """
+        delay = self.parent.reserve(operation_name) if self.parent else 0.0
+        if self.bucket is not None:
+            delay = max(delay, self.bucket.reserve())
+        bucket = self.operations.get(operation_name)
+        if bucket is not None:
+            delay = max(delay, bucket.reserve())
+        with self.__lock:
+            self.acquired += 1
+            self.total_wait_time += delay
+        return delay
+
+    def acquire(self, operation_name: str | None = None) -> float:
+        """
+        Ждёт (блокируя поток), пока запрос можно будет отправить.
+
+        :return: Сколько секунд пришлось ждать.
+        :rtype: `float`
+        """
+        delay = self.reserve(operation_name)
+        if delay > 0:
+            with self.__lock:
+                self.__queue_depth += 1
+            try:
+                time.sleep(delay)
+            finally:
+                with self.__lock:
+                    self.__queue_depth -= 1
+        return delay
+
+    async def acquire_async(self, operation_name: str | None = None) -> float:
+        """
+        Асинхронная версия `acquire`: ждёт, не блокируя event loop.
+
+        :return: Сколько секунд пришлось ждать.
+        :rtype: `float`
+        """
+        delay = self.reserve(operation_name)
+        if delay > 0:
+            with self.__lock:
+                self.__queue_depth += 1
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                with self.__lock:
+                    self.__queue_depth -= 1
+        return delay
+
+    @property
+    def queue_depth(self) -> int:
+        """ Сколько запросов сейчас ждут своей очереди. """
+        return self.__queue_depth
+
+    def wait_time(self, operation_name: str | None = None) -> float:
+        """
+        Получает текущее время ожидания для нового запроса.
+
+        :param operation_name: Название операции, _опционально_.
+        :type operation_name: `str` or `None`
+
+        :return: Время ожидания в секундах.
+        :rtype: `float`
+        """
+        buckets = [self.bucket, self.operations.get(operation_name)]
+        wait = max([bucket.wait_time for bucket in buckets if bucket is not None], default=0.0)
+        if self.parent is not None:
+            wait = max(wait, self.parent.wait_time(operation_name))
+        return wait
+
+    def stats(self) -> dict[str, float]:
+        """
+        Получает статистику ограничителя.
+
+        :return: Словарь с ключами `queue_depth`, `wait_time`, `acquired`, `total_wait_time`.
+        :rtype: `dict[str, float]`
+        """
+        return {
+            "queue_depth": self.queue_depth,
+            "wait_time": self.wait_time(),
+            "acquired": self.acquired,
+            "total_wait_time": self.total_wait_time
+        }
@@ -0,0 +1,302 @@
+from __future__ import annotations
+from typing import *
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+import asyncio
+import threading
+import time
+
+from . import types
+from . import payloads
+from .parser import item
+from .ratelimit import RateLimiter
+
+if TYPE_CHECKING:
+    from .account import Account
+    from .async_account import AsyncAccount
+
+
+class RepriceResult:
+    """
+    Результат изменения цены одного предмета.
+
+    :param item_id: ID предмета.
+    :type item_id: `str`
+
+    :param price: Новая цена.
+    :type price: `int`
+
+    :param status: Статус: `updated` - цена изменена, `skipped` - цена уже такая, `failed` - ошибка.
+    :type status: `str`
+
+    :param old_price: Цена до изменения (если известна), _опционально_.
+    :type old_price: `int` or `None`
+
+    :param item: Объект обновлённого предмета (только если запрашивался полный ответ), _опционально_.
+    :type item: `playerokapi.types.Item` or `None`
+
+    :param error: Ошибка (для статуса `failed`), _опционально_.
+    :type error: `Exception` or `None`
+
+    :param elapsed: Время выполнения запроса (в секундах).
+    :type elapsed: `float`
+    """
+
+    def __init__(self, item_id: str, price: int, status: Literal["updated", "skipped", "failed"],
+                 old_price: int | None = None, item: types.Item | None = None,
+                 error: Exception | None = None, elapsed: float = 0.0):
+        self.item_id: str = item_id
+        """ ID предмета. """
+        self.price: int = price
+        """ Новая цена. """
+        self.status: Literal["updated", "skipped", "failed"] = status
+        """ Статус: `updated`, `skipped` или `failed`. """
+        self.old_price: int | None = old_price
+        """ Цена до изменения (если известна). """
+        self.item: types.Item | None = item
+        """ Объект обновлённого предмета (только если запрашивался полный ответ). """
+        self.error: Exception | None = error
+        """ Ошибка (для статуса `failed`). """
+        self.elapsed: float = elapsed
+        """ Время выполнения запроса (в секундах). """
+
+    def __repr__(self) -> str:
+        return f"RepriceResult({self.item_id!r}, {self.old_price!r} -> {self.price!r}, {self.status})"
+
+
+class RepriceReport:
+    """
+    Отчёт о массовом изменении цен.
+
+    :param results: Результаты по предметам (в порядке входных данных).
+    :type results: `list[playerokapi.repricing.RepriceResult]`
+
+    :param elapsed: Общее время выполнения (в секундах).
+    :type elapsed: `float`
+    """
+
+    def __init__(self, results: list[RepriceResult], elapsed: float):
+        self.results: list[RepriceResult] = results
+        """ Результаты по предметам (в порядке входных данных). """
+        self.elapsed: float = elapsed
+        """ Общее время выполнения (в секундах). """
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[RepriceResult]:
+        return iter(self.results)
+
+    @property
+    def updated(self) -> list[RepriceResult]:
+        """ Предметы, цена которых изменена. """
+        return [result for result in self.results if result.status == "updated"]
+
+    @property
+    def skipped(self) -> list[RepriceResult]:
+        """ Предметы, которые пропущены (цена уже совпадала). """
+        return [result for result in self.results if result.status == "skipped"]
+
+    @property
+    def failed(self) -> list[RepriceResult]:
+        """ Предметы, цену которых изменить не удалось. """
+        return [result for result in self.results if result.status == "failed"]
+
+    @property
+    def throughput(self) -> float:
+        """ Скорость: отправленных запросов (изменённых и неудачных) в секунду. """
+        sent = sum(1 for result in self.results if result.status != "skipped")
+        return sent / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (f"RepriceReport(updated={len(self.updated)}, skipped={len(self.skipped)}, "
+                f"failed={len(self.failed)}, elapsed={self.elapsed:.2f}s, throughput={self.throughput:.1f}/s)")
+
+
+class Repricer:
+    """
+    Массовое изменение цен предметов.\n
+    Запросы `updateItem` отправляются параллельно (не более `max_workers` одновременно),
+    а предметы, цена которых уже совпадает с известной, пропускаются без запроса.
+    Известные цены берутся из предыдущих изменений и из `remember`.
+
+    Пример:
+        account.repricer.remember(account.get_my_items().items)
+        report = account.reprice_items({"item-1": 150, "item-2": 200})
+        print(report.throughput, report.failed)
+
+    :param account: Объект аккаунта.
+    :type account: `playerokapi.account.Account`
+
+    :param max_workers: Максимальное количество одновременных запросов.
+    :type max_workers: `int`
+
+    :param rate_limiter: Дополнительный ограничитель частоты запросов на изменение цен, _опционально_.
+    :type rate_limiter: `playerokapi.ratelimit.RateLimiter` or `None`
+
+    :param minimal_response: Запрашивать в ответе только ID и цену предмета (вместо полного предмета).
+    :type minimal_response: `bool`
+    """
+
+    def __init__(self, account: Account, max_workers: int = 4, rate_limiter: RateLimiter | None = None,
+                 minimal_response: bool = True):
+        self.account: Account = account
+        """ Объект аккаунта. """
+        self.max_workers: int = max_workers
+        """ Максимальное количество одновременных запросов. """
+        self.rate_limiter: RateLimiter | None = rate_limiter
+        """ Дополнительный ограничитель частоты запросов на изменение цен. """
+        self.minimal_response: bool = minimal_response
+        """ Запрашивать ли в ответе только ID и цену предмета. """
+
+        self._lock = threading.Lock()
+        self._prices: dict[str, int] = {} # {item_id: price}
+
+    def get_price(self, item_id: str) -> int | None:
+        """
+        Получает известную цену предмета.
+
+        :param item_id: ID предмета.
+        :type item_id: `str`
+
+        :return: Цена или `None`, если она неизвестна.
+        :rtype: `int` or `None`
+        """
+        return self._prices.get(item_id)
+
+    def set_price(self, item_id: str, price: int | None):
+        """
+        Записывает известную цену предмета (`None` - забыть цену).
+
+        :param item_id: ID предмета.
+        :type item_id: `str`
+
+        :param price: Цена.
+        :type price: `int` or `None`
+        """
+        with self._lock:
+            if price is None:
+                self._prices.pop(item_id, None)
+            else:
+                self._prices[item_id] = int(price)
+
+    def remember(self, items: Iterable[types.ItemProfile | types.MyItem | types.Item]):
+        """
+        Запоминает текущие цены предметов (например, из `Account.get_my_items`),
+        чтобы не отправлять запросы для предметов, цена которых не меняется.
+
+        :param items: Предметы.
+        :type items: `list[playerokapi.types.ItemProfile]` or `list[playerokapi.types.MyItem]`
+        """
+        with self._lock:
+            for _item in items:
+                if _item is not None and _item.price is not None:
+                    self._prices[_item.id] = int(_item.price)
+
+    def forget(self):
+        """
+        Забывает все известные цены.
+        """
+        with self._lock:
+            self._prices.clear()
+
+    def _plan(self, prices: dict[str, int] | Iterable[tuple[str, int]],
+              force: bool) -> tuple[list[RepriceResult | None], list[tuple[int, str, int, int | None]]]:
+        changes = dict(prices)
+        results: list[RepriceResult | None] = []
+        todo = [] # [(index, item_id, price, old_price)]
+        for item_id, price in changes.items():
+            price = int(price)
+            old_price = self._prices.get(item_id)
+            if not force and old_price == price:
+                results.append(RepriceResult(item_id, price, "skipped", old_price))
+            else:
+                results.append(None)
+                todo.append((len(results) - 1, item_id, price, old_price))
+        return results, todo
+
+    def _result(self, item_id: str, price: int, old_price: int | None, data: dict | None, elapsed: float) -> RepriceResult:
+        if data is None:
+            return RepriceResult(item_id, price, "failed", old_price,
+                                 error=LookupError(f"Предмет {item_id} не найден"), elapsed=elapsed)
+        new_price = data.get("price")
+        self.set_price(item_id, new_price if new_price is not None else price)
+        return RepriceResult(item_id, price, "updated", old_price,
+                             item=None if self.minimal_response else item(data), elapsed=elapsed)
+
+    def _update(self, item_id: str, price: int, old_price: int | None) -> RepriceResult:
+        started_at = time.perf_counter()
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire("updateItem")
+            payload = payloads.update_item_price(item_id, price, self.minimal_response)
+            r = self.account.request("post", f"{self.account.base_url}/graphql", {"accept": "*/*"}, payload).json()
+            data = r["data"]["updateItem"]
+        except Exception as e:
+            return RepriceResult(item_id, price, "failed", old_price, error=e, elapsed=time.perf_counter() - started_at)
+        return self._result(item_id, price, old_price, data, time.perf_counter() - started_at)
+
+    def reprice(self, prices: dict[str, int] | Iterable[tuple[str, int]], force: bool = False,
+                max_workers: int | None = None) -> RepriceReport:
+        """
+        Изменяет цены предметов.\n
+        Ошибка одного предмета не прерывает остальные - она попадает в его `RepriceResult`.
+
+        :param prices: Новые цены: {ID предмета: цена} или пары (ID предмета, цена).
+        :type prices: `dict[str, int]` or `list[tuple[str, int]]`
+
+        :param force: Отправлять запросы даже для предметов, цена которых уже совпадает.
+        :type force: `bool`
+
+        :param max_workers: Максимальное количество одновременных запросов (по умолчанию - `self.max_workers`), _опционально_.
+        :type max_workers: `int` or `None`
+
+        :return: Отчёт с результатами по предметам и скоростью.
+        :rtype: `playerokapi.repricing.RepriceReport`
+        """
+        started_at = time.perf_counter()
+        results, todo = self._plan(prices, force)
+        if todo:
+            workers = max(1, min(max_workers or self.max_workers, len(todo)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="playerokapi-reprice") as executor:
+                futures = [(index, executor.submit(copy_context().run, self._update, item_id, price, old_price))
+                           for index, item_id, price, old_price in todo]
+                for index, future in futures:
+                    results[index] = future.result()
+        return RepriceReport(results, time.perf_counter() - started_at)
+
+
+class AsyncRepricer(Repricer):
+    """
+    Массовое изменение цен для `playerokapi.async_account.AsyncAccount`.
+    """
+
+    account: AsyncAccount
+
+    async def _update(self, item_id: str, price: int, old_price: int | None) -> RepriceResult:
+        started_at = time.perf_counter()
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async("updateItem")
+            payload = payloads.update_item_price(item_id, price, self.minimal_response)
+            r = (await self.account.request("post", f"{self.account.base_url}/graphql", {"accept": "*/*"}, payload)).json()
+            data = r["data"]["updateItem"]
+        except Exception as e:
+            return RepriceResult(item_id, price, "failed", old_price, error=e, elapsed=time.perf_counter() - started_at)
+        return self._result(item_id, price, old_price, data, time.perf_counter() - started_at)
+
+    async def reprice(self, prices: dict[str, int] | Iterable[tuple[str, int]], force: bool = False,
+                      max_workers: int | None = None) -> RepriceReport:
+        """ Асинхронная версия `Repricer.reprice`. """
+        started_at = time.perf_counter()
+        results, todo = self._plan(prices, force)
+        semaphore = asyncio.Semaphore(max(1, max_workers or self.max_workers))
+
+        async def update(item_id: str, price: int, old_price: int | None) -> RepriceResult:
+            async with semaphore:
+                return await self._update(item_id, price, old_price)
+
+        updated = await asyncio.gather(*(update(item_id, price, old_price) for _, item_id, price, old_price in todo))
+        for (index, _, _, _), result in zip(todo, updated):
+            results[index] = result
+        return RepriceReport(results, time.perf_counter() - started_at)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+from typing import *
+from datetime import datetime, timedelta, timezone
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MILLISECOND = timedelta(milliseconds=1)
+
+
+def to_epoch_ms(iso_date: str | None) -> int | None:
+    """
+    Переводит дату в формате ISO 8601 (как в ответах Playerok, например `2025-01-01T12:00:00.000Z`)
+    в количество миллисекунд с начала эпохи (UTC). Дата без часового пояса считается UTC.
+
+    :param iso_date: Дата в формате ISO 8601.
+    :type iso_date: `str` or `None`
+
+    :return: Миллисекунды с начала эпохи или `None`, если даты нет.
+    :rtype: `int` or `None`
+    """
+    if not iso_date:
+        return None
+    if iso_date[-1] == "Z":
+        iso_date = iso_date[:-1] + "+00:00"
+    date = datetime.fromisoformat(iso_date)
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return (date - _EPOCH) // _MILLISECOND
+
+
+class EpochTimestamp:
+    """
+    Атрибут модели с датой в миллисекундах с начала эпохи (UTC), посчитанной из строкового атрибута.\n
+    Дата разбирается при первом обращении и запоминается в слоте `_<имя атрибута>` объекта
+    (заново - только если исходная строка изменилась), поэтому сравнения и сортировки
+    по нему - это сравнения целых чисел.
+
+    Пример:
+        class ChatMessage:
+            __slots__ = ("created_at", "_created_at_ts")
+            created_at_ts = EpochTimestamp("created_at")
+
+    :param source: Название строкового атрибута с датой в формате ISO 8601.
+    :type source: `str`
+    """
+
+    __slots__ = ("source", "cache")
+
+    def __init__(self, source: str):
+        self.source: str = source
+        """ Название строкового атрибута с датой. """
+        self.cache: str = f"_{source}_ts"
+        """ Название слота, в котором запоминается результат. """
+
+    def __set_name__(self, owner: type, name: str):
+        self.cache = f"_{name}"
+
+    def __get__(self, obj: Any, owner: type | None = None) -> int | None:
+        if obj is None:
+            return self
+        value = getattr(obj, self.source)
+        cached = getattr(obj, self.cache, None)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        timestamp = to_epoch_ms(value)
+        setattr(obj, self.cache, (value, timestamp))
+        return timestamp
@@ -0,0 +1,257 @@
+from __future__ import annotations
+from typing import *
+from collections import defaultdict
+import asyncio
+import json
+import os
+import threading
+import time
+
+from .cache import CachedResponse
+from .exceptions import CassetteMissError
+
+if TYPE_CHECKING:
+    from .account import Account
+
+
+def _loads(value: Any) -> Any:
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+def cassette_key(payload: dict | list | None) -> tuple[str | None, str]:
+    """
+    Получает ключ записи кассеты по payload запроса: (operationName, variables).\n
+    Переменные сериализуются с сортировкой ключей, поэтому ключ не зависит
+    от того, в каком виде (строкой или словарём) они были в payload.
+
+    :param payload: Payload запроса.
+    :type payload: `dict` or `list` or `None`
+
+    :return: Название операции и переменные в виде JSON строки.
+    :rtype: `tuple[str | None, str]`
+    """
+    if isinstance(payload, list):
+        operations = [(operation.get("operationName"), _loads(operation.get("variables"))) for operation in payload]
+        return "batch", json.dumps(operations, ensure_ascii=False, sort_keys=True)
+    if not isinstance(payload, dict):
+        return None, "null"
+    if "operations" in payload:
+        payload = _loads(payload["operations"])
+    variables = _loads(payload.get("variables"))
+    return payload.get("operationName"), json.dumps(variables, ensure_ascii=False, sort_keys=True)
+
+
+class ReplayResponse(CachedResponse):
+    """
+    Ответ, воспроизведённый из кассеты.
+
+    :param url: URL запроса.
+    :type url: `str`
+
+    :param content: Тело ответа.
+    :type content: `bytes`
+
+    :param status_code: Код ответа.
+    :type status_code: `int`
+
+    :param headers: Заголовки ответа, _опционально_.
+    :type headers: `dict[str, str]` or `None`
+    """
+
+    def __init__(self, url: str, content: bytes, status_code: int = 200, headers: dict[str, str] | None = None):
+        super().__init__(url, content, status_code)
+        if headers:
+            self.headers = dict(headers)
+        self.from_cache = False
+
+
+class Transport:
+    """
+    Транспорт - слой, который отправляет HTTP запросы аккаунта.\n
+    По умолчанию запросы уходят в сеть через HTTP клиенты аккаунта.
+    Наследники могут записывать трафик или подменять его (см. `RecordingTransport`, `ReplayTransport`).
+    """
+
+    def send(self, account: Account, method: str, url: str, headers: dict[str, str],
+             payload: dict | list | None, files: dict | None, proxy: str | None):
+        """
+        Отправляет HTTP запрос.
+
+        :return: Объект ответа.
+        """
+        return account._send_http(method, url, headers, payload, files, proxy)
+
+    async def send_async(self, account: Account, method: str, url: str, headers: dict[str, str],
+                         payload: dict | list | None, files: dict | None, proxy: str | None):
+        """ Асинхронная версия `send` (для `playerokapi.async_account.AsyncAccount`). """
+        return await account._send_http(method, url, headers, payload, files, proxy)
+
+
+class Cassette:
+    """
+    Кассета - файл с записанными ответами (по одной JSON записи на строку).\n
+    Запись: `operationName`, `variables`, `status`, `headers`, `body`, `elapsed`.
+
+    :param path: Путь к файлу кассеты.
+    :type path: `str`
+    """
+
+    def __init__(self, path: str):
+        self.path: str = path
+        """ Путь к файлу кассеты. """
+        self.entries: dict[tuple[str | None, str], list[dict]] = defaultdict(list)
+        """ Записи по ключам (operationName, variables). """
+
+        self.__lock = threading.Lock()
+        self.__positions: dict[tuple[str | None, str], int] = defaultdict(int)
+        self.load()
+
+    def load(self):
+        """
+        Загружает записи из файла (если он есть).
+        """
+        self.entries.clear()
+        self.__positions.clear()
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self.entries[(entry["operationName"], entry["variables"])].append(entry)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.entries.values())
+
+    def append(self, key: tuple[str | None, str], status: int, headers: dict[str, str], body: str, elapsed: float):
+        """
+        Дописывает запись в кассету.
+        """
+        entry = {"operationName": key[0], "variables": key[1], "status": status,
+                 "headers": headers, "body": body, "elapsed": elapsed}
+        line = json.dumps(entry, ensure_ascii=False)
+        with self.__lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self.entries[key].append(entry)
+
+    def next(self, key: tuple[str | None, str]) -> dict | None:
+        """
+        Получает следующую запись по ключу.\n
+        Записи одного ключа воспроизводятся по порядку, после последней повторяется последняя.
+
+        :return: Запись или `None`, если такого запроса в кассете нет.
+        :rtype: `dict` or `None`
+        """
+        entries = self.entries.get(key)
+        if not entries:
+            return None
+        with self.__lock:
+            position = self.__positions[key]
+            self.__positions[key] = position + 1
+        return entries[min(position, len(entries) - 1)]
+
+    def rewind(self):
+        """
+        Перематывает кассету в начало.
+        """
+        with self.__lock:
+            self.__positions.clear()
+
+
+class RecordingTransport(Transport):
+    """
+    Транспорт, который отправляет запросы в сеть и записывает ответы в кассету.
+
+    Пример:
+        account = Account(token, transport=RecordingTransport("traffic.jsonl"))
+
+    :param cassette: Кассета или путь к её файлу.
+    :type cassette: `playerokapi.transport.Cassette` or `str`
+
+    :param transport: Транспорт, через который запросы уходят на самом деле, _опционально_.
+    :type transport: `playerokapi.transport.Transport` or `None`
+    """
+
+    def __init__(self, cassette: Cassette | str, transport: Transport | None = None):
+        self.cassette: Cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        """ Кассета. """
+        self.transport: Transport = transport or Transport()
+        """ Транспорт, через который запросы уходят на самом деле. """
+
+    def _record(self, payload: dict | list | None, response, elapsed: float):
+        headers = {"content-type": response.headers.get("content-type") or ""}
+        self.cassette.append(cassette_key(payload), response.status_code, headers, response.text, elapsed)
+
+    def send(self, account: Account, method: str, url: str, headers: dict[str, str],
+             payload: dict | list | None, files: dict | None, proxy: str | None):
+        started_at = time.perf_counter()
+        response = self.transport.send(account, method, url, headers, payload, files, proxy)
+        self._record(payload, response, time.perf_counter() - started_at)
+        return response
+
+    async def send_async(self, account: Account, method: str, url: str, headers: dict[str, str],
+                         payload: dict | list | None, files: dict | None, proxy: str | None):
+        started_at = time.perf_counter()
+        response = await self.transport.send_async(account, method, url, headers, payload, files, proxy)
+        self._record(payload, response, time.perf_counter() - started_at)
+        return response
+
+
+class ReplayTransport(Transport):
+    """
+    Транспорт, который не ходит в сеть, а отвечает записанными в кассету ответами.\n
+    Позволяет гонять `Account` и `EventListener` на записанном трафике без доступа к playerok.com.
+
+    :param cassette: Кассета или путь к её файлу.
+    :type cassette: `playerokapi.transport.Cassette` or `str`
+
+    :param latency: Имитация задержки сети: `None` - без задержки, число - задержка в секундах,
+        `"recorded"` - записанная задержка каждого ответа, _опционально_.
+    :type latency: `float` or `str` or `None`
+
+    :param speed: Во сколько раз ускорить записанную задержку (для `latency="recorded"`).
+    :type speed: `float`
+    """
+
+    def __init__(self, cassette: Cassette | str, latency: float | Literal["recorded"] | None = None, speed: float = 1.0):
+        self.cassette: Cassette = cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        """ Кассета. """
+        self.latency: float | Literal["recorded"] | None = latency
+        """ Имитация задержки сети. """
+        self.speed: float = speed
+        """ Во сколько раз ускорить записанную задержку. """
+
+    def _replay(self, url: str, payload: dict | list | None) -> tuple[ReplayResponse, float]:
+        key = cassette_key(payload)
+        entry = self.cassette.next(key)
+        if entry is None:
+            raise CassetteMissError(*key)
+        if self.latency == "recorded":
+            delay = entry.get("elapsed", 0.0) / self.speed
+        else:
+            delay = self.latency or 0.0
+        return ReplayResponse(url, entry["body"].encode("utf-8"), entry["status"], entry.get("headers")), delay
+
+    def send(self, account: Account, method: str, url: str, headers: dict[str, str],
+             payload: dict | list | None, files: dict | None, proxy: str | None):
+        response, delay = self._replay(url, payload)
+        if delay > 0:
+            time.sleep(delay)
+        return response
+
+    async def send_async(self, account: Account, method: str, url: str, headers: dict[str, str],
+                         payload: dict | list | None, files: dict | None, proxy: str | None):
+        response, delay = self._replay(url, payload)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return response
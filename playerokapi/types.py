@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import *
-import json
 
 from .account import Account, get_account
 from . import parser
+from . import json_backend
+from .timestamps import EpochTimestamp
 from .enums import *
 
 
@@ -24,6 +25,9 @@ class FileObject:
     :param mime: Mime файла.
     :type mime: `str` or `None`
     """
+
+    __slots__ = ("id", "url", "filename", "mime")
+
     def __init__(self, id: str, url: str, 
                  filename: str | None, mime: str | None):
         self.id: str = id
@@ -58,6 +62,9 @@ class AccountBalance:
     :param pending_income: Ожидаемый доход.
     :type pending_income: `int`
     """
+
+    __slots__ = ("id", "value", "frozen", "available", "withdrawable", "pending_income")
+
     def __init__(self, id: str, value: int, frozen: int, available: int, 
                  withdrawable: int, pending_income: int):
         self.id: str = id
@@ -84,6 +91,9 @@ class AccountIncomingDealsStats:
     :param finished: Завершённых исходящих сделок.
     :type finished: `int`
     """
+
+    __slots__ = ("total", "finished")
+
     def __init__(self, total: int, finished: int):
         self.total: int = total
         """ Всего исходящих сделок. """
@@ -101,6 +111,9 @@ class AccountOutgoingDealsStats:
     :param finished: Завершённых исходящих сделок.
     :type finished: `int`
     """
+
+    __slots__ = ("total", "finished")
+
     def __init__(self, total: int, finished: int):
         self.total = total
         """ Всего исходящих сделок. """
@@ -118,6 +131,9 @@ class AccountDealsStats:
     :param outgoing: Исходящие сделки.
     :type outgoing: `playerokapi.types.AccountOutgoingDealsStats`
     """
+
+    __slots__ = ("incoming", "outgoing")
+
     def __init__(self, incoming: AccountIncomingDealsStats, outgoing: AccountOutgoingDealsStats):
         self.incoming: AccountIncomingDealsStats = incoming
         """ Входящие сделки. """
@@ -135,6 +151,9 @@ class AccountItemsStats:
     :param finished: Завершённых предметов.
     :type finished: `int`
     """
+
+    __slots__ = ("total", "finished")
+
     def __init__(self, total: int, finished: int):
         self.total: int = total
         """ Всего предметов. """
@@ -152,6 +171,9 @@ class AccountStats:
     :param deals: Статистика сделок.
     :type deals: `playerokapi.types.AccountDealsStats`
     """
+
+    __slots__ = ("items", "deals")
+
     def __init__(self, items: AccountItemsStats, deals: AccountDealsStats):
         self.items: AccountItemsStats = items
         """ Статистика предметов. """
@@ -217,6 +239,17 @@ class AccountProfile:
     :param has_enabled_notifications: Включены ли уведомления на аккаунте.
     :type has_enabled_notifications: `bool`
     """
+
+    __slots__ = (
+        "id", "username", "email", "balance", "stats", "role", "avatar_url", "is_online", "is_blocked",
+        "is_blocked_for", "is_verified", "rating", "reviews_count", "created_at", "support_chat_id",
+        "system_chat_id", "has_frozen_balance", "has_enabled_notifications",
+        "_created_at_ts"
+    )
+
+    created_at_ts = EpochTimestamp("created_at")
+    """ Дата создания аккаунта (в миллисекундах с начала эпохи, UTC). """
+
     def __init__(self, id: str, username: str, email: str, balance: AccountBalance, stats: AccountStats, role: UserTypes, avatar_url: str, is_online: bool, is_blocked: bool,
                  is_blocked_for: str, is_verified: bool, rating: int, reviews_count: int, created_at: str, support_chat_id: str, system_chat_id: str,
                  has_frozen_balance: bool, has_enabled_notifications: bool):
@@ -260,7 +293,11 @@ class AccountProfile:
 
 class UserProfile:
     """
-    Класс, описывающий профиль пользователя.
+    Класс, описывающий профиль пользователя.\n
+    Методы профиля (`get_items`, `get_reviews`) работают через аккаунт, из ответа которого профиль разобран:
+    он запоминается при разборе, поэтому методы можно вызывать из любого потока.
+    Профили, разобранные вне запроса аккаунта (например, `parser.user_profile(data)` из своих данных
+    или в потоке, где аккаунт не отправлял запросов), нужно привязать вручную - `bind(account)`.
 
     :param id: ID пользователя.
     :type id: `str`
@@ -295,6 +332,16 @@ class UserProfile:
     :param created_at: Дата создания аккаунта пользователя.
     :type created_at: `str`
     """
+
+    __slots__ = (
+        "id", "username", "role", "avatar_url", "is_online", "is_blocked", "rating", "reviews_count",
+        "support_chat_id", "system_chat_id", "created_at", "__account",
+        "_created_at_ts"
+    )
+
+    created_at_ts = EpochTimestamp("created_at")
+    """ Дата создания аккаунта пользователя (в миллисекундах с начала эпохи, UTC). """
+
     def __init__(self, id: str, username: str, role: UserTypes, avatar_url: str, is_online: bool, is_blocked: bool, 
                  rating: int, reviews_count: int, support_chat_id: str, system_chat_id: str | None, created_at: str | None):
         self.id: str = id
@@ -323,6 +370,31 @@ class UserProfile:
         self.__account: Account | None = get_account()
         """ Объект аккаунта (для методов). """
 
+    def bind(self, account: Account) -> UserProfile:
+        """
+        Привязывает профиль к аккаунту, через который будут работать его методы.\n
+        Профили из ответов аккаунта привязываются сами, вручную это нужно только для профилей,
+        разобранных вне запроса аккаунта.
+
+        :param account: Объект аккаунта.
+        :type account: `playerokapi.account.Account`
+
+        :return: Этот же профиль.
+        :rtype: `playerokapi.types.UserProfile`
+        """
+        self.__account = account
+        return self
+
+    def _get_account(self) -> Account:
+        # методы профиля синхронные, поэтому работают только с аккаунтом, из ответа которого он получен
+        from .async_account import AsyncAccount
+        if self.__account is None:
+            raise RuntimeError("Профиль пользователя не привязан к аккаунту: он разобран вне запроса аккаунта "
+                               "(привяжите его через `UserProfile.bind(account)`)")
+        if isinstance(self.__account, AsyncAccount):
+            raise TypeError("Профиль пользователя получен через AsyncAccount, а методы профиля синхронные - "
+                            "используйте асинхронные методы самого аккаунта")
+        return self.__account
 
     def get_items(self, count: int = 24, statuses: list[ItemStatuses] | None = None,
                   after_cursor: str | None = None) -> ItemProfileList:
@@ -341,6 +413,7 @@ class UserProfile:
         :return: Страница профилей предметов.
         :rtype: `PlayerokAPI.types.ItemProfileList`
         """
+        account = self._get_account()
         payload_status = [] if statuses else None
         if statuses:
             for status in statuses:
@@ -348,14 +421,14 @@ class UserProfile:
         headers = {
             "Accept": "*/*",
             "Content-Type": "application/json",
-            "Origin": self.__account.base_url
+            "Origin": account.base_url
         }
         payload = {
             "operationName": "items",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": {"userId": self.id, "status": payload_status}, "showForbiddenImage": False}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": "29ff7e8c607c7b3f2fa3c7a9e02a3a184bf92905e8ea75ba237c8c7f005287a3"}}, ensure_ascii=False)
+            "variables": json_backend.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": {"userId": self.id, "status": payload_status}, "showForbiddenImage": False}),
+            "extensions": json_backend.dumps({"persistedQuery": {"version": 1, "sha256Hash": "29ff7e8c607c7b3f2fa3c7a9e02a3a184bf92905e8ea75ba237c8c7f005287a3"}})
         }
-        r = self.__account.request("get", f"{self.__account.base_url}/graphql", headers, payload).json()
+        r = account.request("get", f"{account.base_url}/graphql", headers, payload).json()
         return parser.item_profile_list(r["data"]["items"])
 
     def get_reviews(self, count: int = 24, status: ReviewStatuses = ReviewStatuses.APPROVED, 
@@ -401,10 +474,11 @@ class UserProfile:
         :return: Страница отзывов.
         :rtype: `PlayerokAPI.types.ReviewList`
         """
+        account = self._get_account()
         headers = {
             "Accept": "*/*",
             "Content-Type": "application/json",
-            "Origin": self.__account.base_url,
+            "Origin": account.base_url,
         }
 
         filters = {"userId": self.id, "status": [status.name] if status else None}
@@ -425,16 +499,18 @@ class UserProfile:
             filters["itemPrice"] = item_price
         payload = {
             "operationName": "testimonials",
-            "variables": json.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": filters, "sort": {"direction": sort_direction.name if sort_direction else None, "field": sort_field}}, ensure_ascii=False),
-            "extensions": json.dumps({"persistedQuery": {"version": 1, "sha256Hash": "773d40b7efec82a4b86021ba8bcaa462f68eb236e255926f2168c5cd4685e881"}}, ensure_ascii=False)
+            "variables": json_backend.dumps({"pagination": {"first": count, "after": after_cursor}, "filter": filters, "sort": {"direction": sort_direction.name if sort_direction else None, "field": sort_field}}),
+            "extensions": json_backend.dumps({"persistedQuery": {"version": 1, "sha256Hash": "773d40b7efec82a4b86021ba8bcaa462f68eb236e255926f2168c5cd4685e881"}})
         }
-        r = self.__account.request("get", f"{self.__account.base_url}/graphql", headers, payload).json()
+        r = account.request("get", f"{account.base_url}/graphql", headers, payload).json()
         return parser.review_list(r["data"]["testimonials"])
 
 
 class Event:
     #TODO: Сделать класс ивента Event
 
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -506,6 +582,22 @@ class ItemDeal:
     :param comment_from_buyer: Комментарий от покупателя.
     :type comment_from_buyer: `str` or `None`
     """
+
+    __slots__ = (
+        "id", "status", "status_expiration_date", "status_description", "direction", "obtaining",
+        "has_problem", "report_problem_enabled", "completed_user", "props", "previous_status",
+        "completed_at", "created_at", "logs", "transaction", "user", "chat", "item", "review",
+        "obtaining_fields", "comment_from_buyer",
+        "_status_expiration_date_ts", "_completed_at_ts", "_created_at_ts"
+    )
+
+    status_expiration_date_ts = EpochTimestamp("status_expiration_date")
+    """ Дата истечения статуса (в миллисекундах с начала эпохи, UTC). """
+    completed_at_ts = EpochTimestamp("completed_at")
+    """ Дата подтверждения сделки (в миллисекундах с начала эпохи, UTC). """
+    created_at_ts = EpochTimestamp("created_at")
+    """ Дата создания сделки (в миллисекундах с начала эпохи, UTC). """
+
     def __init__(self, id: str, status: ItemDealStatuses, status_expiration_date: str | None, status_description: str | None, 
                  direction: ItemDealDirections, obtaining: str | None, has_problem: bool, report_problem_enabled: bool | None, 
                  completed_user: UserProfile | None, props: str | None, previous_status: ItemDealStatuses | None, 
@@ -572,6 +664,9 @@ class ItemDealPageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -597,6 +692,9 @@ class ItemDealList:
     :param total_count: Всего сделок.
     :type total_count: `int`
     """
+
+    __slots__ = ("deals", "page_info", "total_count")
+
     def __init__(self, deals: list[ItemDeal], page_info: ItemDealPageInfo,
                  total_count: int):
         self.deals: list[ItemDeal] = deals
@@ -623,6 +721,9 @@ class GameCategoryAgreement:
     :param sequence: Последовательность соглашения.
     :type sequence: `str`
     """
+
+    __slots__ = ("id", "description", "icontype", "sequence")
+
     def __init__(self, id: str, description: str, 
                  icontype: GameCategoryAgreementIconTypes, sequence: int):
         self.id: str = id
@@ -651,6 +752,9 @@ class GameCategoryAgreementPageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -676,6 +780,9 @@ class GameCategoryAgreementList:
     :param total_count: Всего соглашений.
     :type total_count: `int`
     """
+
+    __slots__ = ("agreements", "page_info", "total_count")
+
     def __init__(self, agreements: list[GameCategoryAgreement], page_info: GameCategoryAgreementPageInfo,
                  total_count: int):
         self.agreements: list[GameCategoryAgreement] = agreements
@@ -723,6 +830,12 @@ class GameCategoryObtainingType:
     :param props: Пропорции категории.
     :type props: `playerokapi.types.GameCategoryProps`
     """
+
+    __slots__ = (
+        "id", "name", "description", "game_category_id", "no_comment_from_buyer", "instruction_for_buyer",
+        "instruction_for_seller", "sequence", "fee_multiplier", "agreements", "props"
+    )
+
     def __init__(self, id: str, name: str, description: str, game_category_id: str, no_comment_from_buyer: bool,
                  instruction_for_buyer: str | None, instruction_for_seller: str | None, sequence: int, fee_multiplier: float,
                  agreements: list[GameCategoryAgreement], props: GameCategoryProps):
@@ -766,6 +879,9 @@ class GameCategoryObtainingTypePageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -791,6 +907,9 @@ class GameCategoryObtainingTypeList:
     :param total_count: Всего способов.
     :type total_count: `int`
     """
+
+    __slots__ = ("obtaining_types", "page_info", "total_count")
+
     def __init__(self, obtaining_types: list[GameCategoryObtainingType], page_info: GameCategoryObtainingTypePageInfo,
                  total_count: int):
         self.obtaining_types: list[GameCategoryObtainingType] = obtaining_types
@@ -829,6 +948,9 @@ class GameCategoryDataField:
     :param value: Значение данных в поле.
     :type value: `str` or `None`
     """
+
+    __slots__ = ("id", "label", "type", "input_type", "copyable", "hidden", "required", "value")
+
     def __init__(self, id: str, label: str, type: GameCategoryDataFieldTypes,
                  input_type: GameCategoryDataFieldInputTypes, copyable: bool, 
                  hidden: bool, required: bool, value: str | None):
@@ -866,6 +988,9 @@ class GameCategoryDataFieldPageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -891,6 +1016,9 @@ class GameCategoryDataFieldList:
     :param total_count: Всего полей с данными.
     :type total_count: `int`
     """
+
+    __slots__ = ("data_fields", "page_info", "total_count")
+
     def __init__(self, data_fields: list[GameCategoryDataField], 
                  page_info: GameCategoryDataFieldPageInfo, total_count: int):
         self.data_fields: list[GameCategoryDataField] = data_fields
@@ -911,6 +1039,9 @@ class GameCategoryProps:
     :param min_reviews_for_seller: Минимальное количество отзывов для продавца.
     :type min_reviews_for_seller: `int`
     """
+
+    __slots__ = ("min_reviews", "min_reviews_for_seller")
+
     def __init__(self, min_reviews: int, min_reviews_for_seller: int):
         self.min_reviews: int = min_reviews
         """ Минимальное количество отзывов. """
@@ -943,6 +1074,9 @@ class GameCategoryOption:
     :param value_range_limit: Лимит разброса по значению.
     :type value_range_limit: `int` or `None`
     """
+
+    __slots__ = ("id", "group", "label", "type", "field", "value", "value_range_limit")
+
     def __init__(self, id: str, group: str, label: str, type: GameCategoryOptionTypes,
                  field: str, value: str, value_range_limit: int | None):
         self.id: str = id
@@ -971,6 +1105,9 @@ class GameCategoryInstruction:
     :param text: Текст инструкции.
     :type text: `str`
     """
+
+    __slots__ = ("id", "text")
+
     def __init__(self, id: str, text: str):
         self.id: str = id
         """ ID инструкции. """
@@ -994,6 +1131,9 @@ class GameCategoryInstructionPageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -1019,6 +1159,9 @@ class GameCategoryInstructionList:
     :param total_count: Всего инструкций.
     :type total_count: `int`
     """
+
+    __slots__ = ("instructions", "page_info", "total_count")
+
     def __init__(self, instructions: list[GameCategoryInstruction], page_info: GameCategoryInstructionPageInfo,
                  total_count: int):
         self.instructions: list[GameCategoryInstruction] = instructions
@@ -1081,6 +1224,13 @@ class GameCategory:
     :param fee_multiplier: Множитель комиссии.
     :type fee_multiplier: `float` or `None`
     """
+
+    __slots__ = (
+        "id", "slug", "name", "category_id", "game_id", "obtaining", "options", "props",
+        "no_comment_from_buyer", "instruction_for_buyer", "instruction_for_seller", "use_custom_obtaining",
+        "auto_confirm_period", "auto_moderation_mode", "agreements", "fee_multiplier"
+    )
+
     def __init__(self, id: str, slug: str, name: str, category_id: str | None, game_id: str | None,
                  obtaining: str | None, options: list[GameCategoryOption] | None, props: GameCategoryProps | None, 
                  no_comment_from_buyer: bool | None, instruction_for_buyer: str | None, instruction_for_seller: str | None, 
@@ -1148,6 +1298,12 @@ class Game:
     :param created_at: Дата создания.
     :type created_at: `str`
     """
+
+    __slots__ = ("id", "slug", "name", "type", "logo", "banner", "categories", "created_at", "_created_at_ts")
+
+    created_at_ts = EpochTimestamp("created_at")
+    """ Дата создания (в миллисекундах с начала эпохи, UTC). """
+
     def __init__(self, id: str, slug: str, name: str, type: GameTypes, 
                  logo: FileObject, banner: FileObject, categories: list[GameCategory], 
                  created_at: str):
@@ -1188,6 +1344,9 @@ class GameProfile:
     :param logo: Лого игры/приложения.
     :type logo: `playerokapi.types.FileObject`
     """
+
+    __slots__ = ("id", "slug", "name", "type", "logo")
+
     def __init__(self, id: str, slug: str, name: str, 
                  type: GameTypes, logo: FileObject):
         self.id: str = id
@@ -1218,6 +1377,9 @@ class GamePageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -1243,6 +1405,9 @@ class GameList:
     :param total_count: Всего игр.
     :type total_count: `int`
     """
+
+    __slots__ = ("games", "page_info", "total_count")
+
     def __init__(self, games: list[Game], page_info: GamePageInfo,
                  total_count: int):
         self.games: list[Game] = games
@@ -1263,6 +1428,9 @@ class ItemPriorityStatusPriceRange:
     :param max: Максимальная цена предмета.
     :type max: `int`
     """
+
+    __slots__ = ("min", "max")
+
     def __init__(self, min: int, max: str):
         self.min: int = min
         """ Минимальная цена предмета (в рублях). """
@@ -1292,6 +1460,9 @@ class ItemPriorityStatus:
     :param price_range: Ценовой диапазон предмета статуса.
     :type price_range: `playerokapi.types.ItemPriorityStatusPriceRange`
     """
+
+    __slots__ = ("id", "price", "name", "type", "period", "price_range")
+
     def __init__(self, id: str, price: int, name: str, type: PriorityTypes,
                  period: int, price_range: ItemPriorityStatusPriceRange):
         self.id: str = id
@@ -1324,6 +1495,12 @@ class ItemLog:
     :param user: Профиль пользователя, совершившего лог.
     :type user: `playerokapi.types.UserProfile`
     """
+
+    __slots__ = ("id", "event", "created_at", "user", "_created_at_ts")
+
+    created_at_ts = EpochTimestamp("created_at")
+    """ Дата создания лога (в миллисекундах с начала эпохи, UTC). """
+
     def __init__(self, id: str, event: ItemLogEvents, created_at: str,
                  user: UserProfile):
         self.id: str = id
@@ -1394,6 +1571,13 @@ class Item:
     :param user: Профиль продавца.
     :type user: `playerokapi.types.UserProfile`
     """
+
+    __slots__ = (
+        "id", "slug", "name", "description", "obtaining_type", "price", "raw_price", "priority_position",
+        "attachments", "attributes", "category", "comment", "data_fields", "fee_multiplier", "game",
+        "seller_type", "status", "user"
+    )
+
     def __init__(self, id: str, slug: str, name: str, description: str, obtaining_type: GameCategoryObtainingType | None, price: int, raw_price: int, priority_position: int,
                  attachments: list[FileObject], attributes: dict, category: GameCategory, comment: str | None, data_fields: list[GameCategoryDataField] | None, 
                  fee_multiplier: float, game: GameProfile, seller_type: UserTypes, status: ItemStatuses, user: UserProfile):
@@ -1543,6 +1727,28 @@ class MyItem:
     :param created_at: Дата создания товара.
     :type created_at: `str` or `None`
     """
+
+    __slots__ = (
+        "id", "slug", "name", "status", "description", "obtaining_type", "price", "prev_price", "raw_price",
+        "priority_position", "attachments", "attributes", "category", "comment", "data_fields",
+        "fee_multiplier", "prev_fee_multiplier", "seller_notified_about_fee_change", "game", "seller_type",
+        "user", "buyer", "priority", "priority_price", "sequence", "status_expiration_date",
+        "status_description", "status_payment", "views_counter", "is_editable", "approval_date",
+        "deleted_at", "updated_at", "created_at",
+        "_status_expiration_date_ts", "_approval_date_ts", "_deleted_at_ts", "_updated_at_ts", "_created_at_ts"
+    )
+
+    status_expiration_date_ts = EpochTimestamp("status_expiration_date")
+    """ Дата истечения статуса приоритета (в миллисекундах с начала эпохи, UTC). """
+    approval_date_ts = EpochTimestamp("approval_date")
+    """ Дата публикации товара (в миллисекундах с начала эпохи, UTC). """
+    deleted_at_ts = EpochTimestamp("deleted_at")
+    """ Дата удаления товара (в миллисекундах с начала эпохи, UTC). """
+    updated_at_ts = EpochTimestamp("updated_at")
+    """ Дата последнего обновления товара (в миллисекундах с начала эпохи, UTC). """
+    created_at_ts = EpochTimestamp("created_at")
+    """ Дата создания товара (в миллисекундах с начала эпохи, UTC). """
+
     def __init__(self, id: str, slug: str, name: str, description: str, obtaining_type: GameCategoryObtainingType | None, price: int, raw_price: int, priority_position: int,
                  attachments: list[FileObject], attributes: dict, buyer: UserProfile, category: GameCategory, comment: str | None,
                  data_fields: list[GameCategoryDataField] | None, fee_multiplier: float, game: GameProfile, seller_type: UserTypes, status: ItemStatuses,
@@ -1669,6 +1875,18 @@ class ItemProfile:
     :param created_at: Дата создания.
     :type created_at: `str`
     """
+
+    __slots__ = (
+        "id", "slug", "priority", "status", "name", "price", "raw_price", "seller_type", "attachment",
+        "user", "approval_date", "priority_position", "views_counter", "fee_multiplier", "created_at",
+        "_approval_date_ts", "_created_at_ts"
+    )
+
+    approval_date_ts = EpochTimestamp("approval_date")
+    """ Дата одобрения (в миллисекундах с начала эпохи, UTC). """
+    created_at_ts = EpochTimestamp("created_at")
+    """ Дата создания (в миллисекундах с начала эпохи, UTC). """
+
     def __init__(self, id: str, slug: str, priority: PriorityTypes, status: ItemStatuses,
                  name: str, price: int, raw_price: int, seller_type: UserTypes, attachment: FileObject,
                  user: UserProfile, approval_date: str, priority_position: int, views_counter: int | None, 
@@ -1721,6 +1939,9 @@ class ItemProfilePageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -1746,6 +1967,9 @@ class ItemProfileList:
     :param total_count: Всего предметов.
     :type total_count: `int`
     """
+
+    __slots__ = ("items", "page_info", "total_count")
+
     def __init__(self, items: list[ItemProfile], page_info: ItemProfilePageInfo,
                  total_count: int):
         self.items: list[ItemProfile] = items
@@ -1769,6 +1993,9 @@ class SBPBankMember:
     :param icon: URL иконки.
     :type icon: `str`
     """
+
+    __slots__ = ("id", "name", "icon")
+
     def __init__(self, id: str, name: str, icon: str):
         self.id: str = id
         """ ID. """
@@ -1803,6 +2030,9 @@ class TransactionPaymentMethod:
     :param limits: Лимиты провайдера транзакции.
     :type limits: `playerokapi.types.TransactionProviderLimits`
     """
+
+    __slots__ = ("id", "name", "fee", "provider_id", "account", "props", "limits")
+
     def __init__(self, id: TransactionPaymentMethodIds, name: str, fee: int, provider_id: TransactionProviderIds,
                  account: AccountProfile | None, props: TransactionProviderProps, limits: TransactionProviderLimits):
         self.id: TransactionPaymentMethodIds = id
@@ -1831,6 +2061,9 @@ class TransactionProviderLimitRange:
     :param max: Максимальная сумма (в рублях).
     :type max: `int`
     """
+
+    __slots__ = ("min", "max")
+
     def __init__(self, min: int, max: int):
         self.min: int = min
         """ Минимальная сумма (в рублях). """
@@ -1848,6 +2081,9 @@ class TransactionProviderLimits:
     :param outgoing: На вывод.
     :type outgoing: `playerokapi.types.TransactionProviderLimitRange`
     """
+
+    __slots__ = ("incoming", "outgoing")
+
     def __init__(self, incoming: TransactionProviderLimitRange, outgoing: TransactionProviderLimitRange):
         self.incoming: TransactionProviderLimitRange = incoming
         """ На пополнение. """
@@ -1868,6 +2104,9 @@ class TransactionProviderRequiredUserData:
     :param erip_account_number: Обязательно ли указывать номер аккаунта ЕРИП?
     :type erip_account_number: `bool` or `None`
     """
+
+    __slots__ = ("email", "phone_number", "erip_account_number")
+
     def __init__(self, email: bool, phone_number: bool, 
                  erip_account_number: bool | None):
         self.email: bool = email
@@ -1888,6 +2127,9 @@ class TransactionProviderProps:
     :param tooltip: Подсказка.
     :type tooltip: `str` or `None`
     """
+
+    __slots__ = ("required_user_data", "tooltip")
+
     def __init__(self, required_user_data: TransactionProviderRequiredUserData,
                  tooltip: str | None):
         self.required_user_data: TransactionProviderRequiredUserData = required_user_data
@@ -1927,6 +2169,12 @@ class TransactionProvider:
     :param payment_methods: Платёжные методы.
     :type payment_methods: `list` of `playerokapi.types.TransactionPaymentMethod`
     """
+
+    __slots__ = (
+        "id", "name", "fee", "min_fee_amount", "description", "account", "props", "limits",
+        "payment_methods"
+    )
+
     def __init__(self, id: TransactionProviderIds, name: str, fee: int, min_fee_amount: int | None, 
                  description: str | None, account: AccountProfile | None, props: TransactionProviderProps, 
                  limits: TransactionProviderLimits, payment_methods: list[TransactionPaymentMethod]):
@@ -2014,6 +2262,23 @@ class Transaction:
     :param sbp_bank_name: Название банка СБП (если транзакция была совершена с помощью СБП).
     :type sbp_bank_name: `str` or `None`
     """
+
+    __slots__ = (
+        "id", "operation", "direction", "provider_id", "provider", "user", "creator", "status",
+        "status_description", "status_expiration_date", "value", "fee", "created_at", "verified_at",
+        "verified_by", "completed_at", "completed_by", "payment_method_id", "is_suspicious", "sbp_bank_name",
+        "_status_expiration_date_ts", "_created_at_ts", "_verified_at_ts", "_completed_at_ts"
+    )
+
+    status_expiration_date_ts = EpochTimestamp("status_expiration_date")
+    """ Дата истечения статуса (в миллисекундах с начала эпохи, UTC). """
+    created_at_ts = EpochTimestamp("created_at")
+    """ Дата создания транзакции (в миллисекундах с начала эпохи, UTC). """
+    verified_at_ts = EpochTimestamp("verified_at")
+    """ Дата подтверждения транзакции (в миллисекундах с начала эпохи, UTC). """
+    completed_at_ts = EpochTimestamp("completed_at")
+    """ Дата выполнения транзакции (в миллисекундах с начала эпохи, UTC). """
+
     def __init__(self, id: str, operation: TransactionOperations, direction: TransactionDirections, provider_id: TransactionProviderIds, 
                  provider: TransactionProvider, user: UserProfile, creator: UserProfile, status: TransactionStatuses, status_description: str | None, 
                  status_expiration_date: str | None, value: int, fee: int, created_at: str, verified_at: str | None, verified_by: UserProfile | None, 
@@ -2076,6 +2341,9 @@ class TransactionPageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -2101,6 +2369,9 @@ class TransactionList:
     :param total_count: Всего транзакций на странице.
     :type total_count: `int`
     """
+
+    __slots__ = ("transactions", "page_info", "total_count")
+
     def __init__(self, transactions: list[Transaction], page_info: TransactionPageInfo,
                  total_count: int):
         self.transactions: list[Transaction] = transactions
@@ -2130,6 +2401,9 @@ class UserBankCard:
     :param is_chosen: Выбрана ли эта карта как по умолчанию?
     :type is_chosen: `bool`
     """
+
+    __slots__ = ("id", "card_first_six", "card_last_four", "card_type", "is_chosen")
+
     def __init__(self, id: str, card_first_six: str, card_last_four: str,
                  card_type: BankCardTypes, is_chosen: bool):
         self.id: str = id
@@ -2160,6 +2434,9 @@ class UserBankCardPageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -2185,6 +2462,9 @@ class UserBankCardList:
     :param total_count: Всего банковских карт на странице.
     :type total_count: `int`
     """
+
+    __slots__ = ("bank_cards", "page_info", "total_count")
+
     def __init__(self, bank_cards: list[UserBankCard], 
                  page_info: UserBankCardPageInfo, total_count: int):
         self.bank_cards: list[UserBankCard] = bank_cards
@@ -2198,6 +2478,8 @@ class UserBankCardList:
 class Moderator:
     # TODO: Сделать класс модератора Moderator
 
+    __slots__ = ()
+
     def __init__(self):
         pass
 
@@ -2215,6 +2497,9 @@ class ChatMessageButton:
     :param text: Текст кнопки.
     :type text: `str`
     """
+
+    __slots__ = ("type", "url", "text")
+
     def __init__(self, type: ChatMessageButtonTypes, 
                  url: str | None, text: str,):
         self.type: ChatMessageButtonTypes = type
@@ -2286,6 +2571,19 @@ class ChatMessage:
     :param buttons: Кнопки сообщения.
     :type buttons: `list[playerokapi.types.MessageButton]`
     """
+
+    __slots__ = (
+        "id", "text", "created_at", "deleted_at", "is_read", "is_suspicious", "is_bulk_messaging", "game",
+        "file", "user", "deal", "item", "transaction", "moderator", "event_by_user", "event_to_user",
+        "is_auto_response", "event", "buttons",
+        "_created_at_ts", "_deleted_at_ts"
+    )
+
+    created_at_ts = EpochTimestamp("created_at")
+    """ Дата создания сообщения (в миллисекундах с начала эпохи, UTC). """
+    deleted_at_ts = EpochTimestamp("deleted_at")
+    """ Дата удаления сообщения (в миллисекундах с начала эпохи, UTC). """
+
     def __init__(self, id: str, text: str, created_at: str, deleted_at: str | None, is_read: bool, 
                  is_suspicious: bool, is_bulk_messaging: bool, game: Game | None, file: FileObject | None,
                  user: UserProfile, deal: ItemDeal | None, item: ItemProfile | None, transaction: Transaction | None,
@@ -2347,6 +2645,9 @@ class ChatMessagePageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -2372,6 +2673,9 @@ class ChatMessageList:
     :param total_count: Всего сообщений в чате.
     :type total_count: `int`
     """
+
+    __slots__ = ("messages", "page_info", "total_count")
+
     def __init__(self, messages: list[ChatMessage], page_info: ChatMessagePageInfo,
                  total_count: int):
         self.messages: list[ChatMessage] = messages
@@ -2422,6 +2726,18 @@ class Chat:
     :param finished_at: Дата завершения диалога.
     :type finished_at: `str` or `None`
     """
+
+    __slots__ = (
+        "id", "type", "status", "unread_messages_counter", "bookmarked", "is_texting_allowed", "owner",
+        "deals", "last_message", "users", "started_at", "finished_at",
+        "_started_at_ts", "_finished_at_ts"
+    )
+
+    started_at_ts = EpochTimestamp("started_at")
+    """ Дата начала диалога (в миллисекундах с начала эпохи, UTC). """
+    finished_at_ts = EpochTimestamp("finished_at")
+    """ Дата завершения диалога (в миллисекундах с начала эпохи, UTC). """
+
     def __init__(self, id: str, type: ChatTypes, status: ChatStatuses | None, unread_messages_counter: int, 
                  bookmarked: bool | None, is_texting_allowed: bool | None, owner: UserProfile | None, deals: list[ItemDeal] | None,
                  started_at: str | None, finished_at: str | None, last_message: ChatMessage | None, users: list[UserProfile]):
@@ -2467,6 +2783,9 @@ class ChatPageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -2492,6 +2811,9 @@ class ChatList:
     :param total_count: Всего чатов.
     :type total_count: `int`
     """
+
+    __slots__ = ("chats", "page_info", "total_count")
+
     def __init__(self, chats: list[Chat], page_info: ChatPageInfo,
                  total_count: int):
         self.chats: list[Chat] = chats
@@ -2536,6 +2858,17 @@ class Review:
     :param user: Профиль продавца, к которому относится отзыв.
     :type user: `UserProfile`
     """
+
+    __slots__ = (
+        "id", "status", "text", "rating", "created_at", "updated_at", "deal", "creator", "moderator", "user",
+        "_created_at_ts", "_updated_at_ts"
+    )
+
+    created_at_ts = EpochTimestamp("created_at")
+    """ Дата создания отзыва (в миллисекундах с начала эпохи, UTC). """
+    updated_at_ts = EpochTimestamp("updated_at")
+    """ Дата изменения отзыва (в миллисекундах с начала эпохи, UTC). """
+
     def __init__(self, id: str, status: ReviewStatuses, text: str | None, rating: int,
                  created_at: str, updated_at: str, deal: ItemDeal, creator: UserProfile, 
                  moderator: Moderator | None, user: UserProfile):
@@ -2577,6 +2910,9 @@ class ReviewPageInfo:
     :param has_next_page: Имеет ли следующую страницу.
     :type has_next_page: `bool`
     """
+
+    __slots__ = ("start_cursor", "end_cursor", "has_previous_page", "has_next_page")
+
     def __init__(self, start_cursor: str, end_cursor: str,
                  has_previous_page: bool, has_next_page: bool):
         self.start_cursor: str = start_cursor
@@ -2602,6 +2938,9 @@ class ReviewList:
     :param total_count: Всего отзывов.
     :type total_count: `int`
     """
+
+    __slots__ = ("reviews", "page_info", "total_count")
+
     def __init__(self, reviews: list[Review], page_info: ReviewPageInfo,
                  total_count: int):
         self.reviews: list[Review] = reviews
@@ -2609,4 +2948,6 @@ class ReviewList:
         self.page_info: ReviewPageInfo = page_info
         """ Информация о странице. """
         self.total_count: int = total_count
-        """ Всего отзывов. """
\ No newline at end of file
+        """ Всего отзывов. """
+
+parser._bind_types()
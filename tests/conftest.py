@@ -0,0 +1,40 @@
+import pytest
+
+from playerokapi.account import Account
+
+
+@pytest.fixture
+def make_account():
+    """ Создаёт аккаунты, которые ходят в сервер-заглушку (`make_account(server, **kwargs)`). """
+
+    def make(server, **kwargs) -> Account:
+        try:
+            account = Account(token="test", **kwargs)
+        except Exception as e: # tls_requests при первом создании клиента скачивает свою библиотеку
+            pytest.skip(f"HTTP клиенты аккаунта недоступны: {e}")
+        account.base_url = server.url
+        return account
+
+    return make
+
+
+class FakeClock:
+    """ Часы для тестов: подставляются вместо модуля `time` в проверяемый модуль, время идёт только через `sleep`/`advance`. """
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+    monotonic = perf_counter = time
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+    advance = sleep
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
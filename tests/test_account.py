@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+
+from playerokapi import parser
+from playerokapi.bench.server import FakePlayerokServer
+
+
+@pytest.fixture
+def server():
+    with FakePlayerokServer(chats=2, items=1, messages_per_chat=1) as server:
+        yield server
+
+
+def test_persisted_mutation_is_registered_once(server, make_account):
+    account = make_account(server, persisted_mutations=True)
+    chat_id = next(iter(server.chats))
+
+    account.send_message(chat_id, "первое")  # хеш вместе с текстом запроса - без лишнего NOT_FOUND
+    assert server.requests == 1
+    assert len(account.known_persisted_queries) == 1
+
+    account.send_message(chat_id, "второе")  # только хеш
+    assert server.requests == 2
+
+    server.forget_persisted_queries()
+    account.send_message(chat_id, "третье")  # NOT_FOUND -> повтор с текстом -> снова известен
+    assert server.requests == 4
+    assert len(account.known_persisted_queries) == 1
+    assert [message["text"] for message in server.messages[chat_id][:3]] == ["третье", "второе", "первое"]
+
+
+def test_persisted_queries_are_per_account(server, make_account):
+    first = make_account(server, persisted_mutations=True)
+    second = make_account(server, persisted_mutations=True)
+    first.send_message(next(iter(server.chats)), "текст")
+    assert first.known_persisted_queries
+    assert not second.known_persisted_queries
+
+
+def test_profile_methods_use_the_account_they_were_parsed_by(server, make_account):
+    first, second = make_account(server), make_account(server)
+    requests = []
+    for account in (first, second):
+        account.hooks.add("on_request_start", lambda account, operation_name, *_: requests.append((account, operation_name)))
+    profile = first.get_chats(1).chats[0].users[0]
+    second.get_chats(1)  # второй аккаунт - последний, кто отправлял запрос
+    requests.clear()
+
+    def get_items():
+        try:
+            profile.get_items()
+        except Exception:
+            pass  # сервер-заглушка не знает запрос предметов профиля - важно только, через какой аккаунт он ушёл
+
+    thread = threading.Thread(target=get_items)
+    thread.start()
+    thread.join()
+    assert requests and set(requests) == {(first, "items")}
+
+
+def test_profile_parsed_outside_a_request_must_be_bound(server, make_account):
+    account = make_account(server)
+    data = server.resolve("chats", "chats", {"pagination": {"first": 1}})["data"]["chats"]
+    profiles = []
+    thread = threading.Thread(target=lambda: profiles.append(parser.chat_list(data).chats[0].users[0]))
+    thread.start()
+    thread.join()
+
+    with pytest.raises(RuntimeError):
+        profiles[0].get_items()
+    assert profiles[0].bind(account)._get_account() is account
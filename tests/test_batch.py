@@ -0,0 +1,97 @@
+import asyncio
+
+import curl_cffi
+import pytest
+
+from playerokapi.batch import AsyncBatch, Batch
+from playerokapi.bench.server import FakePlayerokServer
+from playerokapi.chat_index import ChatIndex
+from playerokapi.exceptions import BatchOperationError
+
+
+class StubAccount:
+    """ Минимальный аккаунт для `Batch`: отправляет операции в сервер-заглушку (или отдаёт готовый ответ). """
+
+    def __init__(self, base_url: str = "http://stub", answer=None):
+        self.base_url = base_url
+        self.id = "seller"
+        self.chat_index = ChatIndex()
+        self.answer = answer
+
+    def request(self, method, url, headers, payload):
+        if self.answer is not None:
+            return StubResponse(self.answer)
+        return curl_cffi.requests.post(url, json=payload, headers=headers)
+
+
+class AsyncStubAccount(StubAccount):
+    async def request(self, method, url, headers, payload):
+        return StubResponse(self.answer)
+
+
+class StubResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def json(self):
+        return self.data
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakePlayerokServer(chats=5, items=5, messages_per_chat=2) as server:
+        yield server
+
+
+def test_batch_resolves_every_operation(server):
+    account = StubAccount(server.url)
+    deal_ids = list(server.deals)[:3]
+    chat_id = next(iter(server.chats))
+    with Batch(account) as b:
+        deals = [b.get_deal(deal_id) for deal_id in deal_ids]
+        chat = b.get_chat(chat_id)
+    assert [deal.result(timeout=5).id for deal in deals] == deal_ids
+    assert chat.result(timeout=5).id == chat_id
+    assert server.requests == 1
+
+
+def test_batch_operation_error_stays_in_its_future(server):
+    account = StubAccount(server.url)
+    deal_id = next(iter(server.deals))
+    with Batch(account) as b:
+        ok = b.get_deal(deal_id)
+        broken = b.add({"operationName": "unknownMutation", "variables": {},
+                        "extensions": {"persistedQuery": {"version": 1, "sha256Hash": "0" * 64}}},
+                       lambda data: data)
+    assert ok.result(timeout=5).id == deal_id
+    with pytest.raises(BatchOperationError) as e:
+        broken.result(timeout=5)
+    assert e.value.error_code == "PERSISTED_QUERY_NOT_FOUND"
+
+
+@pytest.mark.parametrize("answer", [
+    {"errors": [{"message": "Batching is not supported", "extensions": {"code": "BAD_REQUEST"}}]},
+    [{"data": {"deal": {"id": "deal-1"}}}],
+])
+def test_batch_fails_all_futures_on_unexpected_response(answer):
+    account = StubAccount(answer=answer)
+    with Batch(account) as b:
+        futures = [b.get_deal(f"deal-{i}") for i in range(3)]
+    for future in futures:
+        assert future.done()
+        with pytest.raises(BatchOperationError):
+            future.result(timeout=1)
+
+
+def test_async_batch_fails_all_futures_on_non_list_response():
+    account = AsyncStubAccount(answer={"errors": [{"message": "Batching is not supported"}]})
+
+    async def main():
+        async with AsyncBatch(account) as b:
+            return [b.get_deal(f"deal-{i}") for i in range(3)]
+
+    futures = asyncio.run(main())
+    for future in futures:
+        with pytest.raises(BatchOperationError) as e:
+            future.result(timeout=1)
+        assert e.value.error_message == "Batching is not supported"
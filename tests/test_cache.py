@@ -0,0 +1,68 @@
+import os
+
+from playerokapi import cache
+from playerokapi.cache import DiskCache, MemoryCache
+
+TTLS = {"games": 60, "GamePage": 10}
+
+
+def test_memory_cache_expires_entries_after_ttl(clock, monkeypatch):
+    monkeypatch.setattr(cache, "time", clock)
+    memory = MemoryCache(TTLS)
+    memory.set("GamePage", {"id": "1"}, b"page")
+    memory.set("chats", {}, b"not cacheable")
+    assert memory.get("GamePage", {"id": "1"}) == b"page"
+    assert len(memory) == 1
+
+    clock.advance(10)
+    assert memory.get("GamePage", {"id": "1"}) is None
+    assert len(memory) == 0
+    assert memory.stats() == {"hits": 1, "misses": 1, "size": 0}
+
+
+def test_memory_cache_evicts_least_recently_used(clock, monkeypatch):
+    monkeypatch.setattr(cache, "time", clock)
+    memory = MemoryCache(TTLS, max_size=2)
+    memory.set("games", {"page": 1}, b"1")
+    memory.set("games", {"page": 2}, b"2")
+    memory.get("games", {"page": 1})  # первая запись становится самой свежей
+    memory.set("games", {"page": 3}, b"3")
+    assert memory.get("games", {"page": 2}) is None
+    assert memory.get("games", {"page": 1}) == b"1"
+    assert memory.get("games", {"page": 3}) == b"3"
+
+
+def test_keys_do_not_depend_on_variables_serialization():
+    memory = MemoryCache(TTLS)
+    memory.set("games", {"b": 1, "name": "игры"}, b"cached")
+    assert memory.get("games", '{"name": "\\u0438\\u0433\\u0440\\u044b", "b": 1}') == b"cached"
+    assert memory.get("games", '{"b":1,"name":"игры"}') == b"cached"
+
+
+def test_disk_cache_survives_reload(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(cache, "time", clock)
+    path = str(tmp_path / "cache")
+    disk = DiskCache(path, TTLS)
+    disk.set("games", {"page": 1}, "игры".encode("utf-8"))
+    disk.set("GamePage", {"id": "1"}, b"page")
+
+    reloaded = DiskCache(path, TTLS)
+    assert len(reloaded) == 2
+    assert reloaded.get("games", {"page": 1}).decode("utf-8") == "игры"
+
+    clock.advance(30)  # GamePage устарела - при загрузке её файл удаляется
+    reloaded = DiskCache(path, TTLS)
+    assert len(reloaded) == 1
+    assert reloaded.get("GamePage", {"id": "1"}) is None
+    assert len(os.listdir(path)) == 1
+
+
+def test_disk_cache_evicts_files_over_max_size(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(cache, "time", clock)
+    path = str(tmp_path / "cache")
+    disk = DiskCache(path, TTLS, max_size=2)
+    for page in range(3):
+        disk.set("games", {"page": page}, b"x")
+    assert len(disk) == 2
+    assert len(os.listdir(path)) == 2
+    assert disk.get("games", {"page": 0}) is None
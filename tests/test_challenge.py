@@ -0,0 +1,33 @@
+import pytest
+
+from playerokapi.bench.server import FakePlayerokServer
+from playerokapi.challenge import ChallengePolicy, is_cloudflare_challenge
+
+
+class StubResponse:
+    def __init__(self, status_code, text, headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {"content-type": "text/html"}
+
+
+CHALLENGE_PAGE = "<html><title>Just a moment...</title><script>window._cf_chl_opt={}</script></html>"
+
+
+@pytest.mark.parametrize("resp, expected", [
+    (StubResponse(403, CHALLENGE_PAGE), True),
+    (StubResponse(503, CHALLENGE_PAGE), True),
+    (StubResponse(200, "<p>Cloudflare Ray ID в описании предмета</p>"), False),
+    (StubResponse(200, '{"data": {"text": "Cloudflare Ray ID"}}', {"content-type": "application/json"}), False),
+    (StubResponse(403, '{"errors": []}', {"content-type": "application/json"}), False),
+    (StubResponse(200, "", {"cf-mitigated": "challenge"}), True),
+])
+def test_is_cloudflare_challenge(resp, expected):
+    assert is_cloudflare_challenge(resp) is expected
+
+
+def test_request_max_retries_limits_attempts(make_account):
+    with FakePlayerokServer(chats=1, items=1, messages_per_chat=1) as server:
+        assert make_account(server, request_max_retries=2).challenge_policy.max_attempts == 3
+        policy = ChallengePolicy(max_attempts=7)
+        assert make_account(server, request_max_retries=2, challenge_policy=policy).challenge_policy is policy
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from playerokapi.bench.server import FakePlayerokServer
+from playerokapi.chat_index import COMPACT_MIN_SUPERSEDED, ChatIndex
+from playerokapi.exceptions import RequestFailedError
+
+
+def test_index_is_reloaded_from_file(tmp_path):
+    path = tmp_path / "chats.jsonl"
+    index = ChatIndex(str(path))
+    index.set("Buyer", "chat-1")
+    index.set("other", "chat-2")
+    index.remove("other")
+
+    reloaded = ChatIndex(str(path))
+    assert reloaded.get("buyer") == "chat-1"
+    assert "other" not in reloaded
+
+
+def test_superseded_lines_are_compacted_on_load(tmp_path):
+    path = tmp_path / "chats.jsonl"
+    index = ChatIndex(str(path))
+    for i in range(COMPACT_MIN_SUPERSEDED + 1):
+        index.set("buyer", f"chat-{i}")
+    index.set("seller", "chat-x")
+    assert len(path.read_text(encoding="utf-8").splitlines()) == COMPACT_MIN_SUPERSEDED + 2
+
+    reloaded = ChatIndex(str(path))
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert sorted((line["username"], line["chat_id"]) for line in lines) == [
+        ("buyer", f"chat-{COMPACT_MIN_SUPERSEDED}"), ("seller", "chat-x")]
+    assert reloaded.get("buyer") == f"chat-{COMPACT_MIN_SUPERSEDED}"
+
+
+class NotFoundResponse:
+    url = "http://stub/graphql"
+    status_code = 404
+    text = "Not Found"
+
+
+def test_get_chat_by_username_falls_back_when_indexed_chat_is_gone(make_account, monkeypatch):
+    with FakePlayerokServer(chats=3, items=1, messages_per_chat=1) as server:
+        account = make_account(server)
+        chat_id = next(iter(server.chats))
+        username = server.chats[chat_id]["participants"][1]["username"]
+        account.chat_index.set(username, "deleted-chat")
+
+        def get_chat(id):
+            raise RequestFailedError(NotFoundResponse())
+
+        monkeypatch.setattr(account, "get_chat", get_chat)
+        assert account.get_chat_by_username(username).id == chat_id
+        assert account.chat_index.get(username) == chat_id
@@ -0,0 +1,45 @@
+import pytest
+
+from playerokapi.listener import dedup
+from playerokapi.listener.dedup import BoundedSet
+
+
+@pytest.fixture(autouse=True)
+def fake_time(clock, monkeypatch):
+    monkeypatch.setattr(dedup, "time", clock)
+
+
+def test_oldest_items_are_evicted_over_maxsize():
+    seen = BoundedSet(maxsize=2)
+    assert seen.add("m1") and seen.add("m2")
+    assert not seen.add("m1")  # повтор - m1 становится самым свежим
+    assert seen.add("m3")
+    assert list(seen) == ["m1", "m3"]
+    assert "m2" not in seen
+    assert seen.stats() == {"size": 2, "maxsize": 2, "ttl": None, "hits": 1, "misses": 3, "evictions": 1}
+
+
+def test_items_expire_after_ttl_since_last_access(clock):
+    seen = BoundedSet(maxsize=10, ttl=60)
+    seen.add("m1")
+    seen.add("m2")
+    clock.advance(30)
+    assert not seen.add("m1")  # обращение продлевает жизнь
+    clock.advance(45)
+    assert "m1" in seen and "m2" not in seen
+    assert seen.add("m3")
+    assert list(seen) == ["m1", "m3"]  # m2 вытеснен при добавлении
+    clock.advance(61)
+    assert seen.add("m1")  # устарел - снова новый
+    assert seen.evictions == 2
+
+
+def test_discard_and_clear():
+    seen = BoundedSet(maxsize=10)
+    seen.add("m1")
+    seen.discard("m1")
+    seen.discard("missing")
+    assert seen.add("m1")
+    seen.clear()
+    assert len(seen) == 0
+    assert (seen.hits, seen.misses, seen.evictions) == (0, 0, 0)
@@ -0,0 +1,82 @@
+import pytest
+
+from playerokapi import identity, parser
+from playerokapi.bench.server import FakePlayerokServer
+from playerokapi.identity import IdentityMap
+from playerokapi.listener.events import ChatInitializedEvent, NewMessageEvent
+from playerokapi.listener.listener import EventListener
+from playerokapi.listener.scheduler import ReviewCheckScheduler
+
+
+class _Stop(BaseException):
+    """ Останавливает `listen` (обычные исключения слушатель перехватывает и логирует). """
+
+
+class StubAccount:
+    """ Минимальный аккаунт для `EventListener`: разбирает ответы сервера-заглушки с общей картой идентичности. """
+
+    def __init__(self, server: FakePlayerokServer, identity_map: IdentityMap, polls: int):
+        self.server = server
+        self.identity_map = identity_map
+        self.polls = polls
+
+    def _parse(self, parse, data):
+        with identity.use(self.identity_map):
+            return parse(data)
+
+    def get_chats(self, count):
+        if self.polls == 0:
+            raise _Stop()
+        self.polls -= 1
+        if self.polls == 0:
+            self.server.add_message(next(iter(self.server.chats)), "новое сообщение")
+        data = self.server.resolve("chats", "chats", {"pagination": {"first": count}})["data"]["chats"]
+        return self._parse(parser.chat_list, data)
+
+    def get_chat_messages(self, chat_id, count):
+        variables = {"pagination": {"first": count}, "filter": {"chatId": chat_id}}
+        data = self.server.resolve("chatMessages", "chat_messages", variables)["data"]["chatMessages"]
+        return self._parse(parser.chat_message_list, data)
+
+
+def test_new_message_is_detected_with_identity_map():
+    server = FakePlayerokServer(chats=3, items=1, messages_per_chat=2)
+    account = StubAccount(server, IdentityMap(), polls=2)
+    events = []
+    with pytest.raises(_Stop):
+        for event in EventListener(account).listen(requests_delay=0, get_new_review_events=False):
+            events.append(event)
+
+    assert sum(isinstance(event, ChatInitializedEvent) for event in events) == 3
+    new_messages = [event for event in events if isinstance(event, NewMessageEvent)]
+    assert [event.message.text for event in new_messages] == ["новое сообщение"]
+
+
+class ReviewStubAccount:
+    """ Аккаунт, который не может получить сделки для проверки отзывов. """
+
+    def __init__(self, deals=None):
+        self.deals = deals
+
+    def get_deals_by_ids(self, ids):
+        if self.deals is None:
+            raise ConnectionError("сеть недоступна")
+        return self.deals[:len(ids)]
+
+    def get_chats_by_ids(self, ids):
+        return []
+
+
+@pytest.mark.parametrize("deals", [None, [None, None]])
+def test_unchecked_review_deals_are_rescheduled(deals):
+    scheduler = ReviewCheckScheduler(interval=0, expire_after=None)
+    scheduler.add("deal-1", now=0)
+    scheduler.add("deal-2", now=0)
+    listener = EventListener(ReviewStubAccount(deals), review_scheduler=scheduler)
+    try:
+        listener.get_message_events([], None, True)
+    except ConnectionError:
+        pass
+
+    assert len(scheduler) == 2
+    assert scheduler.next_due() is not None  # сделки снова в куче и будут проверены
@@ -0,0 +1,47 @@
+import json
+
+from playerokapi.cache import CachedResponse
+from playerokapi.hooks import Hooks
+from playerokapi.metrics import MetricsCollector
+
+
+def _response(body: dict, status_code: int = 200) -> CachedResponse:
+    return CachedResponse("http://stub/graphql", json.dumps(body).encode("utf-8"), status_code)
+
+
+def test_collector_counts_requests_latency_and_errors():
+    hooks = Hooks()
+    metrics = MetricsCollector(buckets=(0.1, 1.0)).attach(hooks)
+    ok = _response({"data": {"chats": []}})
+    for elapsed in (0.05, 0.5, 5.0):
+        hooks.emit("on_request_start", None, "chats", "get", "http://stub/graphql")
+        hooks.emit("on_response", None, "chats", ok, elapsed)
+    hooks.emit("on_response", None, "deal", _response({"errors": [{"message": "x", "extensions": {"code": "FORBIDDEN"}}]}), 0.2)
+    hooks.emit("on_response", None, "deal", _response({}, status_code=502), 0.2)
+    hooks.emit("on_retry", None, "deal", "server_error", 1)
+    hooks.emit("on_cloudflare", None, None, "retry")
+
+    snapshot = metrics.snapshot()
+    chats = snapshot["chats"]
+    assert (chats["requests"], chats["responses"]) == (3, 3)
+    assert chats["latency"]["buckets"] == {"0.1": 1, "1.0": 2, "+Inf": 3}
+    assert chats["response_bytes"] == 3 * len(ok.content)
+    assert snapshot["deal"]["errors"] == {"FORBIDDEN": 1, "HTTP_502": 1}
+    assert snapshot["deal"]["retries"] == {"server_error": 1}
+    assert snapshot["unknown"]["cloudflare"] == 1
+    assert json.loads(metrics.to_json()) == snapshot
+
+
+def test_prometheus_export_and_detach():
+    hooks = Hooks()
+    metrics = MetricsCollector(buckets=(1.0,)).attach(hooks)
+    hooks.emit("on_request_start", None, 'op"1', "post", "http://stub/graphql")
+    text = metrics.to_prometheus()
+    assert "# TYPE playerokapi_request_duration_seconds histogram" in text
+    assert 'playerokapi_requests_total{operation="op\\"1"} 1' in text
+
+    metrics.detach(hooks)
+    hooks.emit("on_request_start", None, 'op"1', "post", "http://stub/graphql")
+    assert metrics.snapshot()['op"1']["requests"] == 1
+    metrics.reset()
+    assert metrics.snapshot() == {}
@@ -0,0 +1,49 @@
+import threading
+
+from playerokapi import identity, parser
+from playerokapi.account import _current_account
+from playerokapi.bench.server import FakePlayerokServer
+
+
+def _messages_page() -> dict:
+    server = FakePlayerokServer(chats=1, items=1, messages_per_chat=3)
+    variables = {"pagination": {"first": 3}, "filter": {"chatId": next(iter(server.chats))}}
+    return server.resolve("chatMessages", "chat_messages", variables)["data"]["chatMessages"]
+
+
+def test_lazy_fields_use_the_context_they_were_parsed_in():
+    data = _messages_page()
+    account = object()
+    account_token = _current_account.set(account)
+    try:
+        with identity.use() as identity_map, parser.lazy():
+            messages = parser.chat_message_list(data).messages
+    finally:
+        _current_account.reset(account_token)
+
+    users = []
+    # поле читается в другом потоке: там нет ни аккаунта, ни карты идентичности, ни ленивого режима
+    thread = threading.Thread(target=lambda: users.extend(message.user for message in messages))
+    thread.start()
+    thread.join()
+
+    assert users[0]._UserProfile__account is account
+    assert users[0] is identity_map.get(("UserProfile", users[0].id))
+    assert all(user is users[0] for user in users if user.id == users[0].id)
+
+
+def test_lazy_fields_do_not_leak_their_context():
+    data = _messages_page()
+    reader_account = _current_account.get()
+    account = object()
+    account_token = _current_account.set(account)
+    try:
+        with parser.lazy():
+            message = parser.chat_message_list(data).messages[0]
+    finally:
+        _current_account.reset(account_token)
+
+    assert message.user is not None
+    assert _current_account.get() is reader_account
+    assert identity.current() is None
+    assert parser._lazy_parsing.get() is False
@@ -0,0 +1,43 @@
+import pytest
+
+from playerokapi import ratelimit
+from playerokapi.ratelimit import RateLimiter, TokenBucket
+
+
+@pytest.fixture(autouse=True)
+def fake_time(clock, monkeypatch):
+    monkeypatch.setattr(ratelimit, "time", clock)
+
+
+def test_bucket_spends_burst_then_queues_evenly(clock):
+    bucket = TokenBucket(rate=2, capacity=2)
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert [bucket.reserve() for _ in range(3)] == [0.5, 1.0, 1.5]
+
+    clock.advance(1.5)  # очередь отработала, токенов снова 0
+    assert bucket.wait_time == 0.5
+    clock.advance(10)  # ёмкость не больше capacity
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+
+
+def test_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_limiter_takes_the_strictest_limit(clock):
+    parent = RateLimiter(rate=10)
+    limiter = RateLimiter(rate=4, operations={"chats": (0.5, 1)}, parent=parent)
+    assert limiter.reserve("chats") == 0.0
+    assert limiter.reserve("chats") == 2.0  # лимит операции строже общего
+    assert limiter.reserve("deals") == 0.0
+    assert limiter.wait_time("chats") == 4.0
+    assert parent.acquired == 3
+
+
+def test_acquire_sleeps_for_the_reserved_delay(clock):
+    limiter = RateLimiter(rate=1, capacity=1)
+    started_at = clock.now
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 1.0, 1.0]
+    assert clock.now - started_at == 2.0
+    assert limiter.stats() == {"queue_depth": 0, "wait_time": 1.0, "acquired": 3, "total_wait_time": 2.0}
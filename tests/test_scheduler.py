@@ -0,0 +1,54 @@
+from playerokapi.listener.scheduler import ReviewCheckScheduler
+
+
+def test_interval_grows_by_backoff_up_to_max_interval():
+    scheduler = ReviewCheckScheduler(interval=10, backoff=2, max_interval=30, expire_after=None)
+    scheduler.add("deal-1", now=0)
+    assert scheduler.pop_due(now=9) == []
+    assert scheduler.pop_due(now=10) == ["deal-1"]
+
+    scheduler.reschedule("deal-1", now=10)  # 10 * 2
+    assert scheduler.pop_due(now=29) == []
+    assert scheduler.pop_due(now=30) == ["deal-1"]
+
+    scheduler.reschedule("deal-1", now=30)  # 10 * 4 = 40, но не больше 30
+    assert scheduler.next_due() == 60
+    assert scheduler.checks == 2
+
+
+def test_deals_expire_after_review_window():
+    scheduler = ReviewCheckScheduler(interval=10, backoff=1, expire_after=25)
+    scheduler.add("deal-1", now=0)
+    scheduler.add("deal-2", now=0)
+    assert scheduler.pop_due(now=10) == ["deal-1", "deal-2"]
+    scheduler.reschedule("deal-1", now=10)
+    scheduler.reschedule("deal-2", now=20)  # следующая проверка (30) уже после закрытия окна
+    assert "deal-2" not in scheduler
+
+    assert scheduler.pop_due(now=26) == []  # окно deal-1 закрылось, пока он ждал в очереди
+    assert len(scheduler) == 0
+    assert scheduler.expired == 2
+
+
+def test_stale_heap_entries_are_skipped():
+    scheduler = ReviewCheckScheduler(interval=10, backoff=2, expire_after=None)
+    scheduler.add("deal-1", now=0)
+    scheduler.add("deal-2", now=0)
+    assert not scheduler.add("deal-1", now=5)
+    scheduler.remove("deal-2")
+    assert scheduler.pop_due(now=10) == ["deal-1"]
+    scheduler.reschedule("deal-1", now=10)
+    assert scheduler.stats()["heap"] == 1
+    assert scheduler.next_due() == 30
+
+    scheduler.add("deal-2", now=10)  # снова добавлена после удаления - старая запись в куче не мешает
+    assert scheduler.pop_due(now=20) == ["deal-2"]
+    assert scheduler.pop_due(now=30) == ["deal-1"]
+
+
+def test_pop_due_respects_batch_size():
+    scheduler = ReviewCheckScheduler(interval=0, expire_after=None, batch_size=2)
+    for i in range(5):
+        scheduler.add(f"deal-{i}", now=i)
+    assert scheduler.pop_due(now=10) == ["deal-0", "deal-1"]
+    assert scheduler.pop_due(now=10, limit=10) == ["deal-2", "deal-3", "deal-4"]
@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from playerokapi import transport
+from playerokapi.exceptions import CassetteMissError
+from playerokapi.transport import Cassette, RecordingTransport, ReplayResponse, ReplayTransport, Transport, cassette_key
+
+
+class ServerTransport(Transport):
+    """ "Сеть" для записи: отвечает номером запроса к операции и тратит на ответ 0.25 с на часах теста. """
+
+    def __init__(self, clock):
+        self.clock = clock
+        self.calls = 0
+
+    def send(self, account, method, url, headers, payload, files, proxy):
+        self.calls += 1
+        self.clock.advance(0.25)
+        body = json.dumps({"data": {payload["operationName"]: {"call": self.calls}}})
+        return ReplayResponse(url, body.encode("utf-8"), 200, {"content-type": "application/json"})
+
+
+def _payload(operation_name: str, variables) -> dict:
+    return {"operationName": operation_name, "variables": variables}
+
+
+def test_recorded_traffic_replays_in_order(tmp_path, clock, monkeypatch):
+    monkeypatch.setattr(transport, "time", clock)
+    path = str(tmp_path / "traffic.jsonl")
+    recorder = RecordingTransport(path, ServerTransport(clock))
+    for _ in range(2):
+        recorder.send(None, "get", "http://stub/graphql", {}, _payload("chats", {"first": 24}), None, None)
+    recorder.send(None, "get", "http://stub/graphql", {}, _payload("deal", '{"id": "deal-1"}'), None, None)
+
+    replay = ReplayTransport(path, latency="recorded", speed=0.5)
+    assert len(replay.cassette) == 3
+    chats = [replay.send(None, "get", "http://stub/graphql", {}, _payload("chats", '{"first": 24}'), None, None)
+             for _ in range(3)]
+    assert [r.json()["data"]["chats"]["call"] for r in chats] == [1, 2, 2]  # после последней записи повторяется последняя
+    deal = replay.send(None, "get", "http://stub/graphql", {}, _payload("deal", {"id": "deal-1"}), None, None)
+    assert (deal.status_code, deal.headers["content-type"]) == (200, "application/json")
+    assert clock.now == 1000.0 + 3 * 0.25 + 4 * 0.5  # запись + воспроизведение с записанной задержкой / speed
+
+    replay.cassette.rewind()
+    assert replay.send(None, "get", "http://stub/graphql", {}, _payload("chats", {"first": 24}), None, None).json() \
+        == chats[0].json()
+
+
+def test_replay_miss_raises(tmp_path):
+    replay = ReplayTransport(Cassette(str(tmp_path / "empty.jsonl")))
+    with pytest.raises(CassetteMissError):
+        replay.send(None, "get", "http://stub/graphql", {}, _payload("chats", {}), None, None)
+
+
+def test_cassette_key_is_canonical():
+    assert cassette_key(_payload("deal", {"b": 1, "a": "ы"})) == cassette_key(_payload("deal", '{"a":"\\u044b","b":1}'))
+    batch = [_payload("deal", {"id": "1"}), _payload("chat", '{"id": "2"}')]
+    assert cassette_key(batch)[0] == "batch"